@@ -1,7 +1,13 @@
-from math import isclose
 from .LoadCombo import LoadCombo
-from numpy import array, atleast_2d, zeros, subtract, matmul, divide, seterr, nanmax
-from numpy.linalg import solve
+from .Solver import LinearSolver
+from .Member3D import Member3D
+from .Spring3D import Spring3D
+from .Quad3D import Quad3D
+from .Plate3D import Plate3D
+from .Node3D import NodeResult
+from numpy import array, atleast_2d, zeros, ones, subtract, matmul, divide, seterr, nanmax, arange, repeat, tile, concatenate, bincount, add, hstack, nonzero, cross, minimum, ix_
+from numpy.linalg import norm
+import pickle
 
 def _prepare_model(model):
     """Prepares a model for analysis by ensuring at least one load combination is defined, generating all meshes that have not already been generated, activating all non-linear members, and internally numbering all nodes and elements.
@@ -10,15 +16,14 @@ def _prepare_model(model):
     :type model: FEModel3D
     """
     
-    # Reset any nodal displacements
+    # Reset any nodal displacements and reactions
     model._D = {}
-    for node in model.nodes.values():
-        node.DX = {}
-        node.DY = {}
-        node.DZ = {}
-        node.RX = {}
-        node.RY = {}
-        node.RZ = {}
+    model._R = {}
+
+    # Discard the members' segments from any previous analysis. Sub-members are rebuilt when the
+    # members are descritized, but the physical members keep their segment caches.
+    for phys_member in model.members.values():
+        phys_member._clear_segments()
 
     # Ensure there is at least 1 load combination to solve if the user didn't define any
     if model.load_combos == {}:
@@ -43,6 +48,12 @@ def _prepare_model(model):
     # Assign an internal ID to all nodes and elements in the model. This number is different from the name used by the user to identify nodes and elements.
     _renumber(model)
 
+    # The nodes' displacements and reactions are views of the model's global displacement and
+    # reaction vectors, which are indexed by the node IDs
+    for node in model.nodes.values():
+        node.DX, node.DY, node.DZ, node.RX, node.RY, node.RZ = (NodeResult(model._D, node, dof) for dof in range(6))
+        node.RxnFX, node.RxnFY, node.RxnFZ, node.RxnMX, node.RxnMY, node.RxnMZ = (NodeResult(model._R, node, dof) for dof in range(6))
+
 def _identify_combos(model, combo_tags=None):
     """Returns a list of load combinations that are to be run based on tags given by the user.
 
@@ -73,64 +84,59 @@ def _identify_combos(model, combo_tags=None):
 
 def _check_stability(model, K):
     """
-    Identifies nodal instabilities in a model's stiffness matrix.
+    Identifies nodal instabilities in a model's stiffness matrix. Every unsupported degree of
+    freedom with a zero term on the diagonal of the stiffness matrix is reported. The unstable
+    degrees of freedom are stored in `model.unstable_dofs` as (node name, degree of freedom) pairs,
+    where the degree of freedom is one of 'DX', 'DY', 'DZ', 'RX', 'RY' or 'RZ'.
+
+    :param model: The model being analyzed.
+    :type model: FEModel3D
+    :param K: The global stiffness matrix.
+    :type K: csr_matrix or ndarray
+    :raises Exception: Occurs when any unstable degrees of freedom are found.
     """
 
-    # Initialize the `unstable` flag to `False`
-    unstable = False
+    nodes = _nodes_by_ID(model)
 
-    # Step through each diagonal term in the stiffness matrix
-    for i in range(K.shape[0]):
-        
-        # Determine which node this term belongs to
-        node = [node for node in model.nodes.values() if node.ID == int(i/6)][0]
-
-        # Determine which degree of freedom this term belongs to
-        dof = i%6
-
-        # Check to see if this degree of freedom is supported
-        if dof == 0:
-            supported = node.support_DX
-        elif dof == 1:
-            supported = node.support_DY
-        elif dof == 2:
-            supported = node.support_DZ
-        elif dof == 3:
-            supported = node.support_RX
-        elif dof == 4:
-            supported = node.support_RY
-        elif dof == 5:
-            supported = node.support_RZ
-
-        # Check if the degree of freedom on this diagonal is unstable
-        if isclose(K[i, i], 0) and not supported:
-
-            # Flag the model as unstable
-            unstable = True
-
-            # Identify which direction this instability affects
-            if i%6 == 0:
-                direction = 'for translation in the global X direction.'
-            if i%6 == 1:
-                direction = 'for translation in the global Y direction.'
-            if i%6 == 2:
-                direction = 'for translation in the global Z direction.'
-            if i%6 == 3:
-                direction = 'for rotation about the global X axis.'
-            if i%6 == 4:
-                direction = 'for rotation about the global Y axis.'
-            if i%6 == 5:
-                direction = 'for rotation about the global Z axis.'
-
-            # Print a message to the console
-            print('* Nodal instability detected: node ' + node.name + ' is unstable ' + direction)
-
-    if unstable:
-        raise Exception('Unstable node(s). See console output for details.')
+    # Read the diagonal of the stiffness matrix in one call
+    diagonal = K.diagonal()
+
+    # Build a mask of the supported degrees of freedom, in the same order as the diagonal
+    supported = array([[node.support_DX, node.support_DY, node.support_DZ,
+                        node.support_RX, node.support_RY, node.support_RZ] for node in nodes], dtype=bool).reshape(-1)
+
+    # A degree of freedom is unstable if it has no stiffness and is not supported
+    unstable = nonzero((diagonal == 0) & ~supported[:len(diagonal)])[0]
+
+    dof_names = ('DX', 'DY', 'DZ', 'RX', 'RY', 'RZ')
+    model.unstable_dofs = [(nodes[i//6].name, dof_names[i%6]) for i in unstable]
+
+    if model.unstable_dofs:
+        report = ', '.join(name + ' (' + dof + ')' for name, dof in model.unstable_dofs[:20])
+        if len(model.unstable_dofs) > 20:
+            report += ' and ' + str(len(model.unstable_dofs) - 20) + ' more'
+        raise Exception('Unstable node(s): ' + report + '. See `unstable_dofs` for the full list.')
 
     return
 
-def _PDelta_step(model, combo_name, P1, FER1, D1_indices, D2_indices, D2, log=True, sparse=True, check_stability=False, max_iter=30, first_step=True):
+def _nodes_by_ID(model):
+    """Returns a list of the model's nodes indexed by node ID.
+
+    :param model: The model.
+    :type model: FEModel3D
+    :return: The model's nodes, where `nodes[node.ID]` is `node`.
+    :rtype: list
+    """
+
+    nodes = getattr(model, '_nodes_by_ID', None)
+
+    # Rebuild the list if nodes have been added or removed since the model was last renumbered
+    if nodes is None or len(nodes) != len(model.nodes):
+        nodes = sorted(model.nodes.values(), key=lambda node: node.ID)
+
+    return nodes
+
+def _PDelta_step(model, combo_name, P1, FER1, D1_indices, D2_indices, D2, log=True, sparse=True, check_stability=False, max_iter=30, first_step=True, solver=None):
     """Performs second order (P-Delta) analysis. This type of analysis is appropriate for most models using beams, columns and braces. Second order analysis is usually required by material-specific codes. The analysis is iterative and takes longer to solve. Models with slender members and/or members with combined bending and axial loads will generally have more significant P-Delta effects. P-Delta effects in plates/quads are not considered.
 
     :param combo_name: The name of the load combination to evaluate P-Delta effects for.
@@ -147,13 +153,14 @@ def _PDelta_step(model, combo_name, P1, FER1, D1_indices, D2_indices, D2, log=Tr
     :type check_stability: bool, optional
     :param first_step: Indicates whether this P-Delta analysis is the first load step. Usually this should be set to `True`, unless this is a subsequent step of an analysis using multiple load steps. Default is True.
     :type first_step: bool, optional
+    :param solver: The solver used for each iteration. Its factorization is only recomputed when the stiffness matrix changes. Defaults to `None`, in which case a new one is created.
+    :type solver: LinearSolver, optional
     :raises ValueError: Occurs when there is a singularity in the stiffness matrix, which indicates an unstable structure.
     :raises Exception: Occurs when a model fails to converge.
     """
 
-    # Import `scipy` features if the sparse solver is being used
-    if sparse == True:
-        from scipy.sparse.linalg import spsolve
+    if solver is None:
+        solver = LinearSolver(sparse)
 
     iter_count_TC = 1    # Tracks tension/compression-only iterations
     iter_count_PD = 1    # Tracks P-Delta iterations
@@ -168,46 +175,24 @@ def _PDelta_step(model, combo_name, P1, FER1, D1_indices, D2_indices, D2, log=Tr
         if log:
             print('- Beginning tension/compression-only iteration #' + str(iter_count_TC))
 
-        # Calculate the partitioned global stiffness matrices
-        if sparse == True:
-
-            # Calculate the initial stiffness matrix
-            K11, K12, K21, K22 = _partition(model, model.K(combo_name, log, check_stability, sparse).tolil(), D1_indices, D2_indices)
+        # Calculate the partitioned global stiffness matrices. Sparse matrices are partitioned
+        # into `csr` submatrices, which the `+` operator adds directly.
 
-            # Calculate the geometric stiffness matrix
-            if iter_count_PD == 1 and first_step:
-                # For the first iteration of the first load step P=0
-                Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, True), D1_indices, D2_indices)
-            else:
-                # For subsequent iterations P will be calculated based on member end displacements
-                Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
-            
-            # The stiffness matrices are currently `lil` format which is great for
-            # memory, but slow for mathematical operations. They will be converted to
-            # `csr` format. The `+` operator performs matrix addition on `csr`
-            # matrices.
-            K11 = K11.tocsr() + Kg11.tocsr()
-            K12 = K12.tocsr() + Kg12.tocsr()
-            K21 = K21.tocsr() + Kg21.tocsr()
-            K22 = K22.tocsr() + Kg22.tocsr()
+        # Initial stiffness matrix
+        K11, K12, K21, K22 = _partition(model, model.K(combo_name, log, check_stability, sparse), D1_indices, D2_indices)
 
+        # Geometric stiffness matrix
+        if iter_count_PD == 1 and first_step:
+            # For the first iteration of the first load step P=0
+            Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, True), D1_indices, D2_indices)
         else:
+            # For subsequent iterations P will be calculated based on member end displacements
+            Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
 
-            # Initial stiffness matrix
-            K11, K12, K21, K22 = _partition(model, model.K(combo_name, log, check_stability, sparse), D1_indices, D2_indices)
-            
-            # Geometric stiffness matrix
-            if iter_count_PD == 1 and first_step:
-                # For the first iteration of the first load step P=0
-                Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, True), D1_indices, D2_indices)
-            else:
-                # For subsequent iterations P will be calculated based on member end displacements
-                Kg11, Kg12, Kg21, Kg22 = _partition(model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
-            
-            K11 = K11 + Kg11
-            K12 = K12 + Kg12
-            K21 = K21 + Kg21
-            K22 = K22 + Kg22
+        K11 = K11 + Kg11
+        K12 = K12 + Kg12
+        K21 = K21 + Kg21
+        K22 = K22 + Kg22
 
         # Calculate the changes to the global displacement vector
         if log: print('- Calculating changes to the global displacement vector')
@@ -220,12 +205,11 @@ def _PDelta_step(model, combo_name, P1, FER1, D1_indices, D2_indices, D2, log=Tr
                 if sparse == True:
                     # The partitioned stiffness matrix is already in `csr` format. The `@`
                     # operator performs matrix multiplication on sparse matrices.
-                    Delta_D1 = spsolve(K11.tocsr(), subtract(subtract(P1, FER1), K12.tocsr() @ D2))
-                    Delta_D1 = Delta_D1.reshape(len(Delta_D1), 1)
+                    Delta_D1 = solver.solve(K11, subtract(subtract(P1, FER1), K12 @ D2))
                 else:
                     # The partitioned stiffness matrix is in `csr` format. It will be
                     # converted to a 2D dense array for mathematical operations.
-                    Delta_D1 = solve(K11, subtract(subtract(P1, FER1), matmul(K12, D2)))
+                    Delta_D1 = solver.solve(K11, subtract(subtract(P1, FER1), matmul(K12, D2)))
 
             except:
                 # Return out of the method if 'K' is singular and provide an error message
@@ -269,7 +253,458 @@ def _PDelta_step(model, combo_name, P1, FER1, D1_indices, D2_indices, D2, log=Tr
     # Flag the model as solved
     model.solution = 'P-Delta'
 
-def _pushover_step(model, combo_name, push_combo, step_num, P1, FER1, D1_indices, D2_indices, D2, log=True, sparse=True, check_stability=False):
+def _TC_combo(model, combo, D1_indices, D2_indices, D2, log=False, check_stability=True, max_iter=30, sparse=True, spring_tolerance=0, member_tolerance=0, solver=None):
+    """Solves a single load combination for a first-order analysis, iterating until all tension/compression-only elements have converged.
+
+    :param model: The finite element model being evaluated.
+    :type model: FEModel3D
+    :param combo: The load combination to solve.
+    :type combo: LoadCombo
+    :param D1_indices: The degree of freedom indices for each unknown displacement.
+    :type D1_indices: array
+    :param D2_indices: The degree of freedom indices for each known displacement.
+    :type D2_indices: array
+    :param D2: The known (enforced) displacements.
+    :type D2: array
+    :param solver: The solver used for each iteration. Defaults to `None`, in which case a new one is created.
+    :type solver: LinearSolver, optional
+    :raises Exception: Occurs when the stiffness matrix is singular or the tension/compression-only analysis diverges.
+    """
+
+    if solver is None:
+        solver = LinearSolver(sparse)
+
+    if log:
+        print('')
+        print('- Analyzing load combination ' + combo.name)
+
+    # Keep track of the number of iterations
+    iter_count = 1
+    convergence = False
+    divergence = False
+
+    # Iterate until convergence or divergence occurs
+    while convergence == False and divergence == False:
+        
+        # Check for tension/compression-only divergence
+        if iter_count > max_iter:
+            divergence = True
+            raise Exception('Model diverged during tension/compression-only analysis')
+        
+        # Get the partitioned global stiffness matrix K11, K12, K21, K22
+        K11, K12, K21, K22 = _partition(model, model.K(combo.name, log, check_stability, sparse), D1_indices, D2_indices)
+
+        # Get the partitioned global fixed end reaction vector
+        FER1, FER2 = _partition(model, model.FER(combo.name), D1_indices, D2_indices)
+
+        # Get the partitioned global nodal force vector       
+        P1, P2 = _partition(model, model.P(combo.name), D1_indices, D2_indices)          
+
+        # Calculate the global displacement vector
+        if log: print('- Calculating global displacement vector')
+        if K11.shape == (0, 0):
+            # All displacements are known, so D1 is an empty vector
+            D1 = []
+        else:
+            try:
+                # Calculate the unknown displacements D1
+                if sparse == True:
+                    # The partitioned stiffness matrix is in `csr` format. The `@` operator performs matrix multiplication on sparse matrices.
+                    D1 = solver.solve(K11, subtract(subtract(P1, FER1), K12 @ D2))
+                else:
+                    D1 = solver.solve(K11, subtract(subtract(P1, FER1), matmul(K12, D2)))
+            except:
+                # Return out of the method if 'K' is singular and provide an error message
+                raise Exception('The stiffness matrix is singular, which implies rigid body motion. The structure is unstable. Aborting analysis.')
+
+        # Store the calculated displacements to the model and the nodes in the model
+        _store_displacements(model, D1, D2, D1_indices, D2_indices, combo)
+        
+        # Check for tension/compression-only convergence
+        convergence = _check_TC_convergence(model, combo.name, log=log, spring_tolerance=spring_tolerance, member_tolerance=member_tolerance)
+
+        if convergence == False:
+
+            if log: print('- Tension/compression-only analysis did not converge. Adjusting stiffness matrix and reanalyzing.')
+        else:
+            if log: print('- Tension/compression-only analysis converged after ' + str(iter_count) + ' iteration(s)')
+
+        # Keep track of the number of tension/compression only iterations
+        iter_count += 1
+
+def _PDelta_combo(model, combo, D1_indices, D2_indices, D2, log=False, check_stability=True, max_iter=30, sparse=True, solver=None, tol=0.001):
+    """Solves a single load combination for a P-Delta analysis.
+
+    The elastic stiffness matrix is assembled and partitioned once for each set of active elements. Between P-Delta iterations only the member axial forces change, so each iteration only rescales the members' geometric stiffness matrices (see `_geometric_stiffness`). Iterations continue until the relative changes in the displacements and in the member axial forces are both within `tol`. The changes found on each iteration are stored in `model.pdelta_history[combo.name]`.
+
+    :param model: The finite element model being evaluated.
+    :type model: FEModel3D
+    :param combo: The load combination to solve.
+    :type combo: LoadCombo
+    :param D1_indices: The degree of freedom indices for each unknown displacement.
+    :type D1_indices: array
+    :param D2_indices: The degree of freedom indices for each known displacement.
+    :type D2_indices: array
+    :param D2: The known (enforced) displacements.
+    :type D2: array
+    :param max_iter: The maximum number of P-Delta iterations, and of tension/compression-only iterations. Defaults to 30.
+    :type max_iter: int, optional
+    :param solver: The solver used for each iteration. Defaults to `None`, in which case a new one is created.
+    :type solver: LinearSolver, optional
+    :param tol: The relative change in the displacements and axial forces below which the P-Delta iterations are considered converged. Defaults to 0.001.
+    :type tol: float, optional
+    :raises ValueError: Occurs when there is a singularity in the stiffness matrix, which indicates an unstable structure.
+    :raises Exception: Occurs when the analysis fails to converge.
+    """
+
+    if solver is None:
+        solver = LinearSolver(sparse)
+
+    # Get the partitioned global fixed end reaction vector
+    FER1, FER2 = _partition(model, model.FER(combo.name), D1_indices, D2_indices)
+
+    # Get the partitioned global nodal force vector       
+    P1, P2 = _partition(model, model.P(combo.name), D1_indices, D2_indices)
+
+    history = []
+    model.pdelta_history[combo.name] = history
+
+    iter_count_TC = 1  # Tracks tension/compression-only iterations
+
+    while True:
+
+        if log:
+            print('- Beginning tension/compression-only iteration #' + str(iter_count_TC))
+
+        # Partition the elastic stiffness matrix for the elements that are currently active. It
+        # doesn't change between P-Delta iterations.
+        K11, K12, K21, K22 = _partition(model, model.K(combo.name, log, check_stability, sparse), D1_indices, D2_indices)
+        geometric = _geometric_stiffness(model, combo.name, D1_indices, D2_indices, sparse)
+
+        # The first iteration is a linear solution (all axial forces are taken as zero)
+        axial = zeros(geometric['members'])
+        D1_last = zeros((len(D1_indices), 1))
+        history.clear()
+        convergence_TC = True
+        convergence_PD = False
+
+        for iter_count_PD in range(1, max_iter + 1):
+
+            if iter_count_PD == 1:
+                K11_total, K12_total = K11, K12
+            else:
+                Kg11, Kg12 = _scale_geometric_stiffness(geometric, axial, sparse)
+                K11_total, K12_total = K11 + Kg11, K12 + Kg12
+
+            if log: print('- Calculating the global displacement vector (P-Delta iteration #' + str(iter_count_PD) + ')')
+            if K11.shape == (0, 0):
+                # All displacements are known, so D1 is an empty vector
+                D1 = zeros((0, 1))
+            else:
+                try:
+                    if sparse == True:
+                        D1 = solver.solve(K11_total, subtract(subtract(P1, FER1), K12_total @ D2))
+                    else:
+                        D1 = solver.solve(K11_total, subtract(subtract(P1, FER1), matmul(K12_total, D2)))
+                except:
+                    # Return out of the method if 'K' is singular and provide an error message
+                    raise ValueError('The stiffness matrix is singular, which indicates that the structure is unstable.')
+
+            _store_displacements(model, D1, D2, D1_indices, D2_indices, combo)
+
+            # Check whether the tension/compression-only analysis has converged and deactivate any
+            # members that are showing forces they can't hold
+            convergence_TC = _check_TC_convergence(model, combo.name, log)
+            if convergence_TC == False:
+                break
+
+            # Measure the change in the displacements and axial forces since the last iteration
+            axial_last = axial
+            axial = _axial_forces(geometric, model._D[combo.name])
+            change_D = _relative_change(D1, D1_last)
+            change_P = _relative_change(axial, axial_last)
+            history.append((iter_count_PD, change_D, change_P))
+            D1_last = D1
+
+            if log: print('- P-Delta iteration #' + str(iter_count_PD) + ': displacement change = ' + str(change_D) + ', axial force change = ' + str(change_P))
+
+            # At least 2 iterations are needed for the axial forces to affect the solution
+            if iter_count_PD >= 2 and change_D <= tol and change_P <= tol:
+                convergence_PD = True
+                break
+
+        if convergence_TC == True:
+            if convergence_PD == False:
+                raise Exception('- P-Delta analysis did not converge within ' + str(max_iter) + ' iterations')
+            if log: print('- P-Delta analysis converged after ' + str(len(history)) + ' iteration(s)')
+            break
+
+        if log:
+            print('- Tension/compression-only analysis did not converge on this iteration')
+            print('- Stiffness matrix will be adjusted')
+            print('- P-Delta analysis will be restarted')
+
+        # Check for divergence in the tension/compression-only analysis
+        iter_count_TC += 1
+        if iter_count_TC > max_iter:
+            raise Exception('- Model diverged during tension/compression-only analysis')
+
+    # Flag the model as solved
+    model.solution = 'P-Delta'
+
+def _relative_change(new, old):
+    """Returns the norm of the change from `old` to `new`, relative to the norm of `new`."""
+
+    size = norm(new)
+    if size == 0:
+        return 0.0 if norm(old) == 0 else 1.0
+    return float(norm(new - old)/size)
+
+def _geometric_stiffness(model, combo_name, D1_indices, D2_indices, sparse=True):
+    """Prepares the geometric stiffness of the active members for a load combination.
+
+    A member's geometric stiffness matrix is proportional to its axial force, so each member's matrix for a unit axial force is calculated once. Its terms are stacked with the positions they take in the partitioned matrices K11 and K12, so that the geometric stiffness for any set of axial forces can be formed with `_scale_geometric_stiffness`. The axial forces themselves are a linear function of the global displacements, with coefficients stored here for `_axial_forces`.
+
+    :param model: The finite element model being evaluated.
+    :type model: FEModel3D
+    :param combo_name: The name of the load combination.
+    :type combo_name: str
+    :param D1_indices: The degree of freedom indices for each unknown displacement.
+    :type D1_indices: array
+    :param D2_indices: The degree of freedom indices for each known displacement.
+    :type D2_indices: array
+    :return: The precomputed terms.
+    :rtype: dict
+    """
+
+    members = list(model._active_members(combo_name))
+    n1, n2 = len(D1_indices), len(D2_indices)
+
+    # Position of each global degree of freedom in D1 or D2 (or -1)
+    size = len(model.nodes)*6
+    pos1 = -ones(size, dtype=int)
+    pos1[D1_indices] = arange(n1)
+    pos2 = -ones(size, dtype=int)
+    pos2[D2_indices] = arange(n2)
+
+    geometric = {'members': len(members), 'shape11': (n1, n1), 'shape12': (n1, n2)}
+
+    if not members:
+        geometric['dofs'] = zeros((0, 12), dtype=int)
+        geometric['axial'] = zeros((0, 12))
+        geometric['unit'] = zeros(0)
+        geometric['owner'] = zeros(0, dtype=int)
+        geometric['index11'] = geometric['index12'] = (zeros(0, dtype=bool), zeros(0, dtype=int), zeros(0, dtype=int))
+        return geometric
+
+    dofs, unit = _element_group(members, lambda member: member.Kg(1.0))
+
+    # P = EA/L*(d[6] - d[0]), where d = T*D is the member's local displacement vector
+    geometric['dofs'] = dofs
+    axial = []
+    for member in members:
+        T = member.T()
+        axial.append(member.material.E*member.section.A/member.L()*(T[6, :] - T[0, :]))
+    geometric['axial'] = array(axial)
+
+    n = dofs.shape[1]
+    row = repeat(dofs, n, axis=1).ravel()
+    col = tile(dofs, (1, n)).ravel()
+    geometric['unit'] = unit.ravel()
+    geometric['owner'] = repeat(arange(len(members)), n*n)
+
+    # Keep only the terms that fall in K11 and K12, with their partitioned row and column numbers
+    rows1 = pos1[row]
+    in11 = (rows1 >= 0) & (pos1[col] >= 0)
+    in12 = (rows1 >= 0) & (pos2[col] >= 0)
+    geometric['index11'] = (in11, rows1[in11], pos1[col][in11])
+    geometric['index12'] = (in12, rows1[in12], pos2[col][in12])
+
+    return geometric
+
+def _axial_forces(geometric, D):
+    """Returns the axial force in each member prepared by `_geometric_stiffness` for a global displacement vector."""
+
+    return (geometric['axial']*D[geometric['dofs'], 0]).sum(axis=1)
+
+def _scale_geometric_stiffness(geometric, axial, sparse=True):
+    """Returns the partitioned geometric stiffness matrices Kg11 and Kg12 for the given member axial forces."""
+
+    data = geometric['unit']*axial[geometric['owner']]
+
+    blocks = []
+    for key, shape in (('index11', geometric['shape11']), ('index12', geometric['shape12'])):
+        mask, rows, cols = geometric[key]
+        if sparse:
+            from scipy.sparse import coo_matrix
+            blocks.append(coo_matrix((data[mask], (rows, cols)), shape=shape).tocsr())
+        else:
+            block = zeros(shape)
+            add.at(block, (rows, cols), data[mask])
+            blocks.append(block)
+
+    return blocks
+
+def _solve_combos(model, combo_list, solve_combo, D1_indices, D2_indices, D2, sparse=True, workers=None, **kwargs):
+    """Solves each load combination in a list with `solve_combo`, either one after another or in a pool of worker processes.
+
+    Load combinations are independent of each other once the model has been prepared and partitioned. When more than one worker is requested, a snapshot of the prepared model is sent to each worker process once, each load combination is solved by one of the workers, and the displacements and active element states for the load combination are copied back into the model.
+
+    :param model: The prepared finite element model.
+    :type model: FEModel3D
+    :param combo_list: The load combinations to solve.
+    :type combo_list: list
+    :param solve_combo: The function that solves one load combination, such as `_TC_combo` or `_PDelta_combo`. It must be defined at module level so worker processes can find it.
+    :type solve_combo: function
+    :param D1_indices: The degree of freedom indices for each unknown displacement.
+    :type D1_indices: array
+    :param D2_indices: The degree of freedom indices for each known displacement.
+    :type D2_indices: array
+    :param D2: The known (enforced) displacements.
+    :type D2: array
+    :param sparse: Indicates whether the sparse solver should be used. Defaults to True.
+    :type sparse: bool, optional
+    :param workers: The number of worker processes to use. Defaults to `None`, in which case the load combinations are solved in this process. Nodal tension/compression-only springs hold a single active state rather than one per load combination, so with workers each load combination starts from the state the springs were in before the analysis, and the states found for the last load combination are kept.
+    :type workers: int, optional
+    :param kwargs: Additional keyword arguments for `solve_combo`.
+    """
+
+    combo_list = list(combo_list)
+
+    if workers is None or workers <= 1 or len(combo_list) <= 1:
+
+        # The solver keeps its factorization of K11 between load combinations and iterations. It is only refactored (or given a low-rank update) when elements are switched on or off.
+        solver = LinearSolver(sparse)
+        for combo in combo_list:
+            solve_combo(model, combo, D1_indices, D2_indices, D2, sparse=sparse, solver=solver, **kwargs)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Calculate the element matrices and the load vectors before taking the snapshot, so they are
+    # cached in it rather than recalculated by every worker. The reactions need them here anyway.
+    model.K(combo_list[0].name, check_stability=False, sparse=sparse)
+    _case_load_vectors(model)
+
+    snapshot = _model_snapshot(model)
+    with ProcessPoolExecutor(max_workers=min(workers, len(combo_list)), initializer=_init_worker,
+                             initargs=(snapshot, D1_indices, D2_indices, D2, sparse)) as pool:
+        states = pool.map(_solve_combo_in_worker, [(solve_combo, combo.name, kwargs) for combo in combo_list])
+
+        # Results are merged back in the order of the load combinations
+        for combo, state in zip(combo_list, states):
+            _restore_combo_state(model, combo.name, state)
+
+def _model_snapshot(model):
+    """Returns a picklable copy of a prepared model for sending to worker processes.
+
+    The whole model is sent rather than just its matrices and load vectors, since the workers
+    solve each load combination with the same element objects as a sequential analysis: the
+    tension/compression-only checks switch elements on and off, and P-Delta recalculates the
+    member axial forces. Most of the snapshot is the elements' cached matrices, which the workers
+    would otherwise have to recalculate.
+
+    :param model: The prepared finite element model.
+    :type model: FEModel3D
+    :return: The pickled model.
+    :rtype: bytes
+    """
+
+    # The spatial index of the nodes is keyed on object ids, which don't survive pickling. Workers don't need it.
+    node_index = model._node_index
+    model._node_index = None
+    try:
+        return pickle.dumps(model, pickle.HIGHEST_PROTOCOL)
+    finally:
+        model._node_index = node_index
+
+# The model and partitioning held by each worker process, set by `_init_worker`
+_worker = {}
+
+def _init_worker(snapshot, D1_indices, D2_indices, D2, sparse):
+    """Loads the model snapshot in a worker process."""
+
+    _worker['model'] = pickle.loads(snapshot)
+    _worker['partition'] = (D1_indices, D2_indices, D2)
+    _worker['sparse'] = sparse
+    _worker['solver'] = LinearSolver(sparse)
+    _worker['node_springs'] = _node_spring_states(_worker['model'])
+
+def _solve_combo_in_worker(task):
+    """Solves one load combination in a worker process and returns its results (see `_combo_state`)."""
+
+    solve_combo, combo_name, kwargs = task
+    model = _worker['model']
+
+    # Start every load combination from the nodal spring states of the snapshot
+    _set_node_spring_states(model, _worker['node_springs'])
+
+    solve_combo(model, model.load_combos[combo_name], *_worker['partition'], sparse=_worker['sparse'], solver=_worker['solver'], **kwargs)
+
+    return _combo_state(model, combo_name)
+
+def _node_spring_states(model):
+    """Returns the active state of each nodal spring, in node order."""
+
+    return [[getattr(node, 'spring_' + direction)[2] for direction in ('DX', 'DY', 'DZ', 'RX', 'RY', 'RZ')] for node in model.nodes.values()]
+
+def _set_node_spring_states(model, states):
+    """Sets the active state of each nodal spring from `_node_spring_states`."""
+
+    for node, node_states in zip(model.nodes.values(), states):
+        for direction, state in zip(('DX', 'DY', 'DZ', 'RX', 'RY', 'RZ'), node_states):
+            getattr(node, 'spring_' + direction)[2] = state
+
+def _combo_state(model, combo_name):
+    """Returns the results of a solved load combination that need to be copied back from a worker process: the global displacement vector and the active state of each element.
+
+    :param model: The finite element model.
+    :type model: FEModel3D
+    :param combo_name: The name of the load combination.
+    :type combo_name: str
+    :rtype: dict
+    """
+
+    return {'D': model._D[combo_name],
+            'springs': {name: spring.active[combo_name] for name, spring in model.springs.items()},
+            'members': {name: (phys_member.active[combo_name], {sub_name: sub_member.active[combo_name] for sub_name, sub_member in phys_member.sub_members.items()})
+                        for name, phys_member in model.members.items()},
+            'node_springs': _node_spring_states(model),
+            'pdelta_history': model.pdelta_history.get(combo_name)}
+
+def _restore_combo_state(model, combo_name, state):
+    """Copies the results returned by `_combo_state` into the model.
+
+    :param model: The finite element model.
+    :type model: FEModel3D
+    :param combo_name: The name of the load combination.
+    :type combo_name: str
+    :param state: The results of the load combination.
+    :type state: dict
+    """
+
+    D = state['D']
+    model._D[combo_name] = D
+
+    for name, active in state['springs'].items():
+        model.springs[name].active[combo_name] = active
+
+    for name, (active, sub_active) in state['members'].items():
+        phys_member = model.members[name]
+        phys_member.active[combo_name] = active
+        for sub_name, sub_member in phys_member.sub_members.items():
+            sub_member.active[combo_name] = sub_active[sub_name]
+            sub_member._clear_segments()
+
+    _set_node_spring_states(model, state['node_springs'])
+
+    if state['pdelta_history'] is not None:
+        model.pdelta_history[combo_name] = state['pdelta_history']
+
+def _pushover_step(model, combo_name, push_combo, step_num, P1, FER1, D1_indices, D2_indices, D2, log=True, sparse=True, check_stability=False, solver=None):
+
+    if solver is None:
+        solver = LinearSolver(sparse)
 
     # Run at least one iteration
     run_step = True
@@ -279,46 +714,23 @@ def _pushover_step(model, combo_name, push_combo, step_num, P1, FER1, D1_indices
 
         # Calculate the partitioned global stiffness matrices
         # Sparse solver
-        if sparse == True:
+        # Calculate the partitioned global stiffness matrices. Sparse matrices are partitioned
+        # into `csr` submatrices, which the `+` operator adds directly.
 
-            from scipy.sparse.linalg import spsolve
-            
-            # Calculate the initial stiffness matrix
-            K11, K12, K21, K22 = _partition(model, model.K(combo_name, log, check_stability, sparse).tolil(), D1_indices, D2_indices)
+        # Initial stiffness matrix
+        K11, K12, K21, K22 = _partition(model, model.K(combo_name, log, check_stability, sparse), D1_indices, D2_indices)
 
-            # Calculate the geometric stiffness matrix
-            # The `combo_name` variable in the code below is not the name of the pushover load combination. Rather it is the name of the primary combination that the pushover load will be added to. Axial loads used to develop Kg are calculated from the displacements stored in `combo_name`.
-            Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, False).tolil(), D1_indices, D2_indices)
+        # Geometric stiffness matrix
+        # The `combo_name` variable in the code below is not the name of the pushover load combination. Rather it is the name of the primary combination that the pushover load will be added to. Axial loads used to develop Kg are calculated from the displacements stored in `combo_name`.
+        Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
 
-            # Calculate the stiffness reduction matrix
-            Km11, Km12, Km21, Km22 = _partition(model, model.Km(combo_name, push_combo, step_num, log, sparse).tolil(), D1_indices, D2_indices)
-            
-            # The stiffness matrices are currently `lil` format which is great for
-            # memory, but slow for mathematical operations. They will be converted to
-            # `csr` format. The `+` operator performs matrix addition on `csr`
-            # matrices.
-            K11 = K11.tocsr() + Kg11.tocsr() + Km11.tocsr()
-            K12 = K12.tocsr() + Kg12.tocsr() + Km12.tocsr()
-            K21 = K21.tocsr() + Kg21.tocsr() + Km21.tocsr()
-            K22 = K22.tocsr() + Kg22.tocsr() + Km22.tocsr()
-
-        # Dense solver
-        else:
+        # Calculate the stiffness reduction matrix
+        Km11, Km12, Km21, Km22 = _partition(model, model.Km(combo_name, push_combo, step_num, log, sparse), D1_indices, D2_indices)
 
-            # Initial stiffness matrix
-            K11, K12, K21, K22 = _partition(model, model.K(combo_name, log, check_stability, sparse), D1_indices, D2_indices)
-            
-            # Geometric stiffness matrix
-            # The `combo_name` variable in the code below is not the name of the pushover load combination. Rather it is the name of the primary combination that the pushover load will be added to. Axial loads used to develop Kg are calculated from the displacements stored in `combo_name`.
-            Kg11, Kg12, Kg21, Kg22 = _partition(model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
-            
-            # Calculate the stiffness reduction matrix
-            Km11, Km12, Km21, Km22 = _partition(model, model.Km(combo_name, push_combo, step_num, log, sparse), D1_indices, D2_indices)
-            
-            K11 = K11 + Kg11 + Km11
-            K12 = K12 + Kg12 + Km12
-            K21 = K21 + Kg21 + Km21
-            K22 = K22 + Kg22 + Km22
+        K11 = K11 + Kg11 + Km11
+        K12 = K12 + Kg12 + Km12
+        K21 = K21 + Kg21 + Km21
+        K22 = K22 + Kg22 + Km22
         
         # Calculate the changes to the global displacement vector
         if log: print('- Calculating changes to the global displacement vector')
@@ -331,12 +743,11 @@ def _pushover_step(model, combo_name, push_combo, step_num, P1, FER1, D1_indices
                 if sparse == True:
                     # The partitioned stiffness matrix is already in `csr` format. The `@`
                     # operator performs matrix multiplication on sparse matrices.
-                    Delta_D1 = spsolve(K11.tocsr(), subtract(subtract(P1, FER1), K12.tocsr() @ D2))
-                    Delta_D1 = Delta_D1.reshape(len(Delta_D1), 1)
+                    Delta_D1 = solver.solve(K11, subtract(subtract(P1, FER1), K12 @ D2))
                 else:
                     # The partitioned stiffness matrix is in `csr` format. It will be
                     # converted to a 2D dense array for mathematical operations.
-                    Delta_D1 = solve(K11, subtract(subtract(P1, FER1), matmul(K12, D2)))
+                    Delta_D1 = solver.solve(K11, subtract(subtract(P1, FER1), matmul(K12, D2)))
 
             except:
                 # Return out of the method if 'K' is singular and provide an error message
@@ -381,39 +792,31 @@ def _unpartition_disp(model, D1, D2, D1_indices, D2_indices):
 
     :param model: The finite element model being evaluated
     :type model: FEModel3D
-    :param D1: An array of calculated displacements
+    :param D1: An array of calculated displacements, with one column per load combination
     :type D1: array
     :param D2: An array of enforced displacements
     :type D2: array
-    :param D1_indices: A list of the degree of freedom indices for each displacement in D1
-    :type D1_indices: list
-    :param D2_indices: A list of the degree of freedom indices for each displacement in D2
-    :type D2_indices: list
-    :return: Global displacement matrix
+    :param D1_indices: The degree of freedom indices for each displacement in D1
+    :type D1_indices: array
+    :param D2_indices: The degree of freedom indices for each displacement in D2
+    :type D2_indices: array
+    :return: Global displacement matrix, with the same number of columns as `D1`
     :rtype: array
     """
     
-    D = zeros((len(model.nodes)*6, 1))
+    # `D1` is an empty list when every displacement is known
+    D1 = array(D1)
+    D = zeros((len(model.nodes)*6, D1.shape[1] if D1.ndim == 2 else 1))
 
-    # Step through each node in the model
-    for node in model.nodes.values():
-        
-        # Step through each degree of freedom at the node
-        for i in range(6):
+    # Place the enforced and calculated displacements at their degrees of freedom
+    D[D2_indices, :] = D2
+    D[D1_indices, :] = D1.reshape(len(D1_indices), D.shape[1])
 
-            # Check if the dof is in the list of enforced displacements
-            if node.ID*6 + i in D2_indices:
-                # Get the enforced displacement
-                D[(node.ID*6 + i, 0)] = D2[D2_indices.index(node.ID*6 + i), 0]
-            else:
-                # Get the calculated displacement
-                D[(node.ID*6 + i, 0)] = D1[D1_indices.index(node.ID*6 + i), 0]
-    
     # Return the displacement vector
     return D
 
 def _store_displacements(model, D1, D2, D1_indices, D2_indices, combo):
-    """Stores calculated displacements from the solver into the model's displacement vector `_D` and into each node object in the model
+    """Stores calculated displacements from the solver into the model's displacement vector `_D`. The nodes read their displacements from it.
 
     :param model: The finite element model being evaluated.
     :type model: FEModel3D
@@ -421,10 +824,10 @@ def _store_displacements(model, D1, D2, D1_indices, D2_indices, combo):
     :type D1: array
     :param D2: An array of enforced displacements
     :type D2: array
-    :param D1_indices: A list of the degree of freedom indices for each displacement in D1
-    :type D1_indices: list
-    :param D2_indices: A list of the degree of freedom indices for each displacement in D2
-    :type D2_indices: list
+    :param D1_indices: The degree of freedom indices for each displacement in D1
+    :type D1_indices: array
+    :param D2_indices: The degree of freedom indices for each displacement in D2
+    :type D2_indices: array
     :param combo: The load combination to store the displacements for
     :type combo: LoadCombo
     """
@@ -435,18 +838,181 @@ def _store_displacements(model, D1, D2, D1_indices, D2_indices, combo):
     # Store the displacements in the model's global displacement vector
     model._D[combo.name] = D
 
-    # Store the calculated global nodal displacements into each node object
-    for node in model.nodes.values():
+def _identify_cases(combo_list):
+    """Returns the names of the primitive load cases used by a list of load combinations, in the
+    order they are first encountered.
+
+    :param combo_list: The load combinations to be evaluated.
+    :type combo_list: list
+    :return: The load case names.
+    :rtype: list
+    """
+
+    cases = []
+    for combo in combo_list:
+        for case in combo.factors.keys():
+            if case not in cases:
+                cases.append(case)
+
+    return cases
+
+# The position of each nodal load direction in a node's degrees of freedom
+_NODE_LOAD_DOFS = {'FX': 0, 'FY': 1, 'FZ': 2, 'MX': 3, 'MY': 4, 'MZ': 5}
+
+def _case_load_vectors(model):
+    """Returns the global nodal force vector and fixed end reaction vector for each primitive load
+    case in the model, as if each case were a load combination with a load factor of 1.0. The
+    vectors for any load combination are combinations of these (see `_combo_factors`).
+
+    The vectors are cached in `model._load_vectors` until the model or its loads change (see
+    `FEModel3D.revision` and `FEModel3D.load_revision`).
+
+    :param model: The finite element model being evaluated.
+    :type model: FEModel3D
+    :return: The column of each load case, and the global nodal force vectors and fixed end
+             reaction vectors for the load cases stored column by column in two
+             `(n_dofs, n_cases)` arrays.
+    :rtype: dict, array, array
+    """
+
+    key = (model.revision, model.load_revision)
+    if model._load_vectors is not None and model._load_vectors[0] == key:
+        return model._load_vectors[1:]
+
+    cases = {case: i for i, case in enumerate(model.load_cases)}
+    size = len(model.nodes)*6
+
+    # Scatter all the nodal loads into the nodal force vectors at once
+    P = zeros((size, len(cases)))
+    loads = [(node.ID*6 + _NODE_LOAD_DOFS[load[0]], cases[load[2]], load[1]) for node in model.nodes.values() for load in node.NodeLoads]
+    if loads:
+        rows, columns, values = zip(*loads)
+        add.at(P, (array(rows), array(columns)), array(values, dtype=float))
+
+    # Only the elements carrying loads in a load case have fixed end reactions for it
+    loaded = {case: [] for case in cases}
+    for phys_member in model.members.values():
+        for member in phys_member.sub_members.values():
+            for case in {load[3] for load in member.PtLoads} | {load[5] for load in member.DistLoads}:
+                loaded[case].append(member)
+    for element in list(model.plates.values()) + list(model.quads.values()):
+        for case in {pressure[1] for pressure in element.pressures}:
+            loaded[case].append(element)
+
+    # Elements look up load factors by load combination name, so the model's load combinations are
+    # temporarily replaced by a single-case load combination for each case. The model's own
+    # dictionary is left untouched, since callers may be iterating over it.
+    load_combos = model.load_combos
+    model.load_combos = {case: LoadCombo(case, factors={case: 1.0}) for case in cases}
+    FER = zeros((size, len(cases)))
+    try:
+        for case, i in cases.items():
+            if loaded[case]:
+                FER[:, i] = _assemble_vector(size, _element_groups(loaded[case], lambda element: element.FER(case)))[:, 0]
+    finally:
+        model.load_combos = load_combos
+
+    model._load_vectors = (key, cases, P, FER)
+
+    return cases, P, FER
+
+def _combo_factors(combo, cases):
+    """Returns the load factors of a load combination as a column vector matching the columns of
+    the load case vectors from `_case_load_vectors`. Load cases without any loads are ignored.
+
+    :param combo: The load combination.
+    :type combo: LoadCombo
+    :param cases: The column of each load case.
+    :type cases: dict
+    :return: The `(n_cases, 1)` vector of load factors.
+    :rtype: array
+    """
+
+    factors = zeros((len(cases), 1))
+    for case, factor in combo.factors.items():
+        if case in cases:
+            factors[cases[case], 0] += factor
+
+    return factors
+
+def _superimpose_cases(model, K11, K12, D1_indices, D2_indices, D2, combo_list, log=False, sparse=True, solver=None):
+    """Solves a linear model once for each primitive load case and forms the displacements for each
+    load combination by linear superposition of the load case results. `K11` is factored only once
+    and all load cases are solved together as a block of right-hand sides. Enforced displacements
+    are not factored by load combinations, so they are solved for separately and added to every
+    load combination in full.
+
+    :param model: The finite element model being evaluated.
+    :type model: FEModel3D
+    :param K11: The partitioned stiffness matrix for the unknown degrees of freedom.
+    :type K11: csr_matrix or array
+    :param K12: The partitioned stiffness matrix coupling the unknown and known degrees of freedom.
+    :type K12: csr_matrix or array
+    :param D1_indices: The degree of freedom indices for each unknown displacement.
+    :type D1_indices: array
+    :param D2_indices: The degree of freedom indices for each known displacement.
+    :type D2_indices: array
+    :param D2: The known (enforced) displacements.
+    :type D2: array
+    :param combo_list: The load combinations to be evaluated.
+    :type combo_list: list
+    :param log: Prints updates to the console if set to True. Defaults to False.
+    :type log: bool, optional
+    :param sparse: Indicates whether the sparse solver should be used. Defaults to True.
+    :type sparse: bool, optional
+    :param solver: The solver used to factor `K11`. Defaults to `None`, in which case a new one is created.
+    :type solver: LinearSolver, optional
+    :raises Exception: Occurs when a singular stiffness matrix is found.
+    """
 
-        node.DX[combo.name] = D[node.ID*6 + 0, 0]
-        node.DY[combo.name] = D[node.ID*6 + 1, 0]
-        node.DZ[combo.name] = D[node.ID*6 + 2, 0]
-        node.RX[combo.name] = D[node.ID*6 + 3, 0]
-        node.RY[combo.name] = D[node.ID*6 + 4, 0]
-        node.RZ[combo.name] = D[node.ID*6 + 5, 0]
+    if solver is None:
+        solver = LinearSolver(sparse)
+
+    # Get the nodal force and fixed end reaction vectors for each load case. Load cases without any
+    # loads don't need to be solved.
+    columns, P, FER = _case_load_vectors(model)
+    cases = [case for case in _identify_cases(combo_list) if case in columns]
+
+    if log:
+        print('')
+        print('- Solving ' + str(len(cases)) + ' load case(s) for ' + str(len(combo_list)) + ' load combination(s) by superposition')
+
+    # Partition them
+    P1 = P[D1_indices, :][:, [columns[case] for case in cases]]
+    FER1 = FER[D1_indices, :][:, [columns[case] for case in cases]]
+
+    if K11.shape == (0, 0):
+        # All displacements are known, so D1 is an empty vector
+        D1_cases = zeros((0, len(cases)))
+        D1_enforced = zeros((0, 1))
+    else:
+        try:
+            # Build one right-hand side per load case, and a final one for the enforced displacements
+            if sparse == True:
+                RHS = hstack((subtract(P1, FER1), -(K12 @ D2)))
+            else:
+                RHS = hstack((subtract(P1, FER1), -matmul(K12, D2)))
+            D1_all = solver.solve(K11, RHS)
+        except:
+            # Return out of the method if 'K' is singular and provide an error message
+            raise Exception('The stiffness matrix is singular, which implies rigid body motion. The structure is unstable. Aborting analysis.')
+
+        D1_cases = D1_all[:, :-1]
+        D1_enforced = D1_all[:, -1:]
+
+    # Superimpose the load case displacements for all the load combinations at once
+    columns = {case: i for i, case in enumerate(cases)}
+    factors = zeros((len(cases), len(combo_list)))
+    for j, combo in enumerate(combo_list):
+        factors[:, j] = _combo_factors(combo, columns)[:, 0]
+    D = _unpartition_disp(model, matmul(D1_cases, factors) + D1_enforced, D2, D1_indices, D2_indices)
+
+    # Each load combination's global displacement vector is a column of the same array
+    for j, combo in enumerate(combo_list):
+        model._D[combo.name] = D[:, j:j+1]
 
 def _sum_displacements(model, Delta_D1, Delta_D2, D1_indices, D2_indices, combo):
-    """Sums calculated displacements for a load step from the solver into the model's displacement vector `_D` and into each node object in the model.
+    """Sums calculated displacements for a load step from the solver into the model's displacement vector `_D`. The nodes read their displacements from it.
 
     :param model: The finite element model being evaluated.
     :type model: FEModel3D
@@ -454,10 +1020,10 @@ def _sum_displacements(model, Delta_D1, Delta_D2, D1_indices, D2_indices, combo)
     :type Delta_D1: array
     :param Delta_D2: An array of enforced displacements for a load step
     :type Delta_D2: array
-    :param D1_indices: A list of the degree of freedom indices for each displacement in D1
-    :type D1_indices: list
-    :param D2_indices: A list of the degree of freedom indices for each displacement in D2
-    :type D2_indices: list
+    :param D1_indices: The degree of freedom indices for each displacement in D1
+    :type D1_indices: array
+    :param D2_indices: The degree of freedom indices for each displacement in D2
+    :type D2_indices: array
     :param combo: The load combination to store the displacements for
     :type combo: LoadCombo
     """
@@ -465,18 +1031,10 @@ def _sum_displacements(model, Delta_D1, Delta_D2, D1_indices, D2_indices, combo)
     # The raw results from the solver are partitioned. Unpartition them.
     Delta_D = _unpartition_disp(model, Delta_D1, Delta_D2, D1_indices, D2_indices)
 
-    # Sum the load step's global displacement vector with the model's global displacement vector
-    model._D[combo.name] += Delta_D
-
-    # Sum the load step's calculated global nodal displacements to each node object's global displacement
-    for node in model.nodes.values():
-
-        node.DX[combo.name] += Delta_D[node.ID*6 + 0, 0]
-        node.DY[combo.name] += Delta_D[node.ID*6 + 1, 0]
-        node.DZ[combo.name] += Delta_D[node.ID*6 + 2, 0]
-        node.RX[combo.name] += Delta_D[node.ID*6 + 3, 0]
-        node.RY[combo.name] += Delta_D[node.ID*6 + 4, 0]
-        node.RZ[combo.name] += Delta_D[node.ID*6 + 5, 0]
+    # Sum the load step's global displacement vector with the model's global displacement vector.
+    # A new vector is stored rather than adding in place, so results cached against the old vector
+    # (see `Mesh._results`) are recalculated.
+    model._D[combo.name] = model._D[combo.name] + Delta_D
 
 def _check_TC_convergence(model, combo_name="Combo 1", log=True, spring_tolerance=0, member_tolerance=0):
 
@@ -564,9 +1122,9 @@ def _check_TC_convergence(model, combo_name="Combo 1", log=True, spring_toleranc
                 # Flag the analysis as not converged
                 convergence = False
 
-        # Reset the sub-member's flag to unsolved. This will allow it to resolve for the same load combination after subsequent iterations have made further changes.
+        # Discard the sub-member's segments. This will allow it to resolve for the same load combination after subsequent iterations have made further changes.
         for sub_member in phys_member.sub_members.values():
-            sub_member._solved_combo = None
+            sub_member._clear_segments()
 
     # Return whether the TC analysis has converged
     return convergence
@@ -575,6 +1133,12 @@ def _calc_reactions(model, log=False, combo_tags=None):
     """
     Calculates reactions internally once the model is solved.
 
+    Reactions at supported degrees of freedom are calculated from the partitioned product
+    `K·D + FER - P`, using only the rows of the stiffness matrix belonging to supported nodes. The
+    elements contributing to those rows are found with the node-to-element index built by
+    `_renumber`. Load combinations that share the same set of active springs and members share the
+    same stiffness rows, so their reactions are calculated together in one product.
+
     Parameters
     ----------
     model : FEModel3D
@@ -591,252 +1155,160 @@ def _calc_reactions(model, log=False, combo_tags=None):
     # Identify which load combinations to evaluate
     combo_list = _identify_combos(model, combo_tags)
 
-    # Calculate the reactions node by node
-    for node in model.nodes.values():
-        
-        # Step through each load combination
+    nodes = _nodes_by_ID(model)
+    size = len(nodes)*6
+
+    # Initialize the reactions for every node and load combination. They are stored as the columns
+    # of a single array, and each load combination's global reaction vector is a view of its column.
+    R_all = zeros((size, len(combo_list)))
+    columns = {}
+    for j, combo in enumerate(combo_list):
+        model._R[combo.name] = R_all[:, j:j+1]
+        columns[combo.name] = j
+
+    # Identify the supported nodes, their degrees of freedom and which of them are restrained
+    supported = [node for node in nodes if (node.support_DX or node.support_DY or node.support_DZ
+                                            or node.support_RX or node.support_RY or node.support_RZ)]
+
+    if supported and combo_list:
+
+        support_dofs = (6*array([node.ID for node in supported])[:, None] + arange(6)).ravel()
+        restrained = array([[node.support_DX, node.support_DY, node.support_DZ,
+                             node.support_RX, node.support_RY, node.support_RZ] for node in supported], dtype=bool)
+
+        # Get the elements connected to the supported nodes
+        incident = _incident_elements(model, supported)
+
+        # Group the load combinations by which of these springs and members are active
+        combo_groups = {}
         for combo in combo_list:
-            
-            # Initialize reactions for this node and load combination
-            node.RxnFX[combo.name] = 0.0
-            node.RxnFY[combo.name] = 0.0
-            node.RxnFZ[combo.name] = 0.0
-            node.RxnMX[combo.name] = 0.0
-            node.RxnMY[combo.name] = 0.0
-            node.RxnMZ[combo.name] = 0.0
-
-            # Determine if the node has any supports
-            if (node.support_DX or node.support_DY or node.support_DZ 
-            or  node.support_RX or node.support_RY or node.support_RZ):
-
-                # Sum the spring end forces at the node
-                for spring in model.springs.values():
-
-                    if spring.i_node == node and spring.active[combo.name] == True:
-                        
-                        # Get the spring's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        spring_F = spring.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += spring_F[0, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += spring_F[1, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += spring_F[2, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += spring_F[3, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += spring_F[4, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += spring_F[5, 0]
-
-                    elif spring.j_node == node and spring.active[combo.name] == True:
-                    
-                        # Get the spring's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        spring_F = spring.F(combo.name)
-                    
-                        if node.support_DX: node.RxnFX[combo.name] += spring_F[6, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += spring_F[7, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += spring_F[8, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += spring_F[9, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += spring_F[10, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += spring_F[11, 0]
-
-                # Step through each physical member in the model
-                for phys_member in model.members.values():
-
-                    # Sum the sub-member end forces at the node
-                    for member in phys_member.sub_members.values():
-                        
-                        if member.i_node == node and phys_member.active[combo.name] == True:
-                        
-                            # Get the member's global force matrix
-                            # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                            member_F = member.F(combo.name)
-
-                            if node.support_DX: node.RxnFX[combo.name] += member_F[0, 0]
-                            if node.support_DY: node.RxnFY[combo.name] += member_F[1, 0]
-                            if node.support_DZ: node.RxnFZ[combo.name] += member_F[2, 0]
-                            if node.support_RX: node.RxnMX[combo.name] += member_F[3, 0]
-                            if node.support_RY: node.RxnMY[combo.name] += member_F[4, 0]
-                            if node.support_RZ: node.RxnMZ[combo.name] += member_F[5, 0]
-
-                        elif member.j_node == node and phys_member.active[combo.name] == True:
-                        
-                            # Get the member's global force matrix
-                            # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                            member_F = member.F(combo.name)
-                        
-                            if node.support_DX: node.RxnFX[combo.name] += member_F[6, 0]
-                            if node.support_DY: node.RxnFY[combo.name] += member_F[7, 0]
-                            if node.support_DZ: node.RxnFZ[combo.name] += member_F[8, 0]
-                            if node.support_RX: node.RxnMX[combo.name] += member_F[9, 0]
-                            if node.support_RY: node.RxnMY[combo.name] += member_F[10, 0]
-                            if node.support_RZ: node.RxnMZ[combo.name] += member_F[11, 0]
+            key = tuple(owner.active[combo.name] for element, owner in incident if owner is not None)
+            combo_groups.setdefault(key, []).append(combo)
 
-                # Sum the plate forces at the node
-                for plate in model.plates.values():
+        for combos in combo_groups.values():
 
-                    if plate.i_node == node:
+            # Only active springs and members contribute to the reactions. Springs have no fixed end reactions.
+            active = [element for element, owner in incident if owner is None or owner.active[combos[0].name] == True]
+            members = [element for element in active if isinstance(element, Member3D)]
+            loaded = [element for element in active if not isinstance(element, Spring3D)]
 
-                        # Get the plate's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        plate_F = plate.F(combo.name)
-                
-                        if node.support_DX: node.RxnFX[combo.name] += plate_F[0, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += plate_F[1, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += plate_F[2, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += plate_F[3, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += plate_F[4, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += plate_F[5, 0]
-
-                    elif plate.j_node == node:
-
-                        # Get the plate's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        plate_F = plate.F(combo.name)
-                
-                        if node.support_DX: node.RxnFX[combo.name] += plate_F[6, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += plate_F[7, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += plate_F[8, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += plate_F[9, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += plate_F[10, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += plate_F[11, 0]
-
-                    elif plate.m_node == node:
-
-                        # Get the plate's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        plate_F = plate.F(combo.name)
-                
-                        if node.support_DX: node.RxnFX[combo.name] += plate_F[12, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += plate_F[13, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += plate_F[14, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += plate_F[15, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += plate_F[16, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += plate_F[17, 0]
-
-                    elif plate.n_node == node:
-
-                        # Get the plate's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        plate_F = plate.F(combo.name)
-                
-                        if node.support_DX: node.RxnFX[combo.name] += plate_F[18, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += plate_F[19, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += plate_F[20, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += plate_F[21, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += plate_F[22, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += plate_F[23, 0]
-
-                # Sum the quad forces at the node
-                for quad in model.quads.values():
-
-                    if quad.i_node == node:
-
-                        # Get the quad's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        quad_F = quad.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += quad_F[0, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += quad_F[1, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += quad_F[2, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += quad_F[3, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += quad_F[4, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += quad_F[5, 0]
-
-                    elif quad.j_node == node:
-
-                        # Get the quad's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        quad_F = quad.F(combo.name)
-                
-                        if node.support_DX: node.RxnFX[combo.name] += quad_F[6, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += quad_F[7, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += quad_F[8, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += quad_F[9, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += quad_F[10, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += quad_F[11, 0]
-
-                    elif quad.m_node == node:
-
-                        # Get the quad's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        quad_F = quad.F(combo.name)
-                
-                        if node.support_DX: node.RxnFX[combo.name] += quad_F[12, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += quad_F[13, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += quad_F[14, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += quad_F[15, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += quad_F[16, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += quad_F[17, 0]
-
-                    elif quad.n_node == node:
-
-                        # Get the quad's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        quad_F = quad.F(combo.name)
-                
-                        if node.support_DX: node.RxnFX[combo.name] += quad_F[18, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += quad_F[19, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += quad_F[20, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += quad_F[21, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += quad_F[22, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += quad_F[23, 0]
-                
-                # Sum the joint loads applied to the node
-                for load in node.NodeLoads:
+            # Pushover member end forces depend on the plastic reduction matrix, so they are taken directly from the members
+            if model.solution == 'Pushover':
+                active = [element for element in active if not isinstance(element, Member3D)]
+                loaded = [element for element in loaded if not isinstance(element, Member3D)]
 
-                    for case, factor in combo.factors.items():
-                        
-                        if load[2] == case:
-
-                            if load[0] == 'FX' and node.support_DX:
-                                node.RxnFX[combo.name] -= load[1]*factor
-                            elif load[0] == 'FY' and node.support_DY:
-                                node.RxnFY[combo.name] -= load[1]*factor
-                            elif load[0] == 'FZ' and node.support_DZ:
-                                node.RxnFZ[combo.name] -= load[1]*factor
-                            elif load[0] == 'MX' and node.support_RX:
-                                node.RxnMX[combo.name] -= load[1]*factor
-                            elif load[0] == 'MY' and node.support_RY:
-                                node.RxnMY[combo.name] -= load[1]*factor
-                            elif load[0] == 'MZ' and node.support_RZ:
-                                node.RxnMZ[combo.name] -= load[1]*factor
-            
-            # Calculate any reactions due to active spring supports at the node
-            if node.spring_DX[0] != None and node.spring_DX[2] == True:
-                sign = node.spring_DX[1]
-                k = node.spring_DX[0]
-                if sign != None: k = float(sign + str(k))
-                DX = node.DX[combo.name]
-                node.RxnFX[combo.name] += k*DX
-            if node.spring_DY[0] != None and node.spring_DY[2] == True:
-                sign = node.spring_DY[1]
-                k = node.spring_DY[0]
-                if sign != None: k = float(sign + str(k))
-                DY = node.DY[combo.name]
-                node.RxnFY[combo.name] += k*DY
-            if node.spring_DZ[0] != None and node.spring_DZ[2] == True:
-                sign = node.spring_DZ[1]
-                k = node.spring_DZ[0]
-                if sign != None: k = float(sign + str(k))
-                DZ = node.DZ[combo.name]
-                node.RxnFZ[combo.name] += k*DZ
-            if node.spring_RX[0] != None and node.spring_RX[2] == True:
-                sign = node.spring_RX[1]
-                k = node.spring_RX[0]
-                if sign != None: k = float(sign + str(k))
-                RX = node.RX[combo.name]
-                node.RxnMX[combo.name] += k*RX
-            if node.spring_RY[0] != None and node.spring_RY[2] == True:
-                sign = node.spring_RY[1]
-                k = node.spring_RY[0]
-                if sign != None: k = float(sign + str(k))
-                RY = node.RY[combo.name]
-                node.RxnMY[combo.name] += k*RY
-            if node.spring_RZ[0] != None and node.spring_RZ[2] == True:
-                sign = node.spring_RZ[1]
-                k = node.spring_RZ[0]
+            # Get the rows of the stiffness matrix for the supported degrees of freedom
+            K = _assemble_matrix(size, _stiffness_groups(active)).tocsr()[support_dofs, :]
+
+            # Calculate the reactions for all load combinations in this group at once
+            D = hstack([model._D[combo.name] for combo in combos])
+            R = K @ D
+
+            for j, combo in enumerate(combos):
+
+                # Add the fixed end reactions and subtract the nodal loads
+                FER = _assemble_vector(size, _element_groups(loaded, lambda element: element.FER(combo.name)))
+                R[:, j] += FER[support_dofs, 0] - model.P(combo.name)[support_dofs, 0]
+
+                if model.solution == 'P-Delta':
+                    # Member end forces include geometric stiffness based on each member's axial force
+                    Kg = _assemble_matrix(size, [_element_group(members, lambda member: _member_Kg(member, combo.name, False))])
+                    R[:, j] += Kg.tocsr()[support_dofs, :] @ D[:, j]
+                elif model.solution == 'Pushover':
+                    R[:, j] += _assemble_vector(size, [_element_group(members, lambda member: member.F(combo.name))])[support_dofs, 0]
+
+            # Store the reactions on the restrained degrees of freedom
+            R_all[ix_(support_dofs, [columns[combo.name] for combo in combos])] = R*restrained.reshape(-1, 1)
+
+    # Calculate any reactions due to active spring supports
+    for node in nodes:
+        for dof, node_spring in enumerate((node.spring_DX, node.spring_DY, node.spring_DZ,
+                                           node.spring_RX, node.spring_RY, node.spring_RZ)):
+
+            if node_spring[0] != None and node_spring[2] == True:
+                sign = node_spring[1]
+                k = node_spring[0]
                 if sign != None: k = float(sign + str(k))
-                RZ = node.RZ[combo.name]
-                node.RxnMZ[combo.name] += k*RZ
+                for combo in combo_list:
+                    R_all[node.ID*6 + dof, columns[combo.name]] += k*model._D[combo.name][node.ID*6 + dof, 0]
+
+def _incident_elements(model, nodes):
+    """Returns the springs, members, plates and quads connected to any of the given nodes, using the
+    node-to-element index built by `_renumber`. Each element is listed once.
+
+    :param model: The model.
+    :type model: FEModel3D
+    :param nodes: The nodes.
+    :type nodes: list
+    :return: `(element, owner)` pairs, where `owner` is the object holding the element's `active`
+             flags (the spring itself or the sub-member's physical member), or `None` for plates and
+             quads.
+    :rtype: list
+    """
+
+    node_elements = getattr(model, '_node_elements', None)
+    if node_elements is None or len(node_elements) != len(model.nodes):
+        node_elements = _build_node_elements(model)
+
+    incident = {}
+    for node in nodes:
+        for element, owner in node_elements[node.ID]:
+            incident[id(element)] = (element, owner)
+
+    return list(incident.values())
+
+def _build_node_elements(model):
+    """Builds an index of the elements connected to each node.
+
+    :param model: The model.
+    :type model: FEModel3D
+    :return: A list, indexed by node ID, of `(element, owner)` pairs for the elements connected to
+             each node. See `_incident_elements`.
+    :rtype: list
+    """
+
+    node_elements = [[] for i in range(len(model.nodes))]
+
+    for spring in model.springs.values():
+        for node in (spring.i_node, spring.j_node):
+            node_elements[node.ID].append((spring, spring))
+
+    for phys_member in model.members.values():
+        for member in phys_member.sub_members.values():
+            for node in (member.i_node, member.j_node):
+                node_elements[node.ID].append((member, phys_member))
+
+    for element in list(model.plates.values()) + list(model.quads.values()):
+        for node in (element.i_node, element.j_node, element.m_node, element.n_node):
+            node_elements[node.ID].append((element, None))
+
+    return node_elements
+
+def _member_Kg(member, combo_name, first_step=True):
+    """Returns a member's global geometric stiffness matrix, based on the axial force in the member
+    for the given load combination.
+
+    :param member: The member.
+    :type member: Member3D
+    :param combo_name: The name of the load combination to take the axial force from.
+    :type combo_name: str
+    :param first_step: Takes the axial force as zero if set to True, as for the first step of a
+                       nonlinear analysis. Defaults to True.
+    :type first_step: bool, optional
+    :return: The member's global geometric stiffness matrix.
+    :rtype: array
+    """
+
+    # Calculate the axial force acting on the member
+    if first_step:
+        # For the first load step take P = 0
+        P = 0
+    else:
+        # Calculate the member axial force due to axial strain
+        d = member.d(combo_name)
+        P = member.material.E*member.section.A/member.L()*(d[6, 0] - d[0, 0])
+
+    return member.Kg(P)
 
 def _check_statics(model, combo_tags=None):
     '''
@@ -868,58 +1340,34 @@ def _check_statics(model, combo_tags=None):
             if any(tag in combo.combo_tags for tag in combo_tags):
                 combo_list.append(combo)
 
+    # Get the node coordinates in node ID order
+    nodes = _nodes_by_ID(model)
+    XYZ = array([[node.X, node.Y, node.Z] for node in nodes])
+
+    # Only supported nodes and nodes with spring supports can carry reactions
+    reacting = [node for node in nodes if (node.support_DX or node.support_DY or node.support_DZ
+                                           or node.support_RX or node.support_RY or node.support_RZ
+                                           or node.spring_DX[0] != None or node.spring_DY[0] != None or node.spring_DZ[0] != None
+                                           or node.spring_RX[0] != None or node.spring_RY[0] != None or node.spring_RZ[0] != None)]
+    XYZ_R = array([[node.X, node.Y, node.Z] for node in reacting]).reshape(len(reacting), 3)
+
     # Step through each load combination
     for combo in combo_list:
 
-        # Initialize force and moment summations to zero
-        SumFX, SumFY, SumFZ = 0.0, 0.0, 0.0
-        SumMX, SumMY, SumMZ = 0.0, 0.0, 0.0
-        SumRFX, SumRFY, SumRFZ = 0.0, 0.0, 0.0
-        SumRMX, SumRMY, SumRMZ = 0.0, 0.0, 0.0
-
-        # Get the global force vector and the global fixed end reaction vector
-        P = model.P(combo.name)
-        FER = model.FER(combo.name)
-
-        # Step through each node and sum its forces
-        for node in model.nodes.values():
-
-            # Get the node's coordinates
-            X = node.X
-            Y = node.Y
-            Z = node.Z
-
-            # Get the nodal forces
-            FX = P[node.ID*6+0][0] - FER[node.ID*6+0][0]
-            FY = P[node.ID*6+1][0] - FER[node.ID*6+1][0]
-            FZ = P[node.ID*6+2][0] - FER[node.ID*6+2][0]
-            MX = P[node.ID*6+3][0] - FER[node.ID*6+3][0]
-            MY = P[node.ID*6+4][0] - FER[node.ID*6+4][0]
-            MZ = P[node.ID*6+5][0] - FER[node.ID*6+5][0]
-
-            # Get the nodal reactions
-            RFX = node.RxnFX[combo.name]
-            RFY = node.RxnFY[combo.name]
-            RFZ = node.RxnFZ[combo.name]
-            RMX = node.RxnMX[combo.name]
-            RMY = node.RxnMY[combo.name]
-            RMZ = node.RxnMZ[combo.name]
-
-            # Sum the global forces
-            SumFX += FX
-            SumFY += FY
-            SumFZ += FZ
-            SumMX += MX - FY*Z + FZ*Y
-            SumMY += MY + FX*Z - FZ*X
-            SumMZ += MZ - FX*Y + FY*X
-
-            # Sum the global reactions
-            SumRFX += RFX
-            SumRFY += RFY
-            SumRFZ += RFZ
-            SumRMX += RMX - RFY*Z + RFZ*Y
-            SumRMY += RMY + RFX*Z - RFZ*X
-            SumRMZ += RMZ - RFX*Y + RFY*X 
+        # Get the nodal forces from the global force vector and the global fixed end reaction vector
+        F = (model.P(combo.name) - model.FER(combo.name)).reshape(len(nodes), 6)
+
+        # Get the nodal reactions
+        R = array([[node.RxnFX[combo.name], node.RxnFY[combo.name], node.RxnFZ[combo.name],
+                    node.RxnMX[combo.name], node.RxnMY[combo.name], node.RxnMZ[combo.name]] for node in reacting]).reshape(len(reacting), 6)
+
+        # Sum the global forces, and their moments about the origin
+        SumFX, SumFY, SumFZ = F[:, :3].sum(axis=0)
+        SumMX, SumMY, SumMZ = F[:, 3:].sum(axis=0) + cross(XYZ, F[:, :3]).sum(axis=0)
+
+        # Sum the global reactions, and their moments about the origin
+        SumRFX, SumRFY, SumRFZ = R[:, :3].sum(axis=0)
+        SumRMX, SumRMY, SumRMZ = R[:, 3:].sum(axis=0) + cross(XYZ_R, R[:, :3]).sum(axis=0)
 
         # Add the results to the table
         statics_table.add_row([combo.name, '{:.3g}'.format(SumFX), '{:.3g}'.format(SumRFX),
@@ -936,108 +1384,65 @@ def _check_statics(model, combo_tags=None):
 def _partition_D(model):
     """Builds a list with known nodal displacements and with the positions in global stiffness matrix of known and unknown nodal displacements
 
-    :return: A list of the global matrix indices for the unknown nodal displacements (D1_indices). A list of the global matrix indices for the known nodal displacements (D2_indices). A list of the known nodal displacements (D2).
-    :rtype: list, list, list
+    A degree of freedom is known if it is supported or has an enforced displacement. Enforced
+    displacements take precedence over supports.
+
+    :return: An array of the global matrix indices for the unknown nodal displacements (D1_indices). An array of the global matrix indices for the known nodal displacements (D2_indices). A column vector of the known nodal displacements (D2).
+    :rtype: array, array, array
     """
 
-    D1_indices = [] # A list of the indices for the unknown nodal displacements
-    D2_indices = [] # A list of the indices for the known nodal displacements
-    D2 = []         # A list of the values of the known nodal displacements
+    n = len(model.nodes)*6
+    known = zeros(n, dtype=bool)  # Flags the degrees of freedom with known displacements
+    D = zeros(n)                  # The known displacements (0 at supports)
 
     # Create the auxiliary table
     for node in model.nodes.values():
-        
-        # Unknown displacement DX
-        if node.support_DX == False and node.EnforcedDX == None:
-            D1_indices.append(node.ID*6 + 0)
-        # Known displacement DX
-        elif node.EnforcedDX != None:
-            D2_indices.append(node.ID*6 + 0)
-            D2.append(node.EnforcedDX)
-        # Support at DX
-        else:
-            D2_indices.append(node.ID*6 + 0)
-            D2.append(0.0)
-
-        # Unknown displacement DY
-        if node.support_DY == False and node.EnforcedDY == None:
-            D1_indices.append(node.ID*6 + 1)
-        # Known displacement DY
-        elif node.EnforcedDY != None:
-            D2_indices.append(node.ID*6 + 1)
-            D2.append(node.EnforcedDY)
-        # Support at DY
-        else:
-            D2_indices.append(node.ID*6 + 1)
-            D2.append(0.0)
-
-        # Unknown displacement DZ
-        if node.support_DZ == False and node.EnforcedDZ == None:
-            D1_indices.append(node.ID*6 + 2)
-        # Known displacement DZ
-        elif node.EnforcedDZ != None:
-            D2_indices.append(node.ID*6 + 2)
-            D2.append(node.EnforcedDZ)
-        # Support at DZ
-        else:
-            D2_indices.append(node.ID*6 + 2)
-            D2.append(0.0)
-
-        # Unknown displacement RX
-        if node.support_RX == False and node.EnforcedRX == None:
-            D1_indices.append(node.ID*6 + 3)
-        # Known displacement RX
-        elif node.EnforcedRX != None:
-            D2_indices.append(node.ID*6 + 3)
-            D2.append(node.EnforcedRX)
-        # Support at RX
-        else:
-            D2_indices.append(node.ID*6 + 3)
-            D2.append(0.0)
-
-        # Unknown displacement RY
-        if node.support_RY == False and node.EnforcedRY == None:
-            D1_indices.append(node.ID*6 + 4)
-        # Known displacement RY
-        elif node.EnforcedRY != None:
-            D2_indices.append(node.ID*6 + 4)
-            D2.append(node.EnforcedRY)
-        # Support at RY
-        else:
-            D2_indices.append(node.ID*6 + 4)
-            D2.append(0.0)
-
-        # Unknown displacement RZ
-        if node.support_RZ == False and node.EnforcedRZ == None:
-            D1_indices.append(node.ID*6 + 5)
-        # Known displacement RZ
-        elif node.EnforcedRZ != None:
-            D2_indices.append(node.ID*6 + 5)
-            D2.append(node.EnforcedRZ)
-        # Support at RZ
-        else:
-            D2_indices.append(node.ID*6 + 5)
-            D2.append(0.0)
-    
-    # Legacy code on the next line. I will leave it here until the line that follows has been proven over time.
-    # D2 = atleast_2d(D2)
-    
-    # Convert D2 from a list to a matrix
-    D2 = array(D2, ndmin=2).T
+        for i, (support, enforced) in enumerate(((node.support_DX, node.EnforcedDX), (node.support_DY, node.EnforcedDY),
+                                                 (node.support_DZ, node.EnforcedDZ), (node.support_RX, node.EnforcedRX),
+                                                 (node.support_RY, node.EnforcedRY), (node.support_RZ, node.EnforcedRZ))):
+            if enforced != None:
+                known[node.ID*6 + i] = True
+                D[node.ID*6 + i] = enforced
+            elif support != False:
+                known[node.ID*6 + i] = True
+
+    D1_indices = nonzero(~known)[0]
+    D2_indices = nonzero(known)[0]
+
+    # Store the permutation that puts the unknown displacements first, so `_partition` doesn't
+    # have to derive it from the indices every time it's called
+    model._dof_permutation = (D1_indices, D2_indices, _dof_positions(D1_indices, D2_indices))
 
     # Return the indices and the known displacements
-    return D1_indices, D2_indices, D2
+    return D1_indices, D2_indices, D[D2_indices].reshape(-1, 1)
+
+def _dof_positions(D1_indices, D2_indices):
+    """Returns the position of each global degree of freedom once the unknown displacements
+    (`D1_indices`) have been moved ahead of the known ones (`D2_indices`).
+    """
+
+    positions = zeros(len(D1_indices) + len(D2_indices), dtype=int)
+    positions[D1_indices] = arange(len(D1_indices))
+    positions[D2_indices] = arange(len(D1_indices), len(positions))
+
+    return positions
 
 def _partition(model, unp_matrix, D1_indices, D2_indices):
     """Partitions a matrix (or vector) into submatrices (or subvectors) based on degree of freedom boundary conditions.
 
+    Matrices are partitioned by reordering their rows and columns so the unknown displacements
+    come first, which takes a single pass over a sparse matrix's nonzero terms (or a single copy of
+    a dense one). The four submatrices are then contiguous blocks of the reordered matrix.
+
+    :param model: The finite element model the matrix belongs to. The permutation stored by `_partition_D` is reused when it matches the indices given.
+    :type model: FEModel3D
     :param unp_matrix: The unpartitioned matrix (or vector) to be partitioned.
-    :type unp_matrix: ndarray or lil_matrix
-    :param D1_indices: A list of the indices for degrees of freedom that have unknown displacements.
-    :type D1_indices: list
-    :param D2_indices: A list of the indices for degrees of freedom that have known displacements.
-    :type D2_indices: list
-    :return: Partitioned submatrices (or subvectors) based on degree of freedom boundary conditions.
+    :type unp_matrix: ndarray or scipy sparse matrix
+    :param D1_indices: The indices for degrees of freedom that have unknown displacements.
+    :type D1_indices: array
+    :param D2_indices: The indices for degrees of freedom that have known displacements.
+    :type D2_indices: array
+    :return: Partitioned submatrices (or subvectors) based on degree of freedom boundary conditions. Sparse matrices are returned as `csr` submatrices and dense matrices as views of the reordered matrix.
     :rtype: array, array, array, array
     """
 
@@ -1049,29 +1454,54 @@ def _partition(model, unp_matrix, D1_indices, D2_indices):
         m1 = unp_matrix[D1_indices, :]
         m2 = unp_matrix[D2_indices, :]
         return m1, m2
+
     # 2D matrices
+    n1 = len(D1_indices)
+
+    if hasattr(unp_matrix, 'tocoo'):
+        from scipy.sparse import coo_matrix
+
+        cached = getattr(model, '_dof_permutation', None)
+        if cached is not None and cached[0] is D1_indices and cached[1] is D2_indices:
+            positions = cached[2]
+        else:
+            positions = _dof_positions(D1_indices, D2_indices)
+
+        # Move each term to its reordered row and column
+        unp_matrix = unp_matrix.tocoo()
+        matrix = coo_matrix((unp_matrix.data, (positions[unp_matrix.row], positions[unp_matrix.col])), shape=unp_matrix.shape).tocsr()
     else:
-        # Partition the matrix into 4 submatrices
-        m11 = unp_matrix[D1_indices, :][:, D1_indices]
-        m12 = unp_matrix[D1_indices, :][:, D2_indices]
-        m21 = unp_matrix[D2_indices, :][:, D1_indices]
-        m22 = unp_matrix[D2_indices, :][:, D2_indices]
-        return m11, m12, m21, m22
+        order = concatenate((D1_indices, D2_indices)).astype(int)
+        matrix = unp_matrix[order[:, None], order]
+
+    # Partition the matrix into 4 submatrices
+    m11 = matrix[:n1, :n1]
+    m12 = matrix[:n1, n1:]
+    m21 = matrix[n1:, :n1]
+    m22 = matrix[n1:, n1:]
+    return m11, m12, m21, m22
 
 def _renumber(model):
     """
     Assigns node and element ID numbers to be used internally by the program. Numbers are
-    assigned according to the order in which they occur in each dictionary.
+    assigned according to the order in which they occur in each dictionary, except that nodes may
+    then be renumbered to reduce the bandwidth of the stiffness matrix (see `_reorder_nodes`).
     """
     
     # Number each node in the model
     for id, node in enumerate(model.nodes.values()):
         node.ID = id
+
+    # Keep a list of the nodes indexed by ID for quick lookups
+    model._nodes_by_ID = list(model.nodes.values())
     
     # Number each spring in the model
     for id, spring in enumerate(model.springs.values()):
         spring.ID = id
 
+    # Bring the spatial index of the nodes up to date before it's used to descritize the members
+    model._spatial_index()
+
     # Descritize all the physical members and number each member in the model
     id = 0
     for phys_member in model.members.values():
@@ -1080,6 +1510,10 @@ def _renumber(model):
             member.ID = id
             id += 1
     
+    # Renumber the nodes to reduce the bandwidth of the stiffness matrix. This has to wait until
+    # the members have been descritized, since their sub-members connect the nodes.
+    _reorder_nodes(model)
+
     # Number each plate in the model
     for id, plate in enumerate(model.plates.values()):
         plate.ID = id
@@ -1087,3 +1521,251 @@ def _renumber(model):
     # Number each quadrilateral in the model
     for id, quad in enumerate(model.quads.values()):
         quad.ID = id
+
+    # The sub-members and their loads have been rebuilt, and the nodes may have been renumbered,
+    # so the load vectors cached for each load case are out of date
+    model._load_vectors = None
+
+    # Cache each element's global degree of freedom indices now that every node has its final ID
+    for spring in model.springs.values():
+        spring._dofs = _element_dofs(spring, cached=False)
+    for phys_member in model.members.values():
+        phys_member._dofs = _element_dofs(phys_member, cached=False)
+        for member in phys_member.sub_members.values():
+            member._dofs = _element_dofs(member, cached=False)
+    for plate in model.plates.values():
+        plate._dofs = _element_dofs(plate, cached=False)
+    for quad in model.quads.values():
+        quad._dofs = _element_dofs(quad, cached=False)
+
+    # Index the elements connected to each node
+    model._node_elements = _build_node_elements(model)
+
+def _reorder_nodes(model):
+    """Renumbers the model's nodes with the reverse Cuthill-McKee algorithm, which keeps connected
+    nodes close together in the stiffness matrix. This reduces the matrix's bandwidth and the fill-in
+    when it is factored, which saves memory and time on large models whose nodes were added in an
+    arbitrary order.
+
+    The new numbering is only used if it reduces the profile of the stiffness matrix. The bandwidth
+    and profile (the number of terms between each row's first nonzero term and the diagonal, which
+    bounds the size of its factor) before and after are stored in `model.node_ordering`.
+
+    :param model: The model being renumbered. Its nodes must already be numbered in dictionary order.
+    :type model: FEModel3D
+    """
+
+    model.node_ordering = {}
+
+    reorder = model.reorder_nodes
+    if reorder is None:
+        reorder = len(model.nodes) >= model.reorder_min_nodes
+    if not reorder or len(model.nodes) < 2:
+        return
+
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+    # Find each pair of nodes connected by an element
+    members = [member for phys_member in model.members.values() for member in phys_member.sub_members.values()]
+    pairs = []
+    for elements, node_names in ((list(model.springs.values()) + members, ('i_node', 'j_node')),
+                                 (list(model.plates.values()) + list(model.quads.values()), ('i_node', 'j_node', 'm_node', 'n_node'))):
+        if elements:
+            IDs = array([[getattr(element, name).ID for name in node_names] for element in elements])
+            pairs += [IDs[:, [a, b]] for a in range(len(node_names)) for b in range(a + 1, len(node_names))]
+    pairs = concatenate(pairs) if pairs else zeros((0, 2), dtype=int)
+
+    n = len(model.nodes)
+    graph = coo_matrix((ones(len(pairs)), (pairs[:, 0], pairs[:, 1])), shape=(n, n))
+    order = reverse_cuthill_mckee((graph + graph.T).tocsr(), symmetric_mode=True)
+
+    # The new position of each node
+    positions = zeros(n, dtype=int)
+    positions[order] = arange(n)
+
+    before = _matrix_envelope(pairs, arange(n))
+    after = _matrix_envelope(pairs, positions)
+    model.node_ordering = {'bandwidth': (before[0], after[0]), 'profile': (before[1], after[1])}
+
+    if after[1] < before[1]:
+        nodes = model._nodes_by_ID
+        model._nodes_by_ID = [nodes[ID] for ID in order]
+        for ID, node in enumerate(model._nodes_by_ID):
+            node.ID = ID
+
+def _matrix_envelope(pairs, positions):
+    """Returns the half-bandwidth and profile of the stiffness matrix if the nodes were numbered by
+    `positions`, given the `pairs` of node IDs connected by elements.
+    """
+
+    # Find the first node coupled to each node in the lower triangle of the matrix
+    n = len(positions)
+    first = arange(n)
+    connected = positions[pairs]
+    minimum.at(first, connected[:, 0], connected[:, 1])
+    minimum.at(first, connected[:, 1], connected[:, 0])
+
+    # Each node has 6 degrees of freedom
+    offsets = arange(n) - first
+    bandwidth = int(6*offsets.max() + 5)
+    profile = int((36*offsets + 21).sum())
+
+    return bandwidth, profile
+
+def _element_dofs(element, cached=True):
+    """Returns the global degree of freedom indices for an element, in the same order as the rows of
+    its global matrices (6 per node: i-node, j-node, and for quads/plates m-node and n-node).
+
+    :param element: The member, spring, quad or plate to get the indices for.
+    :type element: Member3D, Spring3D, Quad3D or Plate3D
+    :param cached: Uses the indices cached by `_renumber` when available. Defaults to True.
+    :type cached: bool, optional
+    :return: The element's global degree of freedom indices.
+    :rtype: ndarray
+    """
+
+    if cached and getattr(element, '_dofs', None) is not None:
+        return element._dofs
+
+    # Quads and plates have 4 nodes, members and springs have 2
+    if hasattr(element, 'm_node'):
+        nodes = (element.i_node, element.j_node, element.m_node, element.n_node)
+    else:
+        nodes = (element.i_node, element.j_node)
+
+    return (6*array([node.ID for node in nodes])[:, None] + arange(6)).ravel()
+
+def _element_group(elements, element_matrix):
+    """Stacks the global degree of freedom indices and matrices (or vectors) for a group of
+    elements of the same size so they can be scattered into a global matrix in one operation.
+
+    :param elements: The elements in the group.
+    :type elements: iterable
+    :param element_matrix: A function returning the element's global matrix (or vector).
+    :type element_matrix: function
+    :return: An `(n_elements, n_dofs)` index array and an `(n_elements, n_dofs, n_dofs)` (or
+             `(n_elements, n_dofs, 1)`) array of element terms, or `None` if the group is empty.
+    :rtype: tuple or None
+    """
+
+    elements = list(elements)
+    if not elements:
+        return None
+
+    dofs = array([_element_dofs(element) for element in elements])
+    blocks = array([element_matrix(element) for element in elements], dtype=float)
+
+    return dofs, blocks
+
+def _element_groups(elements, element_matrix):
+    """Splits a mixed list of elements into groups by their number of degrees of freedom and stacks
+    each group with `_element_group`.
+
+    :param elements: The elements.
+    :type elements: iterable
+    :param element_matrix: A function returning the element's global matrix (or vector).
+    :type element_matrix: function
+    :return: A list of `(dofs, blocks)` pairs.
+    :rtype: list
+    """
+
+    by_size = {}
+    for element in elements:
+        by_size.setdefault(len(_element_dofs(element)), []).append(element)
+
+    return [_element_group(group, element_matrix) for group in by_size.values()]
+
+def _batch_group(elements, batch_matrix):
+    """Stacks the global degree of freedom indices for a group of elements along with matrices
+    computed for the whole group at once, such as `Quad3D.batch_K`.
+
+    :param elements: The elements in the group.
+    :type elements: iterable
+    :param batch_matrix: A function returning the stacked global matrices for a list of elements.
+    :type batch_matrix: function
+    :return: A `(dofs, blocks)` pair as returned by `_element_group`, or `None` if the group is empty.
+    :rtype: tuple or None
+    """
+
+    elements = list(elements)
+    if not elements:
+        return None
+
+    return array([_element_dofs(element) for element in elements]), batch_matrix(elements)
+
+def _stiffness_groups(elements):
+    """Groups the global stiffness matrices of a mixed list of elements for `_assemble_matrix`.
+    Quads and plates use their batched kernels, and all other elements use their `K` method.
+
+    :param elements: The elements.
+    :type elements: iterable
+    :return: A list of `(dofs, blocks)` pairs.
+    :rtype: list
+    """
+
+    elements = list(elements)
+    quads = [element for element in elements if isinstance(element, Quad3D)]
+    plates = [element for element in elements if isinstance(element, Plate3D)]
+    others = [element for element in elements if not isinstance(element, (Quad3D, Plate3D))]
+
+    return (_element_groups(others, lambda element: element.K())
+            + [_batch_group(quads, Quad3D.batch_K), _batch_group(plates, Plate3D.batch_K)])
+
+def _assemble_matrix(size, groups, sparse=True):
+    """Assembles a global matrix from groups of stacked element matrices.
+
+    :param size: The number of rows (and columns) in the global matrix.
+    :type size: int
+    :param groups: `(dofs, blocks)` pairs as returned by `_element_group`. `None` entries are ignored.
+    :type groups: iterable
+    :param sparse: Returns a `coo_matrix` if set to True, and a dense matrix otherwise. Defaults to True.
+    :type sparse: bool, optional
+    :return: The assembled global matrix.
+    :rtype: coo_matrix or ndarray
+    """
+
+    row, col, data = [array([], dtype=int)], [array([], dtype=int)], [array([], dtype=float)]
+    for group in groups:
+        if group is None:
+            continue
+        dofs, blocks = group
+        n = dofs.shape[1]
+
+        # Term [e, a, b] of the stacked blocks goes to row dofs[e, a] and column dofs[e, b]
+        row.append(repeat(dofs, n, axis=1).ravel())
+        col.append(tile(dofs, (1, n)).ravel())
+        data.append(blocks.ravel())
+
+    row = concatenate(row)
+    col = concatenate(col)
+    data = concatenate(data)
+
+    if sparse:
+        # The `coo_matrix` sums values at the same (i, j) index when converted to another format
+        from scipy.sparse import coo_matrix
+        return coo_matrix((data, (row, col)), shape=(size, size))
+    else:
+        K = zeros((size, size))
+        add.at(K, (row, col), data)
+        return K
+
+def _assemble_vector(size, groups):
+    """Assembles a global `(size, 1)` vector from groups of stacked element vectors.
+
+    :param size: The number of rows in the global vector.
+    :type size: int
+    :param groups: `(dofs, blocks)` pairs as returned by `_element_group`. `None` entries are ignored.
+    :type groups: iterable
+    :return: The assembled global vector.
+    :rtype: ndarray
+    """
+
+    V = zeros(size)
+    for group in groups:
+        if group is None:
+            continue
+        dofs, blocks = group
+        V += bincount(dofs.ravel(), weights=blocks.ravel(), minlength=size)
+
+    return V.reshape(size, 1)
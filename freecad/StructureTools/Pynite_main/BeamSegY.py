@@ -1,3 +1,4 @@
+from numpy import array
 from .BeamSegZ import BeamSegZ
 
 # %%
@@ -198,4 +199,28 @@ class BeamSegY(BeamSegZ):
     
         # Return the minimum moment
         return min(M1, M2, M3, M4)
-    
\ No newline at end of file
+
+    def coefficients(self, result, P_delta=False):
+        """
+        Returns the coefficients, in increasing powers of x, of the polynomial giving a result
+        along the segment.
+
+        Parameters
+        ----------
+        result : {'shear', 'moment', 'axial', 'torque', 'deflection', 'axial_deflection'}
+            The result to get the polynomial for.
+        P_delta : bool
+            Includes P-little-delta effects in moments, as `moment` does. Default is False.
+        """
+
+        L = self.Length()
+
+        # Bending about the local y-axis has the opposite sign convention
+        if result == 'moment' and not P_delta:
+            return array([-self.M1, -self.V1, -self.w1/2, -(self.w2 - self.w1)/(6*L)])
+        elif result == 'deflection' and not P_delta:
+            EI = self.EI
+            return array([self.delta1, -self.theta1, self.M1/(2*EI), self.V1/(6*EI), self.w1/(24*EI),
+                          (self.w2 - self.w1)/(120*EI*L)])
+        else:
+            return super().coefficients(result, P_delta)
@@ -4,7 +4,8 @@ Created on Mon Nov  6 20:52:31 2017
 
 @author: D. Craig Brinck, SE
 """
-from numpy import full, array
+from numpy import full, array, concatenate
+from numpy.polynomial.polynomial import polyder, polyroots, polyadd, polysub, polymul
 
 # %%
 # A mathematically continuous beam segment
@@ -53,6 +54,10 @@ class BeamSegZ():
       Returns the length of the segment
     Shear(x)
       Returns the shear force at a location on the segment
+    coefficients(result, P_delta=False)
+      Returns the polynomial coefficients of a result along the segment
+    critical_points(result, P_delta=False)
+      Returns the locations where a result can reach its extreme values
     
     Notes
     -----
@@ -455,3 +460,82 @@ class BeamSegZ():
         # Since the torsional moment is constant on the segment, the minimum torsional moment is T1
         # This can be updated in the future for distributed torsional forces
         return self.T1
+
+    def coefficients(self, result, P_delta=False):
+        """
+        Returns the coefficients, in increasing powers of x, of the polynomial giving a result
+        along the segment.
+
+        Parameters
+        ----------
+        result : {'shear', 'moment', 'axial', 'torque', 'deflection', 'axial_deflection'}
+            The result to get the polynomial for.
+        P_delta : bool
+            Includes P-little-delta effects in moments, as `moment` does. Deflections with
+            P-little-delta effects aren't polynomials (see `critical_points`). Default is False.
+        """
+
+        L = self.Length()
+
+        if P_delta and result == 'moment':
+            # `moment` adds P1*(delta(x) - delta1), using the first-order deflection
+            d = self.coefficients('deflection')
+            d[0] = 0
+            return polyadd(self.coefficients('moment'), self.P1*d)
+        elif P_delta and result == 'deflection':
+            raise ValueError('Deflections with P-little-delta effects are not polynomials.')
+        elif result == 'shear':
+            return array([self.V1, self.w1, (self.w2 - self.w1)/(2*L)])
+        elif result == 'moment':
+            return array([self.M1, -self.V1, -self.w1/2, -(self.w2 - self.w1)/(6*L)])
+        elif result == 'axial':
+            return array([self.P1, self.p1, (self.p2 - self.p1)/(2*L)])
+        elif result == 'torque':
+            return array([self.T1])
+        elif result == 'deflection':
+            EI = self.EI
+            return array([self.delta1, self.theta1, -self.M1/(2*EI), self.V1/(6*EI), self.w1/(24*EI),
+                          (self.w2 - self.w1)/(120*EI*L)])
+        elif result == 'axial_deflection':
+            EA = self.EA
+            return array([self.delta_x1, -self.P1/EA, -self.p1/(2*EA), -(self.p2 - self.p1)/(6*L*EA)])
+        else:
+            raise ValueError(f"Unknown result '{result}'.")
+
+    def critical_points(self, result, P_delta=False):
+        """
+        Returns the locations (relative to the start of the segment) where a result can reach
+        its extreme values on the segment: the segment ends and the real roots of the result's
+        derivative that lie between them.
+
+        Parameters
+        ----------
+        result : {'shear', 'moment', 'axial', 'torque', 'deflection', 'axial_deflection'}
+            The result to find the critical points for.
+        P_delta : bool
+            Includes P-little-delta effects in moments and deflections. Default is False.
+        """
+
+        L = self.Length()
+
+        if P_delta and result == 'deflection':
+            # `deflection` iterates towards the solution of delta = A + c*x**2 - b*x**2*delta,
+            # where A is the first-order deflection, i.e. delta = (A + c*x**2)/(1 + b*x**2). The
+            # numerator of its derivative is A'*(1 + b*x**2) + 2*c*x - 2*b*x*A.
+            A = self.coefficients('deflection')
+            b = self.P1/(2*self.EI)
+            c = b*self.delta1
+            derivative = polysub(polyadd(polymul(polyder(A), [1, 0, b]), [0, 2*c]), polymul([0, 2*b], A))
+        else:
+            derivative = polyder(self.coefficients(result, P_delta))
+
+        # Drop zero high order terms so the polynomial degree is correct
+        nonzero = derivative.nonzero()[0]
+        if len(nonzero) == 0 or nonzero[-1] == 0:
+            return array([0, L], dtype=float)
+        roots = polyroots(derivative[:nonzero[-1] + 1])
+
+        # Keep real roots that lie inside the segment
+        real = abs(roots.imag) <= 1e-9*(1 + abs(roots.real))
+        x = roots.real[real]
+        return concatenate(([0, L], x[(x > 0) & (x < L)]))
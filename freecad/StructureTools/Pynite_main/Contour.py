@@ -0,0 +1,89 @@
+from numpy import array, arange, bincount, concatenate, nan
+
+from .Quad3D import _quad_results, _local_d, _dir_cos
+from .Plate3D import _plate_results
+from .Analysis import _element_dofs
+
+#%%
+def _node_contours(model, result, i, local, combo_name):
+    """Returns smoothed plate and quad results at the nodes of a solved model, as used for contour
+    plots. Each node gets the average of the results at the corners of the elements connected to it.
+
+    The results at the corners of all the elements are evaluated together once per load combination,
+    and averaged onto the nodes by a sparse element corner to node incidence matrix. Both are cached
+    in `model._contours`, along with the averages for each result requested, until the model is
+    changed or the load combination is solved again.
+
+    :param model: The solved finite element model.
+    :type model: FEModel3D
+    :param result: The result to average: 'dz' (local z-displacement), 'shear', 'moment' or
+                   'membrane'.
+    :type result: str
+    :param i: The index of the result component (e.g. 1 for My or Sy). Use 0 for 'dz'.
+    :type i: int
+    :param local: Use results in the elements' local coordinate systems rather than global ones.
+    :type local: bool
+    :param combo_name: The name of the load combination.
+    :type combo_name: str
+    :return: The smoothed result at each node, indexed by `Node3D.ID`. Nodes that aren't connected
+             to any quads or plates get `nan`.
+    :rtype: array
+    """
+
+    D = model._D[combo_name]
+
+    cached = model._contours.get(combo_name)
+    if cached is None or cached[0] is not D or cached[1] != model.revision:
+        cached = (D, model.revision) + _corner_results(model, D) + ({},)
+        model._contours[combo_name] = cached
+
+    corners, incidence, unconnected, averages = cached[2:]
+
+    key = (result, i, local)
+    if key not in averages:
+        values = incidence @ corners[result][0 if local else 1][:, :, i].ravel()
+        values[unconnected] = nan
+        averages[key] = values
+
+    return averages[key]
+
+def _corner_results(model, D):
+    """Returns the results at the corners of every quad and plate in the model, given the model's
+    global displacement vector `D`, the sparse matrix averaging them onto the nodes, and a mask of
+    the nodes that aren't connected to any quads or plates.
+    """
+
+    from scipy.sparse import coo_matrix
+
+    corners = []
+    node_IDs = []
+    for elements, element_results in ((list(model.quads.values()), _quad_results),
+                                      (list(model.plates.values()), _plate_results)):
+
+        if not elements:
+            continue
+
+        D_elements = D[array([_element_dofs(element) for element in elements]), 0]
+
+        # Drop the results at the element centers, keeping the 4 corners (i, j, m, n)
+        results = {name: (local[:, :4], glob[:, :4]) for name, (local, glob) in element_results(elements, D_elements).items()}
+        dz = _local_d(D_elements, _dir_cos(elements))[:, [2, 8, 14, 20], None]
+        results['dz'] = (dz, dz)
+
+        corners.append(results)
+        node_IDs.append([[element.i_node.ID, element.j_node.ID, element.m_node.ID, element.n_node.ID] for element in elements])
+
+    if corners:
+        corners = {name: tuple(concatenate([part[name][k] for part in corners]) for k in range(2)) for name in corners[0]}
+        node_IDs = concatenate(node_IDs).ravel()
+    else:
+        corners = {name: (array([]).reshape(0, 4, 3),)*2 for name in ('dz', 'shear', 'moment', 'membrane')}
+        node_IDs = array([], dtype=int)
+
+    # Each row of the incidence matrix averages the corner results at one node
+    n_nodes = len(model.nodes)
+    count = bincount(node_IDs, minlength=n_nodes)
+    incidence = coo_matrix((1/count[node_IDs], (node_IDs, arange(len(node_IDs)))),
+                           shape=(n_nodes, len(node_IDs))).tocsr()
+
+    return corners, incidence, count == 0
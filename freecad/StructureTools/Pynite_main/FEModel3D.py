@@ -6,8 +6,7 @@ from os import rename
 import warnings
 from math import isclose
 
-from numpy import array, zeros, matmul, divide, subtract, atleast_2d, all
-from numpy.linalg import solve
+from numpy import array, matmul, divide, subtract, atleast_2d, all
 
 from .Node3D import Node3D
 from .Material import Material
@@ -19,11 +18,13 @@ from .Quad3D import Quad3D
 from .Plate3D import Plate3D
 from .LoadCombo import LoadCombo
 from .Mesh import Mesh
+from .Solver import LinearSolver
+from .SpatialIndex import SpatialIndex
 # from Mesh import RectangleMesh
 # from Mesh import AnnulusMesh
 # from Mesh import FrustrumMesh
 # from Mesh import CylinderMesh
-from .Analysis import _prepare_model, _identify_combos,_check_stability, _PDelta_step, _pushover_step, _store_displacements ,  _sum_displacements, _check_TC_convergence, _calc_reactions, _check_statics, _partition_D, _partition, _renumber
+from .Analysis import _prepare_model, _identify_combos,_check_stability, _PDelta_step, _pushover_step, _store_displacements ,  _sum_displacements, _calc_reactions, _check_statics, _partition_D, _partition, _renumber, _element_group, _batch_group, _assemble_matrix, _superimpose_cases, _case_load_vectors, _combo_factors, _member_Kg, _solve_combos, _TC_combo, _PDelta_combo
 
 
 # %%
@@ -60,8 +61,39 @@ class FEModel3D():
         self.load_combos.pop(str)
         self._D = {str:[]}                 # A dictionary of the model's nodal displacements by load combination
         self._D.pop(str)
-        
+        self._R = {}                       # A dictionary of the model's nodal reactions by load combination
+        self._contours = {}                # Cached plate contour results by load combination (see `Contour._node_contours`)
+
+        self.unstable_dofs = []  # (node name, degree of freedom) pairs found unstable by the last stability check
+
+        self.pdelta_history = {}  # (iteration, displacement change, axial force change) for each P-Delta iteration, by load combination
+
+        self.segment_cache_size = 64  # The number of load combinations each member keeps its result segments for
+
+        self._node_index = None  # A spatial index of the nodes, created the first time it's needed
+
+        # The nodes can be renumbered with the reverse Cuthill-McKee algorithm before each analysis
+        # to reduce the bandwidth of the stiffness matrix. This helps solvers that factor the matrix
+        # in the order given. The sparse solvers used here find their own fill-reducing ordering,
+        # so it is off (`False`) by default. Set `reorder_nodes` to `True` to always renumber, or
+        # to `None` to renumber models with at least `reorder_min_nodes` nodes.
+        self.reorder_nodes = False
+        self.reorder_min_nodes = 500
+        self.node_ordering = {}  # Stiffness matrix 'bandwidth' and 'profile' before and after the last renumbering
+
+        # Elements cache their matrices until this counter changes. It is incremented whenever
+        # elements, nodes, releases, materials or sections are added, removed or edited through
+        # the model. Increment it after moving nodes or editing elements directly.
+        self.revision = 0
+
+        # Load vectors are calculated once per load case and cached until this counter (or
+        # `revision`) changes. It is incremented whenever loads are added or deleted through the
+        # model. Increment it after editing loads directly.
+        self.load_revision = 0
+        self._load_vectors = None  # Cached load vectors by load case (see `Analysis._case_load_vectors`)
+
         self.solution = None  # Indicates the solution type for the latest run of the model
+        self._solution_revision = None  # (`revision`, `load_revision`) of the last linear solution
 
     @property
     def load_cases(self):
@@ -129,13 +161,18 @@ class FEModel3D():
                 count += 1
         
         # Create a new node
-        new_node = Node3D(name, X, Y, Z)
+        new_node = Node3D(name, X, Y, Z, self)
         
         # Add the new node to the model
         self.nodes[name] = new_node
+
+        # Keep the spatial index up to date
+        if self._node_index is not None:
+            self._node_index.add(new_node)
         
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
 
         #Return the node name
         return name
@@ -174,8 +211,9 @@ class FEModel3D():
         # Add the new material to the model
         self.materials[name] = new_material
         
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
 
         #Return the materal name
         return name
@@ -304,8 +342,9 @@ class FEModel3D():
         # Add the new spring to the model
         self.springs[name] = new_spring
         
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
 
         # Return the spring name
         return name
@@ -358,8 +397,9 @@ class FEModel3D():
         # Add the new member to the model
         self.members[name] = new_member
         
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
 
         # Return the member name
         return name
@@ -422,8 +462,9 @@ class FEModel3D():
         # Add the new plate to the model
         self.plates[name] = new_plate
 
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
         
         # Return the plate name
         return name
@@ -488,8 +529,9 @@ class FEModel3D():
         # Add the new member to the model
         self.quads[name] = new_quad
 
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
         
         #Return the quad name
         return name
@@ -561,8 +603,9 @@ class FEModel3D():
         # Add the new mesh to the `Meshes` dictionary
         self.meshes[name] = new_mesh
 
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
         
         #Return the mesh's name
         return name
@@ -627,8 +670,9 @@ class FEModel3D():
         # Add the new mesh to the `Meshes` dictionary
         self.meshes[name] = new_mesh
 
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
         
         #Return the mesh's name
         return name
@@ -693,8 +737,9 @@ class FEModel3D():
         # Add the new mesh to the `Meshes` dictionary
         self.meshes[name] = new_mesh
 
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
         
         #Return the mesh's name
         return name
@@ -773,12 +818,32 @@ class FEModel3D():
         # Add the new mesh to the `Meshes` dictionary
         self.meshes[name] = new_mesh
 
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
         
         #Return the mesh's name
         return name
 
+    def _spatial_index(self, sync:bool = True) -> SpatialIndex:
+        """Returns the model's spatial index of nodes, creating it if necessary.
+
+        :param sync: Brings the index up to date with any nodes that were added, removed or moved
+                     without going through `add_node` or `delete_node` (e.g. by mesh generation).
+                     Defaults to True.
+        :type sync: bool, optional
+        :return: The spatial index.
+        :rtype: SpatialIndex
+        """
+
+        if self._node_index is None:
+            self._node_index = SpatialIndex()
+            self._node_index.sync(self.nodes.values())
+        elif sync:
+            self._node_index.sync(self.nodes.values())
+
+        return self._node_index
+
     def merge_duplicate_nodes(self, tolerance:float = 0.001) -> list:
         """Removes duplicate nodes from the model and returns a list of the removed node names.
 
@@ -816,6 +881,10 @@ class FEModel3D():
         # Make a list of nodes to be removed from the model
         remove_list = []
 
+        # Use the spatial index so each node is only compared with the nodes near it
+        index = self._spatial_index()
+        order = {id(node): i for i, node in enumerate(self.nodes.values())}
+
         # Step through each node in the copy of the `Nodes` dictionary
         for i, node_1_name in enumerate(node_names):
 
@@ -823,17 +892,20 @@ class FEModel3D():
             if node_lookup[node_1_name] is None:
                 continue
 
-            # There is no need to check `node_1` against itself
-            for node_2_name in node_names[i + 1:]:
+            # Find the nodes within the tolerance of `node_1`. There is no need to check `node_1`
+            # against itself or against any nodes that come before it.
+            node_1 = self.nodes[node_1_name]
+            nearby = [node for node in index.near_point(node_1.X, node_1.Y, node_1.Z, tolerance) if order[id(node)] > i]
+            nearby.sort(key=lambda node: order[id(node)])
+
+            for node_2 in nearby:
+
+                node_2_name = node_2.name
 
                 # Skip iteration if node_2 has already been removed
                 if node_lookup[node_2_name] is None:
                     continue
 
-                # Calculate the distance between nodes
-                if self.nodes[node_1_name].distance(self.nodes[node_2_name]) > tolerance:
-                    continue
-
                 # Replace references to `node_2` in each element with references to `node_1`
                 for element, node_type in node_lookup[node_2_name]:
                     setattr(element, node_type, self.nodes[node_1_name])
@@ -878,10 +950,11 @@ class FEModel3D():
 
         # Remove `node_2` from the model's `Nodes` dictionary
         for node_name in remove_list:
-            self.nodes.pop(node_name)
+            index.remove(self.nodes.pop(node_name))
         
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
 
         # Return the list of removed nodes
         return remove_list
@@ -895,15 +968,20 @@ class FEModel3D():
             
         # Remove the node. Nodal loads are stored within the node, so they
         # will be deleted automatically when the node is deleted.
-        self.nodes.pop(node_name)
+        node = self.nodes.pop(node_name)
+
+        # Keep the spatial index up to date
+        if self._node_index is not None:
+            self._node_index.remove(node)
         
         # Find any elements attached to the node and remove them
         self.members = {name: member for name, member in self.members.items() if member.i_node.name != node_name and member.j_node.name != node_name}
         self.plates = {name: plate for name, plate in self.plates.items() if plate.i_node.name != node_name and plate.j_node.name != node_name and plate.m_node.name != node_name and plate.n_node.name != node_name}
         self.quads = {name: quad for name, quad in self.quads.items() if quad.i_node.name != node_name and quad.j_node.name != node_name and quad.m_node.name != node_name and quad.n_node.name != node_name}
 
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
 
     def delete_spring(self, spring_name:str):
         """Removes a spring from the model.
@@ -915,8 +993,9 @@ class FEModel3D():
         # Remove the spring
         self.springs.pop(spring_name)
 
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
 
     def delete_member(self, member_name:str):
         """Removes a member from the model. All member loads associated with the member will also
@@ -930,8 +1009,9 @@ class FEModel3D():
         # will be deleted automatically when the member is deleted.
         self.members.pop(member_name)
 
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
         
     def def_support(self, node_name:str, support_DX:bool=False, support_DY:bool=False,
                     support_DZ:bool=False, support_RX:bool=False, support_RY:bool=False,
@@ -1096,8 +1176,9 @@ class FEModel3D():
         except KeyError:
             raise NameError(f"Member '{member_name}' does not exist in the model")
 
-        # Flag the model as unsolved
+        # Flag the model as unsolved, and its cached element matrices as out of date
         self.solution = None
+        self.revision += 1
 
     def add_load_combo(self, name:str, factors:dict, combo_tags:list | None = None):
         """Adds a load combination to the model.
@@ -1145,6 +1226,7 @@ class FEModel3D():
 
         # Flag the model as unsolved
         self.solution = None
+        self.load_revision += 1
 
     def add_member_pt_load(self, member_name:str, direction:str, P:float, x:float, case:str = 'Case 1'):
         """Adds a member point load to the model.
@@ -1178,6 +1260,7 @@ class FEModel3D():
                 
         # Flag the model as unsolved
         self.solution = None
+        self.load_revision += 1
 
     def add_member_dist_load(self, member_name:str, direction:str, w1:float, w2:float,
                              x1:float | None = None, x2:float | None = None,
@@ -1230,6 +1313,7 @@ class FEModel3D():
                 
         # Flag the model as unsolved
         self.solution = None
+        self.load_revision += 1
 
     def add_member_self_weight(self, global_direction:str, factor:float, case:str = 'Case 1'):
         """Adds self weight to all members in the model. Note that this only works for members. Plate and Quad elements will be ignored by this command.
@@ -1274,6 +1358,7 @@ class FEModel3D():
         
         # Flag the model as unsolved
         self.solution = None
+        self.load_revision += 1
 
     def add_quad_surface_pressure(self, quad_name:str, pressure:float, case:str = 'Case 1'):
         """Adds a surface pressure to the quadrilateral element.
@@ -1295,6 +1380,7 @@ class FEModel3D():
         
         # Flag the model as unsolved
         self.solution = None
+        self.load_revision += 1
 
     def delete_loads(self):
         """Deletes all loads from the model along with any results based on the loads.
@@ -1307,6 +1393,7 @@ class FEModel3D():
             member.SegmentsZ = []
             member.SegmentsY = []
             member.SegmentsX = []
+            member._clear_segments()
         
         # Delete the plate loads
         for plate in self.plates.values():
@@ -1316,31 +1403,21 @@ class FEModel3D():
         for quad in self.quads.values():
             quad.pressures = []
         
-        # Delete the nodal loads, calculated displacements, and calculated reactions
+        # Delete the nodal loads
         for node in self.nodes.values():
-
             node.NodeLoads = []
 
-            node.DX = {}
-            node.DY = {}
-            node.DZ = {}
-            node.RX = {}
-            node.RY = {}
-            node.RZ = {}
-
-            node.RxnFX = {}
-            node.RxnFY = {}
-            node.RxnFZ = {}
-            node.RxnMX = {}
-            node.RxnMY = {}
-            node.RxnMZ = {}
+        # Delete the calculated displacements and reactions. The nodes' results are views of these.
+        self._D.clear()
+        self._R.clear()
         
         # Flag the model as unsolved
         self.solution = None
+        self.load_revision += 1
                
     def K(self, combo_name='Combo 1', log=False, check_stability=True, sparse=True):
         """Returns the model's global stiffness matrix. The stiffness matrix will be returned in
-           scipy's sparse lil format, which reduces memory usage and can be easily converted to
+           scipy's sparse coo format, which reduces memory usage and can be easily converted to
            other formats.
 
         :param combo_name: The load combination to get the stiffness matrix for. Defaults to 'Combo 1'.
@@ -1355,297 +1432,47 @@ class FEModel3D():
         :type sparse: bool, optional
         :return: The global stiffness matrix for the structure.
         :rtype: ndarray or coo_matrix
-        """           
-        
-        # Determine if a sparse matrix has been requested
-        if sparse == True:
-            # The stiffness matrix will be stored as a scipy `coo_matrix`. Scipy's
-            # documentation states that this type of matrix is ideal for efficient
-            # construction of finite element matrices. When converted to another
-            # format, the `coo_matrix` sums values at the same (i, j) index. We'll
-            # build the matrix from three lists.
-            row = []
-            col = []
-            data = []
-        else:
-            # Initialize a dense matrix of zeros
-            K = zeros((len(self.nodes)*6, len(self.nodes)*6))
-        
+        """
+
+        # Element matrices are stacked by element type and scattered into the global matrix in a
+        # single vectorized step using the degree of freedom indices cached by `_renumber`
+        groups = []
+
         # Add stiffness terms for each nodal spring in the model
         if log: print('- Adding nodal spring support stiffness terms to global stiffness matrix')
+        spring_dofs = []
+        spring_k = []
         for node in self.nodes.values():
-            
-            # Determine if the node has any spring supports
-            if node.spring_DX[0] != None:
-
-                # Check for an active spring support
-                if node.spring_DX[2] == True:
-                    m, n = node.ID*6, node.ID*6
-                    if sparse == True:
-                        data.append(float(node.spring_DX[0]))
-                        row.append(m)
-                        col.append(n)
-                    else:
-                        K[m, n] += float(node.spring_DX[0])
 
-            if node.spring_DY[0] != None:
+            for i, node_spring in enumerate((node.spring_DX, node.spring_DY, node.spring_DZ,
+                                             node.spring_RX, node.spring_RY, node.spring_RZ)):
 
                 # Check for an active spring support
-                if node.spring_DY[2] == True:
-                    m, n = node.ID*6 + 1, node.ID*6 + 1
-                    if sparse == True:
-                        data.append(float(node.spring_DY[0]))
-                        row.append(m)
-                        col.append(n)
-                    else:
-                        K[m, n] += float(node.spring_DY[0])
-
-            if node.spring_DZ[0] != None:
+                if node_spring[0] != None and node_spring[2] == True:
+                    spring_dofs.append([node.ID*6 + i])
+                    spring_k.append([[float(node_spring[0])]])
 
-                # Check for an active spring support
-                if node.spring_DZ[2] == True:
-                    m, n = node.ID*6 + 2, node.ID*6 + 2
-                    if sparse == True:
-                        data.append(float(node.spring_DZ[0]))
-                        row.append(m)
-                        col.append(n)
-                    else:
-                        K[m, n] += float(node.spring_DZ[0])
-        
-            if node.spring_RX[0] != None:
-
-                # Check for an active spring support
-                if node.spring_RX[2] == True:
-                    m, n = node.ID*6 + 3, node.ID*6 + 3
-                    if sparse == True:
-                        data.append(float(node.spring_RX[0]))
-                        row.append(m)
-                        col.append(n)
-                    else:
-                        K[m, n] += float(node.spring_RX[0])
-
-            if node.spring_RY[0] != None:
-
-                # Check for an active spring support
-                if node.spring_RY[2] == True:
-                    m, n = node.ID*6 + 4, node.ID*6 + 4
-                    if sparse == True:
-                        data.append(float(node.spring_RY[0]))
-                        row.append(m)
-                        col.append(n)
-                    else:
-                        K[m, n] += float(node.spring_RY[0])
-            
-            if node.spring_RZ[0] != None:
-
-                # Check for an active spring support
-                if node.spring_RZ[2] == True:
-                    m, n = node.ID*6 + 5, node.ID*6 + 5
-                    if sparse == True:
-                        data.append(float(node.spring_RZ[0]))
-                        row.append(m)
-                        col.append(n)
-                    else:
-                        K[m, n] += float(node.spring_RZ[0])
+        if spring_dofs:
+            groups.append((array(spring_dofs), array(spring_k)))
 
         # Add stiffness terms for each spring in the model
         if log: print('- Adding spring stiffness terms to global stiffness matrix')
-        for spring in self.springs.values():
-            
-            if spring.active[combo_name] == True:
-
-                # Get the spring's global stiffness matrix
-                # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                spring_K = spring.K()
-
-                # Step through each term in the spring's stiffness matrix
-                # 'a' & 'b' below are row/column indices in the spring's stiffness matrix
-                # 'm' & 'n' are corresponding row/column indices in the global stiffness matrix
-                for a in range(12):
-                
-                    # Determine if index 'a' is related to the i-node or j-node
-                    if a < 6:
-                        # Find the corresponding index 'm' in the global stiffness matrix
-                        m = spring.i_node.ID*6 + a
-                    else:
-                        # Find the corresponding index 'm' in the global stiffness matrix
-                        m = spring.j_node.ID*6 + (a-6)
-                    
-                    for b in range(12):
-                    
-                        # Determine if index 'b' is related to the i-node or j-node
-                        if b < 6:
-                            # Find the corresponding index 'n' in the global stiffness matrix
-                            n = spring.i_node.ID*6 + b
-                        else:
-                            # Find the corresponding index 'n' in the global stiffness matrix
-                            n = spring.j_node.ID*6 + (b-6)
-                    
-                        # Now that 'm' and 'n' are known, place the term in the global stiffness matrix
-                        if sparse == True:
-                            row.append(m)
-                            col.append(n)
-                            data.append(spring_K[a, b])
-                        else:
-                            K[m, n] += spring_K[a, b]
+        groups.append(_element_group((spring for spring in self.springs.values() if spring.active[combo_name] == True),
+                                     lambda spring: spring.K()))
 
         # Add stiffness terms for each physical member in the model
         if log: print('- Adding member stiffness terms to global stiffness matrix')
-        for phys_member in self.members.values():
-            
-            # Check to see if the physical member is active for the given load combination
-            if phys_member.active[combo_name] == True:
+        groups.append(_element_group(self._active_members(combo_name), lambda member: member.K()))
 
-                # Step through each sub-member in the physical member and add terms
-                for member in phys_member.sub_members.values():
-                    
-                    # Get the member's global stiffness matrix
-                    # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                    member_K = member.K()
-
-                    # Step through each term in the member's stiffness matrix
-                    # 'a' & 'b' below are row/column indices in the member's stiffness matrix
-                    # 'm' & 'n' are corresponding row/column indices in the global stiffness matrix
-                    for a in range(12):
-                    
-                        # Determine if index 'a' is related to the i-node or j-node
-                        if a < 6:
-                            # Find the corresponding index 'm' in the global stiffness matrix
-                            m = member.i_node.ID*6 + a
-                        else:
-                            # Find the corresponding index 'm' in the global stiffness matrix
-                            m = member.j_node.ID*6 + (a-6)
-                        
-                        for b in range(12):
-                        
-                            # Determine if index 'b' is related to the i-node or j-node
-                            if b < 6:
-                                # Find the corresponding index 'n' in the global stiffness matrix
-                                n = member.i_node.ID*6 + b
-                            else:
-                                # Find the corresponding index 'n' in the global stiffness matrix
-                                n = member.j_node.ID*6 + (b-6)
-                        
-                            # Now that 'm' and 'n' are known, place the term in the global stiffness matrix
-                            if sparse == True:
-                                row.append(m)
-                                col.append(n)
-                                data.append(member_K[a, b])
-                            else:
-                                K[m, n] += member_K[a, b]
-                
         # Add stiffness terms for each quadrilateral in the model
         if log: print('- Adding quadrilateral stiffness terms to global stiffness matrix')
-        for quad in self.quads.values():
-            
-            # Get the quadrilateral's global stiffness matrix
-            # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-            quad_K = quad.K()
-
-            # Step through each term in the quadrilateral's stiffness matrix
-            # 'a' & 'b' below are row/column indices in the quadrilateral's stiffness matrix
-            # 'm' & 'n' are corresponding row/column indices in the global stiffness matrix
-            for a in range(24):
-
-                # Determine which node the index 'a' is related to
-                if a < 6:
-                    # Find the corresponding index 'm' in the global stiffness matrix
-                    m = quad.i_node.ID*6 + a
-                elif a < 12:
-                    # Find the corresponding index 'm' in the global stiffness matrix
-                    m = quad.j_node.ID*6 + (a - 6)
-                elif a < 18:
-                    # Find the corresponding index 'm' in the global stiffness matrix
-                    m = quad.m_node.ID*6 + (a - 12)
-                else:
-                    # Find the corresponding index 'm' in the global stiffness matrix
-                    m = quad.n_node.ID*6 + (a - 18)
-
-                for b in range(24):
-
-                    # Determine which node the index 'b' is related to
-                    if b < 6:
-                        # Find the corresponding index 'n' in the global stiffness matrix
-                        n = quad.i_node.ID*6 + b
-                    elif b < 12:
-                        # Find the corresponding index 'n' in the global stiffness matrix
-                        n = quad.j_node.ID*6 + (b - 6)
-                    elif b < 18:
-                        # Find the corresponding index 'n' in the global stiffness matrix
-                        n = quad.m_node.ID*6 + (b - 12)
-                    else:
-                        # Find the corresponding index 'n' in the global stiffness matrix
-                        n = quad.n_node.ID*6 + (b - 18)
-                    
-                    # Now that 'm' and 'n' are known, place the term in the global stiffness matrix
-                    if sparse == True:
-                        row.append(m)
-                        col.append(n)
-                        data.append(quad_K[a, b])
-                    else:
-                        K[m, n] += quad_K[a, b]
-        
+        groups.append(_batch_group(self.quads.values(), Quad3D.batch_K))
+
         # Add stiffness terms for each plate in the model
         if log: print('- Adding plate stiffness terms to global stiffness matrix')
-        for plate in self.plates.values():
-            
-            # Get the plate's global stiffness matrix
-            # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-            plate_K = plate.K()
-
-            # Step through each term in the plate's stiffness matrix
-            # 'a' & 'b' below are row/column indices in the plate's stiffness matrix
-            # 'm' & 'n' are corresponding row/column indices in the global stiffness matrix
-            for a in range(24):
-
-                # Determine which node the index 'a' is related to
-                if a < 6:
-                    # Find the corresponding index 'm' in the global stiffness matrix
-                    m = plate.i_node.ID*6 + a
-                elif a < 12:
-                    # Find the corresponding index 'm' in the global stiffness matrix
-                    m = plate.j_node.ID*6 + (a - 6)
-                elif a < 18:
-                    # Find the corresponding index 'm' in the global stiffness matrix
-                    m = plate.m_node.ID*6 + (a - 12)
-                else:
-                    # Find the corresponding index 'm' in the global stiffness matrix
-                    m = plate.n_node.ID*6 + (a - 18)
-
-                for b in range(24):
-
-                    # Determine which node the index 'b' is related to
-                    if b < 6:
-                        # Find the corresponding index 'n' in the global stiffness matrix
-                        n = plate.i_node.ID*6 + b
-                    elif b < 12:
-                        # Find the corresponding index 'n' in the global stiffness matrix
-                        n = plate.j_node.ID*6 + (b - 6)
-                    elif b < 18:
-                        # Find the corresponding index 'n' in the global stiffness matrix
-                        n = plate.m_node.ID*6 + (b - 12)
-                    else:
-                        # Find the corresponding index 'n' in the global stiffness matrix
-                        n = plate.n_node.ID*6 + (b - 18)
-                    
-                    # Now that 'm' and 'n' are known, place the term in the global stiffness matrix
-                    if sparse == True:
-                        row.append(m)
-                        col.append(n)
-                        data.append(plate_K[a, b])
-                    else:
-                        K[m, n] += plate_K[a, b]
-
-        if sparse:
-            # The stiffness matrix will be stored as a scipy `coo_matrix`. Scipy's
-            # documentation states that this type of matrix is ideal for efficient
-            # construction of finite element matrices. When converted to another
-            # format, the `coo_matrix` sums values at the same (i, j) index.
-            from scipy.sparse import coo_matrix
-            row = array(row)
-            col = array(col)
-            data = array(data)
-            K = coo_matrix((data, (row, col)), shape=(len(self.nodes)*6, len(self.nodes)*6))
+        groups.append(_batch_group(self.plates.values(), Plate3D.batch_K))
+
+        K = _assemble_matrix(len(self.nodes)*6, groups, sparse)
 
         # Check that there are no nodal instabilities
         if check_stability:
@@ -1654,8 +1481,20 @@ class FEModel3D():
             else: _check_stability(self, K)
 
         # Return the global stiffness matrix
-        return K    
-   
+        return K
+
+    def _active_members(self, combo_name):
+        """Returns a generator over the sub-members of every physical member that is active for
+        the given load combination.
+
+        :param combo_name: The name of the load combination.
+        :type combo_name: str
+        """
+
+        for phys_member in self.members.values():
+            if phys_member.active[combo_name] == True:
+                yield from phys_member.sub_members.values()
+
     def Kg(self, combo_name='Combo 1', log=False, sparse=True, first_step=True):
         """Returns the model's global geometric stiffness matrix. Geometric stiffness of plates is not considered.
 
@@ -1670,71 +1509,14 @@ class FEModel3D():
         :return: The global geometric stiffness matrix for the structure.
         :rtype: ndarray or coo_matrix
         """
-        
-        if sparse == True:
-            # Initialize a zero matrix to hold all the stiffness terms. The matrix will be stored as a scipy sparse `lil_matrix`. This matrix format has several advantages. It uses less memory if the matrix is sparse, supports slicing, and can be converted to other formats (sparse or dense) later on for mathematical operations.
-            from scipy.sparse import lil_matrix
-            Kg = lil_matrix((len(self.nodes)*6, len(self.nodes)*6))
-        else:
-            Kg = zeros(len(self.nodes)*6, len(self.nodes)*6)
-        
+
         # Add stiffness terms for each physical member in the model
         if log: print('- Adding member geometric stiffness terms to global geometric stiffness matrix')
-        for phys_member in self.members.values():
-            
-            # Check to see if the physical member is active for the given load combination
-            if phys_member.active[combo_name] == True:
-
-                # Step through each sub-member in the physical member and add terms
-                for member in phys_member.sub_members.values():
-
-                    # Calculate the axial force in the member
-                    E = member.material.E
-                    A = member.section.A
-                    L = member.L()
-
-                    # Calculate the axial force acting on the member
-                    if first_step:
-                        # For the first load step take P = 0
-                        P = 0
-                    else:
-                        # Calculate the member axial force due to axial strain
-                        d = member.d(combo_name)
-                        P = E*A/L*(d[6, 0] - d[0, 0])
-
-                    # Get the member's global stiffness matrix
-                    # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                    member_Kg = member.Kg(P)
-
-                    # Step through each term in the member's stiffness matrix
-                    # 'a' & 'b' below are row/column indices in the member's stiffness matrix
-                    # 'm' & 'n' are corresponding row/column indices in the global stiffness matrix
-                    for a in range(12):
-                    
-                        # Determine if index 'a' is related to the i-node or j-node
-                        if a < 6:
-                            # Find the corresponding index 'm' in the global stiffness matrix
-                            m = member.i_node.ID*6 + a
-                        else:
-                            # Find the corresponding index 'm' in the global stiffness matrix
-                            m = member.j_node.ID*6 + (a-6)
-                        
-                        for b in range(12):
-                        
-                            # Determine if index 'b' is related to the i-node or j-node
-                            if b < 6:
-                                # Find the corresponding index 'n' in the global stiffness matrix
-                                n = member.i_node.ID*6 + b
-                            else:
-                                # Find the corresponding index 'n' in the global stiffness matrix
-                                n = member.j_node.ID*6 + (b-6)
-                        
-                            # Now that 'm' and 'n' are known, place the term in the global stiffness matrix
-                            Kg[m, n] += member_Kg[(a, b)]
+        Kg = _assemble_matrix(len(self.nodes)*6, [_element_group(self._active_members(combo_name), lambda member: _member_Kg(member, combo_name, first_step))], sparse)
 
         # Return the global geometric stiffness matrix
         return Kg
-      
+
     def Km(self, combo_name='Combo 1', push_combo='Push', step_num=1, log=False, sparse=True):
         """Calculates the structure's global plastic reduction matrix, which is used for nonlinear inelastic analysis.
 
@@ -1751,224 +1533,51 @@ class FEModel3D():
         :return: The gloabl plastic reduction matrix.
         :rtype: array
         """
-       
-        # Determine if a sparse matrix has been requested
-        if sparse == True:
-            # The plastic reduction matrix will be stored as a scipy `coo_matrix`. Scipy's documentation states that this type of matrix is ideal for efficient construction of finite element matrices. When converted to another format, the `coo_matrix` sums values at the same (i, j) index. We'll build the matrix from three lists.
-            row = []
-            col = []
-            data = []
-        else:
-            # Initialize a dense matrix of zeros
-            Km = zeros((len(self.nodes)*6, len(self.nodes)*6))
 
         # Add stiffness terms for each physical member in the model
         if log: print('- Calculating the plastic reduction matrix')
-        for phys_member in self.members.values():
-            
-            # Check to see if the physical member is active for the given load combination
-            if phys_member.active[combo_name] == True:
-
-                # Step through each sub-member in the physical member and add terms
-                for member in phys_member.sub_members.values():
-                    
-                    # Get the member's global plastic reduction matrix
-                    # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                    member_Km = member.Km(combo_name, push_combo, step_num)
-
-                    # Step through each term in the member's plastic reduction matrix
-                    # 'a' & 'b' below are row/column indices in the member's matrix
-                    # 'm' & 'n' are corresponding row/column indices in the structure's global matrix
-                    for a in range(12):
-                    
-                        # Determine if index 'a' is related to the i-node or j-node
-                        if a < 6:
-                            # Find the corresponding index 'm' in the global plastic reduction matrix
-                            m = member.i_node.ID*6 + a
-                        else:
-                            # Find the corresponding index 'm' in the global plastic reduction matrix
-                            m = member.j_node.ID*6 + (a-6)
-                        
-                        for b in range(12):
-                        
-                            # Determine if index 'b' is related to the i-node or j-node
-                            if b < 6:
-                                # Find the corresponding index 'n' in the global plastic reduction matrix
-                                n = member.i_node.ID*6 + b
-                            else:
-                                # Find the corresponding index 'n' in the global plastic reduction matrix
-                                n = member.j_node.ID*6 + (b-6)
-                        
-                            # Now that 'm' and 'n' are known, place the term in the global plastic reduction matrix
-                            if sparse == True:
-                                row.append(m)
-                                col.append(n)
-                                data.append(member_Km[a, b])
-                            else:
-                                Km[m, n] += member_Km[a, b]
-
-        if sparse:
-            # The plastic reduction matrix will be stored as a scipy `coo_matrix`. Scipy's documentation states that this type of matrix is ideal for efficient construction of finite element matrices. When converted to another format, the `coo_matrix` sums values at the same (i, j) index.
-            from scipy.sparse import coo_matrix
-            row = array(row)
-            col = array(col)
-            data = array(data)
-            Km = coo_matrix((data, (row, col)), shape=(len(self.nodes)*6, len(self.nodes)*6))
-
-        # Check that there are no nodal instabilities
-        # if check_stability:
-        #     if log: print('- Checking nodal stability')
-        #     if sparse: Analysis._check_stability(self, Km.tocsr())
-        #     else: Analysis._check_stability(self, Km)
+        group = _element_group(self._active_members(combo_name),
+                               lambda member: member.Km(combo_name, push_combo, step_num))
 
         # Return the global plastic reduction matrix
-        return Km 
+        return _assemble_matrix(len(self.nodes)*6, [group], sparse)
 
     def FER(self, combo_name='Combo 1'):
         """Assembles and returns the global fixed end reaction vector for any given load combo.
 
+        The fixed end reaction vectors for each load case are cached (see `load_revision`), so this
+        is a single product of them with the load combination's factors.
+
         :param combo_name: The name of the load combination to get the fixed end reaction vector
                            for. Defaults to 'Combo 1'.
         :type combo_name: str, optional
         :return: The fixed end reaction vector
         :rtype: array
-        """        
-        
-        # Initialize a zero vector to hold all the terms
-        FER = zeros((len(self.nodes) * 6, 1))
-        
-        # Step through each physical member in the model
-        for phys_member in self.members.values():
-            
-            # Step through each sub-member and add terms
-            for member in phys_member.sub_members.values():
-
-                # Get the member's global fixed end reaction vector
-                # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                member_FER = member.FER(combo_name)
-
-                # Step through each term in the member's fixed end reaction vector
-                # 'a' below is the row index in the member's fixed end reaction vector
-                # 'm' below is the corresponding row index in the global fixed end reaction vector
-                for a in range(12):
-                    
-                    # Determine if index 'a' is related to the i-node or j-node
-                    if a < 6:
-                        # Find the corresponding index 'm' in the global fixed end reaction vector
-                        m = member.i_node.ID * 6 + a
-                    else:
-                        # Find the corresponding index 'm' in the global fixed end reaction vector
-                        m = member.j_node.ID * 6 + (a - 6)
-                    
-                    # Now that 'm' is known, place the term in the global fixed end reaction vector
-                    FER[m, 0] += member_FER[a, 0]
-        
-        # Add terms for each rectangle in the model
-        for plate in self.plates.values():
-            
-            # Get the quadrilateral's global fixed end reaction vector
-            # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-            plate_FER = plate.FER(combo_name)
-
-            # Step through each term in the quadrilateral's fixed end reaction vector
-            # 'a' below is the row index in the quadrilateral's fixed end reaction vector
-            # 'm' below is the corresponding row index in the global fixed end reaction vector
-            for a in range(24):
-                
-                # Determine if index 'a' is related to the i-node, j-node, m-node, or n-node
-                if a < 6:
-                    # Find the corresponding index 'm' in the global fixed end reaction vector
-                    m = plate.i_node.ID*6 + a
-                elif a < 12:
-                    # Find the corresponding index 'm' in the global fixed end reaction vector
-                    m = plate.j_node.ID*6 + (a - 6)
-                elif a < 18:
-                    # Find the corresponding index 'm' in the global fixed end reaction vector
-                    m = plate.m_node.ID*6 + (a - 12)
-                else:
-                    # Find the corresponding index 'm' in the global fixed end reaction vector
-                    m = plate.n_node.ID*6 + (a - 18)
-                
-                # Now that 'm' is known, place the term in the global fixed end reaction vector
-                FER[m, 0] += plate_FER[a, 0]
+        """
 
-        # Add terms for each quadrilateral in the model
-        for quad in self.quads.values():
-            
-            # Get the quadrilateral's global fixed end reaction vector
-            # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-            quad_FER = quad.FER(combo_name)
-
-            # Step through each term in the quadrilateral's fixed end reaction vector
-            # 'a' below is the row index in the quadrilateral's fixed end reaction vector
-            # 'm' below is the corresponding row index in the global fixed end reaction vector
-            for a in range(24):
-                
-                # Determine if index 'a' is related to the i-node, j-node, m-node, or n-node
-                if a < 6:
-                    # Find the corresponding index 'm' in the global fixed end reaction vector
-                    m = quad.i_node.ID*6 + a
-                elif a < 12:
-                    # Find the corresponding index 'm' in the global fixed end reaction vector
-                    m = quad.j_node.ID*6 + (a - 6)
-                elif a < 18:
-                    # Find the corresponding index 'm' in the global fixed end reaction vector
-                    m = quad.m_node.ID*6 + (a - 12)
-                else:
-                    # Find the corresponding index 'm' in the global fixed end reaction vector
-                    m = quad.n_node.ID*6 + (a - 18)
-                
-                # Now that 'm' is known, place the term in the global fixed end reaction vector
-                FER[m, 0] += quad_FER[a, 0]
+        # Fixed end reactions are collected from every sub-member, whether active or not
+        cases, P, FER = _case_load_vectors(self)
 
         # Return the global fixed end reaction vector
-        return FER
-    
+        return FER @ _combo_factors(self.load_combos[combo_name], cases)
+
     def P(self, combo_name='Combo 1'):
         """Assembles and returns the global nodal force vector.
 
+        The nodal force vectors for each load case are cached (see `load_revision`), so this is a
+        single product of them with the load combination's factors.
+
         :param combo_name: The name of the load combination to get the force vector for. Defaults
                            to 'Combo 1'.
         :type combo_name: str, optional
         :return: The global nodal force vector.
         :rtype: array
         """
-            
-        # Initialize a zero vector to hold all the terms
-        P = zeros((len(self.nodes)*6, 1))
-        
-        # Get the load combination for the given 'combo_name'
-        combo = self.load_combos[combo_name]
 
-        # Add terms for each node in the model
-        for node in self.nodes.values():
-            
-            # Get the node's ID
-            ID = node.ID
-
-            # Step through each load factor in the load combination
-            for case, factor in combo.factors.items():
-
-                # Add the node's loads to the global nodal load vector
-                for load in node.NodeLoads:
-
-                    if load[2] == case:
-
-                        if load[0] == 'FX':
-                            P[ID*6 + 0, 0] += factor*load[1]
-                        elif load[0] == 'FY':
-                            P[ID*6 + 1, 0] += factor*load[1]
-                        elif load[0] == 'FZ':
-                            P[ID*6 + 2, 0] += factor*load[1]
-                        elif load[0] == 'MX':
-                            P[ID*6 + 3, 0] += factor*load[1]
-                        elif load[0] == 'MY':
-                            P[ID*6 + 4, 0] += factor*load[1]
-                        elif load[0] == 'MZ':
-                            P[ID*6 + 5, 0] += factor*load[1]
-        
+        cases, P, FER = _case_load_vectors(self)
+
         # Return the global nodal force vector
-        return P
+        return P @ _combo_factors(self.load_combos[combo_name], cases)
 
     def D(self, combo_name='Combo 1'):
         """Returns the global displacement vector for the model.
@@ -1983,7 +1592,21 @@ class FEModel3D():
         # Return the global displacement vector
         return self._D[combo_name]
 
-    def analyze(self, log=False, check_stability=True, check_statics=False, max_iter=30, sparse=True, combo_tags=None, spring_tolerance=0, member_tolerance=0):
+    def R(self, combo_name='Combo 1'):
+        """Returns the global reaction vector for the model. Terms for degrees of freedom without
+        supports are zero.
+
+        :param combo_name: The name of the load combination to get the results for. Defaults to
+                           'Combo 1'.
+        :type combo_name: str, optional
+        :return: The global reaction vector for the model
+        :rtype: array
+        """
+
+        # Return the global reaction vector
+        return self._R[combo_name]
+
+    def analyze(self, log=False, check_stability=True, check_statics=False, max_iter=30, sparse=True, combo_tags=None, spring_tolerance=0, member_tolerance=0, workers=None):
         """Performs first-order static analysis. Iterations are performed if tension-only members or compression-only members are present.
 
         :param log: Prints the analysis log to the console if set to True. Default is False.
@@ -1996,6 +1619,8 @@ class FEModel3D():
         :type max_iter: int, optional
         :param sparse: Indicates whether the sparse matrix solver should be used. A matrix can be considered sparse or dense depening on how many zero terms there are. Structural stiffness matrices often contain many zero terms. The sparse solver can offer faster solutions for such matrices. Using the sparse solver on dense matrices may lead to slower solution times.
         :type sparse: bool, optional
+        :param workers: The number of worker processes used to solve load combinations in parallel. Load combinations are independent, so each one can be solved by a separate process working on its own copy of the prepared model. Defaults to `None`, in which case the load combinations are solved one after another in this process.
+        :type workers: int, optional
         :raises Exception: _description_
         :raises Exception: _description_
         """
@@ -2005,10 +1630,6 @@ class FEModel3D():
             print('| Analyzing |')
             print('+-----------+')
 
-        # Import `scipy` features if the sparse solver is being used
-        if sparse == True:
-            from scipy.sparse.linalg import spsolve
-
         # Prepare the model for analysis
         _prepare_model(self)
 
@@ -2018,70 +1639,9 @@ class FEModel3D():
         # Identify which load combinations have the tags the user has given
         combo_list = _identify_combos(self, combo_tags)
 
-        # Step through each load combination
-        for combo in combo_list:
-
-            if log:
-                print('')
-                print('- Analyzing load combination ' + combo.name)
-
-            # Keep track of the number of iterations
-            iter_count = 1
-            convergence = False
-            divergence = False
-
-            # Iterate until convergence or divergence occurs
-            while convergence == False and divergence == False:
-                
-                # Check for tension/compression-only divergence
-                if iter_count > max_iter:
-                    divergence = True
-                    raise Exception('Model diverged during tension/compression-only analysis')
-                
-                # Get the partitioned global stiffness matrix K11, K12, K21, K22
-                if sparse == True:
-                    K11, K12, K21, K22 = _partition(self, self.K(combo.name, log, check_stability, sparse).tolil(), D1_indices, D2_indices)
-                else:
-                    K11, K12, K21, K22 = _partition(self, self.K(combo.name, log, check_stability, sparse), D1_indices, D2_indices)
-
-                # Get the partitioned global fixed end reaction vector
-                FER1, FER2 = _partition(self, self.FER(combo.name), D1_indices, D2_indices)
-
-                # Get the partitioned global nodal force vector       
-                P1, P2 = _partition(self, self.P(combo.name), D1_indices, D2_indices)          
-
-                # Calculate the global displacement vector
-                if log: print('- Calculating global displacement vector')
-                if K11.shape == (0, 0):
-                    # All displacements are known, so D1 is an empty vector
-                    D1 = []
-                else:
-                    try:
-                        # Calculate the unknown displacements D1
-                        if sparse == True:
-                            # The partitioned stiffness matrix is in `lil` format, which is great for memory, but slow for mathematical operations. The stiffness matrix will be converted to `csr` format for mathematical operations. The `@` operator performs matrix multiplication on sparse matrices.
-                            D1 = spsolve(K11.tocsr(), subtract(subtract(P1, FER1), K12.tocsr() @ D2))
-                            D1 = D1.reshape(len(D1), 1)
-                        else:
-                            D1 = solve(K11, subtract(subtract(P1, FER1), matmul(K12, D2)))
-                    except:
-                        # Return out of the method if 'K' is singular and provide an error message
-                        raise Exception('The stiffness matrix is singular, which implies rigid body motion. The structure is unstable. Aborting analysis.')
-
-                # Store the calculated displacements to the model and the nodes in the model
-                _store_displacements(self, D1, D2, D1_indices, D2_indices, combo)
-                
-                # Check for tension/compression-only convergence
-                convergence = _check_TC_convergence(self, combo.name, log=log, spring_tolerance=spring_tolerance, member_tolerance=member_tolerance)
-
-                if convergence == False:
-
-                    if log: print('- Tension/compression-only analysis did not converge. Adjusting stiffness matrix and reanalyzing.')
-                else:
-                    if log: print('- Tension/compression-only analysis converged after ' + str(iter_count) + ' iteration(s)')
-
-                # Keep track of the number of tension/compression only iterations
-                iter_count += 1
+        # Solve each load combination, iterating on tension/compression-only elements
+        _solve_combos(self, combo_list, _TC_combo, D1_indices, D2_indices, D2, sparse, workers, log=log, check_stability=check_stability,
+                      max_iter=max_iter, spring_tolerance=spring_tolerance, member_tolerance=member_tolerance)
 
         # Calculate reactions
         _calc_reactions(self, log, combo_tags)
@@ -2098,7 +1658,7 @@ class FEModel3D():
         # Flag the model as solved
         self.solution = 'Linear TC'
 
-    def analyze_linear(self, log=False, check_stability=True, check_statics=False, sparse=True, combo_tags=None):
+    def analyze_linear(self, log=False, check_stability=True, check_statics=False, sparse=True, combo_tags=None, superposition=False):
         """Performs first-order static analysis. This analysis procedure is much faster since it only assembles the global stiffness matrix once, rather than once for each load combination. It is not appropriate when non-linear behavior such as tension/compression only analysis or P-Delta analysis are required.
 
         :param log: Prints the analysis log to the console if set to True. Default is False.
@@ -2109,6 +1669,10 @@ class FEModel3D():
         :type check_statics: bool, optional
         :param sparse: Indicates whether the sparse matrix solver should be used. A matrix can be considered sparse or dense depening on how many zero terms there are. Structural stiffness matrices often contain many zero terms. The sparse solver can offer faster solutions for such matrices. Using the sparse solver on dense matrices may lead to slower solution times. Be sure ``scipy`` is installed to use the sparse solver. Default is True.
         :type sparse: bool, optional
+        :param combo_tags: A list of tags used to select the load combinations to be analyzed. Defaults to `None`, in which case all load combinations are analyzed.
+        :type combo_tags: list, optional
+        :param superposition: When set to True, the stiffness matrix is factored once and solved for each primitive load case (plus any enforced displacements) instead of once per load combination. Load combination results are then formed by linear superposition using each combination's load factors. This is much faster for models with many more load combinations than load cases. Defaults to False.
+        :type superposition: bool, optional
         :raises Exception: Occurs when a singular stiffness matrix is found. This indicates an unstable structure has been modeled.
         """
 
@@ -2117,10 +1681,6 @@ class FEModel3D():
             print('| Analyzing: Linear |')
             print('+-------------------+')
         
-        # Import `scipy` features if the sparse solver is being used
-        if sparse == True:
-            from scipy.sparse.linalg import spsolve
-
         # Prepare the model for analysis
         _prepare_model(self)
 
@@ -2130,50 +1690,51 @@ class FEModel3D():
         # Get the partitioned global stiffness matrix K11, K12, K21, K22
         # Note that for linear analysis the stiffness matrix can be obtained for any load combination, as it's the same for all of them
         combo_name = list(self.load_combos.keys())[0]
-        if sparse == True:
-            K11, K12, K21, K22 = _partition(self, self.K(combo_name, log, check_stability, sparse).tolil(), D1_indices, D2_indices)
-        else:
-            K11, K12, K21, K22 = _partition(self, self.K(combo_name, log, check_stability, sparse), D1_indices, D2_indices)
+        K11, K12, K21, K22 = _partition(self, self.K(combo_name, log, check_stability, sparse), D1_indices, D2_indices)
 
         # Identify which load combinations have the tags the user has given
         combo_list = _identify_combos(self, combo_tags)
 
-        # Step through each load combination
-        for combo in combo_list:
+        # K11 is the same for every load combination, so it only needs to be factored once
+        solver = LinearSolver(sparse)
 
-            if log:
-                print('')
-                print('- Analyzing load combination ' + combo.name)
+        if superposition == True:
+            # Solve once per primitive load case and superimpose the results
+            _superimpose_cases(self, K11, K12, D1_indices, D2_indices, D2, combo_list, log, sparse, solver)
+        else:
+            # Step through each load combination
+            for combo in combo_list:
 
-            # Get the partitioned global fixed end reaction vector
-            FER1, FER2 = _partition(self, self.FER(combo.name), D1_indices, D2_indices)
+                if log:
+                    print('')
+                    print('- Analyzing load combination ' + combo.name)
 
-            # Get the partitioned global nodal force vector       
-            P1, P2 = _partition(self, self.P(combo.name), D1_indices, D2_indices)          
+                # Get the partitioned global fixed end reaction vector
+                FER1, FER2 = _partition(self, self.FER(combo.name), D1_indices, D2_indices)
 
-            # Calculate the global displacement vector
-            if log: print('- Calculating global displacement vector')
-            if K11.shape == (0, 0):
-                # All displacements are known, so D1 is an empty vector
-                D1 = []
-            else:
-                try:
-                    # Calculate the unknown displacements D1
-                    if sparse == True:
-                        # The partitioned stiffness matrix is in `lil` format, which is great
-                        # for memory, but slow for mathematical operations. The stiffness
-                        # matrix will be converted to `csr` format for mathematical operations.
-                        # The `@` operator performs matrix multiplication on sparse matrices.
-                        D1 = spsolve(K11.tocsr(), subtract(subtract(P1, FER1), K12.tocsr() @ D2))
-                        D1 = D1.reshape(len(D1), 1)
-                    else:
-                        D1 = solve(K11, subtract(subtract(P1, FER1), matmul(K12, D2)))
-                except:
-                    # Return out of the method if 'K' is singular and provide an error message
-                    raise Exception('The stiffness matrix is singular, which implies rigid body motion. The structure is unstable. Aborting analysis.')
-
-            # Store the calculated displacements to the model and the nodes in the model
-            _store_displacements(self, D1, D2, D1_indices, D2_indices, combo)
+                # Get the partitioned global nodal force vector       
+                P1, P2 = _partition(self, self.P(combo.name), D1_indices, D2_indices)          
+
+                # Calculate the global displacement vector
+                if log: print('- Calculating global displacement vector')
+                if K11.shape == (0, 0):
+                    # All displacements are known, so D1 is an empty vector
+                    D1 = []
+                else:
+                    try:
+                        # Calculate the unknown displacements D1
+                        if sparse == True:
+                            # The partitioned stiffness matrix is in `csr` format. The `@` operator
+                            # performs matrix multiplication on sparse matrices.
+                            D1 = solver.solve(K11, subtract(subtract(P1, FER1), K12 @ D2))
+                        else:
+                            D1 = solver.solve(K11, subtract(subtract(P1, FER1), matmul(K12, D2)))
+                    except:
+                        # Return out of the method if 'K' is singular and provide an error message
+                        raise Exception('The stiffness matrix is singular, which implies rigid body motion. The structure is unstable. Aborting analysis.')
+
+                # Store the calculated displacements to the model and the nodes in the model
+                _store_displacements(self, D1, D2, D1_indices, D2_indices, combo)
 
         # Calculate reactions
         _calc_reactions(self, log, combo_tags)
@@ -2189,8 +1750,9 @@ class FEModel3D():
         
         # Flag the model as solved
         self.solution = 'Linear'
+        self._solution_revision = (self.revision, self.load_revision)
 
-    def analyze_PDelta(self, log=False, check_stability=True, max_iter=30, sparse=True, combo_tags=None):
+    def analyze_PDelta(self, log=False, check_stability=True, max_iter=30, sparse=True, combo_tags=None, workers=None, tol=0.001):
         """Performs second order (P-Delta) analysis. This type of analysis is appropriate for most models using beams, columns and braces. Second order analysis is usually required by material specific codes. The analysis is iterative and takes longer to solve. Models with slender members and/or members with combined bending and axial loads will generally have more significant P-Delta effects. P-Delta effects in plates/quads are not considered.
 
         :param log: Prints updates to the console if set to True. Default is False.
@@ -2201,6 +1763,12 @@ class FEModel3D():
         :type max_iter: int, optional
         :param sparse: Indicates whether the sparse matrix solver should be used. A matrix can be considered sparse or dense depening on how many zero terms there are. Structural stiffness matrices often contain many zero terms. The sparse solver can offer faster solutions for such matrices. Using the sparse solver on dense matrices may lead to slower solution times. Be sure ``scipy`` is installed to use the sparse solver. Default is True.
         :type sparse: bool, optional
+        :param combo_tags: A list of tags used to select the load combinations to be analyzed. Defaults to `None`, in which case all load combinations are analyzed.
+        :type combo_tags: list, optional
+        :param workers: The number of worker processes used to solve load combinations in parallel. Load combinations are independent, so each one can be solved by a separate process working on its own copy of the prepared model. Defaults to `None`, in which case the load combinations are solved one after another in this process.
+        :type workers: int, optional
+        :param tol: The relative change in displacements and member axial forces between iterations below which the P-Delta analysis is considered converged. The changes found on each iteration are stored in `pdelta_history`. Defaults to 0.001.
+        :type tol: float, optional
         :raises ValueError: Occurs when there is a singularity in the stiffness matrix, which indicates an unstable structure.
         :raises Exception: Occurs when a model fails to converge.
         """
@@ -2210,10 +1778,6 @@ class FEModel3D():
             print('| Analyzing: P-Delta |')
             print('+--------------------+')
 
-        # Import `scipy` features if the sparse solver is being used
-        if sparse == True:
-            from scipy.sparse.linalg import spsolve
-
         # Prepare the model for analysis
         _prepare_model(self)
         
@@ -2223,18 +1787,15 @@ class FEModel3D():
         # Identify which load combinations have the tags the user has given
         combo_list = _identify_combos(self, combo_tags)
 
-        # Step through each load combination
-        for combo in combo_list:
-
-            # Get the partitioned global fixed end reaction vector
-            FER1, FER2 = _partition(self, self.FER(combo.name), D1_indices, D2_indices)
+        # Run the P-Delta analysis for each load combination
+        self.pdelta_history = {}
+        _solve_combos(self, combo_list, _PDelta_combo, D1_indices, D2_indices, D2, sparse, workers, log=log, check_stability=check_stability, max_iter=max_iter, tol=tol)
 
-            # Get the partitioned global nodal force vector       
-            P1, P2 = _partition(self, self.P(combo.name), D1_indices, D2_indices)
+        # Flag the model as solved. This is done before calculating reactions, which include the
+        # geometric stiffness for P-Delta solutions. Load combinations solved by worker processes
+        # don't set the flag on this model.
+        self.solution = 'P-Delta'
 
-            # Run the P-Delta analysis for this load combination
-            _PDelta_step(self, combo.name, P1, FER1, D1_indices, D2_indices, D2, log, sparse, check_stability, max_iter, True)
-        
         # Calculate reactions
         _calc_reactions(self, log, combo_tags)
 
@@ -2242,9 +1803,6 @@ class FEModel3D():
             print('')
             print('- Analysis complete')
             print('')
-        
-        # Flag the model as solved
-        self.solution = 'P-Delta'
     
     def _not_ready_yet_analyze_pushover(self, log=False, check_stability=True, push_combo='Push', max_iter=30, tol=0.01, sparse=True, combo_tags=None):
 
@@ -2313,8 +1871,12 @@ class FEModel3D():
             # Get the partitioned global nodal force vector for a pushover load increment
             P1_push, P2_push = _partition(self, self.P(push_combo), D1_indices, D2_indices)
 
+            # The solver keeps its factorization of K11 for as long as the stiffness matrix doesn't
+            # change
+            solver = LinearSolver(sparse)
+
             # Solve the current load combination without the pushover load applied
-            _PDelta_step(self, combo.name, P1, FER1, D1_indices, D2_indices, D2, log, sparse, check_stability, max_iter, first_step=True)
+            _PDelta_step(self, combo.name, P1, FER1, D1_indices, D2_indices, D2, log, sparse, check_stability, max_iter, first_step=True, solver=solver)
 
             # Since a P-Delta analysis was just run, we'll need to correct the solution to flag it
             # as 'pushover' instead of 'PDelta'
@@ -2343,7 +1905,7 @@ class FEModel3D():
                     D_temp = self._D
 
                     # Run or rerun the next pushover load step
-                    d_Delta = _pushover_step(self, combo.name, push_combo, step_num, P1_push, FER1_push, D1_indices, D2_indices, D2, log, sparse, check_stability)
+                    d_Delta = _pushover_step(self, combo.name, push_combo, step_num, P1_push, FER1_push, D1_indices, D2_indices, D2, log, sparse, check_stability, solver)
 
                 # Update nonlinear material member end forces for each member
                 for member in self.members.values():
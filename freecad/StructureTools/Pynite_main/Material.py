@@ -14,4 +14,12 @@ class Material():
         self.G = G
         self.nu = nu
         self.rho = rho
-        self.fy = fy
\ No newline at end of file
+        self.fy = fy
+
+    def __setattr__(self, name, value):
+
+        # Editing a material changes the matrices of the elements that use it
+        super().__setattr__(name, value)
+        model = self.__dict__.get('model')
+        if getattr(model, 'revision', None) is not None:
+            model.revision += 1
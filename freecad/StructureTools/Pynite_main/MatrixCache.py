@@ -0,0 +1,68 @@
+from functools import wraps
+
+from numpy import array, ndarray
+
+def _cache(element):
+    """Returns the dictionary of matrices cached on an element, emptying it first if the element's
+    model has changed since they were calculated (see `FEModel3D.revision`).
+    """
+
+    revision = element.model.revision
+    if element._matrix_revision != revision:
+        element._matrices = {}
+        element._matrix_revision = revision
+
+    return element._matrices
+
+def _store(cache, key, value):
+    """Stores a value in an element's cache. Arrays are made read-only so a cached matrix can't be
+    modified in place by mistake.
+    """
+
+    if isinstance(value, ndarray):
+        value.flags.writeable = False
+    cache[key] = value
+
+    return value
+
+def cached(method):
+    """Decorates an element method that takes no arguments so its result is calculated only once
+    for each revision of the model. Elements using it need `_matrices` and `_matrix_revision`
+    attributes.
+    """
+
+    key = method.__name__
+
+    @wraps(method)
+    def wrapper(self):
+        cache = _cache(self)
+        try:
+            return cache[key]
+        except KeyError:
+            return _store(cache, key, method(self))
+
+    return wrapper
+
+def cached_batch(elements, key, batch_matrix):
+    """Returns the stacked matrices for a group of elements, calculating the ones that aren't cached
+    yet together in a single call to `batch_matrix`, and caching them under `key`.
+
+    :param elements: The elements.
+    :type elements: list
+    :param key: The name the matrices are cached under. Use the name of the element method that
+                returns the same matrix so that both share the cache.
+    :type key: str
+    :param batch_matrix: A function returning the stacked matrices for a list of elements.
+    :type batch_matrix: function
+    :return: The stacked matrices, in the same order as `elements`.
+    :rtype: array
+    """
+
+    caches = [_cache(element) for element in elements]
+    missing = [i for i, cache in enumerate(caches) if key not in cache]
+
+    if missing:
+        for i, value in zip(missing, batch_matrix([elements[i] for i in missing])):
+            _store(caches[i], key, value)
+
+    return array([cache[key] for cache in caches])
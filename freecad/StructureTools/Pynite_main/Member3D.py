@@ -4,8 +4,11 @@ from numpy.linalg import inv, pinv
 from math import isclose
 from .BeamSegZ import BeamSegZ
 from .BeamSegY import BeamSegY
+from .MatrixCache import cached
 from .FixedEndReactions import FER_PtLoad, FER_Moment, FER_LinLoad, FER_AxialPtLoad, FER_AxialLinLoad, FER_Torque
 import warnings
+from collections import OrderedDict
+from numpy.polynomial.polynomial import polyval
 
 #%%
 class Member3D():
@@ -66,13 +69,19 @@ class Member3D():
         # Members need to track whether they are active or not for any given load combination. They may become inactive for a load combination during a tension/compression-only analysis. This dictionary will be used when the model is solved.
         self.active = {} # Key = load combo name, Value = True or False
         
-        # The 'Member3D' object will store results for one load combination at a time. To reduce repetative calculations the '_solved_combo' variable will be used to track whether the member needs to be resegmented before running calculations for any given load combination.
+        # The 'Member3D' object exposes the segments of one load combination at a time through 'SegmentsZ', 'SegmentsY' and 'SegmentsX'. The '_solved_combo' variable tracks which load combination that is. Segments for recently used load combinations are kept in '_segment_cache' (least recently used first), so switching between load combinations doesn't resegment the member.
         self._solved_combo = None # The current solved load combination
+        self._segment_cache = OrderedDict() # Key = load combo name, Value = (SegmentsZ, SegmentsY, SegmentsX)
 
         # Members need a link to the model they belong to
         self.model = model
 
+        # Matrices calculated for the current revision of the model (see 'MatrixCache.cached')
+        self._matrices = {}
+        self._matrix_revision = None
+
 #%%
+    @cached
     def L(self):
         """
         Returns the length of the member.
@@ -105,6 +114,7 @@ class Member3D():
         return R1_indices, R2_indices
 
 #%%
+    @cached
     def k(self):
         """
         Returns the condensed (and expanded) local stiffness matrix for the member.
@@ -267,18 +277,7 @@ class Member3D():
     def lamb(self, model_Delta_D, combo_name='Combo 1', push_combo='Push', step_num=1):
 
         # Obtain the change in the member's end displacements from the calculated displacement change vector
-        Delta_D = array([model_Delta_D[self.i_node.ID*6 + 0],
-                        model_Delta_D[self.i_node.ID*6 + 1],
-                        model_Delta_D[self.i_node.ID*6 + 2],
-                        model_Delta_D[self.i_node.ID*6 + 3],
-                        model_Delta_D[self.i_node.ID*6 + 4],
-                        model_Delta_D[self.i_node.ID*6 + 5],
-                        model_Delta_D[self.j_node.ID*6 + 0],
-                        model_Delta_D[self.j_node.ID*6 + 1],
-                        model_Delta_D[self.j_node.ID*6 + 2],
-                        model_Delta_D[self.j_node.ID*6 + 3],
-                        model_Delta_D[self.j_node.ID*6 + 4],
-                        model_Delta_D[self.j_node.ID*6 + 5]]).reshape(12, 1)
+        Delta_D = array(model_Delta_D)[self._dofs].reshape(12, 1)
         
         # Convert the gloabl changes in displacement to local coordinates
         Delta_d = self.T() @ Delta_D
@@ -481,6 +480,7 @@ class Member3D():
         
 #%%  
     # Transformation matrix
+    @cached
     def T(self):
         """
         Returns the transformation matrix for the member.
@@ -573,8 +573,17 @@ class Member3D():
         
         return transMatrix
 
+    @cached
+    def _T_inv(self):
+        """
+        Returns the inverse of the member's transformation matrix.
+        """
+
+        return inv(self.T())
+
 #%%
     # Member global stiffness matrix
+    @cached
     def K(self):
         """Returns the global elastic stiffness matrix for the member.
 
@@ -583,7 +592,7 @@ class Member3D():
         """
         
         # Calculate and return the stiffness matrix in global coordinates
-        return matmul(matmul(inv(self.T()), self.k()), self.T())
+        return matmul(matmul(self._T_inv(), self.k()), self.T())
 
     def Kg(self, P=0.0):
         """Returns the global geometric stiffness matrix for the member. Used for P-Delta analysis.
@@ -595,7 +604,7 @@ class Member3D():
         """
         
         # Calculate and return the geometric stiffness matrix in global coordinates
-        return matmul(matmul(inv(self.T()), self.kg(P)), self.T())
+        return matmul(matmul(self._T_inv(), self.kg(P)), self.T())
 
     def Km(self, combo_name, push_combo, step_num):
         """Returns the global plastic reduction matrix for the member. Used to modify member behavior for plastic hinges at the ends.
@@ -611,7 +620,7 @@ class Member3D():
         """
 
         # Calculate and return the plastic reduction matrix in global coordinates
-        return matmul(matmul(inv(self.T()), self.km(combo_name, push_combo, step_num)), self.T())
+        return matmul(matmul(self._T_inv(), self.km(combo_name, push_combo, step_num)), self.T())
     
     def F(self, combo_name='Combo 1'):
         """
@@ -619,7 +628,7 @@ class Member3D():
         """
         
         # Calculate and return the global force vector
-        return matmul(inv(self.T()), self.f(combo_name))
+        return matmul(self._T_inv(), self.f(combo_name))
     
     def FER(self, combo_name='Combo 1'):
         """
@@ -632,7 +641,7 @@ class Member3D():
         """
         
         # Calculate and return the fixed end reaction vector
-        return matmul(inv(self.T()), self.fer(combo_name))
+        return matmul(self._T_inv(), self.fer(combo_name))
 
 #%%
     def D(self, combo_name='Combo 1'):
@@ -646,27 +655,13 @@ class Member3D():
             displacement vector for (not the load combination itelf).
         """
         
-        # Initialize the displacement vector
-        D = zeros((12, 1))
+        # Gather the displacements from the model's global displacement vector
+        D = self.model._D[combo_name][self._dofs, :]
         
         # TODO: I'm not sure this next block is the best way to handle inactive members - need to review
-        # Read in the global displacements from the nodes
         # Apply axial displacements only if the member is active
-        if self.active[combo_name] == True:
-            D[0, 0] = self.i_node.DX[combo_name]
-            D[6, 0] = self.j_node.DX[combo_name]
-
-        # Apply the remaining displacements
-        D[1, 0] = self.i_node.DY[combo_name]
-        D[2, 0] = self.i_node.DZ[combo_name]
-        D[3, 0] = self.i_node.RX[combo_name]
-        D[4, 0] = self.i_node.RY[combo_name]
-        D[5, 0] = self.i_node.RZ[combo_name]
-        D[7, 0] = self.j_node.DY[combo_name]
-        D[8, 0] = self.j_node.DZ[combo_name]
-        D[9, 0] = self.j_node.RX[combo_name]
-        D[10, 0] = self.j_node.RY[combo_name]
-        D[11, 0] = self.j_node.RZ[combo_name]      
+        if self.active[combo_name] != True:
+            D[[0, 6], :] = 0
 
         # Return the global displacement vector
         return D
@@ -692,9 +687,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._use_segments(combo_name)
 
             # Check which direction is of interest
             if Direction == 'Fy':
@@ -744,9 +737,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._use_segments(combo_name)
             
             if Direction == 'Fy':
                 
@@ -793,9 +784,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]   
+            self._use_segments(combo_name)
             
             if Direction == 'Fy':
                 
@@ -841,9 +830,7 @@ class Member3D():
         """
         
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._use_segments(combo_name)
         
         # Import 'pyplot' if not already done
         if Member3D.__plt is None:
@@ -883,9 +870,7 @@ class Member3D():
         """
         
         # Segment the member into segments with mathematically continuous loads if not already done
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._use_segments(combo_name)
 
         L = self.L()
         if x_array is None:
@@ -925,9 +910,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._use_segments(combo_name)
             
             # Determine if a P-Delta analysis has been run
             if self.model.solution == 'P-Delta' or self.model.solution == 'Pushover':
@@ -988,40 +971,9 @@ class Member3D():
         # Only calculate results if the member is currently active
         if self.active[combo_name]:
 
-            # Determine if a P-Delta analysis has been run
-            if self.model.solution == 'P-Delta' or self.model.solution == 'Pushover':
-                # Include P-little-delta effects in the moment results
-                P_delta = True
-            else:
-                # Do not include P-little delta effects in the moment results
-                P_delta = False
-            
-            # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
-            
-            if Direction == 'Mz':
-                
-                Mmax = self.SegmentsZ[0].moment(0, P_delta)
-
-                for segment in self.SegmentsZ:
-                    
-                    if segment.max_moment() > Mmax:
-                        
-                        Mmax = segment.max_moment()
-                        
-            if Direction == 'My':
-                
-                Mmax = self.SegmentsY[0].moment(0, P_delta)
-
-                for segment in self.SegmentsY:
-                    
-                    if segment.max_moment() > Mmax:
-                        
-                        Mmax = segment.max_moment()
-            
-            return Mmax
+            # Find the exact maximum moment from the segment polynomials, including P-little-delta
+            # effects if a P-Delta analysis has been run
+            return self.extrema(combo_name, [Direction])[Direction][1][0]
         
         else:
 
@@ -1045,36 +997,9 @@ class Member3D():
         # Only calculate results if the member is currently active
         if self.active[combo_name]:
 
-            # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)   
-                self._solved_combo = self.model.load_combos[combo_name]
-            
-            # Determine if a P-Delta analysis has been run
-            if self.model.solution == 'P-Delta' or self.model.solution == 'Pushover':
-                # Include P-little-delta effects in the moment results
-                P_delta = True
-            else:
-                # Do not include P-little delta effects in the moment results
-                P_delta = False
-
-            if Direction == 'Mz':
-                
-                Mmin = self.SegmentsZ[0].moment(0, P_delta)
-
-                for segment in self.SegmentsZ:
-                    
-                    if segment.min_moment(P_delta) < Mmin: Mmin = segment.min_moment(P_delta)
-                        
-            if Direction == 'My':
-                
-                Mmin = self.SegmentsY[0].moment(0, P_delta)
-
-                for segment in self.SegmentsY:
-                    
-                    if segment.min_moment(P_delta) < Mmin: Mmin = segment.min_moment(P_delta)
-            
-            return Mmin
+            # Find the exact minimum moment from the segment polynomials, including P-little-delta
+            # effects if a P-Delta analysis has been run
+            return self.extrema(combo_name, [Direction])[Direction][0][0]
         
         else:
 
@@ -1098,9 +1023,7 @@ class Member3D():
         """
         
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._use_segments(combo_name)
                 
         # Import 'pyplot' if not already done
         if Member3D.__plt is None:
@@ -1139,9 +1062,7 @@ class Member3D():
             Values must be provided in local member coordinates (between 0 and L) and be in ascending order.
         """
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._use_segments(combo_name)
 
         # Determine if a P-Delta analysis has been run
         if self.model.solution == 'P-Delta' or self.model.solution == 'Pushover':
@@ -1192,9 +1113,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._use_segments(combo_name)
                 
             # Check which segment 'x' falls on
             for segment in self.SegmentsX:
@@ -1224,9 +1143,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]       
+            self._use_segments(combo_name)
             
             Tmax = self.SegmentsX[0].Torsion()   
             
@@ -1257,9 +1174,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._use_segments(combo_name)
             
             Tmin = self.SegmentsX[0].Torsion()
                 
@@ -1289,9 +1204,7 @@ class Member3D():
         """
         
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._use_segments(combo_name)
         
         # Import 'pyplot' if not already done
         if Member3D.__plt is None:
@@ -1325,9 +1238,7 @@ class Member3D():
             Values must be provided in local member coordinates (between 0 and L) and be in ascending order.
         """
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._use_segments(combo_name)
 
         L = self.L()
 
@@ -1356,9 +1267,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._use_segments(combo_name)
                 
             # Check which segment 'x' falls on
             for segment in self.SegmentsZ:
@@ -1387,9 +1296,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._use_segments(combo_name)
             
             Pmax = self.SegmentsZ[0].axial(0)   
             
@@ -1419,9 +1326,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._use_segments(combo_name)
             
             Pmin = self.SegmentsZ[0].axial(0)
                 
@@ -1450,9 +1355,7 @@ class Member3D():
         """
 
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._use_segments(combo_name)
         
         # Import 'pyplot' if not already done
         if Member3D.__plt is None:
@@ -1487,9 +1390,7 @@ class Member3D():
         """
 
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._use_segments(combo_name)
 
         L = self.L()
         if x_array is None:
@@ -1522,9 +1423,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._use_segments(combo_name)
             
             if self.model.solution == 'P-Delta' or self.model.solution == 'Pushover':
                 P_delta = True
@@ -1591,22 +1490,8 @@ class Member3D():
         # Only calculate results if the member is currently active
         if self.active[combo_name]:
 
-            # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
-            
-            # Initialize the maximum deflection
-            dmax = self.deflection(Direction, 0, combo_name)
-            
-            # Check the deflection at 100 locations along the member and find the largest value
-            for i in range(100):
-                d = self.deflection(Direction, self.L()*i/99, combo_name)
-                if d > dmax:
-                    dmax = d
-            
-            # Return the largest value
-            return dmax
+            # Find the exact maximum deflection from the segment polynomials
+            return self.extrema(combo_name, [Direction])[Direction][1][0]
         
         else:
 
@@ -1627,22 +1512,8 @@ class Member3D():
         # Only calculate results if the member is currently active
         if self.active[combo_name]:
 
-            # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
-            
-            # Initialize the minimum deflection
-            dmin = self.deflection(Direction, 0, combo_name)
-            
-            # Check the deflection at 100 locations along the member and find the smallest value
-            for i in range(100):
-                d = self.deflection(Direction, self.L()*i/99, combo_name)
-                if d < dmin:
-                    dmin = d
-            
-            # Return the smallest value
-            return dmin
+            # Find the exact minimum deflection from the segment polynomials
+            return self.extrema(combo_name, [Direction])[Direction][0][0]
         
         else:
 
@@ -1663,9 +1534,7 @@ class Member3D():
         """
         
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._use_segments(combo_name)
                 
         # Import 'pyplot' if not already done
         if Member3D.__plt is None:
@@ -1704,9 +1573,7 @@ class Member3D():
             Values must be provided in local member coordinates (between 0 and L) and be in ascending order.
         """
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._use_segments(combo_name)
 
         # Determine if a P-Delta analysis has been run
         if self.model.solution == 'P-Delta' or self.model.solution == 'Pushover':
@@ -1763,9 +1630,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._use_segments(combo_name)
             
             d = self.d(combo_name)
             dyi = d[1,0]
@@ -1819,9 +1684,7 @@ class Member3D():
         """
         
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._use_segments(combo_name)
                 
         # Import 'pyplot' if not already done
         if Member3D.__plt is None:
@@ -1859,9 +1722,7 @@ class Member3D():
             Values must be provided in local member coordinates (between 0 and L) and be in ascending order.
         """
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._use_segments(combo_name)
 
         d = self.d(combo_name)
         dyi = d[1,0]
@@ -1883,8 +1744,202 @@ class Member3D():
         
         elif Direction == 'dz':
             deflections = self._extract_vector_results(self.SegmentsY, x_array, 'deflection')[1]
-            return vstack((x_array, deflections - (dzi + (dzj-dzi)/L*x_array)))        
-        
+            return vstack((x_array, deflections - (dzi + (dzj-dzi)/L*x_array)))
+
+#%%
+    def result_arrays(self, n_points, combo_name='Combo 1'):
+        """
+        Returns the arrays of several results along the member, and the extreme value of each,
+        from a single segmentation of the member. The arrays are the same as those of the
+        individual `*_array` methods, and the extremes are the exact ones found by `extrema`.
+
+        Parameters
+        ----------
+        n_points : dict
+            The number of points in the array for each result to generate. Keys must be among:
+                'Fy', 'Fz' = Shear acting on the local y or z-axis
+                'My', 'Mz' = Moment about the local y or z-axis
+                'axial' = Axial force
+                'torque' = Torsional moment
+                'dy', 'dz' = Deflection in the local y or z-axis
+        combo_name : string
+            The name of the load combination to get the results for (not the load combination itself).
+
+        Returns
+        -------
+        arrays : dict
+            The array of x values and results (as returned by the `*_array` methods) for each key
+            in `n_points`.
+        extremes : dict
+            The (minimum, maximum) of each result in `n_points`.
+        """
+
+        # Segment the member if necessary
+        self._use_segments(combo_name)
+
+        # Determine if a P-Delta analysis has been run
+        P_delta = self.model.solution == 'P-Delta' or self.model.solution == 'Pushover'
+
+        L = self.L()
+
+        arrays = {}
+        for result, n in n_points.items():
+            x_array = linspace(0, L, n)
+            if result == 'dy' and P_delta:
+                # P-delta deflections are found iteratively, and are not vectorised yet
+                arrays[result] = array([x_array, [self.deflection(result, x, combo_name) for x in x_array]])
+            else:
+                segments, result_name = self._result_segments(result)
+                arrays[result] = self._extract_vector_results(segments, x_array, result_name, P_delta and result != 'dz')
+
+        return arrays, self._result_extremes(n_points.keys(), combo_name)
+
+    def _result_segments(self, result):
+        """
+        Returns the segments and the `_extract_vector_results` result name for a key of `result_arrays`.
+        """
+
+        if result == 'Fy':
+            return self.SegmentsZ, 'shear'
+        elif result == 'Fz':
+            return self.SegmentsY, 'shear'
+        elif result == 'My':
+            return self.SegmentsY, 'moment'
+        elif result == 'Mz':
+            return self.SegmentsZ, 'moment'
+        elif result == 'axial':
+            return self.SegmentsZ, 'axial'
+        elif result == 'torque':
+            return self.SegmentsX, 'torque'
+        elif result == 'dy':
+            return self.SegmentsZ, 'deflection'
+        elif result == 'dz':
+            return self.SegmentsY, 'deflection'
+        elif result == 'dx':
+            return self.SegmentsZ, 'axial_deflection'
+        else:
+            raise ValueError(f"Unknown result '{result}'.")
+
+    def extrema(self, combo_name='Combo 1', results=('Fy', 'Fz', 'My', 'Mz', 'axial', 'torque', 'dy', 'dz')):
+        """
+        Returns the exact minimum and maximum of several results along the member, and where they
+        occur, in a single pass over the member's segments.
+
+        Each segment's results are polynomials in x, so their extremes are found at the segment
+        ends or at the real roots of the polynomial's derivative, rather than by sampling. If a
+        P-Delta analysis has been run, moments and local y deflections include P-little-delta
+        effects. The value reported at each location is the one the single-point result methods
+        (`moment`, `deflection`, ...) return there. Those use the segment that starts at the
+        boundary between two segments, so the end of the segment before it is evaluated just short
+        of the boundary.
+
+        Parameters
+        ----------
+        combo_name : string
+            The name of the load combination to get the results for (not the load combination itself).
+        results : iterable
+            The results to find the extremes of, as keys among:
+                'Fy', 'Fz' = Shear acting on the local y or z-axis
+                'My', 'Mz' = Moment about the local y or z-axis
+                'axial' = Axial force
+                'torque' = Torsional moment
+                'dx', 'dy', 'dz' = Deflection in the local x, y or z-axis
+
+        Returns
+        -------
+        dict
+            ((minimum, x of minimum), (maximum, x of maximum)) for each result, with x measured
+            from the start of the member. Inactive members report zero results at x = 0.
+        """
+
+        # Inactive members report zero for all results
+        if not self.active[combo_name]:
+            return {result: ((0, 0), (0, 0)) for result in results}
+
+        # Segment the member if necessary
+        self._use_segments(combo_name)
+
+        # Determine if a P-Delta analysis has been run
+        P_delta = self.model.solution == 'P-Delta' or self.model.solution == 'Pushover'
+
+        # How far short of a segment boundary its end is evaluated. The single-point result methods
+        # compare locations rounded to 10 decimal places.
+        boundary = 1e-9*max(self.L(), 1)
+
+        extrema = {}
+        for result in results:
+            segments, result_name = self._result_segments(result)
+
+            # Moments and local y deflections include P-little-delta effects
+            P_delta_result = P_delta and result in ('My', 'Mz', 'dy')
+
+            r_min = r_max = None
+            for i, segment in enumerate(segments):
+
+                # Evaluate the result at the points where it can reach its extreme values. The
+                # single-point result methods use the next segment at the end of each segment but
+                # the last, so those ends are moved just short of the boundary.
+                x = segment.critical_points(result_name, P_delta_result)
+                if i < len(segments) - 1:
+                    end = max(segment.Length() - boundary, 0)
+                    x[x >= end] = end
+                if P_delta_result and result == 'dy':
+                    # P-little-delta deflections are found iteratively
+                    values = array([segment.deflection(xi, True) for xi in x])
+                else:
+                    values = polyval(x, segment.coefficients(result_name, P_delta_result))
+
+                i_min, i_max = values.argmin(), values.argmax()
+                if r_min is None or values[i_min] < r_min[0]:
+                    r_min = (float(values[i_min]), float(segment.x1 + x[i_min]))
+                if r_max is None or values[i_max] > r_max[0]:
+                    r_max = (float(values[i_max]), float(segment.x1 + x[i_max]))
+
+            extrema[result] = (r_min, r_max)
+
+        return extrema
+
+    def _result_extremes(self, results, combo_name='Combo 1'):
+        """
+        Returns the (minimum, maximum) of each of the given `result_arrays` keys.
+        """
+
+        return {result: (r_min[0], r_max[0]) for result, (r_min, r_max) in self.extrema(combo_name, results).items()}
+
+    def _use_segments(self, combo_name='Combo 1'):
+        """
+        Makes `SegmentsZ`, `SegmentsY` and `SegmentsX` hold the segments for a load combination,
+        segmenting the member only if they are not in the segment cache. The cache holds the
+        segments of at most `model.segment_cache_size` load combinations.
+        """
+
+        if self._solved_combo is not None and combo_name == self._solved_combo.name:
+            return
+
+        segments = self._segment_cache.pop(combo_name, None)
+        if segments is None:
+            # `_segment_member` fills the current lists in place, so give it new ones to keep the cached lists intact
+            self.SegmentsZ, self.SegmentsY, self.SegmentsX = [], [], []
+            self._segment_member(combo_name)
+            segments = (self.SegmentsZ, self.SegmentsY, self.SegmentsX)
+        else:
+            self.SegmentsZ, self.SegmentsY, self.SegmentsX = segments
+
+        # Store the segments as the most recently used, and drop the least recently used beyond the cache size
+        self._segment_cache[combo_name] = segments
+        while len(self._segment_cache) > max(self.model.segment_cache_size, 1):
+            self._segment_cache.popitem(last=False)
+
+        self._solved_combo = self.model.load_combos[combo_name]
+
+    def _clear_segments(self):
+        """
+        Discards the segments of every load combination, so they are rebuilt from the latest analysis results.
+        """
+
+        self._segment_cache.clear()
+        self._solved_combo = None
+
     def _segment_member(self, combo_name='Combo 1'):
         """
         Divides the element up into mathematically continuous segments along each axis
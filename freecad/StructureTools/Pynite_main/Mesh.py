@@ -1,8 +1,19 @@
 from .Node3D import Node3D
-from .Quad3D import Quad3D
-from .Plate3D import Plate3D
+from .Quad3D import Quad3D, _quad_results
+from .Plate3D import Plate3D, _plate_results
+from .Analysis import _element_dofs
 from math import pi, sin, cos, ceil, isclose
 from bisect import bisect
+from numpy import array, concatenate, amax, amin
+
+# The result, coordinate system (local or global) and component index for each direction
+# reported by `Mesh.envelope`
+_DIRECTIONS = {'Qx': ('shear', True, 0), 'Qy': ('shear', True, 1),
+               'QX': ('shear', False, 0), 'QY': ('shear', False, 1),
+               'Mx': ('moment', True, 0), 'My': ('moment', True, 1), 'Mxy': ('moment', True, 2),
+               'MX': ('moment', False, 0), 'MY': ('moment', False, 1), 'MZ': ('moment', False, 2),
+               'Sx': ('membrane', True, 0), 'Sy': ('membrane', True, 1), 'Sxy': ('membrane', True, 2),
+               'SX': ('membrane', False, 0), 'SY': ('membrane', False, 1)}
 
 #%%
 class Mesh():
@@ -25,6 +36,7 @@ class Mesh():
         self.elements = {}                  # A dictionary containing the elements in the mesh
         self.element_type = 'Quad'          # The type of element used in the mesh
         self._is_generated = False          # A flag indicating whether the mesh has been generated
+        self._combo_results = {}            # Corner and center results for all the elements, by load combination
     
     def is_generated(self):
         return self._is_generated
@@ -91,6 +103,101 @@ class Mesh():
         """
         pass
 
+    def _results(self, combo_name):
+        """
+        Returns the shears, moments and membrane stresses at the corners and center of every
+        element in the mesh for a load combination, stacked in the form returned by
+        `_quad_results`.
+
+        The global displacements of all the elements are gathered from the model's displacement
+        vector in one step and the results are evaluated for all the elements together. They are
+        kept until the model is changed or the load combination is solved again.
+        """
+
+        D = self.model._D[combo_name]
+
+        cached = self._combo_results.get(combo_name)
+        if cached is not None and cached[0] is D and cached[1] == self.model.revision:
+            return cached[2]
+
+        parts = []
+        for element_type, element_results in (('Quad', _quad_results), ('Rect', _plate_results)):
+            elements = [element for element in self.elements.values() if element.type == element_type]
+            if elements:
+                dofs = array([_element_dofs(element) for element in elements])
+                parts.append(element_results(elements, D[dofs, 0]))
+
+        results = {result: tuple(concatenate([part[result][k] for part in parts]) for k in range(2))
+                   for result in parts[0]} if parts else {}
+
+        self._combo_results[combo_name] = (D, self.model.revision, results)
+
+        return results
+
+    def _extreme(self, result, local, i, combo, function):
+        """
+        Returns the largest (`function` = `amax`) or smallest (`function` = `amin`) value of a
+        result component at the corners and centers of the elements in the mesh, or `None` if there
+        are no results to check.
+        """
+
+        values = []
+
+        # Step through each load combination in the model
+        for load_combo in self.model.load_combos.values():
+
+            # Determine if this load combination should be evaluated
+            if combo is None or load_combo.name == combo:
+
+                results = self._results(load_combo.name)
+                if results:
+                    values.append(function(results[result][0 if local else 1][..., i]))
+
+        return function(values) if values else None
+
+    def envelope(self, combo=None):
+        """
+        Returns the minimum and maximum of every shear, moment and membrane stress in the mesh.
+
+        Checks corner and center results in all the elements in the mesh, in the same way as
+        `max_shear`, `min_moment`, etc., but evaluates them all in one pass. The mesh must be part
+        of a solved model prior to using this method.
+
+        Parameters
+        ----------
+        combo : string, optional
+            The name of the load combination to get the envelope for. If omitted, all load
+            combinations will be evaluated.
+
+        Returns
+        -------
+        dict
+            A `(min, max)` tuple for each direction accepted by the other result methods: 'Qx',
+            'Qy', 'QX', 'QY', 'Mx', 'My', 'Mxy', 'MX', 'MY', 'MZ', 'Sx', 'Sy', 'Sxy', 'SX' and
+            'SY'. The dictionary is empty if there are no results to check.
+        """
+
+        envelope = {}
+
+        # Step through each load combination in the model
+        for load_combo in self.model.load_combos.values():
+
+            # Determine if this load combination should be evaluated
+            if combo is None or load_combo.name == combo:
+
+                results = self._results(load_combo.name)
+                if not results:
+                    continue
+
+                for direction, (result, local, i) in _DIRECTIONS.items():
+                    values = results[result][0 if local else 1][..., i]
+                    low, high = amin(values), amax(values)
+                    if direction in envelope:
+                        low, high = min(low, envelope[direction][0]), max(high, envelope[direction][1])
+                    envelope[direction] = (low, high)
+
+        return envelope
+
     def max_shear(self, direction='Qx', combo=None):
         """
         Returns the maximum shear in the mesh.
@@ -120,47 +227,8 @@ class Mesh():
         else:
             raise Exception('Invalid direction specified for mesh shear results. Valid values are \'Qx\', \'Qy\', \'QX\', or \'QY\'')
         
-        # Initialize the maximum value to None
-        Q_max = None
-
-        # Step through each element in the mesh
-        for element in self.elements.values():
-
-            # Determine whether the element is a rectangle or a quadrilateral
-            if element.type == 'Rect':
-                # Use the rectangle's local (x, y) coordinate system
-                xi, yi = 0, 0
-                xj, yj = element.width(), 0
-                xm, ym = element.width(), element.height()
-                xn, yn, = 0, element.height()
-            elif element.type == 'Quad':
-                # Use the quad's natural (r, s) coordinate system
-                xi, yi = -1, -1
-                xj, yj = 1, -1
-                xm, ym = 1, 1
-                xn, yn = -1, 1
-
-            # Step through each load combination in the model
-            for load_combo in self.model.load_combos.values():
-
-                # Determine if this load combination should be evaluated
-                if combo is None or load_combo.name == combo:
-                    
-                    # Find the maximum shear in the element, checking each corner and the center
-                    # of the element
-                    Q_element = max([element.shear(xi, yi, local, load_combo.name)[i, 0],
-                                     element.shear(xj, yj, local, load_combo.name)[i, 0],
-                                     element.shear(xm, ym, local, load_combo.name)[i, 0],
-                                     element.shear(xn, yn, local, load_combo.name)[i, 0],
-                                     element.shear((xi + xj)/2, (yi + yn)/2, local, load_combo.name)[i, 0]])
-
-                    # Determine if the maximum shear calculated is the largest encountered so far
-                    if Q_max == None or Q_max < Q_element:
-                        # Save this value if it's the largest
-                        Q_max = Q_element
-            
-        # Return the largest value encountered from all the elements
-        return Q_max
+        # Return the largest value at the corners and centers of the elements
+        return self._extreme('shear', local, i, combo, amax)
     
     def min_shear(self, direction='Qx', combo=None):
         """
@@ -191,47 +259,8 @@ class Mesh():
         else:
             raise Exception('Invalid direction specified for mesh shear results. Valid values are \'Qx\', \'Qy\', \'QX\', or \'QY\'')
 
-        # Initialize the minimum value to None
-        Q_min = None
-
-        # Step through each element in the mesh
-        for element in self.elements.values():
-
-            # Determine whether the element is a rectangle or a quadrilateral
-            if element.type == 'Rect':
-                # Use the rectangle's local (x, y) coordinate system
-                xi, yi = 0, 0
-                xj, yj = element.width(), 0
-                xm, ym = element.width(), element.height()
-                xn, yn, = 0, element.height()
-            elif element.type == 'Quad':
-                # Use the quad's natural (r, s) coordinate system
-                xi, yi = -1, -1
-                xj, yj = 1, -1
-                xm, ym = 1, 1
-                xn, yn = -1, 1
-
-            # Step through each load combination the element utilizes
-            for load_combo in self.model.load_combos.values():
-
-                # Determine if this load combination should be evaluated
-                if combo is None or load_combo.name == combo:
-                    
-                    # Find the minimum shear in the element, checking each corner and the center
-                    # of the element
-                    Q_element = min([element.shear(xi, yi, local, load_combo.name)[i, 0],
-                                     element.shear(xj, yj, local, load_combo.name)[i, 0],
-                                     element.shear(xm, ym, local, load_combo.name)[i, 0],
-                                     element.shear(xn, yn, local, load_combo.name)[i, 0],
-                                     element.shear((xi + xj)/2, (yi + yn)/2, local, load_combo.name)[i, 0]])
-
-                    # Determine if the minimum shear calculated is the smallest encountered so far
-                    if Q_min == None or Q_min > Q_element:
-                        # Save this value if it's the smallest
-                        Q_min = Q_element
-            
-        # Return the smallest value encountered from all the elements
-        return Q_min
+        # Return the smallest value at the corners and centers of the elements
+        return self._extreme('shear', local, i, combo, amin)
 
     def max_moment(self, direction='Mx', combo=None):
         """
@@ -264,47 +293,8 @@ class Mesh():
         else:
             raise Exception('Invalid direction specified for mesh moment results. Valid values are \'Mx\', \'My\', \'Mxy\', \'MX\', \'MY\', or \'MZ\'')
 
-        # Initialize the maximum value to None
-        M_max = None
-
-        # Step through each element in the mesh
-        for element in self.elements.values():
-
-            # Determine whether the element is a rectangle or a quadrilateral
-            if element.type == 'Rect':
-                # Use the rectangle's local (x, y) coordinate system
-                xi, yi = 0, 0
-                xj, yj = element.width(), 0
-                xm, ym = element.width(), element.height()
-                xn, yn, = 0, element.height()
-            elif element.type == 'Quad':
-                # Use the quad's natural (xi, eta) coordinate system
-                xi, yi = -1, -1
-                xj, yj = 1, -1
-                xm, ym = 1, 1
-                xn, yn = -1, 1
-
-            # Step through each load combination the element utilizes
-            for load_combo in self.model.load_combos.values():
-
-                # Determine if this load combination should be evaluated
-                if combo is None or load_combo.name == combo:
-                    
-                    # Find the maximum moment in the element, checking each corner and the center
-                    # of the element
-                    M_element = max([element.moment(xi, yi, local, load_combo.name)[i, 0],
-                                     element.moment(xj, yj, local, load_combo.name)[i, 0],
-                                     element.moment(xm, ym, local, load_combo.name)[i, 0],
-                                     element.moment(xn, yn, local, load_combo.name)[i, 0],
-                                     element.moment((xi + xj)/2, (yi + yn)/2, local, load_combo.name)[i, 0]])
-
-                    # Determine if the maximum moment calculated is the largest encountered so far
-                    if M_max == None or M_max < M_element:
-                        # Save this value if it's the largest
-                        M_max = M_element
-            
-        # Return the largest value encountered from all the elements
-        return M_max
+        # Return the largest value at the corners and centers of the elements
+        return self._extreme('moment', local, i, combo, amax)
     
     def min_moment(self, direction='Mx', combo=None):
         """
@@ -337,47 +327,8 @@ class Mesh():
         else:
             raise Exception('Invalid direction specified for mesh moment results. Valid values are \'Mx\', \'My\', \'Mxy\', \'MX\', \'MY\', or \'MZ\'')
 
-        # Initialize the minimum value to None
-        M_min = None
-
-        # Step through each element in the mesh
-        for element in self.elements.values():
-
-            # Determine whether the element is a rectangle or a quadrilateral
-            if element.type == 'Rect':
-                # Use the rectangle's local (x, y) coordinate system
-                xi, yi = 0, 0
-                xj, yj = element.width(), 0
-                xm, ym = element.width(), element.height()
-                xn, yn, = 0, element.height()
-            elif element.type == 'Quad':
-                # Use the quad's natural (r, s) coordinate system
-                xi, yi = -1, -1
-                xj, yj = 1, -1
-                xm, ym = 1, 1
-                xn, yn = -1, 1
-
-            # Step through each load combination the element utilizes
-            for load_combo in self.model.load_combos.values():
-
-                # Determine if this load combination should be evaluated
-                if combo is None or load_combo.name == combo:
-                    
-                    # Find the minimum moment in the element, checking each corner and the center
-                    # of the element
-                    M_element = min([element.moment(xi, yi, local, load_combo.name)[i, 0],
-                                     element.moment(xj, yj, local, load_combo.name)[i, 0],
-                                     element.moment(xm, ym, local, load_combo.name)[i, 0],
-                                     element.moment(xn, yn, local, load_combo.name)[i, 0],
-                                     element.moment((xi + xj)/2, (yi + yn)/2, local, load_combo.name)[i, 0]])
-
-                    # Determine if the minimum moment calculated is the smallest encountered so far
-                    if M_min == None or M_min > M_element:
-                        # Save this value if it's the smallest
-                        M_min = M_element
-            
-        # Return the smallest value encountered from all the elements
-        return M_min
+        # Return the smallest value at the corners and centers of the elements
+        return self._extreme('moment', local, i, combo, amin)
     
     def max_membrane(self, direction='Sx', combo=None):
         """
@@ -410,46 +361,8 @@ class Mesh():
         else:
             raise Exception('Invalid direction specified for mesh membrane stress results. Valid values are \'Sx\', \'Sy\', or \'Sxy\'')
 
-        # Initialize the maximum value to None
-        S_max = None
-
-        # Step through each element in the mesh
-        for element in self.elements.values():
-
-            # Determine whether the element is a rectangle or a quadrilateral
-            if element.type == 'Rect':
-                # Use the rectangle's local (x, y) coordinate system
-                xi, yi = 0, 0
-                xj, yj = element.width(), 0
-                xm, ym = element.width(), element.height()
-                xn, yn, = 0, element.height()
-            elif element.type == 'Quad':
-                # Use the quad's natural (r, s) coordinate system
-                xi, yi = -1, -1
-                xj, yj = 1, -1
-                xm, ym = 1, 1
-                xn, yn = -1, 1
-
-            # Step through each load combination the element utilizes
-            for load_combo in self.model.load_combos.values():
-
-                # Determine if this load combination should be evaluated
-                if combo is None or load_combo.name == combo:
-                    
-                    # Find the maximum membrane stress in the element, checking each corner and the center of the element
-                    M_element = max([element.membrane(xi, yi, local, load_combo.name)[i, 0],
-                                        element.membrane(xj, yj, local, load_combo.name)[i, 0],
-                                        element.membrane(xm, ym, local, load_combo.name)[i, 0],
-                                        element.membrane(xn, yn, local, load_combo.name)[i, 0],
-                                        element.membrane((xi + xj)/2, (yi + yn)/2, local, load_combo.name)[i, 0]])
-
-                    # Determine if the maximum membrane stress calculated is the largest encountered so far
-                    if S_max == None or S_max < M_element:
-                        # Save this value if it's the smallest
-                        S_max = M_element
-            
-        # Return the smallest value encountered from all the elements
-        return S_max
+        # Return the largest value at the corners and centers of the elements
+        return self._extreme('membrane', local, i, combo, amax)
     
     def min_membrane(self, direction='Sx', combo=None):
         """
@@ -482,46 +395,8 @@ class Mesh():
         else:
             raise Exception('Invalid direction specified for mesh membrane stress results. Valid values are \'Sx\', \'Sy\', or \'Sxy\'')
 
-        # Initialize the maximum value to None
-        S_min = None
-
-        # Step through each element in the mesh
-        for element in self.elements.values():
-
-            # Determine whether the element is a rectangle or a quadrilateral
-            if element.type == 'Rect':
-                # Use the rectangle's local (x, y) coordinate system
-                xi, yi = 0, 0
-                xj, yj = element.width(), 0
-                xm, ym = element.width(), element.height()
-                xn, yn, = 0, element.height()
-            elif element.type == 'Quad':
-                # Use the quad's natural (r, s) coordinate system
-                xi, yi = -1, -1
-                xj, yj = 1, -1
-                xm, ym = 1, 1
-                xn, yn = -1, 1
-
-            # Step through each load combination the element utilizes
-            for load_combo in self.model.load_combos.values():
-
-                # Determine if this load combination should be evaluated
-                if combo is None or load_combo.name == combo:
-                    
-                    # Find the minimum membrane stress in the element, checking each corner and the center of the element
-                    M_element = min([element.membrane(xi, yi, local, load_combo.name)[i, 0],
-                                        element.membrane(xj, yj, local, load_combo.name)[i, 0],
-                                        element.membrane(xm, ym, local, load_combo.name)[i, 0],
-                                        element.membrane(xn, yn, local, load_combo.name)[i, 0],
-                                        element.membrane((xi + xj)/2, (yi + yn)/2, local, load_combo.name)[i, 0]])
-
-                    # Determine if the minimum membrane stress calculated is the smallest encountered so far
-                    if S_min == None or S_min > M_element:
-                        # Save this value if it's the smallest
-                        S_min = M_element
-            
-        # Return the smallest value encountered from all the elements
-        return S_min
+        # Return the smallest value at the corners and centers of the elements
+        return self._extreme('membrane', local, i, combo, amin)
     
 #%%
 class RectangleMesh(Mesh):
@@ -715,7 +590,7 @@ class RectangleMesh(Mesh):
                             raise Exception('Invalid plane selected for RectangleMesh.')
 
                         # Add the node to the mesh
-                        self.nodes[node_name] = Node3D(node_name, X, Y, Z)
+                        self.nodes[node_name] = Node3D(node_name, X, Y, Z, self.model)
 
                         # Move to the next x coordinate
                         x += b
@@ -1109,7 +984,7 @@ class AnnulusRingMesh(Mesh):
                 else:
                     raise Exception('Invalid axis specified for AnnulusRingMesh.')
             
-            self.nodes[node_name] = Node3D(node_name, x, y, z)
+            self.nodes[node_name] = Node3D(node_name, x, y, z, self.model)
 
         # Generate the elements that make up the ring
         for i in range(1, n + 1, 1):
@@ -1268,7 +1143,7 @@ class AnnulusTransRingMesh(Mesh):
                 else:
                     raise Exception('Invalid axis specified for AnnulusTransRingMesh.')
             
-            self.nodes[node_name] = Node3D(node_name, x, y, z)
+            self.nodes[node_name] = Node3D(node_name, x, y, z, self.model)
 
         # Generate the elements that make up the ring
         for i in range(1, 4*n + 1, 1):
@@ -1648,7 +1523,7 @@ class CylinderRingMesh(Mesh):
                 else:
                     raise Exception('Invalid axis specified for CylinderRingMesh.')
             
-            self.nodes[node_name] = Node3D(node_name, x, y, z)
+            self.nodes[node_name] = Node3D(node_name, x, y, z, self.model)
 
         # Generate the elements that make up the ring
         for i in range(1, n + 1, 1):
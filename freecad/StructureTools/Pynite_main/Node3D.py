@@ -4,14 +4,17 @@ Created on Thu Nov  2 18:04:56 2017
 
 @author: D. Craig Brinck, SE
 """
+from collections.abc import Mapping
+
 # %%      
 class Node3D():
     """
     A class representing a node in a 3D finite element model.
     """
     
-    def __init__(self, name, X, Y, Z):
+    def __init__(self, name, X, Y, Z, model=None):
         
+        self.model = model  # The model the node belongs to, if any
         self.name = name    # A unique name for the node assigned by the user
         self.ID = None      # A unique index number for the node assigned by the program
         
@@ -64,6 +67,15 @@ class Node3D():
         # Initialize the color contour value for the node. This will be used for contour smoothing.
         self.contour = []
 
+    def __setattr__(self, name, value):
+
+        # Moving a node changes the matrices of the elements attached to it
+        super().__setattr__(name, value)
+        if name in ('X', 'Y', 'Z'):
+            model = self.__dict__.get('model')
+            if getattr(model, 'revision', None) is not None:
+                model.revision += 1
+
     def distance(self, other):
         """
         Returns the distance to another node.
@@ -74,3 +86,40 @@ class Node3D():
             A node object to compare coordinates with.
         """
         return ((self.X - other.X)**2 + (self.Y - other.Y)**2 + (self.Z - other.Z)**2)**0.5
+
+# %%
+class NodeResult(Mapping):
+    """
+    A read-only view of one of a node's results (e.g. `DX` or `RxnFZ`) for each load combination.
+    The values are read from the model's global result vectors (e.g. `FEModel3D._D`), so nothing is
+    stored on the node itself. It can be used like a dictionary keyed by load combination name.
+
+    Parameters
+    ----------
+    results : dict
+        The model's global result vectors by load combination name.
+    node : Node3D
+        The node.
+    dof : int
+        The node's degree of freedom (0 to 5 for DX, DY, DZ, RX, RY and RZ).
+    """
+
+    __slots__ = ('_results', '_node', '_dof')
+
+    def __init__(self, results, node, dof):
+
+        self._results = results
+        self._node = node
+        self._dof = dof
+
+    def __getitem__(self, combo_name):
+        return self._results[combo_name][self._node.ID*6 + self._dof, 0]
+
+    def __iter__(self):
+        return iter(self._results)
+
+    def __len__(self):
+        return len(self._results)
+
+    def __repr__(self):
+        return repr(dict(self))
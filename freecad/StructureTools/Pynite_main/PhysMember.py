@@ -26,7 +26,8 @@ class PhysMember(Member3D):
         Subdivides the physical member into sub-members at each node along the physical member
         """
 
-        # Clear out any old sub_members
+        # Clear out any old sub_members, keeping them for now so their cached matrices can be reused
+        old_sub_members = self.sub_members
         self.sub_members = {}
 
         # Start a new list of nodes along the member
@@ -41,8 +42,14 @@ class PhysMember(Member3D):
         int_nodes.append([self.i_node, 0])
         int_nodes.append([self.j_node, norm(vector_ij)])
 
-        # Step through each node in the model
-        for node in self.model.nodes.values():
+        # Only nodes near the member can lie on it, so get the candidates from the model's spatial
+        # index instead of checking every node in the model. They're checked in the same order as
+        # the model's nodes.
+        nodes = self.model._spatial_index(sync=False).near_segment(Xi, Yi, Zi, Xj, Yj, Zj, 1e-4*norm(vector_ij))
+        nodes.sort(key=lambda node: node.ID)
+
+        # Step through each node near the member
+        for node in nodes:
 
             # Check each node in the model (except the i and j-nodes)
             if node is not self.i_node and node is not self.j_node:
@@ -82,6 +89,13 @@ class PhysMember(Member3D):
             # Create a new sub-member
             new_sub_member = Member3D(self.model, name, i_node, j_node, self.material.name, self.section.name, self.rotation, self.tension_only, self.comp_only)
             
+            # A sub-member between the same nodes has the same matrices as before unless the model
+            # has changed since they were calculated
+            old_sub_member = old_sub_members.get(name)
+            if old_sub_member is not None and old_sub_member.i_node is i_node and old_sub_member.j_node is j_node:
+                new_sub_member._matrices = old_sub_member._matrices
+                new_sub_member._matrix_revision = old_sub_member._matrix_revision
+
             # Flag the sub-member as active
             for combo_name in self.model.load_combos.keys():
                 new_sub_member.active[combo_name] = True
@@ -637,6 +651,47 @@ class PhysMember(Member3D):
         PhysMember.__plt.title('Member ' + self.name + '\n' + combo_name)
         PhysMember.__plt.show()
 
+    def extrema(self, combo_name='Combo 1', results=('Fy', 'Fz', 'My', 'Mz', 'axial', 'torque', 'dy', 'dz')):
+        """
+        Returns the exact minimum and maximum of several results along the member, and where they
+        occur, over all the sub-members.
+
+        Parameters
+        ----------
+        combo_name : string
+            The name of the load combination to get the results for (not the load combination itself).
+        results : iterable
+            The results to find the extremes of, as keys of `Member3D.extrema`.
+
+        Returns
+        -------
+        dict
+            ((minimum, x of minimum), (maximum, x of maximum)) for each result, with x measured
+            from the start of the physical member.
+        """
+
+        extrema = {}
+        x_start = 0
+        for member in self.sub_members.values():
+            for result, (r_min, r_max) in member.extrema(combo_name, results).items():
+                r_min = (r_min[0], x_start + r_min[1])
+                r_max = (r_max[0], x_start + r_max[1])
+                if result not in extrema:
+                    extrema[result] = (r_min, r_max)
+                else:
+                    extrema[result] = (min(extrema[result][0], r_min, key=lambda r: r[0]),
+                                       max(extrema[result][1], r_max, key=lambda r: r[0]))
+            x_start += member.L()
+        return extrema
+
+    def _result_extremes(self, results, combo_name='Combo 1'):
+        """
+        Returns the (minimum, maximum) of each of the given `result_arrays` keys over all the
+        sub-members.
+        """
+
+        return {result: (r_min[0], r_max[0]) for result, (r_min, r_max) in self.extrema(combo_name, results).items()}
+
     def find_member(self, x):
         """
         Returns the sub-member that the physical member's local point 'x' lies on, and 'x' modified for that sub-member's local coordinate system.
@@ -1,5 +1,9 @@
-from numpy import zeros, array, matmul, cross, add
+from numpy import zeros, zeros_like, ones_like, array, matmul, cross, add, stack, einsum
 from numpy.linalg import inv, norm, det
+from .MatrixCache import cached, cached_batch
+from .Quad3D import _element_properties, _plane_stress_C, _membrane_B, _membrane_k, _dir_cos, \
+                    _to_global, _local_d, _EXTRAPOLATE, _MEMBRANE_DOFS, _BENDING_DOFS, \
+                    _STIFFNESS_ATTRIBUTES
 
 #%%
 class Plate3D():
@@ -54,12 +58,25 @@ class Plate3D():
         # Plates need a link to the model they belong to
         self.model = model
 
+        # Matrices calculated for the current revision of the model (see 'MatrixCache.cached')
+        self._matrices = {}
+        self._matrix_revision = None
+
         # Get material properties for the plate from the model
         try:
             self.E = self.model.materials[material_name].E
             self.nu = self.model.materials[material_name].nu
         except:
             raise KeyError('Please define the material ' + str(material_name) + ' before assigning it to plates.')
+
+    def __setattr__(self, name, value):
+
+        # Editing the element's properties or nodes changes its matrices
+        super().__setattr__(name, value)
+        if name in _STIFFNESS_ATTRIBUTES:
+            model = self.__dict__.get('model')
+            if getattr(model, 'revision', None) is not None:
+                model.revision += 1
     
     def width(self):
         """
@@ -149,6 +166,7 @@ class Plate3D():
         
         return B_m
     
+    @cached
     def k(self):
         """
         returns the plate's local stiffness matrix
@@ -393,48 +411,20 @@ class Plate3D():
         """
 
         # Calculate and return the global force vector
-        return matmul(inv(self.T()), self.f(combo_name))
+        return matmul(self._T_inv(), self.f(combo_name))
 
     def D(self, combo_name='Combo 1'):
         """
         Returns the plate's global displacement vector for the given load combination.
         """
         
-        # Initialize the displacement vector
-        D = zeros((24, 1))
-        
-        # Read in the global displacements from the nodes
-        D[0, 0] = self.i_node.DX[combo_name]
-        D[1, 0] = self.i_node.DY[combo_name]
-        D[2, 0] = self.i_node.DZ[combo_name]
-        D[3, 0] = self.i_node.RX[combo_name]
-        D[4, 0] = self.i_node.RY[combo_name]
-        D[5, 0] = self.i_node.RZ[combo_name]
-
-        D[6, 0] = self.j_node.DX[combo_name]
-        D[7, 0] = self.j_node.DY[combo_name]
-        D[8, 0] = self.j_node.DZ[combo_name]
-        D[9, 0] = self.j_node.RX[combo_name]
-        D[10, 0] = self.j_node.RY[combo_name]
-        D[11, 0] = self.j_node.RZ[combo_name]
-
-        D[12, 0] = self.m_node.DX[combo_name]
-        D[13, 0] = self.m_node.DY[combo_name]
-        D[14, 0] = self.m_node.DZ[combo_name]
-        D[15, 0] = self.m_node.RX[combo_name]
-        D[16, 0] = self.m_node.RY[combo_name]
-        D[17, 0] = self.m_node.RZ[combo_name]
-
-        D[18, 0] = self.n_node.DX[combo_name]
-        D[19, 0] = self.n_node.DY[combo_name]
-        D[20, 0] = self.n_node.DZ[combo_name]
-        D[21, 0] = self.n_node.RX[combo_name]
-        D[22, 0] = self.n_node.RY[combo_name]
-        D[23, 0] = self.n_node.RZ[combo_name]
-        
+        # Gather the displacements from the model's global displacement vector
+        D = self.model._D[combo_name][self._dofs, :]
+
         # Return the global displacement vector
         return D
  
+    @cached
     def T(self):
         """
         Returns the plate's transformation matrix
@@ -486,13 +476,42 @@ class Plate3D():
         
         return transMatrix
 
+    @cached
+    def _T_inv(self):
+        """
+        Returns the inverse of the plate's transformation matrix
+        """
+
+        return inv(self.T())
+
+    @cached
     def K(self):
         """
         Returns the plate's global stiffness matrix
         """
 
         # Calculate and return the stiffness matrix in global coordinates
-        return matmul(matmul(inv(self.T()), self.k()), self.T())
+        return matmul(matmul(self._T_inv(), self.k()), self.T())
+
+    @staticmethod
+    def batch_K(plates):
+        """
+        Returns the global stiffness matrices for a group of plates, stacked in an `(n, 24, 24)`
+        array in the same order as `plates`.
+
+        The membrane terms and the transformation to global coordinates are evaluated for all the
+        plates at once. The closed form bending matrix only depends on the plate's dimensions,
+        thickness and material, so it is calculated once for each distinct combination of those,
+        which in a regular mesh is usually only a handful of times. Matrices already cached by `K`
+        (or by an earlier call) are reused.
+
+        Parameters
+        ----------
+        plates : list
+            The plates to calculate the stiffness matrices for.
+        """
+
+        return cached_batch(plates, 'K', _plate_K)
 
     def FER(self, combo_name='Combo 1'):
         """
@@ -506,7 +525,7 @@ class Plate3D():
         """
         
         # Calculate and return the fixed end reaction vector
-        return matmul(inv(self.T()), self.fer(combo_name))
+        return matmul(self._T_inv(), self.fer(combo_name))
 
     def _C(self):
         """
@@ -677,3 +696,100 @@ class Plate3D():
         return array([Sx,
                       Sy,
                       Txy])
+
+#%%
+def _plate_local_coords(plates):
+    """
+    Returns the `(n, 4, 2)` local (x, y) coordinates of the nodes of each plate.
+    """
+
+    X = zeros((len(plates), 4, 2))
+    X[:, 1:3, 0] = array([plate.width() for plate in plates])[:, None]
+    X[:, 2:4, 1] = array([plate.height() for plate in plates])[:, None]
+
+    return X
+
+def _plate_K(plates):
+    """
+    Returns the stacked global stiffness matrices for a list of plates (see `Plate3D.batch_K`).
+    """
+
+    E, nu, t, kx_mod, ky_mod = _element_properties(plates)
+    X = _plate_local_coords(plates)
+    widths, heights = X[:, 2, 0], X[:, 2, 1]
+
+    k = _membrane_k(X, t, _plane_stress_C(E, nu, kx_mod, ky_mod))
+
+    # Add the bending terms, reusing them for plates with the same properties
+    k_b = {}
+    for i, plate in enumerate(plates):
+        key = (widths[i], heights[i], plate.t, plate.E, plate.nu)
+        if key not in k_b:
+            k_b[key] = plate.k_b()
+        k[i] += k_b[key]
+
+    return _to_global(k, _dir_cos(plates))
+
+def _plate_results(plates, D):
+    """
+    Returns the internal shears, moments and membrane stresses at the corners and center of each
+    plate, given the stacked `(n, 24)` global displacement vectors `D` of the plates, in the same
+    form as `_quad_results`. Like `Plate3D.shear`, `Plate3D.moment` and `Plate3D.membrane`,
+    the local results are also used for the global ones.
+    """
+
+    d = _local_d(D, _dir_cos(plates))
+
+    E, nu, t, kx_mod, ky_mod = _element_properties(plates)
+    X = _plate_local_coords(plates)
+
+    # Bending constitutive matrices (see `Plate3D.Db`)
+    Db = zeros((len(plates), 3, 3))
+    Db[:, 0, 0] = E*kx_mod
+    Db[:, 0, 1] = nu*E*kx_mod
+    Db[:, 1, 0] = nu*E*ky_mod
+    Db[:, 1, 1] = E*ky_mod
+    Db[:, 2, 2] = E/(2*(1 + nu))
+    Db = (t**3/(12*(1 - nu*nu)))[:, None, None]*Db
+
+    # Rows of the displacement coefficient matrix [C] for the nodes (see `Plate3D._C`)
+    x, y = X[..., 0], X[..., 1]
+    o, l = zeros_like(x), ones_like(x)
+    C = stack([stack([l, x, y, x**2, x*y, y**2, x**3, x**2*y, x*y**2, y**3, x**3*y, x*y**3], axis=-1),
+               stack([o, o, l, o, x, 2*y, o, x**2, 2*x*y, 3*y**2, x**3, 3*x*y**2], axis=-1),
+               stack([o, -l, o, -2*x, -y, o, -3*x**2, -2*x*y, -y**2, o, -3*x**2*y, -y**3], axis=-1)],
+              axis=2).reshape(len(plates), 12, 12)
+
+    # Plate bending constants (see `Plate3D._a`)
+    a = einsum('nij,nj->ni', inv(C), d[:, _BENDING_DOFS])
+
+    # The corners and center of each plate
+    x = X[:, [0, 1, 2, 3, 0], 0] + [0, 0, 0, 0, 0.5]*X[:, 2, None, 0]
+    y = X[:, [0, 1, 2, 3, 0], 1] + [0, 0, 0, 0, 0.5]*X[:, 2, None, 1]
+    o, l = zeros_like(x), ones_like(x)
+
+    # Curvature coefficient matrix [Q] (see `Plate3D._Q`), and its derivatives with respect to x and y
+    Q = stack([stack([o, o, o, -2*l, o, o, -6*x, -2*y, o, o, -6*x*y, o], axis=-1),
+               stack([o, o, o, o, o, -2*l, o, o, -2*x, -6*y, o, -6*x*y], axis=-1),
+               stack([o, o, o, o, -2*l, o, o, -4*x, -4*y, o, -6*x**2, -6*y**2], axis=-1)], axis=2)
+    dQ_dx = stack([stack([o, o, o, o, o, o, -6*l, o, o, o, -6*y, o], axis=-1),
+                   stack([o, o, o, o, o, o, o, o, -2*l, o, o, -6*y], axis=-1),
+                   stack([o, o, o, o, o, o, o, -4*l, o, o, -12*x, o], axis=-1)], axis=2)
+    dQ_dy = stack([stack([o, o, o, o, o, o, o, -2*l, o, o, -6*x, o], axis=-1),
+                   stack([o, o, o, o, o, o, o, o, o, -6*l, o, -6*x], axis=-1),
+                   stack([o, o, o, o, o, o, o, o, -4*l, o, o, -12*y], axis=-1)], axis=2)
+
+    M = -einsum('nab,npbj,nj->npa', Db, Q, a)
+    dM_dx = einsum('nab,npbj,nj->npa', Db, dQ_dx, a)
+    dM_dy = einsum('nab,npbj,nj->npa', Db, dQ_dy, a)
+    Q = stack([dM_dx[..., 0] + dM_dy[..., 2], dM_dy[..., 1] + dM_dx[..., 2]], axis=-1)
+
+    # Membrane stresses, extrapolated from the Gauss points as in `Plate3D.membrane`
+    B_m, _ = _membrane_B(X)
+    S = einsum('pg,nab,ngbj,nj->npa', _EXTRAPOLATE, _plane_stress_C(E, nu, kx_mod, ky_mod), B_m,
+               d[:, _MEMBRANE_DOFS], optimize=True)
+
+    # Global shears get a zero third component so they stack with those of quads
+    Q_global = stack([Q[..., 0], Q[..., 1], zeros_like(x)], axis=-1)
+
+    return {'shear': (Q, Q_global), 'moment': (M, M), 'membrane': (S, S)}
@@ -8,6 +8,10 @@ import numpy as np
 from numpy import add
 from numpy.linalg import inv, det, norm
 from math import sin, cos
+from .MatrixCache import cached, cached_batch
+
+# Element attributes that the element's matrices depend on
+_STIFFNESS_ATTRIBUTES = frozenset(('i_node', 'j_node', 'm_node', 'n_node', 't', 'kx_mod', 'ky_mod', 'E', 'nu'))
 
 class Quad3D():
     """
@@ -37,6 +41,10 @@ class Quad3D():
         # Quads need a link to the model they belong to
         self.model = model
 
+        # Matrices calculated for the current revision of the model (see 'MatrixCache.cached')
+        self._matrices = {}
+        self._matrix_revision = None
+
         # Get material properties for the plate from the model
         try:
             self.E = self.model.materials[material_name].E
@@ -44,6 +52,15 @@ class Quad3D():
         except:
             raise KeyError('Please define the material ' + str(material_name) + ' before assigning it to plates.')
 
+    def __setattr__(self, name, value):
+
+        # Editing the element's properties or nodes changes its matrices
+        super().__setattr__(name, value)
+        if name in _STIFFNESS_ATTRIBUTES:
+            model = self.__dict__.get('model')
+            if getattr(model, 'revision', None) is not None:
+                model.revision += 1
+
     # def _local_coords(self):
     #     """
     #     Calculates or recalculates and stores the local (x, y) coordinates for each node of the
@@ -672,6 +689,7 @@ class Quad3D():
         
         return k_exp
 
+    @cached
     def k(self):
         '''
         Returns the quad element's local stiffness matrix.
@@ -776,7 +794,7 @@ class Quad3D():
         """
         
         # Calculate and return the global force vector
-        return inv(self.T()) @ self.f(combo_name)
+        return self._T_inv() @ self.f(combo_name)
 
     def D(self, combo_name='Combo 1'):
         '''
@@ -790,52 +808,41 @@ class Quad3D():
             for (not the load combination itself).
         '''
         
-        # Initialize the displacement vector
-        D = np.zeros((24, 1))
-        
-        # Read in the global displacements from the nodes
-        D[0, 0] = self.i_node.DX[combo_name]
-        D[1, 0] = self.i_node.DY[combo_name]
-        D[2, 0] = self.i_node.DZ[combo_name]
-        D[3, 0] = self.i_node.RX[combo_name]
-        D[4, 0] = self.i_node.RY[combo_name]
-        D[5, 0] = self.i_node.RZ[combo_name]
-
-        D[6, 0] = self.j_node.DX[combo_name]
-        D[7, 0] = self.j_node.DY[combo_name]
-        D[8, 0] = self.j_node.DZ[combo_name]
-        D[9, 0] = self.j_node.RX[combo_name]
-        D[10, 0] = self.j_node.RY[combo_name]
-        D[11, 0] = self.j_node.RZ[combo_name]
-
-        D[12, 0] = self.m_node.DX[combo_name]
-        D[13, 0] = self.m_node.DY[combo_name]
-        D[14, 0] = self.m_node.DZ[combo_name]
-        D[15, 0] = self.m_node.RX[combo_name]
-        D[16, 0] = self.m_node.RY[combo_name]
-        D[17, 0] = self.m_node.RZ[combo_name]
-
-        D[18, 0] = self.n_node.DX[combo_name]
-        D[19, 0] = self.n_node.DY[combo_name]
-        D[20, 0] = self.n_node.DZ[combo_name]
-        D[21, 0] = self.n_node.RX[combo_name]
-        D[22, 0] = self.n_node.RY[combo_name]
-        D[23, 0] = self.n_node.RZ[combo_name]
-        
+        # Gather the displacements from the model's global displacement vector
+        D = self.model._D[combo_name][self._dofs, :]
+
         # Return the global displacement vector
         return D
 
+    @cached
     def K(self):
         '''
         Returns the quad element's global stiffness matrix
         '''
 
-        # Get the transformation matrix
-        T = self.T()
-
         # Calculate and return the stiffness matrix in global coordinates
-        return inv(T) @ self.k() @ T
- 
+        return self._T_inv() @ self.k() @ self.T()
+
+    @staticmethod
+    def batch_K(quads):
+        """
+        Returns the global stiffness matrices for a group of quads, stacked in an `(n, 24, 24)`
+        array in the same order as `quads`.
+
+        The terms are the same as those returned by `K` for each quad, but every Gauss point of
+        every quad is evaluated together using stacked arrays, which avoids the overhead of
+        building many small matrices one element at a time on large meshes.
+
+        Matrices already cached by `K` (or by an earlier call) are reused.
+
+        Parameters
+        ----------
+        quads : list
+            The quads to calculate the stiffness matrices for.
+        """
+
+        return cached_batch(quads, 'K', _quad_K)
+
     # Global fixed end reaction vector
     def FER(self, combo_name='Combo 1'):
         '''
@@ -849,8 +856,9 @@ class Quad3D():
         '''
         
         # Calculate and return the fixed end reaction vector
-        return inv(self.T()) @ self.fer(combo_name)
+        return self._T_inv() @ self.fer(combo_name)
   
+    @cached
     def T(self):
         """
         Returns the coordinate transformation matrix for the quad element.
@@ -918,6 +926,14 @@ class Quad3D():
         
         # Return the transformation matrix.
         return T
+
+    @cached
+    def _T_inv(self):
+        """
+        Returns the inverse of the quad element's transformation matrix.
+        """
+
+        return inv(self.T())
     
     # def T(self):
     #     """
@@ -1166,3 +1182,323 @@ class Quad3D():
                                                   Sy,
                                                   [0]]))
 
+
+#%%
+# Batched kernels used by `Quad3D.batch_K` and `Plate3D.batch_K`. Each one evaluates the same terms
+# as the element methods above for a group of elements stacked along the first axis.
+
+# The 2x2 Gauss points in natural (xi, eta) coordinates, in the order used by `k_b` and `k_m`
+_gp = 1/3**0.5
+_XI = np.array([-_gp,  _gp, _gp, -_gp])
+_ETA = np.array([-_gp, -_gp, _gp,  _gp])
+
+# Derivatives of the bilinear interpolation functions with respect to xi (row 0) and eta (row 1)
+# at each Gauss point
+_DN = 1/4*np.stack([np.stack([_ETA - 1, -_ETA + 1, _ETA + 1, -_ETA - 1], axis=-1),
+                    np.stack([_XI - 1,  -_XI - 1,  _XI + 1,  -_XI + 1], axis=-1)], axis=1)
+
+# Derivatives of the quadratic interpolation functions P5 to P8 at each Gauss point
+_DP = np.stack([np.stack([_XI*(_ETA - 1), -0.5*(_ETA - 1)*(_ETA + 1), -_XI*(_ETA + 1), 0.5*(_ETA - 1)*(_ETA + 1)], axis=-1),
+                np.stack([0.5*(_XI - 1)*(_XI + 1), -_ETA*(_XI + 1), -0.5*(_XI - 1)*(_XI + 1), _ETA*(_XI - 1)], axis=-1)], axis=1)
+
+# Equation 44 at each Gauss point
+_N_GAMMA = np.stack([np.stack([(1 - _ETA)/2, 0*_XI, (1 + _ETA)/2, 0*_XI], axis=-1),
+                     np.stack([0*_XI, (1 + _XI)/2, 0*_XI, (1 - _XI)/2], axis=-1)], axis=1)
+
+# Rows of the expanded 24x24 matrix that the unexpanded membrane and bending terms go to
+_MEMBRANE_DOFS = np.array([0, 1, 6, 7, 12, 13, 18, 19])
+_BENDING_DOFS = np.array([2, 3, 4, 8, 9, 10, 14, 15, 16, 20, 21, 22])
+_DRILLING_DOFS = np.array([5, 11, 17, 23])
+
+# Local bending terms in the order used by the DKMQ derivation (local x and y rotations swapped),
+# and the signs that correct for +x bending and +x rotation being opposite (see `Quad3D.moment`)
+_DKMQ_DOFS = np.array([2, 4, 3, 8, 10, 9, 14, 16, 15, 20, 22, 21])
+_DKMQ_SIGNS = np.tile([1, 1, -1], 4)
+
+# Natural coordinates of the corners and center of an element, where the mesh results are checked,
+# and the interpolation functions extrapolating Gauss point values to those points
+_RESULT_POINTS = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1], [0, 0]])
+_xi_ex, _eta_ex = _RESULT_POINTS.T/_gp
+_EXTRAPOLATE = 1/4*np.stack([(1 - _xi_ex)*(1 - _eta_ex), (1 + _xi_ex)*(1 - _eta_ex),
+                             (1 + _xi_ex)*(1 + _eta_ex), (1 - _xi_ex)*(1 + _eta_ex)], axis=-1)
+
+def _quad_K(quads):
+    """
+    Returns the stacked global stiffness matrices for a list of quads (see `Quad3D.batch_K`).
+    """
+
+    X = _quad_local_coords(quads)
+    E, nu, t, kx_mod, ky_mod = _element_properties(quads)
+
+    # Store the local coordinates on each quad, as `k` does, for methods that rely on them
+    for quad, (x, y) in zip(quads, X.transpose(0, 2, 1).tolist()):
+        quad.x1, quad.x2, quad.x3, quad.x4 = x
+        quad.y1, quad.y2, quad.y3, quad.y4 = y
+
+    k = _quad_k_b(X, E, nu, t) + _membrane_k(X, t, _plane_stress_C(E, nu, kx_mod, ky_mod))
+
+    return _to_global(k, _dir_cos(quads))
+
+def _node_coords(elements):
+    """
+    Returns an `(n, 4, 3)` array of the global coordinates of each element's i, j, m and n nodes.
+    """
+
+    return np.array([[(node.X, node.Y, node.Z) for node in (element.i_node, element.j_node, element.m_node, element.n_node)]
+                     for element in elements], dtype=float)
+
+def _element_properties(elements):
+    """
+    Returns arrays of `E`, `nu`, `t`, `kx_mod` and `ky_mod` for each element.
+    """
+
+    return np.array([(element.E, element.nu, element.t, element.kx_mod, element.ky_mod) for element in elements], dtype=float).T
+
+def _quad_local_coords(quads):
+    """
+    Returns an `(n, 4, 2)` array of the local (x, y) coordinates of each quad's nodes, calculated
+    the same way as `Quad3D._local_coords`.
+    """
+
+    P = _node_coords(quads)
+    V = P - P[:, :1, :]
+
+    x_axis = V[:, 1]/norm(V[:, 1], axis=1)[:, None]
+    y_axis = np.cross(np.cross(V[:, 1], V[:, 2]), V[:, 1])
+    y_axis = y_axis/norm(y_axis, axis=1)[:, None]
+
+    X = np.stack([np.einsum('nkc,nc->nk', V, x_axis), np.einsum('nkc,nc->nk', V, y_axis)], axis=-1)
+    X[:, 0, :] = 0
+
+    return X
+
+def _dir_cos(elements):
+    """
+    Returns an `(n, 3, 3)` array of the direction cosines used by `Quad3D.T` and `Plate3D.T`.
+    """
+
+    P = _node_coords(elements)
+
+    x = P[:, 1] - P[:, 0]
+    x = x/norm(x, axis=1)[:, None]
+    z = np.cross(x, P[:, 3] - P[:, 0])
+    z = z/norm(z, axis=1)[:, None]
+    y = np.cross(z, x)
+    y = y/norm(y, axis=1)[:, None]
+
+    return np.stack([x, y, z], axis=1)
+
+def _to_global(k, dir_cos):
+    """
+    Transforms stacked `(n, 24, 24)` local stiffness matrices to global coordinates. The
+    transformation matrix is block diagonal in `dir_cos`, and orthogonal, so its inverse is its
+    transpose and each 3x3 block can be rotated directly.
+    """
+
+    n = len(k)
+
+    return np.einsum('npi,napbq,nqj->naibj', dir_cos, k.reshape(n, 8, 3, 8, 3), dir_cos,
+                     optimize=True).reshape(n, 24, 24)
+
+def _plane_stress_C(E, nu, kx_mod, ky_mod):
+    """
+    Returns the `(n, 3, 3)` orthotropic plane stress matrices given by `Quad3D.Cm` and `Plate3D.Dm`.
+    """
+
+    Ex = E*kx_mod
+    Ey = E*ky_mod
+    G = E/(2*(1 + nu))
+
+    C = np.zeros((len(E), 3, 3))
+    C[:, 0, 0] = Ex
+    C[:, 0, 1] = nu*Ex
+    C[:, 1, 0] = nu*Ey
+    C[:, 1, 1] = Ey
+    C[:, 2, 2] = (1 - nu*nu)*G
+
+    return C/(1 - nu*nu)[:, None, None]
+
+def _jacobian(X):
+    """
+    Returns the `(n, 4, 2, 2)` Jacobian matrices at each Gauss point for elements with the local
+    nodal coordinates `X`.
+    """
+
+    return np.einsum('gak,nkb->ngab', _DN, X)
+
+def _membrane_B(X):
+    """
+    Returns the `(n, 4, 3, 8)` membrane strain-displacement matrices and the `(n, 4)` Jacobian
+    determinants at each Gauss point for elements with the local nodal coordinates `X`.
+    """
+
+    J = _jacobian(X)
+    dH = inv(J) @ _DN
+
+    # Reference 2, Example 5.5 (page 353)
+    B = np.zeros(dH.shape[:2] + (3, 8))
+    B[..., 0, 0::2] = dH[..., 0, :]
+    B[..., 1, 1::2] = dH[..., 1, :]
+    B[..., 2, 0::2] = dH[..., 1, :]
+    B[..., 2, 1::2] = dH[..., 0, :]
+
+    return B, det(J)
+
+def _membrane_k(X, t, C):
+    """
+    Returns the expanded `(n, 24, 24)` local membrane stiffness matrices for elements with the local
+    nodal coordinates `X`, thicknesses `t` and plane stress matrices `C`.
+    """
+
+    B, detJ = _membrane_B(X)
+
+    k = t[:, None, None]*np.einsum('ng,ngai,nab,ngbj->nij', detJ, B, C, B, optimize=True)
+
+    k_exp = np.zeros((len(X), 24, 24))
+    k_exp[:, _MEMBRANE_DOFS[:, None], _MEMBRANE_DOFS] = k
+
+    return k_exp
+
+def _bending_H(E, nu, t):
+    """
+    Returns the `(n, 3, 3)` bending and `(n, 2, 2)` shear stress-strain matrices given by
+    `Quad3D.Hb` and `Quad3D.Hs`.
+    """
+
+    n = len(E)
+
+    Hb = (E*t**3/(12*(1 - nu**2)))[:, None, None]*np.stack([np.stack([np.ones(n), nu, np.zeros(n)], axis=-1),
+                                                           np.stack([nu, np.ones(n), np.zeros(n)], axis=-1),
+                                                           np.stack([np.zeros(n), np.zeros(n), (1 - nu)/2], axis=-1)], axis=1)
+    Hs = (E*t*5/6/(2*(1 + nu)))[:, None, None]*np.eye(2)
+
+    return Hb, Hs
+
+def _quad_bending_B(X, nu, t):
+    """
+    Returns the `(n, 4, 3, 12)` DKMQ bending and `(n, 4, 2, 12)` shear strain-displacement matrices
+    given by `Quad3D.B_b` and `Quad3D.B_s`, and the `(n, 4)` Jacobian determinants, at each Gauss
+    point for quads with the local nodal coordinates `X`.
+    """
+
+    n = len(X)
+
+    # Length and direction cosines of sides 5 to 8 (Figures 3 and 5), each running from node k - 4 to the next node
+    dX = np.roll(X, -1, axis=1) - X
+    L = norm(dX, axis=2)
+    C = dX[..., 0]/L
+    S = dX[..., 1]/L
+
+    # Equation 74
+    phi = 2/(5/6*(1 - nu[:, None]))*(t[:, None]/L)**2
+
+    # [A_u] matrix: side k connects node a = k - 5 to node b = k - 4
+    A_u = np.zeros((n, 4, 12))
+    for side in range(4):
+        a, b = 3*side, 3*((side + 1) % 4)
+        A_u[:, side, a] = -2/L[:, side]
+        A_u[:, side, b] = 2/L[:, side]
+        A_u[:, side, [a + 1, b + 1]] = C[:, side, None]
+        A_u[:, side, [a + 2, b + 2]] = S[:, side, None]
+    A_u = A_u/2
+
+    J = _jacobian(X)
+    J_inv = inv(J)
+
+    # [B_b_beta] from the derivatives of the bilinear interpolation functions
+    dN = J_inv @ _DN
+    B_beta = np.zeros((n, 4, 3, 12))
+    B_beta[..., 0, 1::3] = dN[..., 0, :]
+    B_beta[..., 1, 2::3] = dN[..., 1, :]
+    B_beta[..., 2, 1::3] = dN[..., 1, :]
+    B_beta[..., 2, 2::3] = dN[..., 0, :]
+
+    # [B_b_Delta_beta] from the derivatives of the quadratic interpolation functions
+    dP = J_inv @ _DP
+    C, S = C[:, None, :], S[:, None, :]
+    B_Delta = np.stack([dP[..., 0, :]*C, dP[..., 1, :]*S, dP[..., 1, :]*C + dP[..., 0, :]*S], axis=2)
+
+    # [B_b] = [B_b_beta] + [B_b_Delta_beta][A_Delta_inv][A_u]
+    A_Delta_inv_A_u = (-3/2/(1 + phi))[:, :, None]*A_u
+    B_b = B_beta + B_Delta @ A_Delta_inv_A_u[:, None]
+
+    # [B_s] = [J]^-1[N_gamma][A_gamma][A_phi_Delta][A_u]
+    A_gamma = L/2*np.array([1, 1, -1, -1])
+    A_s = (A_gamma*phi/(1 + phi))[:, :, None]*A_u
+    B_s = J_inv @ (_N_GAMMA @ A_s[:, None])
+
+    return B_b, B_s, det(J)
+
+def _quad_k_b(X, E, nu, t):
+    """
+    Returns the expanded `(n, 24, 24)` local DKMQ bending stiffness matrices for quads with the local
+    nodal coordinates `X`, in the same form as `Quad3D.k_b`.
+    """
+
+    n = len(X)
+
+    Hb, Hs = _bending_H(E, nu, t)
+    B_b, B_s, detJ = _quad_bending_B(X, nu, t)
+
+    k = (np.einsum('ng,ngai,nab,ngbj->nij', detJ, B_b, Hb, B_b, optimize=True) +
+         np.einsum('ng,ngai,nab,ngbj->nij', detJ, B_s, Hs, B_s, optimize=True))
+
+    # Weak drilling spring, 1/1000 of the smallest rotational stiffness (see `Quad3D.k_b`)
+    k_rz = np.abs(k[:, [1, 2, 4, 5, 7, 8, 10, 11], [1, 2, 4, 5, 7, 8, 10, 11]]).min(axis=1)/1000
+
+    k_exp = np.zeros((n, 24, 24))
+    k_exp[:, _BENDING_DOFS[:, None], _BENDING_DOFS] = k
+    k_exp[:, _DRILLING_DOFS, _DRILLING_DOFS] = k_rz[:, None]
+
+    # Invert the local +y bending sign convention and swap the local x and y rotations to match Pynite
+    k_exp[:, [4, 10, 16, 22], :] *= -1
+    k_exp[:, :, [4, 10, 16, 22]] *= -1
+    swap = np.arange(24)
+    swap[[3, 4, 9, 10, 15, 16, 21, 22]] = [4, 3, 10, 9, 16, 15, 22, 21]
+
+    return k_exp[:, swap][:, :, swap]
+
+def _local_d(D, dir_cos):
+    """
+    Rotates stacked `(n, 24)` global element displacement vectors into each element's local
+    coordinate system.
+    """
+
+    n = len(D)
+
+    return np.einsum('nij,nbj->nbi', dir_cos, D.reshape(n, 8, 3)).reshape(n, 24)
+
+def _quad_results(quads, D):
+    """
+    Returns the internal shears, moments and membrane stresses at the corners and center of each quad
+    (see `_RESULT_POINTS`), given the stacked `(n, 24)` global displacement vectors `D` of the quads.
+
+    The results are returned in a dictionary keyed by 'shear', 'moment' and 'membrane'. Each entry is
+    a tuple of `(n, 5, 3)` arrays with the local and global results, in the same form as
+    `Quad3D.shear`, `Quad3D.moment` and `Quad3D.membrane`. Local shears only have two components.
+    """
+
+    dir_cos = _dir_cos(quads)
+    d = _local_d(D, dir_cos)
+
+    X = _quad_local_coords(quads)
+    E, nu, t, kx_mod, ky_mod = _element_properties(quads)
+
+    Hb, Hs = _bending_H(E, nu, t)
+    B_b, B_s, _ = _quad_bending_B(X, nu, t)
+    B_m, _ = _membrane_B(X)
+    d_b = d[:, _DKMQ_DOFS]*_DKMQ_SIGNS
+
+    # Evaluate each result at the Gauss points and extrapolate to the corners and center
+    Q = np.einsum('pg,nab,ngbj,nj->npa', _EXTRAPOLATE, Hs, B_s, d_b, optimize=True)
+    M = np.einsum('pg,nab,ngbj,nj->npa', _EXTRAPOLATE, Hb, B_b, d_b, optimize=True)
+    S = np.einsum('pg,nab,ngbj,nj->npa', _EXTRAPOLATE, _plane_stress_C(E, nu, kx_mod, ky_mod), B_m,
+                  d[:, _MEMBRANE_DOFS], optimize=True)
+
+    # Convert to global coordinates
+    zero = np.zeros(Q.shape[:2])
+    Q_global = np.einsum('nji,npj->npi', dir_cos, np.stack([Q[..., 0], Q[..., 1], zero], axis=-1))
+    M_global = np.einsum('nij,npj->npi', dir_cos, np.stack([-M[..., 1], M[..., 0], zero], axis=-1))[..., [1, 0, 2]]
+    S_global = np.einsum('nji,npj->npi', dir_cos, np.stack([S[..., 0], S[..., 1], zero], axis=-1))
+
+    return {'shear': (Q, Q_global), 'moment': (M, M_global), 'membrane': (S, S_global)}
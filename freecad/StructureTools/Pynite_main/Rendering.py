@@ -7,6 +7,8 @@ import numpy as np
 import pyvista as pv
 import math
 
+from .Contour import _node_contours
+
 # Allow for 3D interaction within jupyter notebook using trame
 try:
     pv.global_theme.trame.jupyter_extension_enabled = True
@@ -1213,84 +1215,36 @@ def _PrepContour(model, stress_type='Mx', combo_name='Combo 1'):
 
     if stress_type != None:
     
-        # Erase any previous contours
-        for node in model.nodes.values():
-            node.contour = []
-        
         # Check for global stresses:
         if stress_type in ['MX', 'MY', 'MZ', 'QX', 'QY', 'QZ', 'SX', 'SY']:
             local = False
         else:
             local = True
-    
-        # Step through each element in the model
-        for element in list(model.quads.values()) + list(model.plates.values()):
-            
-            # Rectangular elements and quadrilateral elements have different local coordinate systems. Rectangles are based on a traditional (x, y) system, while quadrilaterals are based on a 'natural' (r, s) coordinate system. To reduce duplication of code for both these elements we'll define the edges of the plate here for either element using the (r, s) terminology.
-            if element.type == 'Rect':
-                r_left = 0
-                r_right = element.width()
-                s_bot = 0
-                s_top = element.height()
-            else:
-                r_left = -1
-                r_right = 1
-                s_bot = -1
-                s_top = 1
-      
-            # Determine which stress result has been requested by the user
-            if stress_type == 'dz':
-                i, j, m, n = element.d(combo_name)[[2, 8, 14, 20], :]
-                element.i_node.contour.append(i)
-                element.j_node.contour.append(j)
-                element.m_node.contour.append(m)
-                element.n_node.contour.append(n)
-            elif stress_type.upper() == 'MX':
-                element.i_node.contour.append(element.moment(r_left, s_bot, local, combo_name)[0])
-                element.j_node.contour.append(element.moment(r_right, s_bot, local, combo_name)[0])
-                element.m_node.contour.append(element.moment(r_right, s_top, local, combo_name)[0])
-                element.n_node.contour.append(element.moment(r_left, s_top, local, combo_name)[0])
-            elif stress_type.upper() == 'MY':
-                element.i_node.contour.append(element.moment(r_left, s_bot, local, combo_name)[1])
-                element.j_node.contour.append(element.moment(r_right, s_bot, local, combo_name)[1])
-                element.m_node.contour.append(element.moment(r_right, s_top, local, combo_name)[1])
-                element.n_node.contour.append(element.moment(r_left, s_top, local, combo_name)[1])
-            elif stress_type.upper() == 'MXY':
-                element.i_node.contour.append(element.moment(r_left, s_bot, local, combo_name)[2])
-                element.j_node.contour.append(element.moment(r_right, s_bot, local, combo_name)[2])
-                element.m_node.contour.append(element.moment(r_right, s_top, local, combo_name)[2])
-                element.n_node.contour.append(element.moment(r_left, s_top, local, combo_name)[2])
-            elif stress_type.upper() == 'QX':
-                element.i_node.contour.append(element.shear(r_left, s_bot, local, combo_name)[0])
-                element.j_node.contour.append(element.shear(r_right, s_bot, local, combo_name)[0])
-                element.m_node.contour.append(element.shear(r_right, s_top, local, combo_name)[0])
-                element.n_node.contour.append(element.shear(r_left, s_top, local, combo_name)[0])
-            elif stress_type.upper() == 'QY':
-                element.i_node.contour.append(element.shear(r_left, s_bot, local, combo_name)[1])
-                element.j_node.contour.append(element.shear(r_right, s_bot, local, combo_name)[1])
-                element.m_node.contour.append(element.shear(r_right, s_top, local, combo_name)[1])
-                element.n_node.contour.append(element.shear(r_left, s_top, local, combo_name)[1])
-            elif stress_type.upper() == 'SX':
-                element.i_node.contour.append(element.membrane(r_left, s_bot, local, combo_name)[0])
-                element.j_node.contour.append(element.membrane(r_right, s_bot, local, combo_name)[0])
-                element.m_node.contour.append(element.membrane(r_right, s_top, local, combo_name)[0])
-                element.n_node.contour.append(element.membrane(r_left, s_top, local, combo_name)[0])
-            elif stress_type.upper() == 'SY':
-                element.i_node.contour.append(element.membrane(r_left, s_bot, local, combo_name)[1])
-                element.j_node.contour.append(element.membrane(r_right, s_bot, local, combo_name)[1])
-                element.m_node.contour.append(element.membrane(r_right, s_top, local, combo_name)[1])
-                element.n_node.contour.append(element.membrane(r_left, s_top, local, combo_name)[1])
-            elif stress_type.upper() == 'TXY':
-                element.i_node.contour.append(element.membrane(r_left, s_bot, local, combo_name)[2])
-                element.j_node.contour.append(element.membrane(r_right, s_bot, local, combo_name)[2])
-                element.m_node.contour.append(element.membrane(r_right, s_top, local, combo_name)[2])
-                element.n_node.contour.append(element.membrane(r_left, s_top, local, combo_name)[2])                 
-      
-        # Average the values at each node to obtain a smoothed contour
+
+        # Determine which stress result has been requested by the user
+        if stress_type == 'dz':
+            result, i = 'dz', 0
+        elif stress_type.upper() in ['MX', 'MY', 'MXY']:
+            result, i = 'moment', ['MX', 'MY', 'MXY'].index(stress_type.upper())
+        elif stress_type.upper() in ['QX', 'QY']:
+            result, i = 'shear', ['QX', 'QY'].index(stress_type.upper())
+        elif stress_type.upper() in ['SX', 'SY', 'TXY']:
+            result, i = 'membrane', ['SX', 'SY', 'TXY'].index(stress_type.upper())
+        else:
+            result = None
+
+        # Average the corner results at each node to obtain a smoothed contour. Nodes that aren't
+        # connected to any plates get an empty list.
+        if result is None:
+            contours = None
+        else:
+            contours = _node_contours(model, result, i, local, combo_name)
+
         for node in model.nodes.values():
-            # Prevent divide by zero errors for nodes with no contour values
-            if node.contour != []:
-                node.contour = sum(node.contour)/len(node.contour)
+            if contours is None or np.isnan(contours[node.ID]):
+                node.contour = []
+            else:
+                node.contour = contours[node.ID]
 
 def sig_fig_round(number, sig_figs):
 
@@ -28,6 +28,14 @@ class Section():
         self.Iy = Iy
         self.Iz = Iz
         self.J = J
+
+    def __setattr__(self, name, value):
+
+        # Editing a section changes the matrices of the members that use it
+        super().__setattr__(name, value)
+        model = self.__dict__.get('model')
+        if getattr(model, 'revision', None) is not None:
+            model.revision += 1
     
     def Phi(self):
         pass
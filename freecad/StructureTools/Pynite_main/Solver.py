@@ -0,0 +1,145 @@
+from numpy import zeros, eye, matmul, unique, concatenate
+from numpy.linalg import solve
+
+#%%
+class LinearSolver():
+    """Solves the partitioned system `K11*D1 = R` while holding on to the factorization of `K11`
+    between solutions.
+
+    The factorization is reused for as long as the stiffness matrix passed in stays the same, so
+    multiple load combinations (or blocks of right-hand sides) only cost one factorization. When
+    the stiffness matrix changes on only a few degrees of freedom, as happens when a handful of
+    tension/compression-only members or springs are switched on or off, the existing
+    factorization is corrected with a low-rank (Woodbury) update instead of being recomputed.
+    """
+
+    def __init__(self, sparse=True, backend=None, max_update_rank=60):
+        """
+        Parameters
+        ----------
+        sparse : bool
+            Indicates whether the sparse solver should be used. When `False` the dense
+            `numpy.linalg.solve` is used for every solution. Default is `True`.
+        backend : string
+            The sparse factorization to use: 'cholmod' (requires `scikit-sparse`) or 'splu'.
+            Defaults to `None`, in which case CHOLMOD is used if it is installed and `splu`
+            otherwise. CHOLMOD also falls back to `splu` if the matrix isn't positive definite.
+        max_update_rank : number
+            The largest number of changed degrees of freedom that will be handled with a low-rank
+            update. Larger changes trigger a full refactorization. Default is 60.
+        """
+
+        self.sparse = sparse
+        self.backend = backend
+        self.max_update_rank = max_update_rank
+
+        self.factorizations = 0  # The number of times a matrix has been factored
+        self.updates = 0         # The number of low-rank updates applied to a factorization
+
+        self._K = None        # The stiffness matrix the current solution is for
+        self._K_base = None   # The stiffness matrix that was actually factored
+        self._factor = None   # A function solving `K_base*X = B`
+        self._U = None        # Degrees of freedom changed since `K_base` was factored
+        self._Z = None        # `inv(K_base)` applied to the changed degrees of freedom
+        self._C = None        # The change in stiffness on the changed degrees of freedom
+        self._S = None        # The Woodbury capacitance matrix `I + C*Z[U, :]`
+
+    def solve(self, K11, R):
+        """Returns the solution to `K11*D1 = R`, refactoring `K11` only if it has changed.
+
+        Parameters
+        ----------
+        K11 : lil_matrix, csr_matrix, csc_matrix or array
+            The partitioned stiffness matrix for the unknown degrees of freedom.
+        R : array
+            A right-hand side vector, or an `(n, m)` block of right-hand sides.
+
+        Returns
+        -------
+        array
+            The solution with the same shape as `R`.
+        """
+
+        # The dense solver has nothing to reuse
+        if not self.sparse:
+            return solve(K11, R)
+
+        self._update(K11.tocsc())
+
+        X = self._factor(R)
+        if self._U is not None:
+            # Woodbury correction: X = Y - Z*inv(I + C*Z[U, :])*C*Y[U, :]
+            X = X - matmul(self._Z, solve(self._S, matmul(self._C, X[self._U])))
+
+        return X.reshape(R.shape)
+
+    def reset(self):
+        """Discards the stored factorization.
+        """
+
+        self._K = None
+        self._K_base = None
+        self._factor = None
+        self._U = None
+        self._Z = None
+        self._C = None
+        self._S = None
+
+    def _update(self, K11):
+        """Makes the stored factorization consistent with `K11`.
+        """
+
+        # Reuse the existing factorization if nothing has changed
+        if self._K is not None and self._K.shape == K11.shape and (self._K != K11).nnz == 0:
+            return
+
+        # Try a low-rank update of the factored matrix
+        if self._K_base is not None and self._K_base.shape == K11.shape:
+
+            Delta = (K11 - self._K_base).tocoo()
+            Delta.eliminate_zeros()
+            U = unique(concatenate((Delta.row, Delta.col)))
+
+            if len(U) == 0:
+                self._K = K11
+                self._U, self._Z, self._C, self._S = None, None, None, None
+                return
+
+            if len(U) <= self.max_update_rank:
+                C = Delta.tocsr()[U, :][:, U].toarray()
+                E = zeros((K11.shape[0], len(U)))
+                E[U, range(len(U))] = 1.0
+                Z = self._factor(E).reshape(E.shape)
+                self._K = K11
+                self._U, self._Z, self._C = U, Z, C
+                self._S = eye(len(U)) + matmul(C, Z[U, :])
+                self.updates += 1
+                return
+
+        self._factorize(K11)
+
+    def _factorize(self, K11):
+        """Factors `K11` from scratch using the selected backend.
+        """
+
+        self._factor = None
+
+        if self.backend in (None, 'cholmod'):
+            try:
+                from sksparse.cholmod import cholesky
+                self._factor = cholesky(K11)
+            except ImportError:
+                if self.backend == 'cholmod':
+                    raise
+            except Exception:
+                # CHOLMOD requires a symmetric positive definite matrix
+                self._factor = None
+
+        if self._factor is None:
+            from scipy.sparse.linalg import splu
+            self._factor = splu(K11).solve
+
+        self._K = K11
+        self._K_base = K11
+        self._U, self._Z, self._C, self._S = None, None, None, None
+        self.factorizations += 1
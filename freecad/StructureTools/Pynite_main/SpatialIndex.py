@@ -0,0 +1,204 @@
+from math import floor, ceil, sqrt
+
+#%%
+class SpatialIndex():
+    """A uniform grid hash of a model's nodes, used to find nodes near a point or along a line
+    without checking every node in the model.
+
+    Each node is stored in the grid cell containing it. Queries only visit the cells that could hold
+    a match, and return candidate nodes. Callers are expected to apply their own exact tests to the
+    candidates.
+    """
+
+    def __init__(self, cell_size=None):
+        """
+        Parameters
+        ----------
+        cell_size : number
+            The edge length of each grid cell. Defaults to `None`, in which case a size is chosen from
+            the spacing of the nodes the first time the index is synchronized with a model.
+        """
+
+        self.cell_size = cell_size
+        self._cells = {}  # Grid cell key -> list of nodes in the cell
+        self._keys = {}   # id(node) -> (node, grid cell key)
+        self._sync_size = 0  # The number of nodes when the cell size was last chosen
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _key(self, X, Y, Z):
+        """Returns the key of the grid cell containing a point.
+        """
+
+        h = self.cell_size
+        return (floor(X/h), floor(Y/h), floor(Z/h))
+
+    def add(self, node):
+        """Adds a node to the index, or moves it to the correct cell if it is already indexed.
+        """
+
+        if self.cell_size is None:
+            return
+
+        key = self._key(node.X, node.Y, node.Z)
+        entry = self._keys.get(id(node))
+        if entry is not None:
+            if entry[1] == key:
+                return
+            self.remove(node)
+
+        self._cells.setdefault(key, []).append(node)
+        self._keys[id(node)] = (node, key)
+
+    def remove(self, node):
+        """Removes a node from the index. Nodes that aren't indexed are ignored.
+        """
+
+        entry = self._keys.pop(id(node), None)
+        if entry is None:
+            return
+
+        cell = self._cells[entry[1]]
+        cell.remove(node)
+        if not cell:
+            del self._cells[entry[1]]
+
+    def sync(self, nodes):
+        """Brings the index up to date with a collection of nodes. Nodes that were added, removed or
+        moved without going through `add` or `remove` are picked up here.
+
+        Parameters
+        ----------
+        nodes : iterable
+            All the nodes that should be in the index (usually `model.nodes.values()`).
+        """
+
+        nodes = list(nodes)
+
+        # Choose a cell size from the average node spacing, and again whenever the number of nodes
+        # has changed significantly
+        if self.cell_size is None or len(nodes) > 2*self._sync_size or 2*len(nodes) < self._sync_size:
+            self._rebuild(nodes)
+            return
+
+        current = set()
+        for node in nodes:
+            current.add(id(node))
+            self.add(node)
+
+        for node_id in [node_id for node_id in self._keys if node_id not in current]:
+            self.remove(self._keys[node_id][0])
+
+    def _rebuild(self, nodes):
+        """Chooses a new cell size and re-indexes all the nodes.
+        """
+
+        self._cells = {}
+        self._keys = {}
+        self._sync_size = len(nodes)
+
+        if nodes:
+            extents = [max(values) - min(values) for values in
+                       zip(*((node.X, node.Y, node.Z) for node in nodes))]
+
+            # Aim for roughly one node per cell, using the volume of the bounding box per node so
+            # that long or flat models get cells matching their node spacing. Directions the model
+            # doesn't extend in (e.g. the out-of-plane direction of a planar model) are left out.
+            extents = [extent for extent in extents if extent > 1e-9*max(extents)]
+            if extents:
+                volume = 1.0
+                for extent in extents:
+                    volume *= extent
+                self.cell_size = (volume/len(nodes))**(1/len(extents))
+            else:
+                self.cell_size = 1.0
+        elif self.cell_size is None:
+            self.cell_size = 1.0
+
+        for node in nodes:
+            self.add(node)
+
+    def _cell_range(self, low, high):
+        """Returns the range of cell indices spanning the interval [low, high] in one direction.
+        """
+
+        h = self.cell_size
+        return range(floor(low/h), floor(high/h) + 1)
+
+    def near_point(self, X, Y, Z, radius):
+        """Returns the indexed nodes within a distance of a point.
+
+        Parameters
+        ----------
+        X, Y, Z : number
+            The coordinates of the point.
+        radius : number
+            The search radius.
+
+        Returns
+        -------
+        list
+            The nodes within `radius` of the point.
+        """
+
+        found = []
+        for i in self._cell_range(X - radius, X + radius):
+            for j in self._cell_range(Y - radius, Y + radius):
+                for k in self._cell_range(Z - radius, Z + radius):
+                    for node in self._cells.get((i, j, k), ()):
+                        if sqrt((node.X - X)**2 + (node.Y - Y)**2 + (node.Z - Z)**2) <= radius:
+                            found.append(node)
+
+        return found
+
+    def near_segment(self, Xi, Yi, Zi, Xj, Yj, Zj, padding=0.0):
+        """Returns the indexed nodes in the grid cells a line segment passes through, including
+        cells within `padding` of the segment. The result is a superset of the nodes lying on the
+        segment. Callers should apply their own exact test to it.
+
+        Parameters
+        ----------
+        Xi, Yi, Zi : number
+            The coordinates of the start of the segment.
+        Xj, Yj, Zj : number
+            The coordinates of the end of the segment.
+        padding : number
+            Extra distance around the segment to search. Defaults to 0.
+
+        Returns
+        -------
+        list
+            Candidate nodes near the segment. Each node is listed once.
+        """
+
+        h = self.cell_size
+        start, delta = (Xi, Yi, Zi), (Xj - Xi, Yj - Yi, Zj - Zi)
+
+        # Split the segment where it crosses the grid planes, so that each piece lies in a single
+        # cell
+        ts = {0.0, 1.0}
+        for a, d in zip(start, delta):
+            if d != 0:
+                low, high = sorted((a, a + d))
+                for c in range(floor(low/h) + 1, ceil(high/h)):
+                    ts.add((c*h - a)/d)
+        ts = sorted(ts)
+
+        # Search the cells within `padding` of each piece's bounding box
+        keys = set()
+        for ta, tb in zip(ts[:-1], ts[1:]):
+            ranges = []
+            for a, d in zip(start, delta):
+                low, high = sorted((a + ta*d, a + tb*d))
+                ranges.append(self._cell_range(low - padding, high + padding))
+            for i in ranges[0]:
+                for j in ranges[1]:
+                    for k in ranges[2]:
+                        keys.add((i, j, k))
+
+        found = []
+        for key in keys:
+            found.extend(self._cells.get(key, ()))
+
+        return found
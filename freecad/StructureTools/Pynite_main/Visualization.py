@@ -3,10 +3,12 @@ from json import load
 import warnings
 
 from IPython.display import Image
-from numpy import array, empty, append, cross
+from numpy import array, empty, append, cross, isnan
 from numpy.linalg import norm
 import vtk
 
+from .Contour import _node_contours
+
 class Renderer():
     """Used to render finite element models.
     """
@@ -1168,86 +1170,30 @@ def _PrepContour(model, stress_type='Mx', combo_name='Combo 1'):
 
     if stress_type != None:
     
-        # Erase any previous contours
+        # Determine which stress result has been requested by the user
+        if stress_type == 'dz':
+            result, i = 'dz', 0
+        elif stress_type in ['Mx', 'My', 'Mxy']:
+            result, i = 'moment', ['Mx', 'My', 'Mxy'].index(stress_type)
+        elif stress_type in ['Qx', 'Qy']:
+            result, i = 'shear', ['Qx', 'Qy'].index(stress_type)
+        elif stress_type in ['Sx', 'Sy', 'Txy']:
+            result, i = 'membrane', ['Sx', 'Sy', 'Txy'].index(stress_type)
+        else:
+            result = None
+
+        # Average the corner results at each node to obtain a smoothed contour. Nodes that aren't
+        # connected to any plates get an empty list.
+        if result is None:
+            contours = None
+        else:
+            contours = _node_contours(model, result, i, True, combo_name)
+
         for node in model.nodes.values():
-            node.contour = []
-    
-        # Step through each element in the model
-        for element in list(model.quads.values()) + list(model.plates.values()):
-            
-            # Rectangular elements and quadrilateral elements have different local coordinate systems.
-            # Rectangles are based on a traditional (x, y) system, while quadrilaterals are based on a
-            # 'natural' (r, s) coordinate system. To reduce duplication of code for both these elements
-            # we'll define the edges of the plate here for either element using the (r, s) terminology.
-            if element.type == 'Rect':
-                r_left = 0
-                r_right = element.width()
-                s_bot = 0
-                s_top = element.height()
+            if contours is None or isnan(contours[node.ID]):
+                node.contour = []
             else:
-                r_left = -1
-                r_right = 1
-                s_bot = -1
-                s_top = 1
-      
-            # Determine which stress result has been requested by the user
-            if stress_type == 'dz':
-                # Internally Pynite defines the nodes for a rectangular element in the order (i, j, m, n),
-                # while it defines the nodes for a quadrilateral element in the order (m, n, i, j)
-                if element.type == 'Rect':
-                    i, j, m, n = element.d(combo_name)[[2, 8, 14, 20], :]
-                else:
-                    i, j, m, n = element.d(combo_name)[[14, 20, 2, 8], :]
-                element.i_node.contour.append(i)
-                element.j_node.contour.append(j)
-                element.m_node.contour.append(m)
-                element.n_node.contour.append(n)
-            elif stress_type == 'Mx':
-                element.i_node.contour.append(element.moment(r_left, s_bot, True, combo_name)[0])
-                element.j_node.contour.append(element.moment(r_right, s_bot, True, combo_name)[0])
-                element.m_node.contour.append(element.moment(r_right, s_top, True, combo_name)[0])
-                element.n_node.contour.append(element.moment(r_left, s_top, True, combo_name)[0])
-            elif stress_type == 'My':
-                element.i_node.contour.append(element.moment(r_left, s_bot, True, combo_name)[1])
-                element.j_node.contour.append(element.moment(r_right, s_bot, True, combo_name)[1])
-                element.m_node.contour.append(element.moment(r_right, s_top, True, combo_name)[1])
-                element.n_node.contour.append(element.moment(r_left, s_top, True, combo_name)[1])
-            elif stress_type == 'Mxy':
-                element.i_node.contour.append(element.moment(r_left, s_bot, True, combo_name)[2])
-                element.j_node.contour.append(element.moment(r_right, s_bot, True, combo_name)[2])
-                element.m_node.contour.append(element.moment(r_right, s_top, True, combo_name)[2])
-                element.n_node.contour.append(element.moment(r_left, s_top, True, combo_name)[2])
-            elif stress_type == 'Qx':
-                element.i_node.contour.append(element.shear(r_left, s_bot, True, combo_name)[0])
-                element.j_node.contour.append(element.shear(r_right, s_bot, True, combo_name)[0])
-                element.m_node.contour.append(element.shear(r_right, s_top, True, combo_name)[0])
-                element.n_node.contour.append(element.shear(r_left, s_top, True, combo_name)[0])
-            elif stress_type == 'Qy':
-                element.i_node.contour.append(element.shear(r_left, s_bot, True, combo_name)[1])
-                element.j_node.contour.append(element.shear(r_right, s_bot, True, combo_name)[1])
-                element.m_node.contour.append(element.shear(r_right, s_top, True, combo_name)[1])
-                element.n_node.contour.append(element.shear(r_left, s_top, True, combo_name)[1])
-            elif stress_type == 'Sx':
-                element.i_node.contour.append(element.membrane(r_left, s_bot, True, combo_name)[0])
-                element.j_node.contour.append(element.membrane(r_right, s_bot, True, combo_name)[0])
-                element.m_node.contour.append(element.membrane(r_right, s_top, True, combo_name)[0])
-                element.n_node.contour.append(element.membrane(r_left, s_top, True, combo_name)[0])
-            elif stress_type == 'Sy':
-                element.i_node.contour.append(element.membrane(r_left, s_bot, True, combo_name)[1])
-                element.j_node.contour.append(element.membrane(r_right, s_bot, True, combo_name)[1])
-                element.m_node.contour.append(element.membrane(r_right, s_top, True, combo_name)[1])
-                element.n_node.contour.append(element.membrane(r_left, s_top, True, combo_name)[1])
-            elif stress_type == 'Txy':
-                element.i_node.contour.append(element.membrane(r_left, s_bot, True, combo_name)[2])
-                element.j_node.contour.append(element.membrane(r_right, s_bot, True, combo_name)[2])
-                element.m_node.contour.append(element.membrane(r_right, s_top, True, combo_name)[2])
-                element.n_node.contour.append(element.membrane(r_left, s_top, True, combo_name)[2])                 
-      
-        # Average the values at each node to obtain a smoothed contour
-        for node in model.nodes.values():
-            # Prevent divide by zero errors for nodes with no contour values
-            if node.contour != []:
-                node.contour = sum(node.contour)/len(node.contour)
+                node.contour = contours[node.ID]
 
 def _DeformedShape(model, vtk_renderer, scale_factor, annotation_size, combo_name, render_nodes=True, theme='default'):
     '''
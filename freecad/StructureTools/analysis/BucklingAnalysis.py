@@ -13,10 +13,11 @@ import numpy as np
 import math
 from typing import List, Dict, Tuple, Optional, Any
 from scipy.linalg import eigh
-from scipy.sparse import csc_matrix
+from scipy.sparse import issparse
 from scipy.sparse.linalg import eigsh
 import time
 
+from ..Pynite_main.Analysis import _partition_D
 from ..utils.exceptions import AnalysisError
 from ..utils.validation import StructuralValidator
 
@@ -146,6 +147,12 @@ class BucklingAnalysis:
     - Buckling mode shape extraction and visualization
     - Stability checking and safety factor calculations
     - Integration with various loading conditions
+    
+    The analysis runs on a Pynite ``FEModel3D``. A reference linear solve gives the member
+    axial forces for each selected load combination (a linear solution already held by the
+    model is reused while the model is unchanged), the sparse elastic and geometric
+    stiffness matrices K and Kg are built from them, and the eigenvalue problem
+    K φ = λ (-Kg) φ is solved for the lowest positive load factors λ.
     """
     
     def __init__(self, structural_model):
@@ -153,7 +160,7 @@ class BucklingAnalysis:
         Initialize buckling analysis.
         
         Args:
-            structural_model: StructureTools structural model or Pynite FEModel3D
+            structural_model: Pynite FEModel3D with load combinations defined
         """
         self.model = structural_model
         
@@ -170,10 +177,14 @@ class BucklingAnalysis:
         # Analysis options
         self.include_geometric_stiffness = True
         self.consider_initial_stress = False
-        self.buckling_solver = "scipy"  # scipy, arpack
+        self.buckling_solver = "scipy"  # scipy (chosen by size), arpack (sparse), dense
+        
+        # With the scipy solver, systems with up to this many free DOF are solved densely
+        self.dense_size_limit = 100
         
         # Results storage
         self.results = None
+        self.combo_results = {}  # Load combination name -> BucklingAnalysisResults
         self.analysis_time = 0.0
         self.convergence_info = {}
     
@@ -200,7 +211,7 @@ class BucklingAnalysis:
         Set the base load case for buckling analysis.
         
         Args:
-            load_case_name: Name of load case to use as base
+            load_case_name: Name of load combination to use as base
             scale_factor: Scale factor for applied loads
         """
         self.base_load_case = load_case_name
@@ -213,8 +224,12 @@ class BucklingAnalysis:
         """
         Execute linear buckling analysis with comprehensive error handling.
         
+        Every selected load combination is analyzed; the results of each one are kept in
+        ``combo_results``.
+        
         Returns:
-            BucklingAnalysisResults object containing all results
+            BucklingAnalysisResults of the base load case, or of the combination with the
+            lowest critical load factor when no base load case is set
         """
         App.Console.PrintMessage("Starting buckling analysis...\n")
         start_time = time.time()
@@ -223,40 +238,28 @@ class BucklingAnalysis:
             # Validate model and parameters
             self._validate_analysis_inputs()
             
-            # Build stiffness matrices
-            App.Console.PrintMessage("Building stiffness matrices...\n")
-            K_elastic = self._build_elastic_stiffness_matrix()
-            K_geometric = self._build_geometric_stiffness_matrix()
-            
-            # Apply boundary conditions
-            K_elastic_reduced, K_geometric_reduced = self._apply_boundary_conditions(
-                K_elastic, K_geometric)
-            
-            # Solve generalized eigenvalue problem: (K_elastic - λ * K_geometric) * φ = 0
-            App.Console.PrintMessage("Solving eigenvalue problem...\n")
-            eigenvalues, eigenvectors = self._solve_buckling_eigenvalue_problem(
-                K_elastic_reduced, K_geometric_reduced)
-            
-            # Process results
-            load_factors = eigenvalues
-            buckling_modes = eigenvectors
+            # Reference linear solve for the member axial forces, unless the model already has one
+            combo_names = self._get_combo_names()
+            if self._has_reference_solution(combo_names):
+                App.Console.PrintMessage("Using the model's existing linear analysis results\n")
+            else:
+                App.Console.PrintMessage("Running reference linear analysis...\n")
+                self.model.analyze_linear(check_stability=False, sparse=True)
             
-            # Calculate critical loads
-            applied_loads = self._get_applied_loads()
-            critical_loads = self._calculate_critical_loads(load_factors, applied_loads)
+            self.combo_results = {}
+            for combo_name in combo_names:
+                self.combo_results[combo_name] = self._analyze_combo(combo_name)
             
-            # Create results object
-            self.results = BucklingAnalysisResults(
-                load_factors=load_factors,
-                buckling_modes=buckling_modes,
-                applied_loads=applied_loads,
-                critical_loads=critical_loads
-            )
+            # Report the most critical combination unless one was asked for
+            if self.base_load_case is not None:
+                self.results = self.combo_results[self.base_load_case]
+            else:
+                self.results = min(self.combo_results.values(),
+                                   key=lambda results: results.get_critical_load_factor())
             
             # Store analysis metadata
             self.analysis_time = time.time() - start_time
             self.results.analysis_time = self.analysis_time
-            self.results.convergence_info = self.convergence_info
             
             App.Console.PrintMessage(f"Buckling analysis completed in {self.analysis_time:.2f} seconds\n")
             
@@ -270,13 +273,51 @@ class BucklingAnalysis:
             App.Console.PrintError(error_msg + "\n")
             raise AnalysisError(error_msg)
     
+    def _analyze_combo(self, combo_name: str) -> BucklingAnalysisResults:
+        """Find the buckling load factors and modes of one solved load combination."""
+        App.Console.PrintMessage(f"Building stiffness matrices for {combo_name}...\n")
+        K_elastic = self._build_elastic_stiffness_matrix(combo_name)
+        K_geometric = self._build_geometric_stiffness_matrix(combo_name)
+        
+        # Apply boundary conditions
+        K_elastic_reduced, K_geometric_reduced, free_dofs = self._apply_boundary_conditions(
+            K_elastic, K_geometric)
+        
+        # Solve generalized eigenvalue problem: (K_elastic + λ * K_geometric) * φ = 0
+        App.Console.PrintMessage("Solving eigenvalue problem...\n")
+        eigenvalues, eigenvectors = self._solve_buckling_eigenvalue_problem(
+            K_elastic_reduced, K_geometric_reduced)
+        
+        # Process results
+        load_factors = eigenvalues
+        buckling_modes = self._expand_modes(eigenvectors, free_dofs, K_elastic.shape[0])
+        
+        # Calculate critical loads
+        applied_loads = self._get_applied_loads(combo_name)
+        critical_loads = self._calculate_critical_loads(load_factors, applied_loads)
+        
+        results = BucklingAnalysisResults(
+            load_factors=load_factors,
+            buckling_modes=buckling_modes,
+            applied_loads=applied_loads,
+            critical_loads=critical_loads
+        )
+        results.convergence_info = dict(self.convergence_info, load_combination=combo_name)
+        
+        return results
+    
     def _validate_analysis_inputs(self) -> None:
         """Validate analysis inputs and model."""
         if self.model is None:
             raise AnalysisError("No structural model provided")
         
+        if not hasattr(self.model, 'analyze_linear'):
+            raise AnalysisError("Buckling analysis requires a Pynite FEModel3D")
+        
         if self.base_load_case is None:
-            App.Console.PrintWarning("No base load case specified - using default loading\n")
+            App.Console.PrintWarning("No base load case specified - analyzing every load combination\n")
+        elif self.base_load_case not in self.model.load_combos:
+            raise AnalysisError(f"Load combination '{self.base_load_case}' is not defined in the model")
         
         if self.num_modes <= 0 or self.num_modes > 100:
             raise AnalysisError(f"Invalid number of modes: {self.num_modes}")
@@ -285,20 +326,29 @@ class BucklingAnalysis:
         if not self._check_model_stability():
             raise AnalysisError("Model is unstable - insufficient constraints for buckling analysis")
     
-    def _build_elastic_stiffness_matrix(self) -> np.ndarray:
-        """Build the elastic (linear) stiffness matrix."""
+    def _get_combo_names(self) -> List[str]:
+        """Get the load combinations to analyze."""
+        if self.base_load_case is not None:
+            return [self.base_load_case]
+        
+        if not self.model.load_combos:
+            raise AnalysisError("The model has no load combinations")
+        
+        return list(self.model.load_combos)
+    
+    def _has_reference_solution(self, combo_names: List[str]) -> bool:
+        """Check whether the model already holds linear results for the combinations, solved
+        after its last change."""
+        model = self.model
+        solved = getattr(model, '_D', None)
+        return (getattr(model, 'solution', None) == 'Linear' and
+                getattr(model, '_solution_revision', None) == (model.revision, model.load_revision) and
+                isinstance(solved, dict) and all(combo_name in solved for combo_name in combo_names))
+    
+    def _build_elastic_stiffness_matrix(self, combo_name: str):
+        """Build the sparse elastic (linear) stiffness matrix."""
         try:
-            # This would interface with the structural model to build K_elastic
-            # For now, create a placeholder matrix
-            num_dofs = self._get_model_dofs()
-            
-            # Use existing FE model if available
-            if hasattr(self.model, 'K'):
-                # Pynite model with existing stiffness matrix
-                K_elastic = np.array(self.model.K)
-            else:
-                # Build from elements
-                K_elastic = self._assemble_element_stiffness_matrices()
+            K_elastic = self.model.K(combo_name, check_stability=False, sparse=True).tocsr()
             
             App.Console.PrintMessage(f"Elastic stiffness matrix: {K_elastic.shape[0]} DOFs\n")
             return K_elastic
@@ -306,78 +356,66 @@ class BucklingAnalysis:
         except Exception as e:
             raise AnalysisError(f"Failed to build elastic stiffness matrix: {str(e)}")
     
-    def _build_geometric_stiffness_matrix(self) -> np.ndarray:
-        """Build the geometric (stress-dependent) stiffness matrix."""
+    def _build_geometric_stiffness_matrix(self, combo_name: str):
+        """Build the sparse geometric stiffness matrix from the member axial forces of a solved combination."""
         try:
-            num_dofs = self._get_model_dofs()
+            # Pynite takes the axial forces from the displacements of the reference solve
+            K_geometric = self.model.Kg(combo_name, sparse=True, first_step=False).tocsr()
             
-            # Initialize geometric stiffness matrix
-            K_geometric = np.zeros((num_dofs, num_dofs))
-            
-            # Get element stresses from applied loads
-            element_stresses = self._calculate_element_stresses()
-            
-            # Assemble geometric stiffness contributions from all elements
-            for element_id, element in self._iterate_model_elements():
-                if element_id in element_stresses:
-                    stress = element_stresses[element_id]
-                    K_geo_element = self._element_geometric_stiffness(element, stress)
-                    
-                    # Assemble into global matrix
-                    dofs = self._get_element_dofs(element)
-                    for i, global_i in enumerate(dofs):
-                        for j, global_j in enumerate(dofs):
-                            K_geometric[global_i, global_j] += K_geo_element[i, j]
-            
-            App.Console.PrintMessage(f"Geometric stiffness matrix assembled\n")
-            return K_geometric
+            # Scaling the reference loads scales the axial forces
+            return K_geometric * self.load_scale_factor
             
         except Exception as e:
             raise AnalysisError(f"Failed to build geometric stiffness matrix: {str(e)}")
     
-    def _solve_buckling_eigenvalue_problem(self, K_elastic: np.ndarray, 
-                                         K_geometric: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    def _solve_buckling_eigenvalue_problem(self, K_elastic, K_geometric) -> Tuple[np.ndarray, np.ndarray]:
         """
         Solve the generalized eigenvalue problem for buckling.
         
-        The buckling problem is: (K_elastic - λ * K_geometric) * φ = 0
+        The buckling problem is: (K_elastic + λ * K_geometric) * φ = 0
         where λ are the load factors and φ are the buckling mode shapes.
+        
+        It is solved as (-K_geometric) φ = μ K_elastic φ with μ = 1/λ, which is the
+        shift-invert transformation of the buckling problem about λ = 0: K_elastic is
+        factored once and Lanczos iterations converge first to the largest μ, i.e. the
+        lowest positive load factors.
         """
         try:
-            if self.buckling_solver == "scipy":
-                # Use SciPy's generalized eigenvalue solver
-                eigenvalues, eigenvectors = eigh(K_elastic, -K_geometric)
-                
-                # Sort by eigenvalue magnitude (smallest first = most critical)
-                idx = np.argsort(eigenvalues)
-                eigenvalues = eigenvalues[idx]
-                eigenvectors = eigenvectors[:, idx]
-                
-                # Take requested number of modes
-                eigenvalues = eigenvalues[:self.num_modes]
-                eigenvectors = eigenvectors[:, :self.num_modes]
-                
-            elif self.buckling_solver == "arpack":
-                # Use ARPACK for large sparse problems
-                from scipy.sparse.linalg import eigsh
-                
-                K_elastic_sparse = csc_matrix(K_elastic)
-                K_geometric_sparse = csc_matrix(-K_geometric)
-                
-                eigenvalues, eigenvectors = eigsh(
-                    K_elastic_sparse, 
-                    k=self.num_modes,
-                    M=K_geometric_sparse,
-                    which='SM',  # Smallest magnitude
-                    tol=self.convergence_tolerance
-                )
-                
-            else:
+            num_dofs = K_elastic.shape[0]
+            if self.buckling_solver not in ("scipy", "arpack", "dense"):
                 raise AnalysisError(f"Unknown buckling solver: {self.buckling_solver}")
             
+            use_dense = (self.buckling_solver == "dense" or
+                         (self.buckling_solver == "scipy" and num_dofs <= self.dense_size_limit))
+            
+            if not use_dense and self.num_modes < num_dofs - 1:
+                # Sparse shift-invert Lanczos
+                mu, eigenvectors = eigsh(-K_geometric.tocsc(), k=self.num_modes, M=K_elastic.tocsc(),
+                                         which='LA', tol=self.convergence_tolerance,
+                                         maxiter=self.max_iterations * self.num_modes)
+                solver = "arpack"
+            else:
+                # Use SciPy's dense generalized eigenvalue solver
+                mu, eigenvectors = eigh(-_dense(K_geometric), _dense(K_elastic))
+                solver = "dense"
+            
+            # Only positive μ are load factors that cause buckling under the applied loads
+            positive = mu > 0
+            eigenvalues = 1 / mu[positive]
+            eigenvectors = eigenvectors[:, positive]
+            
+            # Sort by load factor (smallest first = most critical)
+            idx = np.argsort(eigenvalues)[:self.num_modes]
+            eigenvalues = eigenvalues[idx]
+            eigenvectors = eigenvectors[:, idx]
+            
+            if len(eigenvalues) == 0:
+                raise AnalysisError("No positive load factors found - the applied loads do not cause buckling")
+            
             # Store convergence info
-            self.convergence_info['eigenvalue_solver'] = self.buckling_solver
+            self.convergence_info['eigenvalue_solver'] = solver
             self.convergence_info['num_modes_found'] = len(eigenvalues)
+            self.convergence_info['num_dofs'] = num_dofs
             
             App.Console.PrintMessage(f"Found {len(eigenvalues)} buckling modes\n")
             return eigenvalues, eigenvectors
@@ -385,138 +423,60 @@ class BucklingAnalysis:
         except Exception as e:
             raise AnalysisError(f"Eigenvalue solution failed: {str(e)}")
     
-    def _apply_boundary_conditions(self, K_elastic: np.ndarray, 
-                                 K_geometric: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    def _apply_boundary_conditions(self, K_elastic, K_geometric) -> Tuple[Any, Any, List[int]]:
         """Apply boundary conditions to stiffness matrices."""
         try:
-            # Get constrained DOFs
-            constrained_dofs = self._get_constrained_dofs()
-            
-            # Get free DOFs
-            total_dofs = K_elastic.shape[0]
-            all_dofs = set(range(total_dofs))
-            free_dofs = sorted(list(all_dofs - set(constrained_dofs)))
+            # Supported DOFs and DOFs with enforced displacements are removed
+            free_dofs, _, _ = _partition_D(self.model)
             
             # Extract free DOF matrices
-            K_elastic_reduced = K_elastic[np.ix_(free_dofs, free_dofs)]
-            K_geometric_reduced = K_geometric[np.ix_(free_dofs, free_dofs)]
+            K_elastic_reduced = K_elastic[free_dofs, :][:, free_dofs]
+            K_geometric_reduced = K_geometric[free_dofs, :][:, free_dofs]
             
             App.Console.PrintMessage(f"Applied boundary conditions: {len(free_dofs)} free DOFs\n")
-            return K_elastic_reduced, K_geometric_reduced
+            return K_elastic_reduced, K_geometric_reduced, free_dofs
             
         except Exception as e:
             raise AnalysisError(f"Failed to apply boundary conditions: {str(e)}")
     
-    # Helper methods for matrix assembly and model interface
-    def _get_model_dofs(self) -> int:
-        """Get total number of DOFs in the model."""
-        if hasattr(self.model, 'Nodes'):
-            return len(self.model.Nodes) * 6  # 6 DOFs per node
-        else:
-            return 100  # Default for testing
-    
-    def _assemble_element_stiffness_matrices(self) -> np.ndarray:
-        """Assemble global stiffness matrix from elements."""
-        num_dofs = self._get_model_dofs()
-        K_global = np.zeros((num_dofs, num_dofs))
-        
-        # This would iterate through model elements and assemble
-        # For now, create a simple positive definite matrix
-        K_global = np.eye(num_dofs) * 1000.0  # Diagonal dominance
-        
-        return K_global
-    
-    def _calculate_element_stresses(self) -> Dict:
-        """Calculate element stresses from applied loads."""
-        # This would perform static analysis with applied loads
-        # For now, return placeholder stresses
-        element_stresses = {}
-        if hasattr(self.model, 'Members'):
-            for i, member in enumerate(self.model.Members.values()):
-                element_stresses[i] = {
-                    'axial': 1000.0,  # N
-                    'moment_y': 500.0,  # N*m
-                    'moment_z': 300.0   # N*m
-                }
-        return element_stresses
-    
-    def _iterate_model_elements(self):
-        """Iterate through model elements."""
-        if hasattr(self.model, 'Members'):
-            for i, element in enumerate(self.model.Members.values()):
-                yield i, element
-    
-    def _element_geometric_stiffness(self, element, stress: Dict) -> np.ndarray:
-        """Calculate geometric stiffness matrix for an element."""
-        # Simplified geometric stiffness for beam element
-        # In practice, this would be more sophisticated
-        K_geo = np.zeros((12, 12))  # 2 nodes × 6 DOFs
-        
-        # Axial load effects on bending stiffness
-        axial_force = stress.get('axial', 0.0)
-        length = getattr(element, 'L', 1.0)
-        
-        if axial_force != 0:
-            # Simplified geometric stiffness due to axial load
-            geo_factor = axial_force / length
-            
-            # Affect lateral displacement DOFs (simplified)
-            for i in [1, 2, 7, 8]:  # Lateral DOFs
-                K_geo[i, i] = geo_factor
+    def _expand_modes(self, modes: np.ndarray, free_dofs: List[int], num_dofs: int) -> np.ndarray:
+        """Expand mode shapes to all DOFs, scaled to a largest component of 1."""
+        full_modes = np.zeros((num_dofs, modes.shape[1]))
+        full_modes[free_dofs, :] = modes
         
-        return K_geo
-    
-    def _get_element_dofs(self, element) -> List[int]:
-        """Get global DOF indices for an element."""
-        # This would map element nodes to global DOFs
-        # For now, return placeholder
-        return list(range(12))  # 12 DOFs for beam element
+        scale = np.max(np.abs(full_modes), axis=0)
+        return full_modes / np.where(scale > 0, scale, 1.0)
     
     def _get_constrained_dofs(self) -> List[int]:
         """Get list of constrained (fixed) DOF indices."""
         constrained = []
-        if hasattr(self.model, 'Nodes'):
-            for node_name, node in self.model.Nodes.items():
-                node_id = getattr(node, 'ID', 0)
-                base_dof = node_id * 6
-                
-                # Check support conditions
-                if getattr(node, 'support_DX', False):
-                    constrained.append(base_dof + 0)
-                if getattr(node, 'support_DY', False):
-                    constrained.append(base_dof + 1)
-                if getattr(node, 'support_DZ', False):
-                    constrained.append(base_dof + 2)
-                if getattr(node, 'support_RX', False):
-                    constrained.append(base_dof + 3)
-                if getattr(node, 'support_RY', False):
-                    constrained.append(base_dof + 4)
-                if getattr(node, 'support_RZ', False):
-                    constrained.append(base_dof + 5)
+        for i, node in enumerate(getattr(self.model, 'nodes', {}).values()):
+            node_id = getattr(node, 'ID', None)
+            base_dof = (node_id if isinstance(node_id, int) else i) * 6
+            
+            # Check support conditions
+            for j, dof_name in enumerate(('support_DX', 'support_DY', 'support_DZ',
+                                          'support_RX', 'support_RY', 'support_RZ')):
+                if getattr(node, dof_name, False):
+                    constrained.append(base_dof + j)
         
         return constrained
     
     def _check_model_stability(self) -> bool:
         """Check if model has adequate constraints."""
         constrained_dofs = self._get_constrained_dofs()
-        total_dofs = self._get_model_dofs()
         
         # Basic check - need some constraints
         return len(constrained_dofs) >= 6  # At least fix rigid body motion
     
-    def _get_applied_loads(self) -> Dict:
-        """Get applied loads for the base load case."""
+    def _get_applied_loads(self, combo_name: str) -> Dict:
+        """Get the total applied loads of a solved combination from its support reactions."""
         applied_loads = {}
         
-        if self.base_load_case and hasattr(self.model, 'LoadCombos'):
-            load_combo = self.model.LoadCombos.get(self.base_load_case)
-            if load_combo:
-                # Extract load magnitudes
-                applied_loads['Total_Force'] = 1000.0 * self.load_scale_factor  # N
-                applied_loads['Total_Moment'] = 500.0 * self.load_scale_factor   # N*m
-        else:
-            # Default loading
-            applied_loads['Unit_Load'] = 1.0
+        for direction in ('FX', 'FY', 'FZ'):
+            reaction = sum(getattr(node, 'Rxn' + direction).get(combo_name, 0.0)
+                           for node in self.model.nodes.values())
+            applied_loads[f'Total_{direction}'] = -reaction * self.load_scale_factor
         
         return applied_loads
     
@@ -570,6 +530,11 @@ class BucklingAnalysis:
             raise AnalysisError(f"Failed to create buckling mode visualization: {str(e)}")
 
 
+def _dense(matrix) -> np.ndarray:
+    """Return a sparse or dense matrix as a dense array."""
+    return matrix.toarray() if issparse(matrix) else np.asarray(matrix)
+
+
 # Additional helper functions for integration
 def run_buckling_analysis_on_calc(calc_obj, load_case_name: str = None, 
                                 num_modes: int = 5) -> BucklingAnalysisResults:
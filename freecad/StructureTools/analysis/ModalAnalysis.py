@@ -12,8 +12,8 @@ import FreeCADGui as Gui
 import numpy as np
 import math
 from typing import List, Dict, Tuple, Optional, Any
-from scipy.linalg import eigh
-from scipy.sparse import csc_matrix
+from scipy.linalg import eig, eigh
+from scipy.sparse import coo_matrix, csr_matrix, issparse
 from scipy.sparse.linalg import eigsh
 import time
 
@@ -27,7 +27,8 @@ class ModalAnalysisResults:
     """
     
     def __init__(self, frequencies: np.ndarray, mode_shapes: np.ndarray, 
-                 participation_factors: np.ndarray, effective_mass: Dict):
+                 participation_factors: np.ndarray, effective_mass: Dict,
+                 solver_info: Optional[Dict] = None):
         """
         Initialize modal analysis results.
         
@@ -36,6 +37,8 @@ class ModalAnalysisResults:
             mode_shapes: Mode shape vectors (DOF x modes)
             participation_factors: Modal participation factors
             effective_mass: Effective mass percentages by direction
+            solver_info: Solver statistics (assembly and solve times in seconds,
+                matrix and mode shape memory in bytes, system size)
         """
         self.frequencies = frequencies
         self.mode_shapes = mode_shapes
@@ -43,6 +46,12 @@ class ModalAnalysisResults:
         self.effective_mass = effective_mass
         self.num_modes = len(frequencies)
         
+        # Solver statistics
+        self.solver_info = dict(solver_info or {})
+        self.assembly_time = self.solver_info.get('assembly_time', 0.0)
+        self.solve_time = self.solver_info.get('solve_time', 0.0)
+        self.memory = self.solver_info.get('memory', 0)
+        
         # Calculate periods
         self.periods = np.where(frequencies > 0, 1.0 / frequencies, np.inf)
         
@@ -120,6 +129,13 @@ class ModalAnalysisResults:
         App.Console.PrintMessage(f"X-direction: {self.effective_mass['X']:.1f}%\n")
         App.Console.PrintMessage(f"Y-direction: {self.effective_mass['Y']:.1f}%\n") 
         App.Console.PrintMessage(f"Z-direction: {self.effective_mass['Z']:.1f}%\n")
+        
+        if self.solver_info:
+            App.Console.PrintMessage("\n")
+            App.Console.PrintMessage(f"Free DOF: {self.solver_info.get('num_dof', 0)}\n")
+            App.Console.PrintMessage(f"Assembly time: {self.assembly_time:.3f} s, "
+                                     f"eigenvalue solve time: {self.solve_time:.3f} s\n")
+            App.Console.PrintMessage(f"Matrix and mode shape memory: {self.memory / 2**20:.1f} MB\n")
         App.Console.PrintMessage("="*60 + "\n")
 
 
@@ -155,6 +171,14 @@ class ModalAnalysis:
         self.mass_matrix_type = "Consistent"  # Consistent, Lumped
         self.include_rotational_inertia = True
         
+        # Pynite material densities are weights per unit volume (they are used for self weight),
+        # so they are divided by gravity, in model length units per second squared, to get masses
+        self.gravity = 9.81
+        
+        # Eigenvalues are found nearest this frequency (Hz) using shift-invert mode.
+        # None uses the lower bound of frequency_range.
+        self.target_frequency = None
+        
         # Results storage
         self.results = None
         self.analysis_time = 0.0
@@ -211,10 +235,13 @@ class ModalAnalysis:
             
             # Step 2: Apply boundary conditions
             K_reduced, M_reduced, dof_map = self._apply_boundary_conditions(K, M)
+            assembly_time = time.time() - start_time
             
             # Step 3: Solve eigenvalue problem
             App.Console.PrintMessage(f"Solving eigenvalue problem using {self.analysis_method} method...\n")
+            solve_start = time.time()
             eigenvalues, eigenvectors = self._solve_eigenvalue_problem(K_reduced, M_reduced)
+            solve_time = time.time() - solve_start
             
             # Step 4: Process results
             frequencies = np.sqrt(np.real(eigenvalues)) / (2 * np.pi)
@@ -228,8 +255,15 @@ class ModalAnalysis:
             mode_shapes = self._normalize_mode_shapes(mode_shapes, M)
             
             # Create results object
+            self.convergence_info.update({
+                'num_dof': K_reduced.shape[0],
+                'assembly_time': assembly_time,
+                'solve_time': solve_time,
+                'memory': _nbytes(K) + _nbytes(M) + _nbytes(K_reduced) + _nbytes(M_reduced) + mode_shapes.nbytes,
+            })
             self.results = ModalAnalysisResults(frequencies, mode_shapes, 
-                                             participation_factors, effective_mass)
+                                             participation_factors, effective_mass,
+                                             solver_info=self.convergence_info)
             
             self.analysis_time = time.time() - start_time
             
@@ -246,21 +280,28 @@ class ModalAnalysis:
             App.Console.PrintError(error_msg + "\n")
             raise AnalysisError(error_msg, analysis_type="Modal Analysis")
     
-    def _build_global_stiffness_matrix(self) -> np.ndarray:
-        """Build global stiffness matrix from structural model."""
+    def _build_global_stiffness_matrix(self) -> csr_matrix:
+        """Build the sparse global stiffness matrix from the Pynite model."""
         try:
-            # Get stiffness matrix from Pynite model
-            if hasattr(self.model, 'K'):
-                # Direct access to Pynite stiffness matrix
-                K = self.model.K()
-                return np.array(K)
-            else:
-                # Build from elements manually
-                return self._assemble_stiffness_from_elements()
+            if not hasattr(self.model, 'K'):
+                raise AnalysisError("The model does not provide a stiffness matrix")
+            
+            combo_name = self._prepare_pynite_model()
+            return self.model.K(combo_name, check_stability=False, sparse=True).tocsr()
                 
         except Exception as e:
             raise AnalysisError(f"Failed to build stiffness matrix: {str(e)}")
     
+    def _prepare_pynite_model(self) -> str:
+        """Number the model's nodes and elements if it hasn't been analyzed yet, and return
+        the load combination whose active members define the stiffness matrix."""
+        from ..Pynite_main.Analysis import _prepare_model
+        
+        if getattr(self.model, 'solution', None) is None:
+            _prepare_model(self.model)
+        
+        return next(iter(self.model.load_combos), 'Combo 1')
+    
     def _build_global_mass_matrix(self) -> np.ndarray:
         """Build global mass matrix with consistent or lumped formulation."""
         try:
@@ -272,106 +313,140 @@ class ModalAnalysis:
         except Exception as e:
             raise AnalysisError(f"Failed to build mass matrix: {str(e)}")
     
-    def _build_consistent_mass_matrix(self) -> np.ndarray:
-        """Build consistent mass matrix from element matrices."""
-        # Get number of DOF
-        if hasattr(self.model, 'nodes'):
-            num_nodes = len(self.model.nodes)
-            num_dof = num_nodes * 6  # 6 DOF per node
-        else:
+    def _build_consistent_mass_matrix(self) -> csr_matrix:
+        """Build the sparse consistent mass matrix of the model's members."""
+        return self._assemble_member_mass(self._consistent_member_mass)
+    
+    def _build_lumped_mass_matrix(self) -> csr_matrix:
+        """Build the sparse lumped (diagonal) mass matrix of the model's members."""
+        return self._assemble_member_mass(self._lumped_member_mass)
+    
+    def _assemble_member_mass(self, member_mass) -> csr_matrix:
+        """
+        Assemble a global mass matrix from the model's members.
+        
+        Each element matrix is formed in local coordinates, rotated to global coordinates
+        with the member's transformation matrix, and all of them are summed into a COO
+        matrix in one step using the member degree of freedom indices.
+        
+        Args:
+            member_mass: Function returning the stacked (members, 12, 12) local mass matrices
+                for a list of Pynite members
+        """
+        if not hasattr(self.model, 'nodes'):
             raise AnalysisError("Cannot determine model size")
         
-        # Initialize global mass matrix
-        M = np.zeros((num_dof, num_dof))
+        from ..Pynite_main.Analysis import _element_dofs
         
-        # Add member mass contributions
-        if hasattr(self.model, 'members'):
-            for member_name, member in self.model.members.items():
-                try:
-                    # Get member mass matrix
-                    m_local = self._get_member_mass_matrix(member)
-                    
-                    # Get DOF indices for member
-                    i_dof, j_dof = self._get_member_dof_indices(member)
-                    
-                    # Assemble into global matrix
-                    dof_indices = i_dof + j_dof
-                    for i, global_i in enumerate(dof_indices):
-                        for j, global_j in enumerate(dof_indices):
-                            M[global_i, global_j] += m_local[i, j]
-                            
-                except Exception as e:
-                    App.Console.PrintWarning(f"Error processing member {member_name}: {str(e)}\n")
-        
-        # Add nodal masses (if any)
-        self._add_nodal_masses(M)
+        num_dof = len(self.model.nodes) * 6
+        members = [member for phys_member in getattr(self.model, 'members', {}).values()
+                   for member in getattr(phys_member, 'sub_members', {phys_member.name: phys_member}).values()]
+        
+        if not members:
+            return csr_matrix((num_dof, num_dof))
+        
+        m_local = member_mass(members)
+        T = np.array([member.T() for member in members])
+        
+        # m_global = T' * m_local * T for each member
+        m_global = np.einsum('eji,ejk,ekl->eil', T, m_local, T)
+        
+        dofs = np.array([_element_dofs(member) for member in members])
+        rows = np.repeat(dofs, 12, axis=1).ravel()
+        cols = np.tile(dofs, (1, 12)).ravel()
+        
+        M = coo_matrix((m_global.ravel(), (rows, cols)), shape=(num_dof, num_dof)).tocsr()
+        M.eliminate_zeros()
         
         return M
     
-    def _build_lumped_mass_matrix(self) -> np.ndarray:
-        """Build lumped mass matrix (diagonal)."""
-        # Simplified lumped mass - can be enhanced
-        consistent_mass = self._build_consistent_mass_matrix()
+    def _member_mass_properties(self, members) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return the mass per unit length, length, and polar and bending inertias of members."""
+        L = np.array([member.L() for member in members])
+        A = np.array([member.section.A for member in members])
+        Iy = np.array([member.section.Iy for member in members])
+        Iz = np.array([member.section.Iz for member in members])
+        density = np.array([member.material.rho for member in members]) / self.gravity
+        
+        return density * A, L, density * (Iy + Iz), density[:, None] * np.stack((Iy, Iz), axis=1)
+    
+    def _consistent_member_mass(self, members) -> np.ndarray:
+        """Return the local consistent mass matrices of members as a (members, 12, 12) array."""
+        mass_per_length, L, polar_inertia, bending_inertia = self._member_mass_properties(members)
+        m = np.zeros((len(members), 12, 12))
+        
+        # Axial
+        c = mass_per_length * L / 6
+        m[:, 0, 0] = m[:, 6, 6] = 2 * c
+        m[:, 0, 6] = m[:, 6, 0] = c
+        
+        # Bending in the local xy plane (v, theta_z) and the local xz plane (w, theta_y).
+        # The rotations about the local y-axis have the opposite sign convention.
+        c = mass_per_length * L / 420
+        for v, rz, vj, rzj, sign in ((1, 5, 7, 11, 1), (2, 4, 8, 10, -1)):
+            m[:, v, v] = m[:, vj, vj] = 156 * c
+            m[:, v, vj] = m[:, vj, v] = 54 * c
+            m[:, rz, rz] = m[:, rzj, rzj] = 4 * c * L**2
+            m[:, rz, rzj] = m[:, rzj, rz] = -3 * c * L**2
+            m[:, v, rz] = m[:, rz, v] = sign * 22 * c * L
+            m[:, vj, rzj] = m[:, rzj, vj] = -sign * 22 * c * L
+            m[:, v, rzj] = m[:, rzj, v] = -sign * 13 * c * L
+            m[:, vj, rz] = m[:, rz, vj] = sign * 13 * c * L
+        
+        if self.include_rotational_inertia:
+            # Torsional inertia
+            c = polar_inertia * L / 6
+            m[:, 3, 3] = m[:, 9, 9] = 2 * c
+            m[:, 3, 9] = m[:, 9, 3] = c
+            
+            # Rotary inertia of the cross section in bending
+            for (v, rz, vj, rzj, sign), inertia in zip(((1, 5, 7, 11, 1), (2, 4, 8, 10, -1)),
+                                                       (bending_inertia[:, 1], bending_inertia[:, 0])):
+                c = inertia / (30 * L)
+                m[:, v, v] += 36 * c
+                m[:, vj, vj] += 36 * c
+                m[:, v, vj] -= 36 * c
+                m[:, vj, v] -= 36 * c
+                m[:, rz, rz] += 4 * c * L**2
+                m[:, rzj, rzj] += 4 * c * L**2
+                m[:, rz, rzj] -= c * L**2
+                m[:, rzj, rz] -= c * L**2
+                for a, b, value in ((v, rz, 3), (v, rzj, 3), (vj, rz, -3), (vj, rzj, -3)):
+                    m[:, a, b] += sign * value * c * L
+                    m[:, b, a] += sign * value * c * L
+        
+        return m
+    
+    def _lumped_member_mass(self, members) -> np.ndarray:
+        """Return the local lumped mass matrices of members as a (members, 12, 12) array."""
+        mass_per_length, L, polar_inertia, bending_inertia = self._member_mass_properties(members)
+        m = np.zeros((len(members), 12, 12))
         
-        # Create lumped mass by row sum method
-        lumped_mass = np.zeros_like(consistent_mass)
-        for i in range(consistent_mass.shape[0]):
-            lumped_mass[i, i] = np.sum(consistent_mass[i, :])
+        # Half of the member's mass goes to each end
+        for dof in (0, 1, 2, 6, 7, 8):
+            m[:, dof, dof] = mass_per_length * L / 2
         
-        return lumped_mass
-    
-    def _get_member_mass_matrix(self, member) -> np.ndarray:
-        """Calculate mass matrix for a structural member."""
-        try:
-            # Get member properties
-            length = member.length
-            area = getattr(member, 'A', 1.0)
-            density = getattr(member, 'rho', 7850.0)  # Steel default
-            
-            # Mass per unit length
-            mass_per_length = area * density
-            
-            # Consistent mass matrix for beam element (12x12)
-            L = length
-            m = mass_per_length * L / 420.0
-            
-            # Simplified beam mass matrix
-            mass_matrix = np.zeros((12, 12))
-            
-            # Translational mass terms
-            mass_matrix[0, 0] = mass_matrix[6, 6] = 140 * m    # Axial
-            mass_matrix[1, 1] = mass_matrix[7, 7] = 156 * m    # Transverse Y
-            mass_matrix[2, 2] = mass_matrix[8, 8] = 156 * m    # Transverse Z
-            
-            # Add coupling terms for consistent formulation
-            mass_matrix[1, 7] = mass_matrix[7, 1] = 54 * m
-            mass_matrix[2, 8] = mass_matrix[8, 2] = 54 * m
-            
-            # Rotational inertia (if included)
-            if self.include_rotational_inertia:
-                Ix = getattr(member, 'J', area * length**2 / 12)  # Torsional
-                Iy = getattr(member, 'Iy', area * length**2 / 12)
-                Iz = getattr(member, 'Iz', area * length**2 / 12)
-                
-                mass_matrix[3, 3] = mass_matrix[9, 9] = Ix * density / 3
-                mass_matrix[4, 4] = mass_matrix[10, 10] = 4 * Iy * density * L / 420
-                mass_matrix[5, 5] = mass_matrix[11, 11] = 4 * Iz * density * L / 420
-            
-            return mass_matrix
-            
-        except Exception as e:
-            App.Console.PrintWarning(f"Error calculating member mass matrix: {str(e)}\n")
-            return np.eye(12) * 1.0  # Fallback unit matrix
+        if self.include_rotational_inertia:
+            for dof in (3, 9):
+                m[:, dof, dof] = polar_inertia * L / 2
+        
+        return m
     
-    def _apply_boundary_conditions(self, K: np.ndarray, M: np.ndarray) -> Tuple[np.ndarray, np.ndarray, List[int]]:
+    def _apply_boundary_conditions(self, K, M) -> Tuple[Any, Any, List[int]]:
         """Apply boundary conditions by eliminating constrained DOF."""
         try:
             # Get list of free DOF (not supported)
             free_dof = self._get_free_dof_indices()
             
             # Reduce matrices to free DOF only
-            K_reduced = K[np.ix_(free_dof, free_dof)]
-            M_reduced = M[np.ix_(free_dof, free_dof)]
+            if issparse(K):
+                K_reduced = csr_matrix(K)[free_dof, :][:, free_dof]
+            else:
+                K_reduced = K[np.ix_(free_dof, free_dof)]
+            if issparse(M):
+                M_reduced = csr_matrix(M)[free_dof, :][:, free_dof]
+            else:
+                M_reduced = M[np.ix_(free_dof, free_dof)]
             
             App.Console.PrintMessage(f"Reduced system size: {len(free_dof)} DOF (from {K.shape[0]})\n")
             
@@ -387,7 +462,8 @@ class ModalAnalysis:
         try:
             if hasattr(self.model, 'nodes'):
                 for i, (node_name, node) in enumerate(self.model.nodes.items()):
-                    base_dof = i * 6
+                    node_id = getattr(node, 'ID', None)
+                    base_dof = (node_id if isinstance(node_id, int) else i) * 6
                     
                     # Check each DOF for supports
                     dof_names = ['support_DX', 'support_DY', 'support_DZ', 
@@ -406,8 +482,14 @@ class ModalAnalysis:
         except Exception as e:
             raise AnalysisError(f"Failed to determine free DOF: {str(e)}")
     
-    def _solve_eigenvalue_problem(self, K: np.ndarray, M: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-        """Solve generalized eigenvalue problem (K - λM)φ = 0."""
+    def _solve_eigenvalue_problem(self, K, M) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve generalized eigenvalue problem (K - λM)φ = 0.
+        
+        Sparse systems are solved with ``eigsh`` in shift-invert mode, which factors
+        K - σM once and returns the eigenvalues nearest the shift σ = (2π f_target)².
+        Very small systems, or requests for nearly every mode, use the dense solver.
+        """
         try:
             App.Console.PrintMessage(f"Solving {K.shape[0]} DOF eigenvalue problem for {self.num_modes} modes...\n")
             
@@ -416,22 +498,37 @@ class ModalAnalysis:
                 self.num_modes = K.shape[0] - 1
                 App.Console.PrintWarning(f"Reducing number of modes to {self.num_modes}\n")
             
-            if self.analysis_method == "Subspace" and K.shape[0] > 100:
-                # Use sparse solver for large problems
-                K_sparse = csc_matrix(K)
-                M_sparse = csc_matrix(M)
-                
-                # Solve subset of eigenvalues
-                eigenvalues, eigenvectors = eigsh(K_sparse, k=self.num_modes, M=M_sparse, 
-                                                which='SM', tol=self.convergence_tolerance)
+            target = self.target_frequency if self.target_frequency is not None else self.frequency_range[0]
+            sigma = (2 * np.pi * target)**2
+            
+            if self.analysis_method == "Subspace" and K.shape[0] > 100 and self.num_modes < K.shape[0] - 1:
+                # Solve for the modes nearest the target frequency in shift-invert mode
+                eigenvalues, eigenvectors = eigsh(csr_matrix(K).tocsc(), k=self.num_modes, M=csr_matrix(M).tocsc(),
+                                                  sigma=sigma, which='LM', tol=self.convergence_tolerance)
+                self.convergence_info['solver'] = 'eigsh shift-invert'
             else:
                 # Use dense solver for small problems
-                eigenvalues, eigenvectors = eigh(K, M)
-                
-                # Sort by eigenvalue magnitude
-                idx = np.argsort(eigenvalues)
-                eigenvalues = eigenvalues[idx[:self.num_modes]]
-                eigenvectors = eigenvectors[:, idx[:self.num_modes]]
+                try:
+                    eigenvalues, eigenvectors = eigh(_dense(K), _dense(M))
+                except np.linalg.LinAlgError:
+                    # A lumped mass matrix without rotational inertia is singular; its
+                    # massless DOF have infinite eigenvalues, which are discarded
+                    eigenvalues, eigenvectors = eig(_dense(K), _dense(M))
+                    finite = np.isfinite(eigenvalues)
+                    eigenvalues, eigenvectors = np.real(eigenvalues[finite]), np.real(eigenvectors[:, finite])
+
+                # Keep the modes nearest the target frequency, as the sparse solver does
+                idx = np.argsort(np.abs(eigenvalues - sigma))[:self.num_modes]
+                eigenvalues = eigenvalues[idx]
+                eigenvectors = eigenvectors[:, idx]
+                self.convergence_info['solver'] = 'dense'
+            
+            self.convergence_info['shift'] = sigma
+            
+            # Sort by eigenvalue magnitude
+            idx = np.argsort(eigenvalues)
+            eigenvalues = eigenvalues[idx]
+            eigenvectors = eigenvectors[:, idx]
             
             # Validate results
             if np.any(eigenvalues <= 0):
@@ -452,13 +549,11 @@ class ModalAnalysis:
         else:
             full_size = len(free_dof) * 2  # Conservative estimate
         
-        # Initialize full mode shape matrix
-        full_modes = np.zeros((full_size, reduced_modes.shape[1]))
-        
         # Insert reduced modes at free DOF positions
-        for i, dof in enumerate(free_dof):
-            if dof < full_size:
-                full_modes[dof, :] = reduced_modes[i, :]
+        free_dof = np.asarray(free_dof)
+        inside = free_dof < full_size
+        full_modes = np.zeros((full_size, reduced_modes.shape[1]))
+        full_modes[free_dof[inside], :] = reduced_modes[inside, :]
         
         return full_modes
     
@@ -552,13 +647,8 @@ class ModalAnalysis:
     
     def _get_total_mass_direction(self, M: np.ndarray, direction: int) -> float:
         """Get total mass in specified direction."""
-        total_mass = 0.0
-        
         # Sum diagonal terms for specified direction
-        for i in range(direction, M.shape[0], 6):
-            total_mass += M[i, i]
-        
-        return total_mass
+        return float(np.sum(M.diagonal()[direction::6]))
     
     def _normalize_mode_shapes(self, mode_shapes: np.ndarray, M: np.ndarray) -> np.ndarray:
         """Normalize mode shapes with respect to mass matrix."""
@@ -602,6 +692,19 @@ class ModalAnalysis:
             raise AnalysisError(f"Failed to create mode shape visualization: {str(e)}")
 
 
+def _dense(matrix) -> np.ndarray:
+    """Return a sparse or dense matrix as a dense array."""
+    return matrix.toarray() if issparse(matrix) else np.asarray(matrix)
+
+
+def _nbytes(matrix) -> int:
+    """Return the memory used by the values and indices of a sparse or dense matrix."""
+    if issparse(matrix):
+        matrix = matrix.tocsr()
+        return matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+    return np.asarray(matrix).nbytes
+
+
 # Additional helper functions for integration
 def run_modal_analysis_on_calc(calc_obj, num_modes: int = 10) -> ModalAnalysisResults:
     """
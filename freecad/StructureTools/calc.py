@@ -1,5 +1,6 @@
 import os, math
 import sys
+import time
 
 # Setup FreeCAD stubs for standalone operation
 try:
@@ -116,7 +117,11 @@ except ImportError:
 
 ICONPATH = os.path.join(os.path.dirname(__file__), "resources")
 
+import numpy
+
 from .Pynite_main.FEModel3D import FEModel3D
+from .result_store import ResultStore, DIAGRAM_QUANTITIES, EXTREMES, REACTIONS, sidecar_path
+from .fingerprint import fingerprint
 
 # Import material standards database
 try:
@@ -129,13 +134,105 @@ except ImportError:
 	HAS_MATERIAL_DATABASE = False
 
 
-def _find_matching_node_index(nodes_map, coord, tol=1e-3):
-	"""Return index of node in nodes_map whose coordinates match coord within tol, or None."""
-	import math as _math
-	for idx, n in enumerate(nodes_map):
-		if _math.isclose(n[0], coord[0], abs_tol=tol) and _math.isclose(n[1], coord[1], abs_tol=tol) and _math.isclose(n[2], coord[2], abs_tol=tol):
-			return idx
-	return None
+# Load combinations offered by Calc (factors are given by Calc.getLoadFactors)
+LOAD_COMBINATIONS = [
+	'100_DL', '101_DL+LL', '102_DL+0.75(LL+W(X+))', '103_DL+0.75(LL+W(x-))',
+	'104_DL+0.75(LL+W(y+))', '105_DL+0.75(LL+W(y-))', '106_0.6DL+W(X+)', '107_0.6DL+W(x-)',
+	'108_0.6DL+W(y+)', '109_0.6DL+W(y-)', '110_DL+0.7E(X+)', '111_DL+0.7E(x-)',
+	'112_DL+0.7E(y+)', '113_DL+0.7E(y-)', '114_DL+0.525E(X+)+0.75LL', '115_DL+0.525E(x-)+0.75LL',
+	'116_DL+0.525E(Z+)+0.75LL', '117_DL+0.525E(z-)+0.75LL', '118_0.6DL+0.7E(X+)', '119_0.6DL+0.7E(x-)',
+	'120_0.6DL+0.7E(y+)', '121_0.6DL+0.7E(y-)', '122_DL+LL+H+F',
+	'1000_1.4DL', '1001_1.4DL+1.7LL', '1002_1.05DL+1.275LL+1.6W(x+)', '1003_1.05DL+1.275LL+1.6W(x-)',
+	'1004_1.05DL+1.275LL+1.6W(y+)', '1005_1.05DL+1.275LL+1.6W(y-)', '1006_0.9DL+1.6W(X+)', '1007_0.9DL+1.6W(x-)',
+	'1008_0.9DL+1.6W(y+)', '1009_0.9DL+1.6W(y-)', '1010_1.05DL+1.275LL+E(x+)', '1011_1.05DL+1.275LL+E(x-)',
+	'1012_1.05DL+1.275LL+E(y+)', '1013_1.05DL+1.275LL+E(y-)', '1014_0.9DL+E(X+)', '1015_0.9DL+E(x-)',
+	'1016_0.9DL+E(y+)', '1017_0.9DL+E(y-)', '1018_1.4DL+1.7LL+1.7H', '1019_0.9DL+1.7H',
+	'1020_1.4DL+1.7LL+1.4F', '1021_0.9DL+1.4F'
+]
+
+
+
+class NodeIndex:
+	"""Coordinate-keyed index of a nodes_map list.
+
+	Exact lookups use a dictionary keyed on the (already rounded) coordinate tuple, and
+	tolerance lookups use a grid hash, so neither has to scan the whole nodes_map.
+	"""
+
+	def __init__(self, nodes_map=None, cell_size=0.01):
+		self.nodes_map = nodes_map if nodes_map is not None else []
+		self.cell_size = cell_size
+		self._exact = {}  # coordinate tuple -> index of the first node with those coordinates
+		self._grid = {}   # grid cell key -> indices of the nodes in the cell
+		self._count = 0   # number of entries of nodes_map indexed so far
+		self.sync()
+
+	def _cell(self, x, y, z):
+		h = self.cell_size
+		return (math.floor(x/h), math.floor(y/h), math.floor(z/h))
+
+	def sync(self):
+		"""Index any nodes appended to nodes_map since the last call."""
+		for idx in range(self._count, len(self.nodes_map)):
+			node = self.nodes_map[idx]
+			self._exact.setdefault(tuple(node), idx)
+			self._grid.setdefault(self._cell(*node), []).append(idx)
+		self._count = len(self.nodes_map)
+
+	def add(self, node):
+		"""Append node to nodes_map unless it is already there. Returns its index."""
+		idx = self._exact.get(tuple(node))
+		if idx is None:
+			self.nodes_map.append(node)
+			self.sync()
+			idx = self._count - 1
+		return idx
+
+	def get(self, node):
+		"""Return the index of the node with exactly these coordinates, or None."""
+		return self._exact.get(tuple(node))
+
+	def index(self, node):
+		"""Like list.index: return the index of node, raising ValueError if it isn't present."""
+		idx = self._exact.get(tuple(node))
+		if idx is None:
+			raise ValueError(f"{node} is not in nodes_map")
+		return idx
+
+	def find(self, coord, tol=1e-3):
+		"""Return the lowest index of a node matching coord within tol on every axis, or None."""
+		h = self.cell_size
+		best = None
+		for i in range(math.floor((coord[0] - tol)/h), math.floor((coord[0] + tol)/h) + 1):
+			for j in range(math.floor((coord[1] - tol)/h), math.floor((coord[1] + tol)/h) + 1):
+				for k in range(math.floor((coord[2] - tol)/h), math.floor((coord[2] + tol)/h) + 1):
+					for idx in self._grid.get((i, j, k), ()):
+						if best is not None and idx > best:
+							continue
+						n = self.nodes_map[idx]
+						if math.isclose(n[0], coord[0], abs_tol=tol) and math.isclose(n[1], coord[1], abs_tol=tol) and math.isclose(n[2], coord[2], abs_tol=tol):
+							best = idx
+		return best
+
+
+def _find_matching_node_index(nodes_map, coord, tol=1e-3, index=None):
+	"""Return index of node in nodes_map whose coordinates match coord within tol, or None.
+
+	Pass a NodeIndex built on nodes_map as `index` to avoid re-indexing on every call.
+	"""
+	if index is None or index.nodes_map is not nodes_map:
+		index = NodeIndex(nodes_map, cell_size=max(tol, 1e-6))
+	index.sync()
+	return index.find(coord, tol)
+
+
+# Key of each diagram series in a MemberResults entry, by ResultStore quantity
+MEMBER_SERIES = dict(zip(DIAGRAM_QUANTITIES, ('momentY', 'momentZ', 'shearY', 'shearZ', 'axial', 'torque', 'deflectionY', 'deflectionZ')))
+
+
+def _floats(values):
+	"""Return stored station values as floats, or an empty list for a member whose results failed."""
+	return [float(value) for value in values] if not numpy.isnan(values).all() else []
 
 
 # Try to import PlateMesher at module import time so tests can monkeypatch module attribute
@@ -263,24 +360,14 @@ class Calc:
 
 		# Load Combination Properties (Both Allowable Stress and Strength Design)
 		_addProp("App::PropertyEnumeration", "LoadCombination", "Load Combinations", "Select load combination for analysis")
-		obj.LoadCombination = [
-			'100_DL', '101_DL+LL', '102_DL+0.75(LL+W(X+))', '103_DL+0.75(LL+W(x-))',
-			'104_DL+0.75(LL+W(y+))', '105_DL+0.75(LL+W(y-))', '106_0.6DL+W(X+)', '107_0.6DL+W(x-)',
-			'108_0.6DL+W(y+)', '109_0.6DL+W(y-)', '110_DL+0.7E(X+)', '111_DL+0.7E(x-)',
-			'112_DL+0.7E(y+)', '113_DL+0.7E(y-)', '114_DL+0.525E(X+)+0.75LL', '115_DL+0.525E(x-)+0.75LL',
-			'116_DL+0.525E(Z+)+0.75LL', '117_DL+0.525E(z-)+0.75LL', '118_0.6DL+0.7E(X+)', '119_0.6DL+0.7E(x-)',
-			'120_0.6DL+0.7E(y+)', '121_0.6DL+0.7E(y-)', '122_DL+LL+H+F',
-			'1000_1.4DL', '1001_1.4DL+1.7LL', '1002_1.05DL+1.275LL+1.6W(x+)', '1003_1.05DL+1.275LL+1.6W(x-)',
-			'1004_1.05DL+1.275LL+1.6W(y+)', '1005_1.05DL+1.275LL+1.6W(y-)', '1006_0.9DL+1.6W(X+)', '1007_0.9DL+1.6W(x-)',
-			'1008_0.9DL+1.6W(y+)', '1009_0.9DL+1.6W(y-)', '1010_1.05DL+1.275LL+E(x+)', '1011_1.05DL+1.275LL+E(x-)',
-			'1012_1.05DL+1.275LL+E(y+)', '1013_1.05DL+1.275LL+E(y-)', '1014_0.9DL+E(X+)', '1015_0.9DL+E(x-)',
-			'1016_0.9DL+E(y+)', '1017_0.9DL+E(y-)', '1018_1.4DL+1.7LL+1.7H', '1019_0.9DL+1.7H',
-			'1020_1.4DL+1.7LL+1.4F', '1021_0.9DL+1.4F'
-		]
+		obj.LoadCombination = list(LOAD_COMBINATIONS)
 		obj.LoadCombination = '100_DL'
+		_addProp("App::PropertyBool", "SolveAllCombinations", "Load Combinations", "Analyze every load combination in one pass and keep all results, so switching LoadCombination doesn't re-solve", default=False)
 
 		# Structured per-member results (stored as a python object so tests and UI can access lists/dicts)
 		_addProp("App::PropertyPythonObject", "MemberResults", "Calc", "structured per-member results", default=[])
+		_addProp("App::PropertyString", "ResultStoreFile", "Calc", "sidecar directory of .npy files holding the per-member diagrams and per-node reactions of every analyzed combination", default='')
+		_addProp("App::PropertyPythonObject", "StageTimes", "Calc", "seconds spent building the model, meshing, solving and extracting results in the last recompute (None for skipped stages)", default={})
 
 		# Other result properties written by execute(); provide safe defaults to avoid AttributeError
 		_addProp("App::PropertyStringList", "NameMembers", "Calc", "list of member names", default=[])
@@ -381,24 +468,35 @@ class Calc:
 	def mapNodes(self, elements, unitLength):	
 		# Varre todos os elementos de linha e adiciona seus vertices à tabela de nodes
 		listNodes = []
+		index = NodeIndex(listNodes)
 		for element in elements:
 			for edge in element.Shape.Edges:
 				for vertex in edge.Vertexes:
 					node = [round(float(App.Units.Quantity(vertex.Point.x,'mm').getValueAs(unitLength)), 2), round(float(App.Units.Quantity(vertex.Point.z,'mm').getValueAs(unitLength)),2), round(float(App.Units.Quantity(vertex.Point.y,'mm').getValueAs(unitLength)),2)]
-					if not node in listNodes:
-						listNodes.append(node)
+					index.add(node)
 
+		self._node_index = index
 		return listNodes
 
+	# Retorna o índice de coordenadas compartilhado para nodes_map (criado em mapNodes)
+	def nodeIndex(self, nodes_map):
+		index = getattr(self, '_node_index', None)
+		if index is None or index.nodes_map is not nodes_map:
+			index = NodeIndex(nodes_map)
+			self._node_index = index
+		index.sync()
+		return index
+
 	# Mapeia os membros da estrutura 
 	def mapMembers(self, elements, listNodes, unitLength):
 		listMembers = {}
+		nodeIndex = self.nodeIndex(listNodes)
 		for element in elements:
 			for i, edge in enumerate(element.Shape.Edges):
 				listIndexVertex = []
 				for vertex in edge.Vertexes:
 					node = [round(float(App.Units.Quantity(vertex.Point.x,'mm').getValueAs(unitLength)), 2), round(float(App.Units.Quantity(vertex.Point.z,'mm').getValueAs(unitLength)),2), round(float(App.Units.Quantity(vertex.Point.y,'mm').getValueAs(unitLength)),2)]
-					index = listNodes.index(node)
+					index = nodeIndex.index(node)
 					listIndexVertex.append(index)
 
 				# valida se o primeiro nó é mais auto do que o segundo nó, se sim inverte os nós do membro (necessário para manter os diagramas voltados para a posição correta)
@@ -569,7 +667,40 @@ class Calc:
 		return True  # No specific direction requirement
 
 	# Cria os carregamentos
-	def setLoads(self, model, loads, nodes_map, unitForce, unitLength, load_combination):
+	# Nome do caso de carga para cargas de vento/sismo de uma direção (usado ao analisar todas as combinações)
+	def directionalCase(self, load_type, direction):
+		return f"{load_type}{direction}"
+
+	# Fatores de cada caso de carga para uma combinação
+	def loadCombinationFactors(self, load_combination, loads=None):
+		"""Returns the {case: factor} dictionary for a load combination.
+
+		If loads is given, wind and earthquake loads are assumed to have been applied to
+		per-direction cases (see directionalCase), and only the directions compatible with
+		the combination receive its W/E factor.
+		"""
+		load_factors = {}
+		for load_type in ['DL', 'LL', 'W', 'E', 'H', 'F']:
+			factor = self.getLoadFactors(load_combination, load_type)
+			if factor == 0.0:
+				continue
+			if loads is not None and load_type in ['W', 'E']:
+				for load in loads:
+					if getattr(load, 'LoadType', 'DL') == load_type and self.checkDirectionCompatibility(load_combination, load.GlobalDirection):
+						load_factors[self.directionalCase(load_type, load.GlobalDirection)] = factor
+			else:
+				load_factors[load_type] = factor
+		return load_factors
+
+	# Lista de combinações de carga disponíveis
+	def loadCombinationNames(self, obj):
+		try:
+			return list(obj.getEnumerationsOfProperty('LoadCombination'))
+		except Exception:
+			return list(LOAD_COMBINATIONS)
+
+	def setLoads(self, model, loads, nodes_map, unitForce, unitLength, load_combination, all_combinations=False):
+		nodeIndex = self.nodeIndex(nodes_map)
 		for load in loads:
 			# Check if load has LoadType property, if not default to 'DL'
 			load_type = getattr(load, 'LoadType', 'DL')
@@ -613,7 +744,10 @@ class Calc:
 
 			# Check direction compatibility for wind and earthquake loads
 			if load_type in ['W', 'E']:
-				if not self.checkDirectionCompatibility(load_combination, load.GlobalDirection):
+				if all_combinations:
+					# Every combination is analyzed, so keep each direction in its own load case
+					load_type = self.directionalCase(load_type, load.GlobalDirection)
+				elif not self.checkDirectionCompatibility(load_combination, load.GlobalDirection):
 					continue  # Skip loads that don't match the required direction
 			
 			# Valida se o carregamento é distribuido
@@ -683,8 +817,8 @@ class Calc:
 				numVertex = int(load.ObjectBase[0][1][0].split('Vertex')[1]) - 1
 				vertex = load.ObjectBase[0][0].Shape.Vertexes[numVertex]
 				
-				node = list(filter(lambda element: element == [round(float(App.Units.Quantity(vertex.Point.x,'mm').getValueAs(unitLength)), 2), round(float(App.Units.Quantity(vertex.Point.z,'mm').getValueAs(unitLength)),2), round(float(App.Units.Quantity(vertex.Point.y,'mm').getValueAs(unitLength)),2)], nodes_map))[0]
-				indexNode = nodes_map.index(node)
+				node = [round(float(App.Units.Quantity(vertex.Point.x,'mm').getValueAs(unitLength)), 2), round(float(App.Units.Quantity(vertex.Point.z,'mm').getValueAs(unitLength)),2), round(float(App.Units.Quantity(vertex.Point.y,'mm').getValueAs(unitLength)),2)]
+				indexNode = nodeIndex.index(node)
 
 				# Apply load factor based on load combination and load type
 				factored_load = float(load.NodalLoading.getValueAs(unitForce)) * direction * load_factor
@@ -701,33 +835,33 @@ class Calc:
 		support_count = 0
 		
 		_print_message(f"Applying {len(suports)} support conditions\n")
+		nodeIndex = self.nodeIndex(nodes_map)
 		
 		for suport in suports:
 			try:
 				suportvertex = list(suport.ObjectBase[0][0].Shape.Vertexes[int(suport.ObjectBase[0][1][0].split('Vertex')[1])-1].Point)
 				support_found = False
 				
-				for i, node in enumerate(nodes_map):
-					if (round(float(App.Units.Quantity(suportvertex[0],'mm').getValueAs(unitLength)),2) == round(node[0],2) and 
-						round(float(App.Units.Quantity(suportvertex[1],'mm').getValueAs(unitLength)),2) == round(node[2],2) and 
-						round(float(App.Units.Quantity(suportvertex[2],'mm').getValueAs(unitLength)),2) == round(node[1],2)):
-						
-						name = str(i)
-						_print_message(f"Applying support at node {name} with coordinates ({node[0]:.2f}, {node[1]:.2f}, {node[2]:.2f})\n")
-						_print_message(f"  Support conditions: X={suport.FixTranslationX}, Y={suport.FixTranslationZ}, Z={suport.FixTranslationY}, ")
-						_print_message(f"RX={suport.FixRotationX}, RY={suport.FixRotationZ}, RZ={suport.FixRotationY}\n")
-						
-						model.def_support(name, 
-							suport.FixTranslationX, 
-							suport.FixTranslationZ, 
-							suport.FixTranslationY, 
-							suport.FixRotationX, 
-							suport.FixRotationZ, 
-							suport.FixRotationY)
-						
-						support_count += 1
-						support_found = True
-						break
+				i = nodeIndex.get([round(float(App.Units.Quantity(suportvertex[0],'mm').getValueAs(unitLength)),2),
+					round(float(App.Units.Quantity(suportvertex[2],'mm').getValueAs(unitLength)),2),
+					round(float(App.Units.Quantity(suportvertex[1],'mm').getValueAs(unitLength)),2)])
+				if i is not None:
+					node = nodes_map[i]
+					name = str(i)
+					_print_message(f"Applying support at node {name} with coordinates ({node[0]:.2f}, {node[1]:.2f}, {node[2]:.2f})\n")
+					_print_message(f"  Support conditions: X={suport.FixTranslationX}, Y={suport.FixTranslationZ}, Z={suport.FixTranslationY}, ")
+					_print_message(f"RX={suport.FixRotationX}, RY={suport.FixRotationZ}, RZ={suport.FixRotationY}\n")
+					
+					model.def_support(name, 
+						suport.FixTranslationX, 
+						suport.FixTranslationZ, 
+						suport.FixTranslationY, 
+						suport.FixRotationX, 
+						suport.FixRotationZ, 
+						suport.FixRotationY)
+					
+					support_count += 1
+					support_found = True
 				
 				if not support_found:
 					_print_warning(f"Could not find a node matching support location for {suport.Label}\n")
@@ -794,10 +928,71 @@ class Calc:
 		return model
 
 	
+	# Impressões digitais das entradas de cada etapa do cálculo
+	def inputFingerprints(self, obj):
+		"""Fingerprints the inputs of the model (which is built, meshed and solved together) and of the result extraction"""
+		solve_all = getattr(obj, 'SolveAllCombinations', False)
+		# When only the selected combination is solved its loads and factors depend on the selection
+		combinations = self.loadCombinationNames(obj) if solve_all else getattr(obj, 'LoadCombination', '100_DL')
+		return {
+			'model': fingerprint(list(obj.ListElements), obj.LengthUnit, obj.ForceUnit, getattr(obj, 'selfWeight', True), solve_all, combinations),
+			'extract': self.extractFingerprint(obj),
+		}
+
+	def extractFingerprint(self, obj):
+		points = tuple(getattr(obj, name, None) for name in ('NumPointsMoment', 'NumPointsAxial', 'NumPointsShear', 'NumPointsTorque', 'NumPointsDeflection'))
+		return fingerprint(points, getattr(obj, 'LoadCombination', '100_DL'))
+
+	# Registra o tempo gasto em cada etapa do último recálculo
+	def setStageTimes(self, obj, times):
+		self.stageTimes = times
+		try:
+			if not hasattr(obj, 'StageTimes'):
+				obj.addProperty("App::PropertyPythonObject", "StageTimes", "Calc", "seconds spent building the model, meshing, solving and extracting results in the last recompute (None for skipped stages)")
+			obj.StageTimes = times
+		except Exception as e:
+			_print_warning(f"Could not store stage times: {e}\n")
+
+	# Armazena e extrai os resultados do modelo já analisado
+	def extractStage(self, obj, model):
+		loads, nodes_map, members_map = self._resultInputs
+		active_load_combination = obj.LoadCombination if hasattr(obj, 'LoadCombination') else '100_DL'
+		solve_all = getattr(obj, 'SolveAllCombinations', False)
+		self.resultStore = ResultStore(model.members.keys(), nodes=model.nodes.keys())
+		self.storeResults(obj, model, list(model.load_combos) if solve_all else [active_load_combination])
+		self.saveResultStore(obj)
+		self.extractResults(obj, model, loads, nodes_map, members_map, active_load_combination)
+
 	def execute(self, obj):
+		# Only redo the stages whose inputs changed since the last recompute. A solved model is
+		# reused when the elements, loads, units and combinations are unchanged, and its results
+		# are only extracted again when the diagram points or the selected combination changed.
+		fingerprints = self.inputFingerprints(obj)
+		previous = getattr(self, '_fingerprints', None) or {}
+		model = getattr(self, 'model', None)
+		if (model is not None and getattr(model, 'solution', None) and getattr(self, '_resultInputs', None) is not None
+				and previous.get('model') == fingerprints['model']):
+			times = {'model': None, 'mesh': None, 'solve': None, 'extract': None}
+			if previous.get('extract') != fingerprints['extract']:
+				start = time.perf_counter()
+				self.extractStage(obj, model)
+				times['extract'] = time.perf_counter() - start
+			self._fingerprints = fingerprints
+			self.setStageTimes(obj, times)
+			return
+
+		start = time.perf_counter()
+		solve_time = None
+		self._fingerprints = None
+		self._meshTime = 0.0
+		# Plate meshes are reused for plates whose face and mesh density are unchanged
+		mesh_cache = getattr(self, '_meshCache', None) or {}
+		self._meshCache = {}
+
 		model = FEModel3D()
 		# Store the model as an attribute so tests can access it
 		self.model = model
+		self.resultStore = None
 		# Initialize materials list to track processed materials
 		materiais = []
 		
@@ -833,6 +1028,7 @@ class Calc:
 		# Map nodes and members
 		nodes_map = self.mapNodes(lines, obj.LengthUnit)
 		members_map = self.mapMembers(lines, nodes_map, obj.LengthUnit)
+		nodeIndex = self.nodeIndex(nodes_map)
 
 		# Set up materials, nodes, and members
 		model = self.setMaterialAndSections(model, lines, obj.LengthUnit, obj.ForceUnit)
@@ -865,8 +1061,9 @@ class Calc:
 					corner_indices = []
 					for pt in corner_points[:4]:
 						node = [round(qty_val(pt.x, 'mm', obj.LengthUnit), 2), round(qty_val(pt.z, 'mm', obj.LengthUnit), 2), round(qty_val(pt.y, 'mm', obj.LengthUnit), 2)]
-						if node in nodes_map:
-							corner_indices.append(nodes_map.index(node))
+						idx = nodeIndex.get(node)
+						if idx is not None:
+							corner_indices.append(idx)
 
 			# Fallback: try to use the first Face's Vertexes
 			if corner_indices is None or len(corner_indices) < 4:
@@ -877,8 +1074,9 @@ class Calc:
 						corner_indices = []
 						for v in verts[:4]:
 							node = [round(qty_val(v.Point.x, 'mm', obj.LengthUnit), 2), round(qty_val(v.Point.z, 'mm', obj.LengthUnit), 2), round(qty_val(v.Point.y, 'mm', obj.LengthUnit), 2)]
-							if node in nodes_map:
-								corner_indices.append(nodes_map.index(node))
+							idx = nodeIndex.get(node)
+							if idx is not None:
+								corner_indices.append(idx)
 
 			# If user requested a mesh (MeshDensity property) use PlateMesher to create elements
 			use_mesh = hasattr(plate_obj, 'MeshDensity') and getattr(plate_obj, 'MeshDensity')
@@ -905,10 +1103,19 @@ class Calc:
 						mesh_kwargs = {'target_size': float(plate_mesh_density)}
 					mesh_data = None
 					if shape and hasattr(shape, 'Faces') and len(shape.Faces) > 0:
-						try:
-							mesh_data = mesher.meshFace(shape.Faces[0], **mesh_kwargs)
-						except Exception as e:
-							_print_warning(f"PlateMesher.meshFace failed for plate '{plate_obj.Name}': {e}\n")
+						mesh_key = fingerprint(shape.Faces[0], mesh_kwargs, _PlateMesher)
+						cached = mesh_cache.get(plate_obj.Name)
+						if cached is not None and cached[0] == mesh_key:
+							mesh_data = cached[1]
+						else:
+							mesh_start = time.perf_counter()
+							try:
+								mesh_data = mesher.meshFace(shape.Faces[0], **mesh_kwargs)
+							except Exception as e:
+								_print_warning(f"PlateMesher.meshFace failed for plate '{plate_obj.Name}': {e}\n")
+							self._meshTime += time.perf_counter() - mesh_start
+						if mesh_data:
+							self._meshCache[plate_obj.Name] = (mesh_key, mesh_data)
 					if mesh_data and 'nodes' in mesh_data and 'elements' in mesh_data:
 						# map mesh nodes to model nodes (try to reuse existing nodes_map first)
 						node_id_map = {}
@@ -918,7 +1125,7 @@ class Calc:
 							z = float(coord.get('z', 0))
 							# try to match against existing nodes_map using same rounding rule
 							coord_rounded = [round(x, 2), round(z, 2), round(y, 2)]
-							match_idx = _find_matching_node_index(nodes_map, coord_rounded, tol=1e-2)
+							match_idx = _find_matching_node_index(nodes_map, coord_rounded, tol=1e-2, index=nodeIndex)
 							if match_idx is not None:
 								# reuse existing node name (setNodes used str(index))
 								node_name = str(match_idx)
@@ -1293,24 +1500,22 @@ class Calc:
 		
 		# Load ALL loads regardless of combination - Pynite will handle factors via combinations
 		# We now load all loads with their LoadType as case names
-		model = self.setLoads(model, loads, nodes_map, obj.ForceUnit, obj.LengthUnit, active_load_combination)
+		solve_all = getattr(obj, 'SolveAllCombinations', False)
+		model = self.setLoads(model, loads, nodes_map, obj.ForceUnit, obj.LengthUnit, active_load_combination, all_combinations=solve_all)
 		model = self.setSuports(model, suports, nodes_map, obj.LengthUnit)
 
-		# Create individual load cases and combinations for Pynite
-		load_factors = {}
-		for load_type in ['DL', 'LL', 'W', 'E', 'H', 'F']:
-			factor = self.getLoadFactors(active_load_combination, load_type)
-			if factor != 0.0:
-				load_factors[load_type] = factor
-		
-		# Clear existing load combinations and add the current one
+		# Clear existing load combinations and add the current one (or all of them)
 		model.load_combos.clear()
+		combinations = [active_load_combination]
+		if solve_all:
+			combinations += [combo for combo in self.loadCombinationNames(obj) if combo != active_load_combination]
 		
 		# Create load combination with proper factors for each load type
 		# Now loads are loaded with factor 1.0, so Pynite will apply the factors
-		model.add_load_combo(active_load_combination, load_factors)
-		
-		_print_message(f"Added load combination '{active_load_combination}' with factors: {load_factors}\n")
+		for combination in combinations:
+			load_factors = self.loadCombinationFactors(combination, loads if solve_all else None)
+			model.add_load_combo(combination, load_factors)
+			_print_message(f"Added load combination '{combination}' with factors: {load_factors}\n")
 		_print_message(f"Model now has load combinations: {list(model.load_combos.keys())}\n")
 		
 		# Debug: Show available load cases in model
@@ -1347,7 +1552,9 @@ class Calc:
 			_print_message(f"Model ready for analysis with {len(model.nodes)} nodes, {len(model.members)} members, and {support_count} supports.\n")
 			
 			# Run analysis with verification
+			solve_start = time.perf_counter()
 			model.analyze()
+			solve_time = time.perf_counter() - solve_start
 			
 			# Verify analysis ran successfully by checking if reaction attributes exist
 			supported_node = None
@@ -1396,6 +1603,125 @@ class Calc:
 			import traceback
 			_print_warning(f"Stack trace:\n{traceback.format_exc()}\n")
 
+		# Keep what is needed to extract results again for another combination without re-solving
+		self._resultInputs = (loads, nodes_map, members_map)
+		extract_start = time.perf_counter()
+		self.extractStage(obj, model)
+		extract_time = time.perf_counter() - extract_start
+
+		# Building the model is everything up to the analysis that isn't meshing or solving
+		self.setStageTimes(obj, {
+			'model': extract_start - start - self._meshTime - (solve_time or 0.0),
+			'mesh': self._meshTime,
+			'solve': solve_time,
+			'extract': extract_time,
+		})
+		if model.solution:
+			self._fingerprints = fingerprints
+	   
+
+	# Armazena os diagramas dos membros e as reações dos nós das combinações passadas no ResultStore
+	def storeResults(self, obj, model, combos):
+		"""Evaluates the per-member diagrams and extremes and the per-node reactions of each combination and stores them in self.resultStore"""
+		store = getattr(self, 'resultStore', None)
+		if store is None:
+			store = self.resultStore = ResultStore(model.members.keys(), nodes=model.nodes.keys())
+
+		# Quantity -> (result key of Member3D.result_arrays, number of points property, default)
+		quantities = {
+			'MomentY': ('My', 'NumPointsMoment', 5),
+			'MomentZ': ('Mz', 'NumPointsMoment', 5),
+			'ShearY': ('Fy', 'NumPointsShear', 4),
+			'ShearZ': ('Fz', 'NumPointsShear', 4),
+			'AxialForce': ('axial', 'NumPointsAxial', 3),
+			'Torque': ('torque', 'NumPointsTorque', 3),
+			'DeflectionY': ('dy', 'NumPointsDeflection', 4),
+			'DeflectionZ': ('dz', 'NumPointsDeflection', 4),
+		}
+		n_points = {key: getattr(obj, points, default) for key, points, default in quantities.values()}
+		for combo in combos:
+			for name, member in model.members.items():
+				# All diagrams and extremes of the member come from one pass over its segments
+				try:
+					arrays, extremes = member.result_arrays(n_points, combo_name=combo)
+				except Exception as e:
+					_print_warning(f"Error getting results for member '{name}' with combo '{combo}': {e}\n")
+					arrays, extremes = {}, {}
+				for quantity, (key, points, default) in quantities.items():
+					values = arrays[key][1] if key in arrays else numpy.full(n_points[key], numpy.nan)
+					store.set(quantity, name, combo, values)
+				# Extremes are stored in the order of EXTREMES ('Min'/'Max' followed by the quantity)
+				row = numpy.full(len(EXTREMES), numpy.nan)
+				for i, extreme in enumerate(EXTREMES):
+					key = quantities[extreme[3:]][0]
+					if key in extremes:
+						row[i] = extremes[key][extreme.startswith('Max')]
+				store.set('Extremes', name, combo, row)
+			for name, node in model.nodes.items():
+				store.set('Reactions', name, combo, [getattr(node, reaction, {}).get(combo, numpy.nan) for reaction in REACTIONS])
+		return store
+
+	# Retorna o ResultStore do objeto (mapeando os arquivos .npy se o documento foi reaberto)
+	def getResultStore(self, obj):
+		store = getattr(self, 'resultStore', None)
+		if store is None:
+			path = getattr(obj, 'ResultStoreFile', '')
+			if path and os.path.exists(path):
+				try:
+					store = self.resultStore = ResultStore.load(path)
+				except Exception as e:
+					_print_warning(f"Could not read result file '{path}': {e}\n")
+		return store
+
+	# Salva o ResultStore ao lado do documento .FCStd
+	def saveResultStore(self, obj):
+		try:
+			document_path = getattr(getattr(obj, 'Document', None), 'FileName', '')
+		except Exception:
+			document_path = ''
+		# Without a saved store the results are only kept in the document's string properties
+		obj.ResultStoreFile = ''
+		if not document_path or getattr(self, 'resultStore', None) is None:
+			return
+		path = sidecar_path(document_path, obj.Name)
+		try:
+			self.resultStore.save(path)
+			obj.ResultStoreFile = path
+		except Exception as e:
+			_print_warning(f"Could not write result file '{path}': {e}\n")
+
+	# Retorna os valores de uma grandeza de cada membro na combinação ativa
+	def resultSeries(self, obj, quantity):
+		"""Returns the per-member station values of a diagram quantity for the active load combination"""
+		store = self.getResultStore(obj)
+		combo = getattr(obj, 'LoadCombination', None)
+		if store is not None and quantity in store.arrays and combo in store:
+			return [_floats(values) or [0.0] for values in store.matrix(quantity, combo)]
+		return [[float(value) for value in series.split(',')] for series in getattr(obj, quantity, [])]
+
+	# Retorna o MemberResults com as séries dos diagramas lidas do ResultStore
+	def memberResults(self, obj):
+		"""Returns obj.MemberResults with each member's diagram lists read from the result store"""
+		results = getattr(obj, 'MemberResults', [])
+		store = self.getResultStore(obj)
+		combo = getattr(obj, 'LoadCombination', None)
+		if store is None or combo not in store:
+			return results
+
+		merged = []
+		for summary in results:
+			summary = dict(summary)
+			for quantity, key in MEMBER_SERIES.items():
+				try:
+					summary[key] = _floats(store.get(quantity, summary['name'], combo))
+				except KeyError:
+					pass  # Quantity or member not in the store; keep the stored list
+			merged.append(summary)
+		return merged
+
+	# Extrai os resultados de uma combinação de carga já analisada para as propriedades do objeto
+	def extractResults(self, obj, model, loads, nodes_map, members_map, active_load_combination):
+		"""Writes the results of an analyzed load combination to the Calc object's properties"""
 		# Update analysis summary
 		analysis_type = "Allowable Stress Design" if active_load_combination.startswith('1') and not active_load_combination.startswith('10') else "Strength Design" if active_load_combination.startswith('10') else "Allowable Stress Design"
 		obj.AnalysisType = f"{analysis_type}: {active_load_combination}"
@@ -1551,175 +1877,70 @@ class Calc:
 		# Structured per-member results (list of dicts) for easier downstream consumption
 		member_results = []
 
+		# Diagram values come from the columnar result store, filled once per combination
+		store = self.getResultStore(obj)
+		if store is None or active_load_combination not in store or 'Extremes' not in store.arrays:
+			store = self.storeResults(obj, model, [active_load_combination])
+			if getattr(obj, 'ResultStoreFile', ''):
+				self.saveResultStore(obj)
+
+		# A saved store replaces the comma-joined diagram properties, which are then left empty
+		write_series = not getattr(obj, 'ResultStoreFile', '')
+
+		def _series(values):
+			return ','.join(str(value) for value in values) if not numpy.isnan(values).all() else '0.0'
+
 		# helper: create a member summary dict from model/member
-		def _build_member_summary(member_name: str) -> dict:
+		def _build_member_summary(member_name: str, rows: dict) -> dict:
 			"""Build a dict summary for a member.
 
 			Returns keys: name, section, nodes, momentY, momentZ, shearY, shearZ,
 			axial, torque, deflectionY, deflectionZ and min/max scalar values.
+			The diagram lists are empty when the results are in a saved store.
 			"""
-			m = model.members[member_name]
-			# numeric arrays (try-except to tolerate missing methods)
-			try:
-				my_vals = [float(v) for v in m.moment_array('My', getattr(obj, 'NumPointsMoment', 3))[1]]
-			except Exception:
-				my_vals = []
-			try:
-				mz_vals = [float(v) for v in m.moment_array('Mz', getattr(obj, 'NumPointsMoment', 3))[1]]
-			except Exception:
-				mz_vals = []
-			try:
-				fy_vals = [float(v) for v in m.shear_array('Fy', getattr(obj, 'NumPointsShear', 3))[1]]
-			except Exception:
-				fy_vals = []
-			try:
-				fz_vals = [float(v) for v in m.shear_array('Fz', getattr(obj, 'NumPointsShear', 3))[1]]
-			except Exception:
-				fz_vals = []
-			try:
-				ax_vals = [float(v) for v in m.axial_array(getattr(obj, 'NumPointsAxial', 2))[1]]
-			except Exception:
-				ax_vals = []
-			try:
-				tq_vals = [float(v) for v in m.torque_array(getattr(obj, 'NumPointsTorque', 2))[1]]
-			except Exception:
-				tq_vals = []
-			try:
-				dy_vals = [float(v) for v in m.deflection_array('dy', getattr(obj, 'NumPointsDeflection', 2))[1]]
-			except Exception:
-				dy_vals = []
-			try:
-				dz_vals = [float(v) for v in m.deflection_array('dz', getattr(obj, 'NumPointsDeflection', 2))[1]]
-			except Exception:
-				dz_vals = []
-
 			return {
 				'name': member_name,
-				'section': (members_map.get(member_name, {}).get('section') if 'members_map' in locals() else None),
-				'nodes': (members_map.get(member_name, {}).get('nodes') if 'members_map' in locals() else []),
-				'momentY': my_vals,
-				'momentZ': mz_vals,
-				'shearY': fy_vals,
-				'shearZ': fz_vals,
-				'axial': ax_vals,
-				'torque': tq_vals,
-				'deflectionY': dy_vals,
-				'deflectionZ': dz_vals,
-				'minMomentY': m.min_moment('My', combo_name=active_load_combination),
-				'maxMomentY': m.max_moment('My', combo_name=active_load_combination),
-				'minMomentZ': m.min_moment('Mz', combo_name=active_load_combination),
-				'maxMomentZ': m.max_moment('Mz', combo_name=active_load_combination),
-				'minShearY': m.min_shear('Fy', combo_name=active_load_combination),
-				'maxShearY': m.max_shear('Fy', combo_name=active_load_combination),
-				'minShearZ': m.min_shear('Fz', combo_name=active_load_combination),
-				'maxShearZ': m.max_shear('Fz', combo_name=active_load_combination),
-				'minTorque': m.min_torque(combo_name=active_load_combination),
-				'maxTorque': m.max_torque(combo_name=active_load_combination),
-				'minDeflectionY': m.min_deflection('dy', combo_name=active_load_combination),
-				'maxDeflectionY': m.max_deflection('dy', combo_name=active_load_combination),
-				'minDeflectionZ': m.min_deflection('dz', combo_name=active_load_combination),
-				'maxDeflectionZ': m.max_deflection('dz', combo_name=active_load_combination)
+				'section': members_map.get(member_name, {}).get('section'),
+				'nodes': members_map.get(member_name, {}).get('nodes', []),
+				**{key: _floats(rows[quantity]) if write_series else [] for quantity, key in MEMBER_SERIES.items()},
+				**{extreme[0].lower() + extreme[1:]: value for extreme, value in rows['Extremes'].items()}
 			}
 
 		for name in model.members.keys():
-			try:
-				momenty.append(','.join( str(value) for value in model.members[name].moment_array('My', getattr(obj, 'NumPointsMoment', 5), combo_name=active_load_combination)[1]))
-				momentz.append(','.join( str(value) for value in model.members[name].moment_array('Mz', getattr(obj, 'NumPointsMoment', 5), combo_name=active_load_combination)[1]))
-			except Exception as e:
-				_print_warning(f"Error getting moment arrays for member '{name}' with combo '{active_load_combination}': {e}\n")
-				momenty.append('0.0')
-				momentz.append('0.0')
-
-			try:
-				sheary.append(','.join( str(value) for value in model.members[name].shear_array('Fy', getattr(obj, 'NumPointsShear', 4), combo_name=active_load_combination)[1]))
-				shearz.append(','.join( str(value) for value in model.members[name].shear_array('Fz', getattr(obj, 'NumPointsShear', 4), combo_name=active_load_combination)[1]))
-
-				axial.append(','.join( str(value) for value in model.members[name].axial_array(getattr(obj, 'NumPointsAxial', 3), combo_name=active_load_combination)[1]))
-				
-				torque.append(','.join( str(value) for value in model.members[name].torque_array(getattr(obj, 'NumPointsTorque', 3), combo_name=active_load_combination)[1]))
-
-				deflectiony.append(','.join( str(value) for value in model.members[name].deflection_array('dy', getattr(obj, 'NumPointsDeflection', 4), combo_name=active_load_combination)[1]))
-				deflectionz.append(','.join( str(value) for value in model.members[name].deflection_array('dz', getattr(obj, 'NumPointsDeflection', 4), combo_name=active_load_combination)[1]))
-			except Exception as e:
-				_print_warning(f"Error getting force/deflection arrays for member '{name}' with combo '{active_load_combination}': {e}\n")
-				sheary.append('0.0')
-				shearz.append('0.0')
-				axial.append('0.0')
-				torque.append('0.0')
-				deflectiony.append('0.0')
-				deflectionz.append('0.0')
-
-			try:
-				mimMomenty.append(model.members[name].min_moment('My', combo_name=active_load_combination))
-				mimMomentz.append(model.members[name].min_moment('Mz', combo_name=active_load_combination))
-				maxMomenty.append(model.members[name].max_moment('My', combo_name=active_load_combination))
-				maxMomentz.append(model.members[name].max_moment('Mz', combo_name=active_load_combination))
-
-				minSheary.append(model.members[name].min_shear('Fy', combo_name=active_load_combination))
-				minShearz.append(model.members[name].min_shear('Fz', combo_name=active_load_combination))
-				maxSheary.append(model.members[name].max_shear('Fy', combo_name=active_load_combination))
-				maxShearz.append(model.members[name].max_shear('Fz', combo_name=active_load_combination))
-
-				minTorque.append(model.members[name].min_torque(combo_name=active_load_combination))
-				maxTorque.append(model.members[name].max_torque(combo_name=active_load_combination))
-
-				minDeflectiony.append(model.members[name].min_deflection('dy', combo_name=active_load_combination))
-				minDeflectionz.append(model.members[name].min_deflection('dz', combo_name=active_load_combination))
-				maxDeflectiony.append(model.members[name].max_deflection('dy', combo_name=active_load_combination))
-				maxDeflectionz.append(model.members[name].max_deflection('dz', combo_name=active_load_combination))
-			except Exception as e:
-				_print_warning(f"Error getting min/max values for member '{name}' with combo '{active_load_combination}': {e}\n")
-				mimMomenty.append(0.0)
-				mimMomentz.append(0.0)
-				maxMomenty.append(0.0)
-				maxMomentz.append(0.0)
-				minSheary.append(0.0)
-				minShearz.append(0.0)
-				maxSheary.append(0.0)
-				maxShearz.append(0.0)
-				minTorque.append(0.0)
-				maxTorque.append(0.0)
-				minDeflectiony.append(0.0)
-				minDeflectionz.append(0.0)
-				maxDeflectiony.append(0.0)
-				maxDeflectionz.append(0.0)
-
-			# Also collect structured numeric results for this member (lists of floats)
-			try:
-				my_vals = [float(v) for v in model.members[name].moment_array('My', getattr(obj, 'NumPointsMoment', 3), combo_name=active_load_combination)[1]]
-			except Exception:
-				my_vals = []
-			try:
-				mz_vals = [float(v) for v in model.members[name].moment_array('Mz', getattr(obj, 'NumPointsMoment', 3), combo_name=active_load_combination)[1]]
-			except Exception:
-				mz_vals = []
-			try:
-				fy_vals = [float(v) for v in model.members[name].shear_array('Fy', getattr(obj, 'NumPointsShear', 3), combo_name=active_load_combination)[1]]
-			except Exception:
-				fy_vals = []
-			try:
-				fz_vals = [float(v) for v in model.members[name].shear_array('Fz', getattr(obj, 'NumPointsShear', 3), combo_name=active_load_combination)[1]]
-			except Exception:
-				fz_vals = []
-			try:
-				ax_vals = [float(v) for v in model.members[name].axial_array(getattr(obj, 'NumPointsAxial', 2), combo_name=active_load_combination)[1]]
-			except Exception:
-				ax_vals = []
-			try:
-				tq_vals = [float(v) for v in model.members[name].torque_array(getattr(obj, 'NumPointsTorque', 2), combo_name=active_load_combination)[1]]
-			except Exception:
-				tq_vals = []
-			try:
-				dy_vals = [float(v) for v in model.members[name].deflection_array('dy', getattr(obj, 'NumPointsDeflection', 2), combo_name=active_load_combination)[1]]
-			except Exception:
-				dy_vals = []
-			try:
-				dz_vals = [float(v) for v in model.members[name].deflection_array('dz', getattr(obj, 'NumPointsDeflection', 2), combo_name=active_load_combination)[1]]
-			except Exception:
-				dz_vals = []
+			rows = {quantity: store.get(quantity, name, active_load_combination) for quantity in DIAGRAM_QUANTITIES}
+
+			if write_series:
+				momenty.append(_series(rows['MomentY']))
+				momentz.append(_series(rows['MomentZ']))
+				sheary.append(_series(rows['ShearY']))
+				shearz.append(_series(rows['ShearZ']))
+				axial.append(_series(rows['AxialForce']))
+				torque.append(_series(rows['Torque']))
+				deflectiony.append(_series(rows['DeflectionY']))
+				deflectionz.append(_series(rows['DeflectionZ']))
+
+			extremes = dict(zip(EXTREMES, _floats(store.get('Extremes', name, active_load_combination)) or [0.0]*len(EXTREMES)))
+			rows['Extremes'] = extremes
+			mimMomenty.append(extremes['MinMomentY'])
+			mimMomentz.append(extremes['MinMomentZ'])
+			maxMomenty.append(extremes['MaxMomentY'])
+			maxMomentz.append(extremes['MaxMomentZ'])
+
+			minSheary.append(extremes['MinShearY'])
+			minShearz.append(extremes['MinShearZ'])
+			maxSheary.append(extremes['MaxShearY'])
+			maxShearz.append(extremes['MaxShearZ'])
+
+			minTorque.append(extremes['MinTorque'])
+			maxTorque.append(extremes['MaxTorque'])
+
+			minDeflectiony.append(extremes['MinDeflectionY'])
+			minDeflectionz.append(extremes['MinDeflectionZ'])
+			maxDeflectiony.append(extremes['MaxDeflectionY'])
+			maxDeflectionz.append(extremes['MaxDeflectionZ'])
 
 			# build structured summary and append
-			summary = _build_member_summary(name)
+			summary = _build_member_summary(name, rows)
 			member_results.append(summary)
 			
 
@@ -1765,7 +1986,6 @@ class Calc:
 		# Update Global Units if enabled (New enhanced system)
 		if hasattr(obj, 'UseGlobalUnits') and getattr(obj, 'UseGlobalUnits', True):
 			self.updateGlobalUnitsResults(obj)
-	   
 
 	def updateThaiUnitsResults(self, obj):
 		"""Update Thai units calculation results"""
@@ -1781,14 +2001,12 @@ class Calc:
 			# Convert moment results to ksc
 			moment_z_ksc = []
 			moment_y_ksc = []
-			for mz_str in obj.MomentZ:
-				values = [float(v) for v in mz_str.split(',')]
+			for values in self.resultSeries(obj, 'MomentZ'):
 				# Use a more generic conversion method if kn_m_to_ksc_m is not available
 				ksc_values = [v * 101.97162129779283 for v in values]  # Approximate conversion factor
 				moment_z_ksc.append(','.join(str(v) for v in ksc_values))
 			
-			for my_str in obj.MomentY:
-				values = [float(v) for v in my_str.split(',')]
+			for values in self.resultSeries(obj, 'MomentY'):
 				# Use a more generic conversion method if kn_m_to_ksc_m is not available
 				ksc_values = [v * 101.97162129779283 for v in values]  # Approximate conversion factor
 				moment_y_ksc.append(','.join(str(v) for v in ksc_values))
@@ -1799,8 +2017,7 @@ class Calc:
 			# Convert axial forces to kgf and tf
 			axial_kgf = []
 			axial_tf = []
-			for ax_str in obj.AxialForce:
-				values = [float(v) for v in ax_str.split(',')]
+			for values in self.resultSeries(obj, 'AxialForce'):
 				# Use a more generic conversion method if kn_to_kgf is not available
 				kgf_values = [v * 101.97162129779283 for v in values]  # Approximate conversion factor
 				tf_values = [v * 0.0010197162129779283 for v in values]  # Approximate conversion factor
@@ -1813,14 +2030,12 @@ class Calc:
 			# Convert shear forces to kgf
 			shear_y_kgf = []
 			shear_z_kgf = []
-			for sy_str in obj.ShearY:
-				values = [float(v) for v in sy_str.split(',')]
+			for values in self.resultSeries(obj, 'ShearY'):
 				# Use a more generic conversion method if kn_to_kgf is not available
 				kgf_values = [v * 101.97162129779283 for v in values]  # Approximate conversion factor
 				shear_y_kgf.append(','.join(str(v) for v in kgf_values))
 			
-			for sz_str in obj.ShearZ:
-				values = [float(v) for v in sz_str.split(',')]
+			for values in self.resultSeries(obj, 'ShearZ'):
 				# Use a more generic conversion method if kn_to_kgf is not available
 				kgf_values = [v * 101.97162129779283 for v in values]  # Approximate conversion factor
 				shear_z_kgf.append(','.join(str(v) for v in kgf_values))
@@ -1896,15 +2111,26 @@ class Calc:
 
 
 	def onChanged(self,obj,Parameter):
-		pass
+		# With every combination solved, switching combinations is only a lookup of the retained results
+		if Parameter == 'LoadCombination' and getattr(obj, 'SolveAllCombinations', False):
+			model = getattr(self, 'model', None)
+			inputs = getattr(self, '_resultInputs', None)
+			combo = obj.LoadCombination
+			if model is not None and inputs is not None and combo in getattr(model, 'load_combos', {}) and getattr(model, 'solution', None):
+				self.extractResults(obj, model, *inputs, combo)
+				# The following recompute has nothing left to extract
+				fingerprints = getattr(self, '_fingerprints', None)
+				if fingerprints:
+					fingerprints['extract'] = self.extractFingerprint(obj)
 
 	def member_results_to_json(self, obj) -> str:
 		"""Return a JSON string of obj.MemberResults.
 
-		This helper serializes the structured MemberResults for export or UI use.
+		This helper serializes the structured MemberResults, with the diagram lists
+		read from the result store, for export or UI use.
 		"""
 		import json
-		results = getattr(obj, 'MemberResults', [])
+		results = self.memberResults(obj)
 		# Ensure numeric types are JSON serializable (lists of floats are fine)
 		return json.dumps(results)
 
@@ -1915,7 +2141,7 @@ class Calc:
 		Lists are serialized as semicolon-separated numeric strings inside cells.
 		"""
 		import csv, io
-		results = getattr(obj, 'MemberResults', [])
+		results = self.memberResults(obj)
 		if not results:
 			return ''
 
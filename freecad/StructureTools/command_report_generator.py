@@ -2,6 +2,7 @@
 
 import os
 import sys
+import math
 import FreeCAD as App
 import FreeCADGui as Gui
 from PySide2 import QtCore, QtGui, QtWidgets
@@ -9,6 +10,8 @@ from datetime import datetime
 import tempfile
 import webbrowser
 
+from .result_store import EXTREMES, REACTIONS
+
 # Import Global Units System
 try:
     from .utils.units_manager import (
@@ -1156,16 +1159,29 @@ class ReportGeneratorDialog(QtWidgets.QDialog):
             elif hasattr(calc_obj, 'Proxy') and hasattr(calc_obj.Proxy, 'model'):
                 model = calc_obj.Proxy.model
             
+            # Extremes and reactions of the active combination come from the calc's result store when it has them
+            proxy = getattr(calc_obj, 'Proxy', None)
+            store = proxy.getResultStore(calc_obj) if hasattr(proxy, 'getResultStore') else None
+            combo = getattr(calc_obj, 'LoadCombination', None)
+
+            def _magnitudes(quantity, stations, station, prop):
+                """Absolute values of one station of a stored quantity, or of the calc property holding them"""
+                if store is not None and quantity in store.arrays and combo in store:
+                    column = store.matrix(quantity, combo)[:, stations.index(station)]
+                    return [abs(float(val)) for val in column if not math.isnan(val)]
+                return [abs(val) for val in getattr(calc_obj, prop, None) or []]
+
             # Reaction summary - Enhanced data collection
             if hasattr(calc_obj, 'ReactionNodes') and calc_obj.ReactionNodes:
+                reactions_x = _magnitudes('Reactions', REACTIONS, 'RxnFX', 'ReactionX')
+                reactions_y = _magnitudes('Reactions', REACTIONS, 'RxnFY', 'ReactionY')
+                reactions_z = _magnitudes('Reactions', REACTIONS, 'RxnFZ', 'ReactionZ')
                 # Use stored reaction data if available
-                if (hasattr(calc_obj, 'ReactionX') and calc_obj.ReactionX and
-                    hasattr(calc_obj, 'ReactionY') and calc_obj.ReactionY and
-                    hasattr(calc_obj, 'ReactionZ') and calc_obj.ReactionZ):
+                if reactions_x and reactions_y and reactions_z:
                     
-                    total_fx = sum(abs(val) for val in calc_obj.ReactionX)
-                    total_fy = sum(abs(val) for val in calc_obj.ReactionY)
-                    total_fz = sum(abs(val) for val in calc_obj.ReactionZ)
+                    total_fx = sum(reactions_x)
+                    total_fy = sum(reactions_y)
+                    total_fz = sum(reactions_z)
                     
                     analysis_summary['reactions'] = {
                         'support_count': len(calc_obj.ReactionNodes),
@@ -1201,8 +1217,9 @@ class ReportGeneratorDialog(QtWidgets.QDialog):
                 }
                 
                 # Add member force data if available
-                if hasattr(calc_obj, 'MaxMomentY') and calc_obj.MaxMomentY:
-                    max_moment = max(abs(val) for val in calc_obj.MaxMomentY)
+                moments = _magnitudes('Extremes', EXTREMES, 'MaxMomentY', 'MaxMomentY')
+                if moments:
+                    max_moment = max(moments)
                     analysis_summary['max_moment'] = {
                         'value': max_moment,
                         'units': 'kN·m',
@@ -1210,8 +1227,9 @@ class ReportGeneratorDialog(QtWidgets.QDialog):
                         'acceptable': True
                     }
                 
-                if hasattr(calc_obj, 'MaxShearY') and calc_obj.MaxShearY:
-                    max_shear = max(abs(val) for val in calc_obj.MaxShearY)
+                shears = _magnitudes('Extremes', EXTREMES, 'MaxShearY', 'MaxShearY')
+                if shears:
+                    max_shear = max(shears)
                     analysis_summary['max_shear'] = {
                         'value': max_shear,
                         'units': 'kN',
@@ -1245,8 +1263,9 @@ class ReportGeneratorDialog(QtWidgets.QDialog):
                     }
             
             # Deflection data
-            if hasattr(calc_obj, 'MaxDeflectionY') and calc_obj.MaxDeflectionY:
-                max_deflection = max(abs(val) for val in calc_obj.MaxDeflectionY)
+            deflections = _magnitudes('Extremes', EXTREMES, 'MaxDeflectionY', 'MaxDeflectionY')
+            if deflections:
+                max_deflection = max(deflections)
                 # Estimate span for deflection ratio
                 span_estimate = 1000  # Default 1m, should be calculated from geometry
                 if hasattr(calc_obj, 'NameMembers') and calc_obj.NameMembers and model:
@@ -1,5 +1,6 @@
 import FreeCAD, FreeCADGui, Part, math, os
 from PySide import QtWidgets
+from numpy import isnan, nan_to_num
 
 ICONPATH = os.path.join(os.path.dirname(__file__), "resources")
 pathFont = os.path.join(os.path.dirname(__file__), "resources/fonts/ARIAL.TTF")
@@ -56,6 +57,19 @@ class Diagram:
 		
 		return listMembers
 
+	# Retorna a matriz de resultados de uma grandeza do calc, lida do ResultStore quando disponível
+	def getResults(self, calc, quantity):
+		proxy = getattr(calc, 'Proxy', None)
+		store = proxy.getResultStore(calc) if hasattr(proxy, 'getResultStore') else None
+		combo = getattr(calc, 'LoadCombination', None)
+		if store is not None and quantity in store.arrays and combo in store:
+			matrix = store.matrix(quantity, combo)
+			# Members whose results failed are stored as NaN and drawn as zero, as in the string properties
+			if len(matrix) == len(calc.NameMembers):
+				return nan_to_num(matrix) if isnan(matrix).any() else matrix
+
+		return self.getMatrix(getattr(calc, quantity))
+
 	# Gera uma matriz baseado em umdos parâmetros do calc
 	def getMatrix(self, param):
 		matriz = []
@@ -422,27 +436,27 @@ class Diagram:
 		
 		if moment_z:
 			show_text = draw_text and show_text_moment
-			moment_diagrams += self.makeDiagram(self.getMatrix(obj.ObjectBaseCalc.MomentZ),nodes, members, orderMembers, obj.ObjectBaseCalc.NumPointsMoment, 0, obj.ScaleMoment, obj.FontHeight, obj.Precision, show_text, obj, color_moment)
+			moment_diagrams += self.makeDiagram(self.getResults(obj.ObjectBaseCalc, 'MomentZ'),nodes, members, orderMembers, obj.ObjectBaseCalc.NumPointsMoment, 0, obj.ScaleMoment, obj.FontHeight, obj.Precision, show_text, obj, color_moment)
 		
 		if moment_y:
 			show_text = draw_text and show_text_moment
-			moment_diagrams += self.makeDiagram(self.getMatrix(obj.ObjectBaseCalc.MomentY),nodes, members, orderMembers, obj.ObjectBaseCalc.NumPointsMoment, 90, obj.ScaleMoment, obj.FontHeight, obj.Precision, show_text, obj, color_moment)
+			moment_diagrams += self.makeDiagram(self.getResults(obj.ObjectBaseCalc, 'MomentY'),nodes, members, orderMembers, obj.ObjectBaseCalc.NumPointsMoment, 90, obj.ScaleMoment, obj.FontHeight, obj.Precision, show_text, obj, color_moment)
 		
 		if shear_y:
 			show_text = draw_text and show_text_shear
-			shear_diagrams += self.makeDiagram(self.getMatrix(obj.ObjectBaseCalc.ShearY),nodes, members, orderMembers, obj.ObjectBaseCalc.NumPointsShear, 0, obj.ScaleShear, obj.FontHeight, obj.Precision, show_text, obj, color_shear)
+			shear_diagrams += self.makeDiagram(self.getResults(obj.ObjectBaseCalc, 'ShearY'),nodes, members, orderMembers, obj.ObjectBaseCalc.NumPointsShear, 0, obj.ScaleShear, obj.FontHeight, obj.Precision, show_text, obj, color_shear)
 
 		if shear_z:
 			show_text = draw_text and show_text_shear
-			shear_diagrams += self.makeDiagram(self.getMatrix(obj.ObjectBaseCalc.ShearZ),nodes, members, orderMembers, obj.ObjectBaseCalc.NumPointsShear, 90, obj.ScaleShear, obj.FontHeight, obj.Precision, show_text, obj, color_shear)
+			shear_diagrams += self.makeDiagram(self.getResults(obj.ObjectBaseCalc, 'ShearZ'),nodes, members, orderMembers, obj.ObjectBaseCalc.NumPointsShear, 90, obj.ScaleShear, obj.FontHeight, obj.Precision, show_text, obj, color_shear)
 		
 		if torque:
 			show_text = draw_text and show_text_torque
-			torque_diagrams += self.makeDiagram(self.getMatrix(obj.ObjectBaseCalc.Torque),nodes, members, orderMembers, obj.ObjectBaseCalc.NumPointsTorque, 0, obj.ScaleTorque, obj.FontHeight, obj.Precision, show_text, obj, color_torque)
+			torque_diagrams += self.makeDiagram(self.getResults(obj.ObjectBaseCalc, 'Torque'),nodes, members, orderMembers, obj.ObjectBaseCalc.NumPointsTorque, 0, obj.ScaleTorque, obj.FontHeight, obj.Precision, show_text, obj, color_torque)
 		
 		if axial_force:
 			show_text = draw_text and show_text_axial
-			axial_diagrams += self.makeDiagram(self.getMatrix(obj.ObjectBaseCalc.AxialForce),nodes, members, orderMembers, obj.ObjectBaseCalc.NumPointsAxial, 0, obj.ScaleAxial, obj.FontHeight, obj.Precision, show_text, obj, color_axial)
+			axial_diagrams += self.makeDiagram(self.getResults(obj.ObjectBaseCalc, 'AxialForce'),nodes, members, orderMembers, obj.ObjectBaseCalc.NumPointsAxial, 0, obj.ScaleAxial, obj.FontHeight, obj.Precision, show_text, obj, color_axial)
 		
 		# Create colored compounds for each diagram type
 		all_shapes = []
@@ -0,0 +1,74 @@
+"""
+fingerprint.py - Fingerprints of the document objects feeding an analysis
+
+Calc used to rebuild, mesh and solve its model on every recompute, even when nothing the
+analysis depends on had changed. fingerprint() reduces document objects (their properties,
+linked objects and shape geometry) to a short digest, so Calc can compare the inputs of each
+of its stages with the ones used last time and skip the stages whose inputs are unchanged.
+"""
+
+import hashlib
+
+
+# Document object properties that have no effect on an analysis
+IGNORED_PROPERTIES = frozenset(('Label', 'Label2', 'Visibility', 'ExpressionEngine', 'Proxy', 'ViewObject'))
+
+# How many links deep linked objects (materials, sections, support bases, ...) are followed
+MAX_DEPTH = 4
+
+
+def fingerprint(*values):
+    """Returns a hex digest of the values, which may be (lists of) document objects.
+
+    Values that can't be reduced to plain data are represented by their repr(), so an unknown
+    value errs on the side of reporting a change.
+    """
+    return hashlib.sha1(repr(state(values)).encode()).hexdigest()
+
+
+def state(value, depth=0, seen=None):
+    """Reduces a value to nested tuples of plain data describing it."""
+    if seen is None:
+        seen = set()
+
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(state(item, depth, seen) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), state(item, depth, seen)) for key, item in value.items()))
+    if isinstance(value, type):
+        return ('class', value.__module__, value.__qualname__)
+
+    # Shapes are described by the positions of their vertexes
+    if hasattr(value, 'ShapeType') and hasattr(value, 'Vertexes'):
+        return ('Shape', value.ShapeType, tuple(_point(vertex.Point) for vertex in value.Vertexes))
+    # Quantities, vectors and rotations
+    if hasattr(value, 'Value') and hasattr(value, 'Unit'):
+        return ('Quantity', float(value.Value), str(value.Unit))
+    if all(hasattr(value, axis) for axis in 'xyz') and not hasattr(value, '__dict__'):
+        return _point(value)
+    if hasattr(value, 'Q'):
+        return ('Rotation',) + tuple(value.Q)
+
+    # Document objects (and plain Python objects standing in for them) are described by their
+    # properties. Objects already described, or too many links away, only by their name.
+    name = getattr(value, 'Name', None)
+    if id(value) in seen or depth > MAX_DEPTH:
+        return ('ref', name if name is not None else id(value))
+    if hasattr(value, 'PropertiesList'):
+        seen.add(id(value))
+        return ('object', name) + tuple((prop, state(getattr(value, prop, None), depth + 1, seen))
+                                        for prop in value.PropertiesList if prop not in IGNORED_PROPERTIES)
+    if hasattr(value, '__dict__'):
+        seen.add(id(value))
+        return ('object', name) + tuple((key, state(item, depth + 1, seen))
+                                        for key, item in sorted(vars(value).items()) if key not in IGNORED_PROPERTIES)
+
+    return repr(value)
+
+
+def _point(point):
+    if isinstance(point, (list, tuple)):
+        return tuple(float(coordinate) for coordinate in point)
+    return (float(point.x), float(point.y), float(point.z))
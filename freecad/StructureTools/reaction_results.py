@@ -29,6 +29,8 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+from .result_store import REACTIONS
+
 ICONPATH = os.path.join(os.path.dirname(__file__), "resources")
 
 
@@ -200,7 +202,7 @@ class ReactionResults:
             FreeCAD.Console.PrintMessage(f"  ℹ️ Using first available load combination: {load_combo}\n")
         
         # Print detailed reaction information as requested
-        self.print_detailed_reaction_info(model, load_combo)
+        self.print_detailed_reaction_info(calc_obj, model, load_combo)
         
         # Calculate auto scale factors if enabled
         if obj.AutoScaleReactions:
@@ -235,50 +237,51 @@ class ReactionResults:
                 display_coords = (pynite_x, pynite_y, pynite_z)
                 
                 # Collect all reaction values for this node
+                reactions = self.get_node_reactions(calc_obj, node_name, node, load_combo)
                 reaction_values = []
                 
-                if obj.ShowReactionFX and hasattr(node, 'RxnFX') and load_combo in node.RxnFX and abs(node.RxnFX[load_combo]) > obj.MinReactionThreshold:
-                    reaction_values.append(node.RxnFX[load_combo])
+                if obj.ShowReactionFX and abs(reactions['RxnFX']) > obj.MinReactionThreshold:
+                    reaction_values.append(reactions['RxnFX'])
                     
-                if obj.ShowReactionFY and hasattr(node, 'RxnFY') and load_combo in node.RxnFY and abs(node.RxnFY[load_combo]) > obj.MinReactionThreshold:
-                    reaction_values.append(node.RxnFY[load_combo])
+                if obj.ShowReactionFY and abs(reactions['RxnFY']) > obj.MinReactionThreshold:
+                    reaction_values.append(reactions['RxnFY'])
                     
-                if obj.ShowReactionFZ and hasattr(node, 'RxnFZ') and load_combo in node.RxnFZ and abs(node.RxnFZ[load_combo]) > obj.MinReactionThreshold:
-                    reaction_values.append(node.RxnFZ[load_combo])
+                if obj.ShowReactionFZ and abs(reactions['RxnFZ']) > obj.MinReactionThreshold:
+                    reaction_values.append(reactions['RxnFZ'])
                     
-                if obj.ShowReactionMX and hasattr(node, 'RxnMX') and load_combo in node.RxnMX and abs(node.RxnMX[load_combo]) > obj.MinReactionThreshold:
-                    reaction_values.append(node.RxnMX[load_combo])
+                if obj.ShowReactionMX and abs(reactions['RxnMX']) > obj.MinReactionThreshold:
+                    reaction_values.append(reactions['RxnMX'])
                     
-                if obj.ShowReactionMY and hasattr(node, 'RxnMY') and load_combo in node.RxnMY and abs(node.RxnMY[load_combo]) > obj.MinReactionThreshold:
-                    reaction_values.append(node.RxnMY[load_combo])
+                if obj.ShowReactionMY and abs(reactions['RxnMY']) > obj.MinReactionThreshold:
+                    reaction_values.append(reactions['RxnMY'])
                     
-                if obj.ShowReactionMZ and hasattr(node, 'RxnMZ') and load_combo in node.RxnMZ and abs(node.RxnMZ[load_combo]) > obj.MinReactionThreshold:
-                    reaction_values.append(node.RxnMZ[load_combo])
+                if obj.ShowReactionMZ and abs(reactions['RxnMZ']) > obj.MinReactionThreshold:
+                    reaction_values.append(reactions['RxnMZ'])
                 
                 # Check if reactions should be displayed based on specialized visualization options
-                if self.should_display_reaction(obj, node, load_combo, reaction_values):
+                if self.should_display_reaction(obj, reactions, reaction_values):
                     # Collect all significant reaction components for this node
                     reaction_components = []
                     
                     # Force components (in kN) - only show significant values
-                    if obj.ShowReactionFX and hasattr(node, 'RxnFX') and load_combo in node.RxnFX and abs(node.RxnFX[load_combo]) > obj.MinReactionThreshold:
-                        reaction_components.append(f"Fx={node.RxnFX[load_combo]:.{obj.Precision}f}")
+                    if obj.ShowReactionFX and abs(reactions['RxnFX']) > obj.MinReactionThreshold:
+                        reaction_components.append(f"Fx={reactions['RxnFX']:.{obj.Precision}f}")
                         
-                    if obj.ShowReactionFY and hasattr(node, 'RxnFY') and load_combo in node.RxnFY and abs(node.RxnFY[load_combo]) > obj.MinReactionThreshold:
-                        reaction_components.append(f"Fy={node.RxnFY[load_combo]:.{obj.Precision}f}")
+                    if obj.ShowReactionFY and abs(reactions['RxnFY']) > obj.MinReactionThreshold:
+                        reaction_components.append(f"Fy={reactions['RxnFY']:.{obj.Precision}f}")
                         
-                    if obj.ShowReactionFZ and hasattr(node, 'RxnFZ') and load_combo in node.RxnFZ and abs(node.RxnFZ[load_combo]) > obj.MinReactionThreshold:
-                        reaction_components.append(f"Fz={node.RxnFZ[load_combo]:.{obj.Precision}f}")
+                    if obj.ShowReactionFZ and abs(reactions['RxnFZ']) > obj.MinReactionThreshold:
+                        reaction_components.append(f"Fz={reactions['RxnFZ']:.{obj.Precision}f}")
                     
                     # Moment components (in kN·m) - only show significant values
-                    if obj.ShowReactionMX and hasattr(node, 'RxnMX') and load_combo in node.RxnMX and abs(node.RxnMX[load_combo]) > obj.MinReactionThreshold:
-                        reaction_components.append(f"Mx={node.RxnMX[load_combo]:.{obj.Precision}f}")
+                    if obj.ShowReactionMX and abs(reactions['RxnMX']) > obj.MinReactionThreshold:
+                        reaction_components.append(f"Mx={reactions['RxnMX']:.{obj.Precision}f}")
                         
-                    if obj.ShowReactionMY and hasattr(node, 'RxnMY') and load_combo in node.RxnMY and abs(node.RxnMY[load_combo]) > obj.MinReactionThreshold:
-                        reaction_components.append(f"My={node.RxnMY[load_combo]:.{obj.Precision}f}")
+                    if obj.ShowReactionMY and abs(reactions['RxnMY']) > obj.MinReactionThreshold:
+                        reaction_components.append(f"My={reactions['RxnMY']:.{obj.Precision}f}")
                         
-                    if obj.ShowReactionMZ and hasattr(node, 'RxnMZ') and load_combo in node.RxnMZ and abs(node.RxnMZ[load_combo]) > obj.MinReactionThreshold:
-                        reaction_components.append(f"Mz={node.RxnMZ[load_combo]:.{obj.Precision}f}")
+                    if obj.ShowReactionMZ and abs(reactions['RxnMZ']) > obj.MinReactionThreshold:
+                        reaction_components.append(f"Mz={reactions['RxnMZ']:.{obj.Precision}f}")
                     
                     # Create a single combined label for this node if there are reactions to show
                     if obj.ShowLabels and reaction_components:
@@ -287,12 +290,12 @@ class ReactionResults:
                 # Create resultant force and moment arrows if enabled
                 if obj.ShowResultantForces or obj.ShowResultantMoments:
                     # Get all reaction components for this node
-                    fx = node.RxnFX.get(load_combo, 0.0) if hasattr(node, 'RxnFX') else 0.0
-                    fy = node.RxnFY.get(load_combo, 0.0) if hasattr(node, 'RxnFY') else 0.0
-                    fz = node.RxnFZ.get(load_combo, 0.0) if hasattr(node, 'RxnFZ') else 0.0
-                    mx = node.RxnMX.get(load_combo, 0.0) if hasattr(node, 'RxnMX') else 0.0
-                    my = node.RxnMY.get(load_combo, 0.0) if hasattr(node, 'RxnMY') else 0.0
-                    mz = node.RxnMZ.get(load_combo, 0.0) if hasattr(node, 'RxnMZ') else 0.0
+                    fx = reactions['RxnFX']
+                    fy = reactions['RxnFY']
+                    fz = reactions['RxnFZ']
+                    mx = reactions['RxnMX']
+                    my = reactions['RxnMY']
+                    mz = reactions['RxnMZ']
                     
                     # Calculate resultant magnitudes
                     force_magnitude = math.sqrt(fx*fx + fy*fy + fz*fz)
@@ -300,7 +303,7 @@ class ReactionResults:
                     
                     # Check if resultants should be displayed based on specialized visualization options
                     reaction_values = [fx, fy, fz, mx, my, mz]
-                    if self.should_display_reaction(obj, node, load_combo, reaction_values):
+                    if self.should_display_reaction(obj, reactions, reaction_values):
                         # Create labels only for resultants (positioned at exact node coordinates)
                         if obj.ShowLabels and obj.ShowResultantForces and force_magnitude > obj.MinReactionThreshold:
                             self.create_reaction_label_only(obj, node_pos, "force", "Resultant", force_magnitude, node_name)
@@ -360,12 +363,13 @@ class ReactionResults:
             node_pos = FreeCAD.Vector(node.X, node.Z, node.Y)  # Convert Pynite coords to FreeCAD
             
             # Get reaction values for this node
-            rx = node.RxnFX.get(load_combo, 0.0) if hasattr(node, 'RxnFX') else 0.0
-            ry = node.RxnFY.get(load_combo, 0.0) if hasattr(node, 'RxnFY') else 0.0
-            rz = node.RxnFZ.get(load_combo, 0.0) if hasattr(node, 'RxnFZ') else 0.0
-            mx = node.RxnMX.get(load_combo, 0.0) if hasattr(node, 'RxnMX') else 0.0
-            my = node.RxnMY.get(load_combo, 0.0) if hasattr(node, 'RxnMY') else 0.0
-            mz = node.RxnMZ.get(load_combo, 0.0) if hasattr(node, 'RxnMZ') else 0.0
+            reactions = self.get_node_reactions(calc_obj, node_name, node, load_combo)
+            rx = reactions['RxnFX']
+            ry = reactions['RxnFY']
+            rz = reactions['RxnFZ']
+            mx = reactions['RxnMX']
+            my = reactions['RxnMY']
+            mz = reactions['RxnMZ']
             
             # Check if any reactions are significant
             has_reactions = any(abs(val) > obj.MinReactionThreshold for val in [rx, ry, rz, mx, my, mz])
@@ -513,7 +517,7 @@ class ReactionResults:
         
         FreeCAD.Console.PrintMessage(f"    Resultant {type_name}: {bar} ({formatted_magnitude} {'kN' if type_name == 'Force' else 'kN·m'})\n")
 
-    def print_detailed_reaction_info(self, model, load_combo):
+    def print_detailed_reaction_info(self, calc_obj, model, load_combo):
         """Print detailed reaction information as requested."""
         try:
             FreeCAD.Console.PrintMessage(f"\nCollecting reactions for load combination: {load_combo}\n")
@@ -532,12 +536,13 @@ class ReactionResults:
             # Process each supported node
             for node_name, node in supported_nodes:
                 # Get reaction values
-                rx = node.RxnFX.get(load_combo, 0.0) if hasattr(node, 'RxnFX') else 0.0
-                ry = node.RxnFY.get(load_combo, 0.0) if hasattr(node, 'RxnFY') else 0.0
-                rz = node.RxnFZ.get(load_combo, 0.0) if hasattr(node, 'RxnFZ') else 0.0
-                mx = node.RxnMX.get(load_combo, 0.0) if hasattr(node, 'RxnMX') else 0.0
-                my = node.RxnMY.get(load_combo, 0.0) if hasattr(node, 'RxnMY') else 0.0
-                mz = node.RxnMZ.get(load_combo, 0.0) if hasattr(node, 'RxnMZ') else 0.0
+                reactions = self.get_node_reactions(calc_obj, node_name, node, load_combo)
+                rx = reactions['RxnFX']
+                ry = reactions['RxnFY']
+                rz = reactions['RxnFZ']
+                mx = reactions['RxnMX']
+                my = reactions['RxnMY']
+                mz = reactions['RxnMZ']
                 
                 # Add to totals
                 sum_fx += rx
@@ -573,6 +578,23 @@ class ReactionResults:
         return (node.support_DX or node.support_DY or node.support_DZ or 
                 node.support_RX or node.support_RY or node.support_RZ)
 
+    def get_node_reactions(self, calc_obj, node_name: str, node, load_combo: str) -> Dict[str, float]:
+        """Get the reactions of a node keyed by component ('RxnFX' ... 'RxnMZ').
+
+        Values are read from the calculation's result store when it holds the load combination,
+        and from the FE model node otherwise. Missing components are 0.0.
+        """
+        proxy = getattr(calc_obj, 'Proxy', None)
+        store = proxy.getResultStore(calc_obj) if hasattr(proxy, 'getResultStore') else None
+        if store is not None and 'Reactions' in store.arrays and load_combo in store:
+            try:
+                values = store.get('Reactions', node_name, load_combo)
+            except KeyError:
+                values = None  # Node not in the store
+            if values is not None and not any(math.isnan(value) for value in values):
+                return {reaction: float(value) for reaction, value in zip(REACTIONS, values)}
+        return {reaction: getattr(node, reaction, {}).get(load_combo, 0.0) for reaction in REACTIONS}
+
     def format_reaction_label(self, obj, component_type: str, direction: str, magnitude: float) -> str:
         """Format reaction label text based on selected language."""
         # Format value with units
@@ -841,21 +863,16 @@ class ReactionResults:
             max_moment = 0.0
             load_combo = obj.ActiveLoadCombination
             
-            for node in model.nodes.values():
+            for node_name, node in model.nodes.items():
                 if self.is_node_supported(node):
+                    reactions = self.get_node_reactions(calc_obj, node_name, node, load_combo)
                     # Check force reactions
                     for reaction_attr in ['RxnFX', 'RxnFY', 'RxnFZ']:
-                        if hasattr(node, reaction_attr):
-                            reaction_dict = getattr(node, reaction_attr)
-                            if load_combo in reaction_dict:
-                                max_force = max(max_force, abs(reaction_dict[load_combo]))
+                        max_force = max(max_force, abs(reactions[reaction_attr]))
                                 
                     # Check moment reactions
                     for reaction_attr in ['RxnMX', 'RxnMY', 'RxnMZ']:
-                        if hasattr(node, reaction_attr):
-                            reaction_dict = getattr(node, reaction_attr)
-                            if load_combo in reaction_dict:
-                                max_moment = max(max_moment, abs(reaction_dict[load_combo]))
+                        max_moment = max(max_moment, abs(reactions[reaction_attr]))
                                 
             # Calculate scale factors (target arrow length is 5% of model size)
             target_length = model_size * 0.05
@@ -902,17 +919,14 @@ class ReactionResults:
             max_magnitude = float('-inf')
             load_combo = obj.ActiveLoadCombination
             
-            for node in model.nodes.values():
+            for node_name, node in model.nodes.items():
                 if self.is_node_supported(node):
                     # Check all reaction components
-                    for reaction_attr in ['RxnFX', 'RxnFY', 'RxnFZ', 'RxnMX', 'RxnMY', 'RxnMZ']:
-                        if hasattr(node, reaction_attr):
-                            reaction_dict = getattr(node, reaction_attr)
-                            if load_combo in reaction_dict:
-                                magnitude = abs(reaction_dict[load_combo])
-                                if magnitude > obj.MinReactionThreshold:  # Only consider significant reactions
-                                    min_magnitude = min(min_magnitude, magnitude)
-                                    max_magnitude = max(max_magnitude, magnitude)
+                    for value in self.get_node_reactions(calc_obj, node_name, node, load_combo).values():
+                        magnitude = abs(value)
+                        if magnitude > obj.MinReactionThreshold:  # Only consider significant reactions
+                            min_magnitude = min(min_magnitude, magnitude)
+                            max_magnitude = max(max_magnitude, magnitude)
                                     
             # Handle edge cases
             if min_magnitude == float('inf'):
@@ -961,7 +975,7 @@ class ReactionResults:
             logger.error(f"Error calculating gradient color: {str(e)}")
             return None
 
-    def should_display_reaction(self, obj, node, load_combo, reaction_values):
+    def should_display_reaction(self, obj, reactions, reaction_values):
         """Determine if a reaction should be displayed based on specialized visualization options."""
         try:
             # Always show if no specialized options are enabled
@@ -973,21 +987,15 @@ class ReactionResults:
             
             # Collect force reaction magnitudes
             for reaction_attr in ['RxnFX', 'RxnFY', 'RxnFZ']:
-                if hasattr(node, reaction_attr):
-                    reaction_dict = getattr(node, reaction_attr)
-                    if load_combo in reaction_dict:
-                        magnitude = abs(reaction_dict[load_combo])
-                        if magnitude > obj.MinReactionThreshold:
-                            all_magnitudes.append(magnitude)
+                magnitude = abs(reactions[reaction_attr])
+                if magnitude > obj.MinReactionThreshold:
+                    all_magnitudes.append(magnitude)
                             
             # Collect moment reaction magnitudes
             for reaction_attr in ['RxnMX', 'RxnMY', 'RxnMZ']:
-                if hasattr(node, reaction_attr):
-                    reaction_dict = getattr(node, reaction_attr)
-                    if load_combo in reaction_dict:
-                        magnitude = abs(reaction_dict[load_combo])
-                        if magnitude > obj.MinReactionThreshold:
-                            all_magnitudes.append(magnitude)
+                magnitude = abs(reactions[reaction_attr])
+                if magnitude > obj.MinReactionThreshold:
+                    all_magnitudes.append(magnitude)
                             
             # If no reactions found, don't display
             if not all_magnitudes:
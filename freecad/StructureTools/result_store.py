@@ -0,0 +1,127 @@
+"""
+result_store.py - Columnar storage of per-member analysis results
+
+Calc used to keep its diagram results only as comma-joined strings (one per member) in
+document properties, which every consumer had to parse again. ResultStore keeps them as
+NumPy arrays instead, one array per quantity with shape (members, combinations, stations),
+and can be saved as a sidecar directory of .npy files next to the FreeCAD document. Loaded
+arrays are memory-mapped, so readers only touch the slices they use.
+"""
+
+import os
+
+import numpy as np
+
+
+# Per-member diagram quantities, named after the Calc properties that hold them as strings
+DIAGRAM_QUANTITIES = ('MomentY', 'MomentZ', 'ShearY', 'ShearZ', 'AxialForce', 'Torque', 'DeflectionY', 'DeflectionZ')
+
+# Per-member extreme values, kept together as the stations of the 'Extremes' quantity in this order
+EXTREMES = tuple(f'{bound}{quantity}' for quantity in DIAGRAM_QUANTITIES if quantity != 'AxialForce'
+                 for bound in ('Min', 'Max'))
+
+# Per-node support reactions, kept together as the stations of the 'Reactions' quantity in this order
+REACTIONS = ('RxnFX', 'RxnFY', 'RxnFZ', 'RxnMX', 'RxnMY', 'RxnMZ')
+
+# Quantities whose rows are nodes rather than members
+NODE_QUANTITIES = ('Reactions',)
+
+# Files of a saved store that hold its labels rather than a quantity
+_LABELS = ('members', 'nodes', 'combos')
+
+
+class ResultStore:
+    """Per-member and per-node results keyed by (name, combination, quantity, station).
+
+    Values that were never stored read back as NaN.
+    """
+
+    def __init__(self, members=(), combos=(), nodes=()):
+        self.members = list(members)
+        self.nodes = list(nodes)
+        self.combos = list(combos)
+        self._member_index = {name: i for i, name in enumerate(self.members)}
+        self._node_index = {name: i for i, name in enumerate(self.nodes)}
+        self._combo_index = {name: i for i, name in enumerate(self.combos)}
+        self.arrays = {}  # quantity -> array of shape (members or nodes, combos, stations)
+
+    def __contains__(self, combo):
+        return combo in self._combo_index
+
+    def _rows(self, quantity):
+        return self._node_index if quantity in NODE_QUANTITIES else self._member_index
+
+    def _add_combo(self, combo):
+        self._combo_index[combo] = len(self.combos)
+        self.combos.append(combo)
+        for quantity, array in self.arrays.items():
+            grown = np.full((array.shape[0], array.shape[1] + 1, array.shape[2]), np.nan)
+            grown[:, :-1, :] = array
+            self.arrays[quantity] = grown
+
+    def set(self, quantity, name, combo, values):
+        """Store the station values of a quantity for a member (or node) and combination."""
+        if combo not in self._combo_index:
+            self._add_combo(combo)
+
+        rows = self._rows(quantity)
+        values = np.asarray(values, dtype=float)
+        array = self.arrays.get(quantity)
+        if array is None or array.shape[2] != len(values):
+            # The number of stations changed, so earlier values for this quantity no longer apply
+            array = np.full((len(rows), len(self.combos), len(values)), np.nan)
+            self.arrays[quantity] = array
+        elif not array.flags.writeable:
+            # Arrays mapped from a saved store are read-only; copy before the first write
+            array = self.arrays[quantity] = np.array(array)
+
+        array[rows[name], self._combo_index[combo], :] = values
+
+    def get(self, quantity, name=None, combo=None):
+        """Return a view of the stored values.
+
+        With neither name nor combo this is the full (rows, combos, stations) array; giving
+        either one selects along that axis. Names are members, or nodes for NODE_QUANTITIES.
+        """
+        array = self.arrays[quantity]
+        if name is not None:
+            array = array[self._rows(quantity)[name]]
+            return array if combo is None else array[self._combo_index[combo]]
+        if combo is not None:
+            return array[:, self._combo_index[combo], :]
+        return array
+
+    def matrix(self, quantity, combo):
+        """Return the (rows, stations) values of a quantity for one combination."""
+        return self.get(quantity, combo=combo)
+
+    def save(self, path):
+        """Write the store to a directory holding one uncompressed .npy file per array."""
+        os.makedirs(path, exist_ok=True)
+        arrays = {label: np.array(getattr(self, label), dtype=str) for label in _LABELS}
+        arrays.update(self.arrays)
+        for key, array in arrays.items():
+            # Replace each file rather than overwrite it, so stores still mapping the old one keep it
+            target = os.path.join(path, key + '.npy')
+            temporary = os.path.join(path, key + '.tmp.npy')
+            np.save(temporary, array)
+            os.replace(temporary, target)
+        for file_name in os.listdir(path):
+            if file_name.endswith('.npy') and file_name[:-4] not in arrays:
+                os.remove(os.path.join(path, file_name))
+
+    @classmethod
+    def load(cls, path):
+        """Read a store written by save, memory-mapping its arrays read-only."""
+        labels = {label: np.load(os.path.join(path, label + '.npy')).tolist() for label in _LABELS}
+        store = cls(labels['members'], labels['combos'], labels['nodes'])
+        for file_name in sorted(os.listdir(path)):
+            quantity = file_name[:-4]
+            if file_name.endswith('.npy') and quantity not in _LABELS:
+                store.arrays[quantity] = np.load(os.path.join(path, file_name), mmap_mode='r')
+        return store
+
+
+def sidecar_path(document_path, object_name):
+    """Return the path of the result directory for a Calc object saved next to its document."""
+    return os.path.splitext(document_path)[0] + f'.{object_name}.results'
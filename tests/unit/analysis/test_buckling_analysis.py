@@ -28,6 +28,7 @@ class MockApp:
 sys.modules['FreeCAD'] = MockApp
 
 from freecad.StructureTools.analysis.BucklingAnalysis import BucklingAnalysis, BucklingAnalysisResults
+from freecad.StructureTools.utils.exceptions import AnalysisError
 
 
 class TestBucklingAnalysis:
@@ -376,6 +377,76 @@ class TestBucklingAnalysisIntegration:
         assert stored_results is not None
         assert hasattr(stored_results, 'critical_load_factors')
 
+class TestSparseBucklingAnalysis:
+    """Test the sparse buckling analysis on a Pynite column"""
+    
+    def _column(self, segments=20, height=5.0, load=100.0):
+        from freecad.StructureTools.Pynite_main.FEModel3D import FEModel3D
+        
+        model = FEModel3D()
+        model.add_material('Steel', 200e6, 77e6, 0.3, 78.5)
+        model.add_section('W', 0.01, 2e-5, 8e-6, 1e-6)
+        for i in range(segments + 1):
+            model.add_node(f'N{i}', 0, height * i / segments, 0)
+        for i in range(segments):
+            model.add_member(f'M{i}', f'N{i}', f'N{i + 1}', 'Steel', 'W')
+        model.def_support('N0', True, True, True, True, True, True)
+        model.add_node_load(f'N{segments}', 'FY', -load, case='D')
+        model.add_load_combo('1.4D', {'D': 1.4})
+        model.add_load_combo('Uplift', {'D': -1.0})
+        return model
+    
+    def test_cantilever_column_matches_euler_load(self):
+        """The critical load factor of a cantilever column matches π²EI/(4L²)"""
+        model = self._column()
+        buckling_analysis = BucklingAnalysis(model)
+        buckling_analysis.num_modes = 3
+        buckling_analysis.set_load_case('1.4D')
+        results = buckling_analysis.run_buckling_analysis()
+        
+        assert results.convergence_info['eigenvalue_solver'] == 'arpack'
+        
+        euler_load = np.pi**2 * 200e6 * 8e-6 / (4 * 5.0**2)
+        assert results.get_critical_load_factor() == pytest.approx(euler_load / 140.0, rel=1e-3)
+        assert results.applied_loads['Total_FY'] == pytest.approx(-140.0)
+        assert results.buckling_modes.shape == (126, 3)
+        
+        # The dense solver finds the same load factors
+        buckling_analysis.buckling_solver = "dense"
+        dense = buckling_analysis.run_buckling_analysis()
+        np.testing.assert_allclose(dense.load_factors, results.load_factors, rtol=1e-8)
+    
+    def test_combinations_without_compression_do_not_buckle(self):
+        """Only combinations that put members in compression give load factors"""
+        model = self._column(segments=4)
+        buckling_analysis = BucklingAnalysis(model)
+        buckling_analysis.num_modes = 2
+        buckling_analysis.set_load_case('Uplift')
+        
+        with pytest.raises(AnalysisError):
+            buckling_analysis.run_buckling_analysis()
+    
+    def test_existing_linear_solution_is_reused(self):
+        """A model solved since its last change is not solved again"""
+        model = self._column(segments=8)
+        model.analyze_linear(check_stability=False)
+        expected = BucklingAnalysis(model)
+        expected.set_load_case('1.4D')
+        expected = expected.run_buckling_analysis().load_factors
+        
+        buckling_analysis = BucklingAnalysis(model)
+        buckling_analysis.set_load_case('1.4D')
+        with patch.object(model, 'analyze_linear', side_effect=AssertionError('solved again')):
+            results = buckling_analysis.run_buckling_analysis()
+        np.testing.assert_allclose(results.load_factors, expected, rtol=1e-10)
+        
+        # Editing the model directly invalidates the solution
+        model.materials['Steel'].E = 2 * 200e6
+        with patch.object(model, 'analyze_linear', wraps=model.analyze_linear) as analyze_linear:
+            results = buckling_analysis.run_buckling_analysis()
+        analyze_linear.assert_called_once()
+        np.testing.assert_allclose(results.load_factors, 2 * expected, rtol=1e-6)
+
 
 if __name__ == '__main__':
-    pytest.main([__file__, '-v'])
\ No newline at end of file
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,158 @@
+import json
+import sys
+import types
+
+import pytest
+
+# calc registers its command on import; the shared FreeCAD stubs may not provide addCommand
+_gui = sys.modules.get('FreeCADGui')
+if _gui is not None and not hasattr(_gui, 'addCommand'):
+    _gui.addCommand = lambda *args, **kwargs: None
+
+from freecad.StructureTools import calc
+from freecad.StructureTools.calc import Calc
+
+
+class _Quantity:
+    def __init__(self, value, unit=None):
+        self.value = float(getattr(value, 'value', value))
+
+    def getValueAs(self, unit):
+        return self.value/1000
+
+
+def _ns(**kwargs):
+    return types.SimpleNamespace(**kwargs)
+
+
+def _vertex(x, y, z):
+    return _ns(Point=_ns(x=x, y=y, z=z))
+
+
+class _Material:
+    Name = 'Steel'
+
+    class Proxy:
+        @staticmethod
+        def get_calc_properties(material, unit_length, unit_force):
+            return {'name': 'Steel', 'E': 200e6, 'G': 77e6, 'nu': 0.3, 'density': 78.5}
+
+
+_section = _ns(Name='W', MomentInertiaPolar=2e6, MomentInertiaY=8e6, MomentInertiaZ=4e6, ProductInertiaYZ=0.0,
+               AreaSection=_Quantity(8))
+
+
+def _line(name, a, b):
+    vertexes = [_vertex(*a), _vertex(*b)]
+    return _ns(Name=name, Label=name, Shape=_ns(Edges=[_ns(Vertexes=vertexes)], Vertexes=vertexes),
+               MaterialMember=_Material, SectionMember=_section, TrussMember=False, RotationSection=_Quantity(0))
+
+
+def _elements():
+    lines = [_line('Line', (0, 0, 0), (0, 0, 3000)), _line('Line001', (0, 0, 3000), (5000, 0, 3000)),
+             _line('Line002', (5000, 0, 0), (5000, 0, 3000))]
+    # Support vertices expose Point as a sequence of coordinates
+    bases = [_ns(Shape=_ns(Vertexes=[_ns(Point=[x, 0, 0])])) for x in (0, 5000)]
+    supports = [_ns(Name=f'Suport{i}', Label=f'Suport{i}', ObjectBase=[(base, ('Vertex1',))],
+                    FixTranslationX=True, FixTranslationY=True, FixTranslationZ=True,
+                    FixRotationX=True, FixRotationY=True, FixRotationZ=True) for i, base in enumerate(bases)]
+    loads = [_ns(Name='Load', Label='Load', LoadType='DL', GlobalDirection='-Z', NodalLoading=_Quantity(10000),
+                 ObjectBase=[(lines[1], ('Vertex2',))]),
+             _ns(Name='Load001', Label='Load001', LoadType='W', GlobalDirection='+X', NodalLoading=_Quantity(4000),
+                 ObjectBase=[(lines[1], ('Vertex1',))]),
+             _ns(Name='Load002', Label='Load002', LoadType='W', GlobalDirection='-X', NodalLoading=_Quantity(2000),
+                 ObjectBase=[(lines[1], ('Vertex2',))])]
+    return lines + supports + loads
+
+
+def _run(combo, solve_all):
+    obj = _ns(ListElements=_elements(), LengthUnit='m', ForceUnit='kN', selfWeight=True,
+              NumPointsMoment=4, NumPointsShear=4, NumPointsAxial=3, NumPointsTorque=3, NumPointsDeflection=3)
+    proxy = Calc(obj, elements=None)
+    obj.LoadCombination = combo
+    obj.SolveAllCombinations = solve_all
+    proxy.execute(obj)
+    return proxy, obj
+
+
+def _snapshot(obj):
+    moments = [float(v) for series in obj.MomentZ for v in series.split(',')]
+    return list(obj.ReactionX) + list(obj.ReactionY) + list(obj.MaxMomentZ) + moments
+
+
+@pytest.fixture(autouse=True)
+def _fake_freecad(monkeypatch):
+    app = _ns(Units=_ns(Quantity=_Quantity), Vector=lambda x, y, z: (x, y, z),
+              Console=_ns(PrintMessage=lambda msg: None, PrintWarning=lambda msg: None, PrintError=lambda msg: None))
+    monkeypatch.setattr(calc, 'App', app)
+
+
+def test_solve_all_combinations_matches_single_combination_runs():
+    combos = ['100_DL', '106_0.6DL+W(X+)', '107_0.6DL+W(x-)', '1006_0.9DL+1.6W(X+)']
+
+    proxy, obj = _run('100_DL', solve_all=True)
+    assert set(calc.LOAD_COMBINATIONS) == set(proxy.model.load_combos)
+    assert proxy.model.load_combos['106_0.6DL+W(X+)'].factors == {'DL': 0.6, 'W+X': 1.0}
+
+    for combo in combos:
+        expected = _run(combo, solve_all=False)[1]
+
+        # Switching the combination is a lookup of the retained results, not a new analysis
+        model = proxy.model
+        obj.LoadCombination = combo
+        proxy.onChanged(obj, 'LoadCombination')
+        assert proxy.model is model
+        assert obj.AnalysisType == expected.AnalysisType
+        assert _snapshot(obj) == pytest.approx(_snapshot(expected), rel=1e-9, abs=1e-9)
+
+
+def test_result_store_holds_every_combination(tmp_path):
+    from freecad.StructureTools.result_store import ResultStore
+
+    obj = _ns(ListElements=_elements(), LengthUnit='m', ForceUnit='kN', selfWeight=True, Name='Calc',
+              Document=_ns(FileName=str(tmp_path / 'frame.FCStd')),
+              NumPointsMoment=4, NumPointsShear=4, NumPointsAxial=3, NumPointsTorque=3, NumPointsDeflection=3)
+    proxy = Calc(obj, elements=None)
+    obj.LoadCombination = '106_0.6DL+W(X+)'
+    obj.SolveAllCombinations = True
+    proxy.execute(obj)
+
+    store = ResultStore.load(obj.ResultStoreFile)
+    assert obj.ResultStoreFile == str(tmp_path / 'frame.Calc.results')
+    assert store.get('MomentZ').shape == (3, len(calc.LOAD_COMBINATIONS), obj.NumPointsMoment)
+    assert store.get('AxialForce').shape[2] == obj.NumPointsAxial
+    assert store.get('Reactions').shape == (len(proxy.model.nodes), len(calc.LOAD_COMBINATIONS), 6)
+
+    # With a saved store the string properties are left empty and readers go through the store
+    expected = _run('106_0.6DL+W(X+)', solve_all=False)[1]
+    assert obj.MomentZ == [] and all(result['momentZ'] == [] for result in obj.MemberResults)
+    proxy.resultStore = None  # As after reopening the document
+    moments = proxy.resultSeries(obj, 'MomentZ')
+    assert moments == [[float(v) for v in series.split(',')] for series in expected.MomentZ]
+    assert [result['momentZ'] for result in json.loads(proxy.member_results_to_json(obj))] == moments
+    reactions = proxy.getResultStore(obj).matrix('Reactions', '106_0.6DL+W(X+)')
+    assert sorted(reactions[:, 0][reactions[:, 0] != 0]) == pytest.approx(sorted(expected.ReactionX))
+
+
+def test_recompute_only_redoes_stages_whose_inputs_changed():
+    proxy, obj = _run('100_DL', solve_all=False)
+    model = proxy.model
+    assert all(obj.StageTimes[stage] is not None for stage in ('model', 'solve', 'extract'))
+
+    # Nothing changed, so nothing is redone
+    proxy.execute(obj)
+    assert proxy.model is model
+    assert obj.StageTimes == {'model': None, 'mesh': None, 'solve': None, 'extract': None}
+
+    # New diagram points only need the results of the same model to be extracted again
+    obj.NumPointsMoment = 6
+    proxy.execute(obj)
+    assert proxy.model is model and obj.StageTimes['solve'] is None and obj.StageTimes['extract'] is not None
+    assert all(len(series.split(',')) == 6 for series in obj.MomentZ)
+
+    # A changed load means the model is built and solved again
+    vertical = sum(obj.ReactionY)
+    obj.ListElements[-3].NodalLoading = _Quantity(20000)
+    proxy.execute(obj)
+    assert proxy.model is not model and obj.StageTimes['solve'] is not None
+    assert abs(sum(obj.ReactionY) - vertical) == pytest.approx(10)
@@ -0,0 +1,69 @@
+import types
+
+from freecad.StructureTools import calc
+from freecad.StructureTools.calc import Calc, NodeIndex, _find_matching_node_index
+from freecad.StructureTools.Pynite_main.FEModel3D import FEModel3D
+
+
+class _Quantity:
+    def __init__(self, value, unit=None):
+        self.value = float(value)
+
+    def getValueAs(self, unit):
+        # Document coordinates are in mm, the model is built in m
+        return self.value/1000
+
+
+def _vertex(x, y, z):
+    return types.SimpleNamespace(Point=types.SimpleNamespace(x=x, y=y, z=z))
+
+
+def _line(name, *points):
+    edges = [types.SimpleNamespace(Vertexes=[_vertex(*a), _vertex(*b)]) for a, b in zip(points[:-1], points[1:])]
+    return types.SimpleNamespace(Name=name, Shape=types.SimpleNamespace(Edges=edges),
+                                 MaterialMember=types.SimpleNamespace(Name='Steel'),
+                                 SectionMember=types.SimpleNamespace(Name='W'), TrussMember=False)
+
+
+def test_node_index_lookups():
+    nodes_map = [[0.0, 0.0, 0.0], [1.0, 2.0, 3.0], [1.0, 2.0, 3.005]]
+    index = NodeIndex(nodes_map)
+
+    assert index.index([1.0, 2.0, 3.0]) == 1
+    assert index.get([5.0, 5.0, 5.0]) is None
+    assert index.add([1.0, 2.0, 3.0]) == 1
+    assert index.add([4.0, 0.0, 0.0]) == 3 and len(nodes_map) == 4
+
+    # Tolerance lookups return the first matching node, like a scan of the list would
+    assert index.find([1.004, 2.0, 3.004], tol=1e-2) == 1
+    assert index.find([1.0, 2.0, 3.012], tol=1e-2) == 2
+    assert index.find([1.0, 2.0, 3.03], tol=1e-2) is None
+
+    # Nodes appended to the list directly are picked up on the next lookup
+    nodes_map.append([-0.5, 0.0, 0.0])
+    assert _find_matching_node_index(nodes_map, [-0.501, 0.0, 0.0], tol=1e-2, index=index) == 4
+    assert _find_matching_node_index(nodes_map, [-0.501, 0.0, 0.0], tol=1e-4) is None
+
+
+def test_map_nodes_members_and_supports(monkeypatch):
+    monkeypatch.setattr(calc, 'App', types.SimpleNamespace(Units=types.SimpleNamespace(Quantity=_Quantity)))
+    lines = [_line('Line', (0, 0, 3000), (0, 0, 0)), _line('Wire', (0, 0, 3000), (4000, 0, 3000), (4000, 0, 0))]
+
+    proxy = Calc.__new__(Calc)
+    nodes_map = proxy.mapNodes(lines, 'm')
+    assert nodes_map == [[0.0, 3.0, 0.0], [0.0, 0.0, 0.0], [4.0, 3.0, 0.0], [4.0, 0.0, 0.0]]
+
+    members_map = proxy.mapMembers(lines, nodes_map, 'm')
+    assert members_map['Line_0']['nodes'] == ['1', '0']
+    assert members_map['Wire_0']['nodes'] == ['0', '2']
+    assert members_map['Wire_1']['nodes'] == ['3', '2']
+
+    model = FEModel3D()
+    proxy.setNodes(model, nodes_map)
+    base = types.SimpleNamespace(Shape=types.SimpleNamespace(Vertexes=[_vertex(0, 0, 0), types.SimpleNamespace(Point=(4000, 0, 0))]))
+    support = types.SimpleNamespace(Label='Suport', ObjectBase=[(base, ('Vertex2',))],
+                                    FixTranslationX=True, FixTranslationY=True, FixTranslationZ=True,
+                                    FixRotationX=False, FixRotationY=False, FixRotationZ=False)
+    proxy.setSuports(model, [support], nodes_map, 'm')
+    assert model.nodes['3'].support_DX and model.nodes['3'].support_DY
+    assert not model.nodes['1'].support_DX
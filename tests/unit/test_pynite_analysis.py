@@ -0,0 +1,606 @@
+import numpy as np
+import pytest
+
+from freecad.StructureTools.Pynite_main.FEModel3D import FEModel3D
+
+
+def _build_frame():
+    model = FEModel3D()
+    model.add_material('Steel', 29000, 11200, 0.3, 0.49e-3)
+    model.add_section('W', 10, 100, 150, 5)
+
+    for i in range(3):
+        model.add_node(f'B{i}', i*120, 0, 0)
+        model.add_node(f'T{i}', i*120, 0, 144)
+        model.add_member(f'C{i}', f'B{i}', f'T{i}', 'Steel', 'W')
+        model.def_support(f'B{i}', True, True, True, True, True, True)
+    model.add_member('G1', 'T0', 'T1', 'Steel', 'W')
+    model.add_member('G2', 'T1', 'T2', 'Steel', 'W')
+
+    model.add_node_load('T0', 'FX', 10, 'W')
+    model.add_node_load('T1', 'FZ', -5, 'D')
+    model.add_member_dist_load('G1', 'Fy', -0.1, -0.2, case='D')
+    model.add_member_pt_load('G2', 'Fy', -3, 40, case='L')
+    model.def_node_disp('T2', 'DY', 0.01)
+
+    model.add_load_combo('1.4D', {'D': 1.4})
+    model.add_load_combo('1.2D+1.6L', {'D': 1.2, 'L': 1.6})
+    model.add_load_combo('0.9D+W', {'D': 0.9, 'W': 1.0})
+    return model
+
+
+def _results(model):
+    results = []
+    for combo in model.load_combos:
+        for node in model.nodes.values():
+            results += [node.DX[combo], node.DY[combo], node.DZ[combo], node.RZ[combo],
+                        node.RxnFX[combo], node.RxnFY[combo], node.RxnMZ[combo]]
+        for member in model.members.values():
+            results += [member.max_moment('Mz', combo), member.min_shear('Fy', combo)]
+    return np.array(results)
+
+
+def test_superposition_matches_per_combination_solve():
+    expected = _build_frame()
+    expected.analyze_linear()
+
+    for sparse in (True, False):
+        model = _build_frame()
+        model.analyze_linear(sparse=sparse, superposition=True)
+        assert np.allclose(_results(model), _results(expected), rtol=1e-9, atol=1e-12)
+        assert model.solution == 'Linear'
+        # The temporary load case combinations must not leak into the model
+        assert list(model.load_combos) == ['1.4D', '1.2D+1.6L', '0.9D+W']
+
+
+def test_linear_solver_reuses_and_updates_factorization():
+    from scipy.sparse import random as sparse_random, identity
+    from freecad.StructureTools.Pynite_main.Solver import LinearSolver
+
+    A = sparse_random(40, 40, density=0.1, random_state=1)
+    K = (A @ A.T + 40*identity(40)).tocsc()
+    R = np.arange(80, dtype=float).reshape(40, 2)
+
+    solver = LinearSolver(backend='splu')
+    assert np.allclose(K @ solver.solve(K, R), R)
+    assert np.allclose(K @ solver.solve(K.tolil(), R[:, :1]), R[:, :1])
+    assert solver.factorizations == 1
+
+    # Softening a few degrees of freedom is handled as a low-rank update
+    K2 = K.tolil()
+    K2[3, 3] -= 5.0
+    K2[3, 7] += 1.0
+    K2[7, 3] += 1.0
+    K2 = K2.tocsc()
+    assert np.allclose(K2 @ solver.solve(K2, R), R)
+    assert solver.factorizations == 1
+    assert solver.updates == 1
+
+    # Returning to the original matrix drops the update again
+    assert np.allclose(K @ solver.solve(K, R), R)
+    assert solver.factorizations == 1
+
+    # A change touching more degrees of freedom than allowed triggers a refactorization
+    solver.max_update_rank = 0
+    assert np.allclose(K2 @ solver.solve(K2, R), R)
+    assert solver.factorizations == 2
+
+
+def test_stability_check_reports_every_unstable_dof():
+    import pytest
+
+    model = FEModel3D()
+    model.add_material('Steel', 29000, 11200, 0.3, 0.49e-3)
+    model.add_section('W', 10, 100, 150, 5)
+    model.add_node('A', 0, 0, 0)
+    model.add_node('B', 120, 0, 0)
+    model.add_node('C', 240, 0, 0)  # Not connected to anything
+    model.add_member('M1', 'A', 'B', 'Steel', 'W')
+    model.def_releases('M1', Rxj=True, Ryj=True, Rzj=True)
+    model.def_support('A', True, True, True, True, True, True)
+    model.def_support('C', True, True, True, False, False, False)
+
+    with pytest.raises(Exception, match='Unstable node'):
+        model.analyze_linear()
+
+    assert model.unstable_dofs == [('B', 'RX'), ('B', 'RY'), ('B', 'RZ'),
+                                   ('C', 'RX'), ('C', 'RY'), ('C', 'RZ')]
+
+    # A stable model clears the report
+    model = _build_frame()
+    model.analyze_linear()
+    assert model.unstable_dofs == []
+
+
+def test_reactions_match_element_end_forces():
+    model = _build_frame()
+    model.add_node('S', 0, 0, -60)
+    model.add_spring('K1', 'S', 'B0', 100)
+    model.def_support('S', True, True, True, True, True, True)
+    model.add_member('BR', 'B1', 'T2', 'Steel', 'W', tension_only=True)
+    model.analyze()
+
+    # The tension-only brace is switched off for at least one combination
+    assert not all(model.members['BR'].active.values())
+
+    for combo in model.load_combos:
+        for node_name in ('B0', 'B1', 'B2', 'S'):
+            node = model.nodes[node_name]
+            expected = np.zeros(6)
+            for spring in model.springs.values():
+                if spring.active[combo]:
+                    if spring.i_node is node: expected += spring.F(combo)[:6, 0]
+                    if spring.j_node is node: expected += spring.F(combo)[6:, 0]
+            for phys_member in model.members.values():
+                if phys_member.active[combo]:
+                    for member in phys_member.sub_members.values():
+                        if member.i_node is node: expected += member.F(combo)[:6, 0]
+                        if member.j_node is node: expected += member.F(combo)[6:, 0]
+            expected *= [node.support_DX, node.support_DY, node.support_DZ,
+                         node.support_RX, node.support_RY, node.support_RZ]
+
+            reactions = [node.RxnFX[combo], node.RxnFY[combo], node.RxnFZ[combo],
+                         node.RxnMX[combo], node.RxnMY[combo], node.RxnMZ[combo]]
+            assert np.allclose(reactions, expected, atol=1e-9)
+
+
+def test_result_arrays_match_individual_result_methods():
+    n_points = {'Fy': 4, 'Fz': 4, 'My': 5, 'Mz': 5, 'axial': 3, 'torque': 3, 'dy': 6, 'dz': 6}
+    single = {'Fy': 'shear', 'Fz': 'shear', 'My': 'moment', 'Mz': 'moment', 'dy': 'deflection', 'dz': 'deflection'}
+
+    for analyze in ('analyze_linear', 'analyze_PDelta'):
+        model = _build_frame()
+        getattr(model, analyze)()
+
+        for combo in model.load_combos:
+            for member in model.members.values():
+                arrays, extremes = member.result_arrays(n_points, combo)
+                for result, n in n_points.items():
+                    if result in single:
+                        name = single[result]
+                        expected = getattr(member, name + '_array')(result, n, combo)
+                        bounds = (getattr(member, 'min_' + name)(result, combo), getattr(member, 'max_' + name)(result, combo))
+                    else:
+                        expected = getattr(member, result + '_array')(n, combo)
+                        bounds = (getattr(member, 'min_' + result)(combo), getattr(member, 'max_' + result)(combo))
+                    assert np.allclose(arrays[result], expected, rtol=1e-9, atol=1e-12)
+                    assert np.allclose(extremes[result], bounds, rtol=1e-9, atol=1e-12)
+
+
+def test_worker_processes_match_sequential_analysis():
+    def build():
+        model = _build_frame()
+        model.add_member('BR', 'B0', 'T1', 'Steel', 'W', tension_only=True)
+        model.add_load_combo('0.9D-W', {'D': 0.9, 'W': -1.0})
+        return model
+
+    for analyze in ('analyze', 'analyze_PDelta'):
+        expected = build()
+        getattr(expected, analyze)()
+        model = build()
+        getattr(model, analyze)(workers=2)
+
+        assert np.allclose(_results(model), _results(expected), rtol=1e-9, atol=1e-12)
+        for combo in model.load_combos:
+            assert model.members['BR'].active[combo] == expected.members['BR'].active[combo]
+        assert not all(model.members['BR'].active.values())
+
+
+def test_pdelta_reuses_elastic_stiffness_and_reports_convergence():
+    from freecad.StructureTools.Pynite_main import Analysis
+
+    def build():
+        model = _build_frame()
+        model.add_member('BR', 'B0', 'T1', 'Steel', 'W', tension_only=True)
+        model.add_node_load('T2', 'FZ', -300, 'D')
+        return model
+
+    for sparse in (True, False):
+        # The original engine: exactly two iterations, reassembling everything on each
+        expected = build()
+        Analysis._prepare_model(expected)
+        D1_indices, D2_indices, D2 = Analysis._partition_D(expected)
+        for combo in expected.load_combos:
+            FER1, FER2 = Analysis._partition(expected, expected.FER(combo), D1_indices, D2_indices)
+            P1, P2 = Analysis._partition(expected, expected.P(combo), D1_indices, D2_indices)
+            Analysis._PDelta_step(expected, combo, P1, FER1, D1_indices, D2_indices, D2, False, sparse)
+        Analysis._calc_reactions(expected)
+
+        # Stopping after two iterations reproduces it
+        model = build()
+        model.analyze_PDelta(sparse=sparse, tol=float('inf'))
+        assert np.allclose(_results(model), _results(expected), rtol=1e-9, atol=1e-9)
+
+        # Iterating to convergence records the history of each combination
+        model = build()
+        model.analyze_PDelta(sparse=sparse, tol=1e-6)
+        for combo, history in model.pdelta_history.items():
+            assert [step[0] for step in history] == list(range(1, len(history) + 1))
+            assert history[-1][1] <= 1e-6 and history[-1][2] <= 1e-6
+        assert np.allclose(_results(model), _results(expected), rtol=1e-2, atol=1e-6)
+
+
+def test_segment_cache_segments_each_member_once_per_combination(monkeypatch):
+    from freecad.StructureTools.Pynite_main.Member3D import Member3D
+
+    model = _build_frame()
+    for i in range(50):
+        model.add_load_combo(f'C{i}', {'D': 1.0 + i/10, 'L': 0.5, 'W': (-1)**i})
+    model.analyze_linear(check_stability=False)
+    expected = {combo: [member.moment('Mz', 30, combo) for member in model.members.values()]
+                for combo in model.load_combos}
+
+    calls = []
+    segment_member = Member3D._segment_member
+    monkeypatch.setattr(Member3D, '_segment_member', lambda self, combo_name='Combo 1': (
+        calls.append((self.name, combo_name)), segment_member(self, combo_name)))
+    model.analyze_linear(check_stability=False)
+
+    # Alternating queries across every combination reuse the cached segments
+    for _ in range(2):
+        for combo in model.load_combos:
+            for member in model.members.values():
+                member.shear('Fy', 30, combo)
+                member.moment('Mz', 30, combo)
+    for combo in model.load_combos:
+        assert [member.moment('Mz', 30, combo) for member in model.members.values()] == expected[combo]
+    assert len(calls) == len(set(calls)) == 5*len(model.load_combos)
+
+    # A smaller cache evicts the least recently used combinations
+    model.segment_cache_size = 2
+    member = next(iter(model.members['G1'].sub_members.values()))
+    for combo in ('1.4D', '1.2D+1.6L', '0.9D+W', '1.4D'):
+        member.moment('Mz', 30, combo)
+    assert list(member._segment_cache) == ['0.9D+W', '1.4D']
+
+
+@pytest.mark.parametrize('analysis', ['analyze_linear', 'analyze_PDelta'])
+def test_extrema_are_exact_and_located(analysis):
+    model = _build_frame()
+
+    # A concentrated moment makes the moment jump between two segments of the column
+    model.add_member_pt_load('C1', 'My', 2000, 70, case='W')
+    getattr(model, analysis)(check_stability=False)
+    single = {'Fy': 'shear', 'Fz': 'shear', 'My': 'moment', 'Mz': 'moment', 'dy': 'deflection', 'dz': 'deflection'}
+
+    for combo in model.load_combos:
+        for member in model.members.values():
+            for result, ((v_min, x_min), (v_max, x_max)) in member.extrema(combo).items():
+                if result in single:
+                    sampled = getattr(member, single[result] + '_array')(result, 2001, combo)[1]
+                    at = lambda x: getattr(member, single[result])(result, x, combo)
+                else:
+                    sampled = getattr(member, result + '_array')(2001, combo)[1]
+                    at = lambda x: getattr(member, result)(x, combo)
+
+                # The exact extremes bound the sampled values, and are found where they occur
+                scale = max(abs(sampled).max(), 1e-12)
+                assert v_min <= sampled.min() + 1e-12*scale and v_max >= sampled.max() - 1e-12*scale
+                assert v_min == pytest.approx(sampled.min(), abs=1e-3*scale)
+                assert v_max == pytest.approx(sampled.max(), abs=1e-3*scale)
+                assert at(x_min) == pytest.approx(v_min, rel=1e-9, abs=1e-12*scale)
+                assert at(x_max) == pytest.approx(v_max, rel=1e-9, abs=1e-12*scale)
+
+    # The span moment of the loaded girder peaks between the points a sampled search would check
+    (m_min, x_min), _ = model.members['G1'].extrema('1.4D', ['Mz'])['Mz']
+    assert 0 < x_min < 120
+    assert m_min < min(model.members['G1'].moment('Mz', x, '1.4D') for x in np.linspace(0, 120, 7))
+
+    # Both sides of the jump are reported where `moment` gives them
+    (m_min, x_min), (m_max, x_max) = model.members['C1'].extrema('0.9D+W', ['My'])['My']
+    assert x_min == 70 and x_max == pytest.approx(70) and x_max < 70
+    assert m_max - m_min > 1900
+
+
+def test_batched_quad_and_plate_stiffness_match_element_matrices():
+    from freecad.StructureTools.Pynite_main.Quad3D import Quad3D
+    from freecad.StructureTools.Pynite_main.Plate3D import Plate3D
+
+    model = FEModel3D()
+    model.add_material('Concrete', 3600, 1500, 0.2, 0.15e-3)
+
+    # A skewed, slightly warped quad and a rotated rectangular plate, with orthotropic modifiers
+    for name, X in (('q', [(0, 0, 0), (50, 5, 0), (60, 40, 3), (-5, 35, 0)]),
+                    ('p', [(0, 0, 100), (0, 48, 100), (0, 48, 130), (0, 0, 130)])):
+        for i, (x, y, z) in enumerate(X):
+            model.add_node(f'{name}{i}', x, y, z)
+    model.add_quad('Q1', 'q0', 'q1', 'q2', 'q3', 6, 'Concrete', kx_mod=0.8, ky_mod=1.2)
+    model.add_plate('P1', 'p0', 'p1', 'p2', 'p3', 8, 'Concrete', kx_mod=0.5)
+
+    quad, plate = model.quads['Q1'], model.plates['P1']
+    np.testing.assert_allclose(Quad3D.batch_K([quad, quad])[1], quad.K(), rtol=0, atol=1e-12*np.abs(quad.K()).max())
+    np.testing.assert_allclose(Plate3D.batch_K([plate])[0], plate.K(), rtol=0, atol=1e-12*np.abs(plate.K()).max())
+
+
+def test_element_matrices_are_cached_until_the_model_changes():
+    model = _build_frame()
+    model.analyze_linear()
+    member = next(iter(model.members['G1'].sub_members.values()))
+    K = member.K()
+
+    # Analyzing again reuses the matrices, and they can't be modified in place
+    model.analyze_linear()
+    member = next(iter(model.members['G1'].sub_members.values()))
+    assert member.K() is K
+    with pytest.raises(ValueError):
+        K[0, 0] = 0
+
+    # Editing the model through its methods, or a material directly, invalidates them
+    model.def_releases('G1', Rzj=True)
+    model.materials['Steel'].E = 2*29000
+    model.analyze_linear()
+    edited = _results(model)
+
+    fresh = _build_frame()
+    fresh.def_releases('G1', Rzj=True)
+    fresh.materials['Steel'].E = 2*29000
+    fresh.analyze_linear()
+    np.testing.assert_allclose(edited, _results(fresh), rtol=1e-12, atol=1e-12)
+    assert not np.allclose(next(iter(model.members['G1'].sub_members.values())).K(), K)
+
+
+
+def test_moving_nodes_and_editing_plates_invalidates_cached_matrices():
+    def build(edit=False):
+        model = _build_frame()
+        model.add_node('P0', 0, 200, 0)
+        model.add_node('P1', 120, 200, 0)
+        model.add_node('P2', 120, 200, 144)
+        model.add_node('P3', 0, 200, 144)
+        model.add_quad('Q1', 'P0', 'P1', 'P2', 'P3', 6, 'Steel')
+        model.add_plate('R1', 'P0', 'P1', 'P2', 'P3', 4, 'Steel')
+        for name in ('P0', 'P1'):
+            model.def_support(name, True, True, True, True, True, True)
+        model.add_node_load('P2', 'FY', 2, 'W')
+        if edit:
+            model.nodes['T2'].X += 30
+            model.quads['Q1'].t = 8
+            model.plates['R1'].kx_mod = 0.5
+        return model
+
+    # Edit a model that has already been analyzed, so its matrices are cached
+    model = build()
+    model.analyze_linear()
+    model.nodes['T2'].X += 30
+    model.quads['Q1'].t = 8
+    model.plates['R1'].kx_mod = 0.5
+    model.analyze_linear()
+
+    fresh = build(edit=True)
+    fresh.analyze_linear()
+    np.testing.assert_allclose(_results(model), _results(fresh), rtol=1e-12, atol=1e-12)
+    for name in ('P2', 'P3'):
+        assert model.nodes[name].DY['0.9D+W'] == pytest.approx(fresh.nodes[name].DY['0.9D+W'], rel=1e-12)
+
+@pytest.mark.parametrize('element_type', ['Quad', 'Rect'])
+def test_mesh_results_match_element_results(element_type):
+    from freecad.StructureTools.Pynite_main.Mesh import RectangleMesh
+
+    model = FEModel3D()
+    model.add_material('Concrete', 3600, 1500, 0.2, 0.15e-3)
+    mesh = RectangleMesh(24, 72, 48, 6, 'Concrete', model, kx_mod=0.8, plane='XZ',
+                         element_type=element_type, start_element='E1')
+    model.meshes['MSH1'] = mesh
+    mesh.generate()
+
+    for node in mesh.nodes.values():
+        if node.X in (0, 72):
+            model.def_support(node.name, True, True, True, False, False, False)
+    for element in mesh.elements.values():
+        if element_type == 'Quad':
+            model.add_quad_surface_pressure(element.name, 0.01, 'D')
+        else:
+            model.add_plate_surface_pressure(element.name, 0.01, 'D')
+    model.add_node_load(list(mesh.nodes)[5], 'FX', 3, 'W')
+    model.add_load_combo('D', {'D': 1.4})
+    model.add_load_combo('D+W', {'D': 0.9, 'W': 1.0})
+    model.analyze_linear(check_stability=False)
+
+    envelope = mesh.envelope('D+W')
+    for direction, result, local, i in (('Qy', 'shear', True, 1), ('MX', 'moment', False, 0),
+                                        ('Mxy', 'moment', True, 2), ('Sx', 'membrane', True, 0)):
+        values = []
+        for element in mesh.elements.values():
+            if element_type == 'Quad':
+                points = [(-1, -1), (1, -1), (1, 1), (-1, 1), (0, 0)]
+            else:
+                w, h = element.width(), element.height()
+                points = [(0, 0), (w, 0), (w, h), (0, h), (w/2, h/2)]
+            values += [getattr(element, result)(x, y, local, 'D+W')[i, 0] for x, y in points]
+
+        expected = (min(values), max(values))
+        assert getattr(mesh, 'min_' + result)(direction, 'D+W') == pytest.approx(expected[0], rel=1e-9)
+        assert getattr(mesh, 'max_' + result)(direction, 'D+W') == pytest.approx(expected[1], rel=1e-9)
+        assert envelope[direction] == pytest.approx(expected, rel=1e-9)
+
+
+def test_node_contours_average_element_corner_results():
+    from freecad.StructureTools.Pynite_main.Contour import _node_contours
+
+    model = FEModel3D()
+    model.add_material('Concrete', 3600, 1500, 0.2, 0.15e-3)
+
+    # A 3x2 grid: quads on the left, plates on the right, and a free node off the grid
+    for i in range(4):
+        for j in range(3):
+            model.add_node(f'N{i}{j}', 24*i, 0, 20*j)
+    model.add_node('Free', 0, 100, 0)
+    for i in range(3):
+        for j in range(2):
+            nodes = (f'N{i}{j}', f'N{i + 1}{j}', f'N{i + 1}{j + 1}', f'N{i}{j + 1}')
+            if i < 2:
+                model.add_quad(f'Q{i}{j}', *nodes, 6, 'Concrete')
+                model.add_quad_surface_pressure(f'Q{i}{j}', 0.01)
+            else:
+                model.add_plate(f'P{i}{j}', *nodes, 6, 'Concrete')
+                model.add_plate_surface_pressure(f'P{i}{j}', 0.01)
+    for j in range(3):
+        model.def_support(f'N0{j}', True, True, True, True, True, True)
+    model.def_support('Free', True, True, True, True, True, True)
+    model.add_node_load('N32', 'FX', 2)
+    model.analyze_linear(check_stability=False)
+
+    elements = list(model.quads.values()) + list(model.plates.values())
+    for result, i, local in (('moment', 1, True), ('shear', 0, False), ('membrane', 2, True), ('dz', 0, True)):
+        contours = _node_contours(model, result, i, local, 'Combo 1')
+        assert _node_contours(model, result, i, local, 'Combo 1') is contours
+
+        corners = {name: [] for name in model.nodes}
+        for element in elements:
+            if element.type == 'Rect':
+                points = [(0, 0), (element.width(), 0), (element.width(), element.height()), (0, element.height())]
+            else:
+                points = [(-1, -1), (1, -1), (1, 1), (-1, 1)]
+            nodes = (element.i_node, element.j_node, element.m_node, element.n_node)
+            for node, (x, y), k in zip(nodes, points, (2, 8, 14, 20)):
+                if result == 'dz':
+                    corners[node.name].append(element.d('Combo 1')[k, 0])
+                else:
+                    corners[node.name].append(getattr(element, result)(x, y, local, 'Combo 1')[i, 0])
+
+        for node in model.nodes.values():
+            if corners[node.name]:
+                assert contours[node.ID] == pytest.approx(np.mean(corners[node.name]), rel=1e-9, abs=1e-12)
+            else:
+                assert np.isnan(contours[node.ID])
+
+    # The 'dz' contour at each node is that node's own displacement normal to the grid, for quads
+    # as well as plates (their corners are in i, j, m, n order)
+    contours = _node_contours(model, 'dz', 0, True, 'Combo 1')
+    for element in elements:
+        normal = element.T()[2, :3]
+        for node in (element.i_node, element.j_node, element.m_node, element.n_node):
+            D = np.array([node.DX['Combo 1'], node.DY['Combo 1'], node.DZ['Combo 1']])
+            assert contours[node.ID] == pytest.approx(normal @ D, rel=1e-9, abs=1e-12)
+
+
+def test_partition_matches_direct_slicing():
+    from freecad.StructureTools.Pynite_main import Analysis
+
+    model = _build_frame()
+    model.analyze_linear()
+    D1_indices, D2_indices, D2 = Analysis._partition_D(model)
+
+    # Enforced displacements take precedence over supports
+    assert model.nodes['T2'].ID*6 + 1 in D2_indices
+    assert D2[list(D2_indices).index(model.nodes['T2'].ID*6 + 1), 0] == 0.01
+    assert sorted(np.concatenate((D1_indices, D2_indices))) == list(range(len(model.nodes)*6))
+
+    K = model.K('1.4D', sparse=False)
+    for unp_matrix in (K, model.K('1.4D', sparse=True)):
+        blocks = Analysis._partition(model, unp_matrix, D1_indices, D2_indices)
+        for block, (rows, cols) in zip(blocks, ((D1_indices, D1_indices), (D1_indices, D2_indices),
+                                                (D2_indices, D1_indices), (D2_indices, D2_indices))):
+            block = block.toarray() if hasattr(block, 'toarray') else block
+            np.testing.assert_allclose(block, K[np.ix_(rows, cols)], rtol=0, atol=1e-9)
+
+
+def test_node_reordering_reduces_bandwidth_without_changing_results():
+
+    def build(reorder):
+        model = FEModel3D()
+        model.add_material('Concrete', 3600, 1500, 0.2, 0.15e-3)
+        model.add_section('Beam', 50, 200, 300, 100)
+        model.reorder_nodes = reorder
+
+        # Add the nodes of a 6x6 slab in a scrambled order, with a beam along one edge
+        names = [(i, j) for i in range(7) for j in range(7)]
+        for i, j in np.random.default_rng(0).permutation(names):
+            model.add_node(f'N{i}_{j}', 24*i, 24*j, 0)
+        for i in range(6):
+            for j in range(6):
+                model.add_quad(f'Q{i}_{j}', f'N{i}_{j}', f'N{i + 1}_{j}', f'N{i + 1}_{j + 1}', f'N{i}_{j + 1}', 6, 'Concrete')
+                model.add_quad_surface_pressure(f'Q{i}_{j}', 0.01)
+        model.add_member('B1', 'N0_6', 'N6_6', 'Concrete', 'Beam')
+        for i in range(7):
+            model.def_support(f'N{i}_0', True, True, True, True, True, True)
+        model.analyze_linear(check_stability=False)
+        return model
+
+    reordered, original = build(True), build(False)
+
+    bandwidth, profile = reordered.node_ordering['bandwidth'], reordered.node_ordering['profile']
+    assert bandwidth[1] < bandwidth[0] and profile[1] < profile[0]
+    assert original.node_ordering == {}
+
+    # Models below the size threshold aren't renumbered automatically
+    small = _build_frame()
+    small.reorder_nodes = None
+    small.analyze_linear()
+    assert small.node_ordering == {}
+    assert [node.ID for node in reordered.nodes.values()] != list(range(len(reordered.nodes)))
+
+    for name, node in original.nodes.items():
+        other = reordered.nodes[name]
+        assert other.DZ['Combo 1'] == pytest.approx(node.DZ['Combo 1'], rel=1e-9, abs=1e-12)
+        assert other.RxnMY['Combo 1'] == pytest.approx(node.RxnMY['Combo 1'], rel=1e-9, abs=1e-9)
+    assert reordered.members['B1'].max_moment('Mz') == pytest.approx(original.members['B1'].max_moment('Mz'), rel=1e-9)
+
+
+def test_load_vectors_are_cached_per_load_case():
+    model = _build_frame()
+    model.analyze_linear()
+
+    # Each combination's vectors match the elements' own fixed end reactions and the nodal loads
+    for name, combo in model.load_combos.items():
+        FER = np.zeros((len(model.nodes)*6, 1))
+        for phys_member in model.members.values():
+            for member in phys_member.sub_members.values():
+                dofs = [member.i_node.ID*6 + k for k in range(6)] + [member.j_node.ID*6 + k for k in range(6)]
+                FER[dofs] += member.FER(name)
+        P = np.zeros((len(model.nodes)*6, 1))
+        for node in model.nodes.values():
+            for direction, value, case in node.NodeLoads:
+                P[node.ID*6 + ['FX', 'FY', 'FZ', 'MX', 'MY', 'MZ'].index(direction)] += combo.factors.get(case, 0)*value
+        assert np.allclose(model.FER(name), FER)
+        assert np.allclose(model.P(name), P)
+
+    # The vectors are calculated once for all the combinations
+    cached = model._load_vectors
+    model.P('1.4D'), model.FER('0.9D+W')
+    assert model._load_vectors is cached
+    assert list(cached[1]) == ['D', 'L', 'W']
+
+    # Adding a load invalidates them
+    model.add_node_load('T2', 'FZ', -2, 'L')
+    assert model.P('1.2D+1.6L')[model.nodes['T2'].ID*6 + 2, 0] == pytest.approx(-3.2)
+    assert model._load_vectors is not cached
+
+
+def test_node_results_are_views_of_the_global_result_vectors():
+    model = _build_frame()
+    model.analyze_linear()
+
+    # Superimposed load combinations share one array of displacements, one column per combination
+    assert model.D('1.4D').base is model.D('0.9D+W').base
+
+    for combo in model.load_combos:
+        D, R = model.D(combo), model.R(combo)
+        for node in model.nodes.values():
+            dofs = slice(node.ID*6, node.ID*6 + 6)
+            assert [node.DX[combo], node.DY[combo], node.DZ[combo], node.RX[combo], node.RY[combo], node.RZ[combo]] == list(D[dofs, 0])
+            assert [node.RxnFX[combo], node.RxnFY[combo], node.RxnFZ[combo], node.RxnMX[combo], node.RxnMY[combo], node.RxnMZ[combo]] == list(R[dofs, 0])
+        member = model.members['G1'].sub_members['G1a']
+        assert np.array_equal(member.D(combo)[:, 0], D[[member.i_node.ID*6 + k for k in range(6)] + [member.j_node.ID*6 + k for k in range(6)], 0])
+
+    # Unsupported nodes have no reactions, and the views behave like dictionaries
+    assert dict(model.nodes['T1'].RxnFZ) == {combo: 0 for combo in model.load_combos}
+    assert '1.4D' in model.nodes['T1'].DZ and len(model.nodes['T1'].DZ) == 3
+
+    model.delete_loads()
+    assert dict(model.nodes['T1'].DZ) == {} and dict(model.nodes['B0'].RxnFX) == {}
+
+
+def test_member_arrays_follow_reanalysis_after_load_change():
+    model = _build_frame()
+    model.analyze_linear(check_stability=False)
+    member = model.members['G1']
+    before = {combo: member.moment_array('Mz', 3, combo)[1] for combo in ('1.4D', '1.2D+1.6L')}
+
+    # Re-analyzing with a changed load must not return the segments of the previous analysis
+    model.add_member_dist_load('G1', 'Fy', -1, -1, case='D')
+    model.analyze_linear(check_stability=False)
+    for combo in ('1.4D', '1.2D+1.6L'):
+        x, M = member.moment_array('Mz', 3, combo)
+        assert not np.allclose(M, before[combo])
+        assert np.allclose(M, [member.moment('Mz', xi, combo) for xi in x])
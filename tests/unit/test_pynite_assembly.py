@@ -0,0 +1,105 @@
+import numpy as np
+
+from freecad.StructureTools.Pynite_main.FEModel3D import FEModel3D
+from freecad.StructureTools.Pynite_main.Analysis import _prepare_model
+
+
+def _build_model():
+    model = FEModel3D()
+    model.add_material('Steel', 29000, 11200, 0.3, 0.49e-3)
+    model.add_material('Concrete', 3600, 1500, 0.17, 0.15e-3)
+    model.add_section('W', 10, 100, 150, 5)
+
+    model.add_node('N1', 0, 0, 0)
+    model.add_node('N2', 0, 0, 120)
+    model.add_node('N3', 120, 0, 120)
+    model.add_node('N4', 120, 0, 0)
+    model.add_node('N5', 60, 0, 120)  # Splits the beam into two sub-members
+    model.add_node('N6', 0, 60, 120)
+    model.add_node('N7', 120, 60, 120)
+
+    model.add_member('C1', 'N1', 'N2', 'Steel', 'W')
+    model.add_member('B1', 'N2', 'N3', 'Steel', 'W')
+    model.add_member('C2', 'N4', 'N3', 'Steel', 'W')
+    model.add_spring('S1', 'N1', 'N3', 50)
+    model.add_quad('Q1', 'N2', 'N5', 'N7', 'N6', 6, 'Concrete')
+    model.add_plate('P1', 'N5', 'N3', 'N7', 'N6', 6, 'Concrete')
+
+    model.def_support('N1', True, True, True, True, True, True)
+    model.def_support('N4', True, True, True, True, True, True)
+    model.def_support_spring('N6', 'DZ', 25)
+
+    model.add_member_dist_load('B1', 'Fy', -0.1, -0.2, case='D')
+    model.add_member_pt_load('C1', 'Fx', -3, 40, case='D')
+    model.add_quad_surface_pressure('Q1', 0.01, 'D')
+    model.add_plate_surface_pressure('P1', 0.02, 'D')
+    model.add_load_combo('D', {'D': 1.0})
+
+    _prepare_model(model)
+    return model
+
+
+def _reference_K(model, combo_name):
+    # Term-by-term scatter, as the global stiffness matrix used to be assembled
+    n = len(model.nodes)*6
+    K = np.zeros((n, n))
+    elements = list(model.springs.values()) + list(model.quads.values()) + list(model.plates.values())
+    elements += [m for pm in model.members.values() for m in pm.sub_members.values()]
+    for element in elements:
+        nodes = [element.i_node, element.j_node]
+        if hasattr(element, 'm_node'):
+            nodes += [element.m_node, element.n_node]
+        dofs = [node.ID*6 + i for node in nodes for i in range(6)]
+        k = element.K()
+        for a, m in enumerate(dofs):
+            for b, n in enumerate(dofs):
+                K[m, n] += k[a, b]
+    node = model.nodes['N6']
+    K[node.ID*6 + 2, node.ID*6 + 2] += 25
+    return K
+
+
+def test_sparse_and_dense_K_match_term_by_term_scatter():
+    model = _build_model()
+    expected = _reference_K(model, 'D')
+
+    assert np.allclose(model.K('D', check_stability=False).toarray(), expected)
+    assert np.allclose(model.K('D', check_stability=False, sparse=False), expected)
+
+
+def test_K_skips_inactive_members():
+    model = _build_model()
+    full = model.K('D', check_stability=False).toarray()
+
+    model.members['B1'].active['D'] = False
+    reduced = model.K('D', check_stability=False).toarray()
+
+    for member in model.members['B1'].sub_members.values():
+        dofs = [node.ID*6 + i for node in (member.i_node, member.j_node) for i in range(6)]
+        reduced[np.ix_(dofs, dofs)] += member.K()
+    assert len(model.members['B1'].sub_members) == 2
+    assert np.allclose(reduced, full)
+
+
+def test_FER_and_Kg_assembly():
+    model = _build_model()
+    n = len(model.nodes)*6
+
+    # Quads compute their local coordinates when their stiffness is first requested
+    model.K('D', check_stability=False)
+
+    expected = np.zeros((n, 1))
+    elements = [m for pm in model.members.values() for m in pm.sub_members.values()]
+    for element in elements + list(model.quads.values()) + list(model.plates.values()):
+        nodes = [element.i_node, element.j_node]
+        if hasattr(element, 'm_node'):
+            nodes += [element.m_node, element.n_node]
+        dofs = [node.ID*6 + i for node in nodes for i in range(6)]
+        expected[dofs, :] += element.FER('D')
+    assert np.allclose(model.FER('D'), expected)
+
+    # With no axial force on the first step the geometric stiffness is all zeros
+    Kg = model.Kg('D')
+    assert Kg.shape == (n, n)
+    assert np.allclose(Kg.toarray(), 0)
+    assert np.allclose(model.Kg('D', sparse=False), 0)
@@ -0,0 +1,82 @@
+from freecad.StructureTools.Pynite_main.FEModel3D import FEModel3D
+from freecad.StructureTools.Pynite_main.Node3D import Node3D
+from freecad.StructureTools.Pynite_main.Analysis import _renumber
+
+
+def _grid_model():
+    model = FEModel3D()
+    model.add_material('Steel', 29000, 11200, 0.3, 0.49e-3)
+    model.add_section('W', 10, 100, 150, 5)
+    for i in range(6):
+        for j in range(6):
+            model.add_node(f'N{i}_{j}', i*10.0, j*10.0, 0.0)
+    return model
+
+
+def test_merge_duplicate_nodes_uses_tolerance_and_keeps_first_node():
+    model = _grid_model()
+    model.add_node('D1', 20.0005, 30.0, 0.0)
+    model.add_node('D2', 20.0, 30.0, 0.002)  # Outside the tolerance
+    model.add_node('D3', 50.0, 50.0, 0.0)
+    model.add_member('M1', 'D1', 'D3', 'Steel', 'W')
+    model.def_support('D1', support_DX=True)
+
+    removed = model.merge_duplicate_nodes(0.001)
+
+    assert removed == ['D1', 'D3']
+    assert model.members['M1'].i_node is model.nodes['N2_3']
+    assert model.members['M1'].j_node is model.nodes['N5_5']
+    assert model.nodes['N2_3'].support_DX
+    assert 'D2' in model.nodes
+
+
+def test_descritize_finds_nodes_along_members():
+    model = _grid_model()
+    model.add_member('X', 'N0_2', 'N5_2', 'Steel', 'W')
+    model.add_member('D', 'N0_0', 'N5_5', 'Steel', 'W')
+    model.add_node('Off', 25.0, 25.01, 0.0)  # Near the diagonal, but not on it
+
+    # Nodes added directly to the dictionary (as meshes do) are picked up as well
+    model._spatial_index()
+    model.nodes['Mesh'] = Node3D('Mesh', 15.0, 15.0, 0.0)
+
+    _renumber(model)
+
+    x_nodes = [m.i_node.name for m in model.members['X'].sub_members.values()] + ['N5_2']
+    d_nodes = [m.i_node.name for m in model.members['D'].sub_members.values()] + ['N5_5']
+    assert x_nodes == [f'N{i}_2' for i in range(6)]
+    assert d_nodes == ['N0_0', 'N1_1', 'Mesh', 'N2_2', 'N3_3', 'N4_4', 'N5_5']
+
+    # Deleted nodes drop out of the index
+    model.delete_node('N3_3')
+    _renumber(model)
+    assert 'N3_3' not in [m.i_node.name for m in model.members['D'].sub_members.values()]
+
+
+def test_slender_models_get_cells_matching_their_node_spacing():
+    from random import Random
+    from freecad.StructureTools.Pynite_main.SpatialIndex import SpatialIndex
+
+    # A tall, slender tower of nodes spaced 10 apart
+    nodes = [Node3D(f'N{i}_{j}_{k}', i*10.0, j*10.0, k*10.0)
+             for i in range(4) for j in range(4) for k in range(60)]
+    index = SpatialIndex()
+    index.sync(nodes)
+    assert 5 < index.cell_size < 20
+
+    # A segment between neighbouring nodes only visits the cells near it
+    assert len(index.near_segment(10, 10, 100, 10, 10, 110, 0.01)) < 10
+
+    # Every node within the padding of a segment is a candidate
+    rng = Random(1)
+    for _ in range(50):
+        Pi = [rng.uniform(-5, 35), rng.uniform(-5, 35), rng.uniform(-5, 600)]
+        Pj = [rng.uniform(-5, 35), rng.uniform(-5, 35), rng.uniform(-5, 600)]
+        padding = rng.choice([0.0, 1.0, 12.0])
+        candidates = set(map(id, index.near_segment(*Pi, *Pj, padding)))
+        d = [b - a for a, b in zip(Pi, Pj)]
+        for node in nodes:
+            P = (node.X, node.Y, node.Z)
+            t = min(max(sum((p - a)*c for p, a, c in zip(P, Pi, d))/sum(c*c for c in d), 0), 1)
+            if sum((p - a - t*c)**2 for p, a, c in zip(P, Pi, d))**0.5 <= padding:
+                assert id(node) in candidates
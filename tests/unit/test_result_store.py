@@ -0,0 +1,40 @@
+import numpy as np
+
+from freecad.StructureTools.result_store import ResultStore, sidecar_path
+
+
+def test_store_set_get_and_round_trip(tmp_path):
+    store = ResultStore(['M1', 'M2'], ['C1'])
+    store.set('MomentZ', 'M1', 'C1', [1.0, 2.0, 3.0])
+    store.set('MomentZ', 'M2', 'C2', [4.0, 5.0, 6.0])  # New combinations are added as needed
+
+    assert store.combos == ['C1', 'C2'] and 'C2' in store and 'C3' not in store
+    assert store.get('MomentZ').shape == (2, 2, 3)
+    assert np.array_equal(store.get('MomentZ', 'M1', 'C1'), [1.0, 2.0, 3.0])
+    assert np.array_equal(store.matrix('MomentZ', 'C2')[1], [4.0, 5.0, 6.0])
+    assert np.isnan(store.matrix('MomentZ', 'C2')[0]).all()
+
+    # Slices are views of the stored array
+    store.get('MomentZ', 'M1')[1, 0] = 7.0
+    assert store.get('MomentZ', 'M1', 'C2')[0] == 7.0
+
+    # Reactions are stored per node
+    nodal = ResultStore(['M1'], ['C1'], nodes=['N1', 'N2'])
+    nodal.set('Reactions', 'N2', 'C1', [1.0, 2.0, 3.0, 0.0, 0.0, 0.0])
+    assert nodal.get('Reactions', 'N2', 'C1')[2] == 3.0 and np.isnan(nodal.get('Reactions', 'N1', 'C1')).all()
+
+    path = sidecar_path(str(tmp_path / 'model.FCStd'), 'Calc')
+    assert path == str(tmp_path / 'model.Calc.results')
+    nodal.save(path)
+    assert ResultStore.load(path).nodes == ['N1', 'N2']
+    store.save(path)
+    loaded = ResultStore.load(path)
+    assert loaded.members == ['M1', 'M2'] and loaded.combos == ['C1', 'C2'] and loaded.nodes == []
+    assert set(loaded.arrays) == {'MomentZ'}  # The earlier 'Reactions' file is removed
+    assert np.array_equal(loaded.get('MomentZ'), store.get('MomentZ'), equal_nan=True)
+
+    # Loaded arrays are read-only memory maps, copied on the first write
+    assert isinstance(loaded.get('MomentZ'), np.memmap) and not loaded.get('MomentZ').flags.writeable
+    loaded.set('MomentZ', 'M2', 'C1', [9.0, 9.0, 9.0])
+    assert loaded.get('MomentZ', 'M2', 'C1')[0] == 9.0
+    assert np.isnan(ResultStore.load(path).get('MomentZ', 'M2', 'C1')).all()